@@ -20,12 +20,19 @@ PROFILING_MODE = bool(os.getenv("PROFILING_MODE", ""))
 ANNOTATION_MODE = bool(os.getenv("ANNOTATION_MODE", ""))
 # Skipping the build copy prevents copying built *.so files back into the source tree
 SKIP_BUILD_COPY = bool(os.getenv("SKIP_BUILD_COPY", ""))
+# If TRUSTED mode is enabled, compile out precondition checks on internal hot paths.
+# Toggling the mode requires a clean build, as the mode is a C macro which leaves the
+# sources unchanged (so existing extensions are not rebuilt). From the repository root:
+#   rm -rf build/ && find nautilus_trader examples -name "*.so" -delete
+#   TRUSTED_MODE=true poetry install  (or without TRUSTED_MODE to restore the checks)
+TRUSTED_MODE = bool(os.getenv("TRUSTED_MODE", ""))
 
 
 print(
     f"DEBUG_MODE={DEBUG_MODE}, "
     f"PROFILING_MODE={PROFILING_MODE}, "
-    f"ANNOTATION_MODE={ANNOTATION_MODE}"
+    f"ANNOTATION_MODE={ANNOTATION_MODE}, "
+    f"TRUSTED_MODE={TRUSTED_MODE}"
 )
 
 ##########################
@@ -56,10 +63,11 @@ CYTHON_COMPILER_DIRECTIVES = {
 def _build_extensions() -> List[Extension]:
     # Build Extensions to feed into cythonize()
     # Profiling requires special macro directives
+    define_macros = []
     if PROFILING_MODE or ANNOTATION_MODE:
-        define_macros = [("CYTHON_TRACE", "1")]
-    else:
-        define_macros = None
+        define_macros.append(("CYTHON_TRACE", "1"))
+    if TRUSTED_MODE:
+        define_macros.append(("NAUTILUS_TRUSTED_MODE", "1"))
 
     return [
         Extension(
@@ -44,6 +44,11 @@ config = {
         "connection_timeout": 5.0,     # Timeout for successful connections for all engine clients
         "disconnection_timeout": 5.0,  # Timeout for successful disconnection for all engine clients
         "check_residuals_delay": 5.0,  # How long to wait after stopping for residual events (secs)
+        "loop_monitor_interval": 1.0,  # Interval between event loop lag samples, 0 to disable (secs)
+        "loop_lag_warning": 0.1,       # Event loop lag at which a warning is logged (secs)
+        "trace_latency": False,        # Trace tick-to-order and order-to-fill latencies
+        "trace_log_interval": 60.0,    # Interval between latency summaries being logged (secs)
+        "use_uvloop": True,            # Run the event loop on uvloop when installed
     },
 
     "logging": {
@@ -17,6 +17,7 @@ import ccxt
 from ccxt.base.errors import BaseError as CCXTError
 
 from nautilus_trader.adapters.ccxt.execution cimport CCXTExecutionClient
+from nautilus_trader.adapters.ccxt.providers cimport CCXTInstrumentProvider
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.core.correctness cimport Condition
@@ -26,6 +27,7 @@ from nautilus_trader.model.c_enums.order_side cimport OrderSideParser
 from nautilus_trader.model.c_enums.order_type cimport OrderType
 from nautilus_trader.model.c_enums.time_in_force cimport TimeInForce
 from nautilus_trader.model.c_enums.time_in_force cimport TimeInForceParser
+from nautilus_trader.model.commands cimport SubmitOrder
 from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.order.base cimport Order
 from nautilus_trader.model.order.base cimport PassiveOrder
@@ -43,6 +45,7 @@ cdef class BinanceExecutionClient(CCXTExecutionClient):
         LiveExecutionEngine engine not None,
         LiveClock clock not None,
         Logger logger not None,
+        CCXTInstrumentProvider instrument_provider=None,
     ):
         """
         Initialize a new instance of the `BinanceExecutionClient` class.
@@ -59,6 +62,9 @@ cdef class BinanceExecutionClient(CCXTExecutionClient):
             The clock for the client.
         logger : Logger
             The logger for the client.
+        instrument_provider : CCXTInstrumentProvider, optional
+            The instrument provider for the client (can be shared with the
+            data client). If None then a new provider is created.
 
         """
         Condition.true(client.name.upper() == "BINANCE", "client.name != BINANCE")
@@ -69,11 +75,14 @@ cdef class BinanceExecutionClient(CCXTExecutionClient):
             engine,
             clock,
             logger,
+            instrument_provider,
         )
 
 # -- COMMANDS --------------------------------------------------------------------------------------
 
-    async def _submit_order(self, Order order):
+    async def _submit_order(self, SubmitOrder command):
+        cdef Order order = command.order
+
         # Common arguments
 
         if order.time_in_force == TimeInForce.GTD:
@@ -114,6 +123,7 @@ cdef class BinanceExecutionClient(CCXTExecutionClient):
 
         try:
             # Submit order and await response
+            self._record_sent(command)
             await self._client.create_order(
                 symbol=order.security.symbol.value,
                 type=order_type,
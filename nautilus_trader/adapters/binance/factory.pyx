@@ -18,6 +18,7 @@ import sys
 
 from nautilus_trader.adapters.binance.execution cimport BinanceExecutionClient
 from nautilus_trader.adapters.ccxt.data cimport CCXTDataClient
+from nautilus_trader.adapters.ccxt.providers cimport CCXTInstrumentProvider
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.logging cimport LiveLogger
 from nautilus_trader.live.data_engine cimport LiveDataEngine
@@ -92,6 +93,8 @@ cdef class BinanceClientsFactory:
         if config.get("sandbox_mode", False):
             client.set_sandbox_mode(True)
 
+        instrument_provider = CCXTInstrumentProvider.from_config(client, config)
+
         if config.get("data_client", True):
             # Check required CCXT methods are available
             if not client.has.get("fetchTrades", False):
@@ -116,6 +119,7 @@ cdef class BinanceClientsFactory:
                 engine=data_engine,
                 clock=clock,
                 logger=logger,
+                instrument_provider=instrument_provider,
             )
         else:
             # The data client was not enabled
@@ -149,6 +153,7 @@ cdef class BinanceClientsFactory:
                 engine=exec_engine,
                 clock=clock,
                 logger=logger,
+                instrument_provider=instrument_provider,
             )
         else:
             # The execution client not enabled
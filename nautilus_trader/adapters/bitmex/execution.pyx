@@ -17,6 +17,7 @@ import ccxt
 from ccxt.base.errors import BaseError as CCXTError
 
 from nautilus_trader.adapters.ccxt.execution cimport CCXTExecutionClient
+from nautilus_trader.adapters.ccxt.providers cimport CCXTInstrumentProvider
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.core.correctness cimport Condition
@@ -24,6 +25,7 @@ from nautilus_trader.live.execution_engine cimport LiveExecutionEngine
 from nautilus_trader.model.c_enums.order_side cimport OrderSideParser
 from nautilus_trader.model.c_enums.order_type cimport OrderType
 from nautilus_trader.model.c_enums.time_in_force cimport TimeInForce
+from nautilus_trader.model.commands cimport SubmitOrder
 from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.order.base cimport Order
 from nautilus_trader.model.order.base cimport PassiveOrder
@@ -41,6 +43,7 @@ cdef class BitmexExecutionClient(CCXTExecutionClient):
         LiveExecutionEngine engine not None,
         LiveClock clock not None,
         Logger logger not None,
+        CCXTInstrumentProvider instrument_provider=None,
     ):
         """
         Initialize a new instance of the `BitmexExecutionClient` class.
@@ -57,6 +60,9 @@ cdef class BitmexExecutionClient(CCXTExecutionClient):
             The clock for the client.
         logger : Logger
             The logger for the client.
+        instrument_provider : CCXTInstrumentProvider, optional
+            The instrument provider for the client (can be shared with the
+            data client). If None then a new provider is created.
 
         """
         Condition.true(client.name.upper() == "BITMEX", "client.name != BITMEX")
@@ -67,11 +73,14 @@ cdef class BitmexExecutionClient(CCXTExecutionClient):
             engine,
             clock,
             logger,
+            instrument_provider,
         )
 
 # -- COMMANDS --------------------------------------------------------------------------------------
 
-    async def _submit_order(self, Order order):
+    async def _submit_order(self, SubmitOrder command):
+        cdef Order order = command.order
+
         if order.time_in_force == TimeInForce.GTD:
             raise ValueError("GTD not supported in this version.")
 
@@ -118,6 +127,7 @@ cdef class BitmexExecutionClient(CCXTExecutionClient):
 
         try:
             # Submit order and await response
+            self._record_sent(command)
             await self._client.create_order(
                 symbol=order.security.symbol.value,
                 type=order_type,
@@ -28,36 +28,36 @@ cdef class CCXTDataClient(LiveMarketDataClient):
 
     cdef set _subscribed_instruments
     cdef dict _subscribed_order_books
-    cdef dict _subscribed_quote_ticks
+    cdef set _subscribed_quote_ticks
     cdef dict _subscribed_trade_ticks
     cdef dict _subscribed_bars
+    cdef dict _order_book_streams
+    cdef dict _published_instruments
 
     cdef object _update_instruments_task
 
     cdef inline void _log_ccxt_error(self, ex, str method_name) except *
+    cdef inline void _start_order_book_stream(self, Security security) except *
+    cdef inline void _stop_order_book_stream(self, Security security) except *
     cdef inline void _on_quote_tick(
         self,
         Security security,
-        double best_bid,
-        double best_ask,
-        double best_bid_size,
-        double best_ask_size,
+        best_bid,
+        best_ask,
+        best_bid_size,
+        best_ask_size,
         long timestamp,
-        int price_precision,
-        int size_precision,
+        price_exponent,
+        size_exponent,
     ) except *
-    cdef inline void _on_trade_tick(
+    cdef inline list _parse_new_trade_ticks(
         self,
         Security security,
-        double price,
-        double amount,
-        str order_side,
-        str liquidity_side,
-        str trade_match_id,
-        long timestamp,
-        int price_precision,
-        int size_precision,
-    ) except *
+        trades,
+        str last_trade_id,
+        price_exponent,
+        size_exponent,
+    )
     cdef inline void _on_bar(
         self,
         BarType bar_type,
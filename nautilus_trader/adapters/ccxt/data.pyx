@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import decimal
 
 from cpython.datetime cimport datetime
 
@@ -51,6 +52,18 @@ from nautilus_trader.model.tick cimport TradeTick
 cdef int _SECONDS_IN_HOUR = 60 * 60
 
 
+cdef inline object _exponent(int precision):
+    # The exponent to quantize decimals to the given precision, computed once
+    # per subscription
+    return decimal.Decimal(1).scaleb(-precision)
+
+
+cdef inline object _quantize(value, exponent):
+    # Rounds the exact value half even to the exponent, giving the same result
+    # as formatting to the precision without building a string
+    return decimal.Decimal(value).quantize(exponent)
+
+
 cdef class CCXTDataClient(LiveMarketDataClient):
     """
     Provides a data client for the unified CCXT Pro API.
@@ -62,6 +75,7 @@ cdef class CCXTDataClient(LiveMarketDataClient):
         LiveDataEngine engine not None,
         LiveClock clock not None,
         Logger logger not None,
+        CCXTInstrumentProvider instrument_provider=None,
     ):
         """
         Initialize a new instance of the `CCXTDataClient` class.
@@ -76,6 +90,9 @@ cdef class CCXTDataClient(LiveMarketDataClient):
             The clock for the client.
         logger : Logger
             The logger for the client.
+        instrument_provider : CCXTInstrumentProvider, optional
+            The instrument provider for the client (can be shared with the
+            execution client). If None then a new provider is created.
 
         Raises
         ------
@@ -96,21 +113,30 @@ cdef class CCXTDataClient(LiveMarketDataClient):
             }
         )
 
+        if instrument_provider is None:
+            instrument_provider = CCXTInstrumentProvider(
+                client=client,
+                load_all=False,
+            )
+
         self._client = client
-        self._instrument_provider = CCXTInstrumentProvider(
-            client=client,
-            load_all=False,
-        )
+        self._instrument_provider = instrument_provider
 
         self.is_connected = False
 
         # Subscriptions
         self._subscribed_instruments = set()   # type: set[Security]
-        self._subscribed_order_books = {}      # type: dict[Security, asyncio.Task]
-        self._subscribed_quote_ticks = {}      # type: dict[Security, asyncio.Task]
+        self._subscribed_order_books = {}      # type: dict[Security, tuple]
+        self._subscribed_quote_ticks = set()   # type: set[Security]
         self._subscribed_trade_ticks = {}      # type: dict[Security, asyncio.Task]
         self._subscribed_bars = {}             # type: dict[BarType, asyncio.Task]
 
+        # Streams (one upstream order book watch per security)
+        self._order_book_streams = {}          # type: dict[Security, asyncio.Task]
+
+        # Instruments last published to the data engine
+        self._published_instruments = {}       # type: dict[Symbol, Instrument]
+
         # Scheduled tasks
         self._update_instruments_task = None
 
@@ -136,7 +162,7 @@ cdef class CCXTDataClient(LiveMarketDataClient):
         list[Security]
 
         """
-        return sorted(list(self._subscribed_quote_ticks.keys()))
+        return sorted(list(self._subscribed_quote_ticks))
 
     @property
     def subscribed_trade_ticks(self):
@@ -182,7 +208,8 @@ cdef class CCXTDataClient(LiveMarketDataClient):
             self._log_ccxt_error(ex, self._connect.__name__)
             return
 
-        for instrument in self._instrument_provider.get_all().values():
+        self._published_instruments = self._instrument_provider.get_all()
+        for instrument in self._published_instruments.values():
             self._handle_instrument(instrument)
 
         self.is_connected = True
@@ -206,7 +233,7 @@ cdef class CCXTDataClient(LiveMarketDataClient):
             # stop_tasks.append(self._update_instruments_task)
 
         # Cancel residual tasks
-        for task in self._subscribed_trade_ticks.values():
+        for task in list(self._order_book_streams.values()) + list(self._subscribed_trade_ticks.values()):
             if not task.cancelled():
                 self._log.debug(f"Cancelling {task}...")
                 task.cancel()
@@ -233,12 +260,6 @@ cdef class CCXTDataClient(LiveMarketDataClient):
 
         self._log.info("Resetting...")
 
-        # TODO: Reset client
-        self._instrument_provider = CCXTInstrumentProvider(
-            client=self._client,
-            load_all=False,
-        )
-
         self._subscribed_instruments = set()
 
         # Check all tasks have been popped and cancelled
@@ -246,6 +267,7 @@ cdef class CCXTDataClient(LiveMarketDataClient):
         assert len(self._subscribed_quote_ticks) == 0
         assert len(self._subscribed_trade_ticks) == 0
         assert len(self._subscribed_bars) == 0
+        assert len(self._order_book_streams) == 0
 
         self._log.info("Reset.")
 
@@ -309,13 +331,12 @@ cdef class CCXTDataClient(LiveMarketDataClient):
             self._log.warning(f"Already subscribed {security.symbol} <OrderBook> data.")
             return
 
-        task = self._loop.create_task(self._watch_order_book(
-            security=security,
-            level=level,
-            depth=depth,
-            kwargs=kwargs,
-        ))
-        self._subscribed_order_books[security] = task
+        self._subscribed_order_books[security] = (level, depth, kwargs)
+
+        # Restart any stream already serving quote ticks so that it watches
+        # with the order book depth and parameters.
+        self._stop_order_book_stream(security)
+        self._start_order_book_stream(security)
 
         self._log.info(f"Subscribed to {security.symbol} <OrderBook> data.")
 
@@ -332,11 +353,11 @@ cdef class CCXTDataClient(LiveMarketDataClient):
         Condition.not_none(security, "security")
 
         if security in self._subscribed_quote_ticks:
-            self._log.warning(f"Already subscribed {security.symbol} <TradeTick> data.")
+            self._log.warning(f"Already subscribed {security.symbol} <QuoteTick> data.")
             return
 
-        task = self._loop.create_task(self._watch_quotes(security))
-        self._subscribed_quote_ticks[security] = task
+        self._subscribed_quote_ticks.add(security)
+        self._start_order_book_stream(security)
 
         self._log.info(f"Subscribed to {security.symbol} <QuoteTick> data.")
 
@@ -418,9 +439,10 @@ cdef class CCXTDataClient(LiveMarketDataClient):
             self._log.debug(f"Not subscribed to {security.symbol} <OrderBook> data.")
             return
 
-        task = self._subscribed_order_books.pop(security)
-        task.cancel()
-        self._log.debug(f"Cancelled {task}.")
+        self._subscribed_order_books.pop(security)
+        if security not in self._subscribed_quote_ticks:
+            self._stop_order_book_stream(security)
+
         self._log.info(f"Unsubscribed from {security.symbol} <OrderBook> data.")
 
     cpdef void unsubscribe_quote_ticks(self, Security security) except *:
@@ -439,9 +461,10 @@ cdef class CCXTDataClient(LiveMarketDataClient):
             self._log.debug(f"Not subscribed to {security.symbol} <QuoteTick> data.")
             return
 
-        task = self._subscribed_quote_ticks.pop(security)
-        task.cancel()
-        self._log.debug(f"Cancelled {task}.")
+        self._subscribed_quote_ticks.discard(security)
+        if security not in self._subscribed_order_books:
+            self._stop_order_book_stream(security)
+
         self._log.info(f"Unsubscribed from {security.symbol} <QuoteTick> data.")
 
     cpdef void unsubscribe_trade_ticks(self, Security security) except *:
@@ -647,87 +670,64 @@ cdef class CCXTDataClient(LiveMarketDataClient):
     cdef inline void _log_ccxt_error(self, ex, str method_name) except *:
         self._log.warning(f"{type(ex).__name__}: {ex} in {method_name}")
 
-# -- STREAMS ---------------------------------------------------------------------------------------
+    cdef inline void _start_order_book_stream(self, Security security) except *:
+        if security in self._order_book_streams:
+            return  # Already streaming
 
-    # TODO: Possibly combine this with _watch_quotes
-    async def _watch_order_book(self, Security security, int level, int depth, dict kwargs):
-        cdef Instrument instrument = self._instrument_provider.get(security)
-        if instrument is None:
-            self._log.error(f"Cannot subscribe to order book (no instrument for {security.symbol}).")
-            return
-
-        cdef OrderBook order_book = None
-        try:
-            while True:
-                try:
-                    lob = await self._client.watch_order_book(
-                        symbol=security.symbol.value,
-                        limit=None if depth == 0 else depth,
-                        params=kwargs,
-                    )
-                    timestamp = lob["timestamp"]
-                    if timestamp is None:  # Compiled to fast C check
-                        # First quote timestamp often None
-                        timestamp = self._client.milliseconds()
-
-                    bids = lob.get("bids")
-                    asks = lob.get("asks")
-                    if bids is None:
-                        continue
-                    if asks is None:
-                        continue
+        task = self._loop.create_task(self._watch_order_book(security))
+        self._order_book_streams[security] = task
 
-                    if order_book is None:
-                        order_book = OrderBook(
-                            security,
-                            level,
-                            depth,
-                            instrument.price_precision,
-                            instrument.size_precision,
-                            list(bids),
-                            list(asks),
-                            lob.get("nonce"),
-                            timestamp,
-                        )
+    cdef inline void _stop_order_book_stream(self, Security security) except *:
+        task = self._order_book_streams.pop(security, None)
+        if task is None:
+            return  # Not streaming
 
-                    else:
-                        # Currently inefficient while using CCXT. The order book
-                        # is regenerated with a snapshot on every update.
-                        order_book.apply_snapshot(list(bids), list(asks), lob.get("nonce"), timestamp)
+        task.cancel()
+        self._log.debug(f"Cancelled {task}.")
 
-                    self._handle_order_book(order_book)
-                except CCXTError as ex:
-                    self._log_ccxt_error(ex, self._watch_order_book.__name__)
-                    continue
-        except asyncio.CancelledError as ex:
-            self._log.debug(f"Cancelled `_watch_order_book` for {security.symbol}.")
-        except Exception as ex:
-            self._log.exception(ex)
+# -- STREAMS ---------------------------------------------------------------------------------------
 
-    async def _watch_quotes(self, Security security):
+    async def _watch_order_book(self, Security security):
+        # A single upstream order book watch per security, fanning out both
+        # order book snapshots and top-of-book quote ticks to subscribers.
         cdef Instrument instrument = self._instrument_provider.get(security)
         if instrument is None:
-            self._log.error(f"Cannot subscribe to quote ticks (no instrument for {security.symbol}).")
+            self._log.error(f"Cannot subscribe to order book (no instrument for {security.symbol}).")
             return
 
         # Setup precisions
         cdef int price_precision = instrument.price_precision
         cdef int size_precision = instrument.size_precision
+        price_exponent = _exponent(price_precision)
+        size_exponent = _exponent(size_precision)
+
+        # Stream parameters are fixed for the lifetime of the task, a new
+        # order book subscription restarts the stream.
+        cdef int level = 0
+        cdef int depth = 0
+        cdef dict kwargs = {}
+        cdef tuple params = self._subscribed_order_books.get(security)
+        if params is not None:
+            level, depth, kwargs = params
 
+        cdef OrderBook order_book = None
         cdef list bids
         cdef list asks
-        cdef bint generate_tick = False
+        cdef list best_bid
+        cdef list best_ask
         cdef list last_best_bid = None
         cdef list last_best_ask = None
-        cdef list best_bid = None
-        cdef list best_ask = None
         cdef bint exiting = False  # Flag to stop loop
         try:
             while True:
                 try:
-                    lob = await self._client.watch_order_book(symbol=security.symbol.value)
+                    lob = await self._client.watch_order_book(
+                        symbol=security.symbol.value,
+                        limit=None if depth == 0 else depth,
+                        params=kwargs,
+                    )
                 except CCXTError as ex:
-                    self._log_ccxt_error(ex, self._watch_quotes.__name__)
+                    self._log_ccxt_error(ex, self._watch_order_book.__name__)
                     continue
                 except TypeError:
                     # Temporary workaround for testing
@@ -736,28 +736,9 @@ cdef class CCXTDataClient(LiveMarketDataClient):
 
                 bids = <list>lob.get("bids")
                 asks = <list>lob.get("asks")
-
-                if bids:
-                    best_bid = bids[0]
-                else:
-                    continue
-
-                if asks:
-                    best_ask = asks[0]
-                else:
-                    continue
-
-                generate_tick = False
-                # Cache last quotes if changed
-                if last_best_bid is None or best_bid != last_best_bid:
-                    last_best_bid = best_bid
-                    generate_tick = True
-                if last_best_ask is None or best_ask != last_best_ask:
-                    last_best_ask = best_ask
-                    generate_tick = True
-
-                # Only generate quote tick on change to best bid or ask
-                if not generate_tick:
+                if not bids or not asks:
+                    if exiting:
+                        break
                     continue
 
                 timestamp = lob["timestamp"]
@@ -765,41 +746,68 @@ cdef class CCXTDataClient(LiveMarketDataClient):
                     # First quote timestamp often None
                     timestamp = self._client.milliseconds()
 
-                self._on_quote_tick(
-                    security,
-                    best_bid[0],
-                    best_ask[0],
-                    best_bid[1],
-                    best_ask[1],
-                    timestamp,
-                    price_precision,
-                    size_precision,
-                )
+                if security in self._subscribed_order_books:
+                    if order_book is None:
+                        order_book = OrderBook(
+                            security,
+                            level,
+                            depth,
+                            price_precision,
+                            size_precision,
+                            list(bids),
+                            list(asks),
+                            lob.get("nonce"),
+                            timestamp,
+                        )
+                    else:
+                        # Currently inefficient while using CCXT. The order book
+                        # is regenerated with a snapshot on every update.
+                        order_book.apply_snapshot(list(bids), list(asks), lob.get("nonce"), timestamp)
+
+                    self._handle_order_book(order_book)
+
+                if security in self._subscribed_quote_ticks:
+                    best_bid = bids[0]
+                    best_ask = asks[0]
+                    # Only generate quote tick on change to best bid or ask
+                    if best_bid != last_best_bid or best_ask != last_best_ask:
+                        last_best_bid = best_bid
+                        last_best_ask = best_ask
+                        self._on_quote_tick(
+                            security,
+                            best_bid[0],
+                            best_ask[0],
+                            best_bid[1],
+                            best_ask[1],
+                            timestamp,
+                            price_exponent,
+                            size_exponent,
+                        )
 
                 if exiting:
                     break
         except asyncio.CancelledError as ex:
-            self._log.debug(f"Cancelled `_watch_ticker` for {security.symbol}.")
+            self._log.debug(f"Cancelled `_watch_order_book` for {security.symbol}.")
         except Exception as ex:
             self._log.exception(ex)
 
     cdef inline void _on_quote_tick(
         self,
         Security security,
-        double best_bid,
-        double best_ask,
-        double best_bid_size,
-        double best_ask_size,
+        best_bid,
+        best_ask,
+        best_bid_size,
+        best_ask_size,
         long timestamp,
-        int price_precision,
-        int size_precision,
+        price_exponent,
+        size_exponent,
     ) except *:
         cdef QuoteTick tick = QuoteTick(
             security,
-            Price(best_bid, price_precision),
-            Price(best_ask, price_precision),
-            Quantity(best_bid_size, size_precision),
-            Quantity(best_ask_size, size_precision),
+            Price.from_decimal_c(_quantize(best_bid, price_exponent)),
+            Price.from_decimal_c(_quantize(best_ask, price_exponent)),
+            Quantity.from_decimal_c(_quantize(best_bid_size, size_exponent)),
+            Quantity.from_decimal_c(_quantize(best_ask_size, size_exponent)),
             from_unix_time_ms(timestamp),
         )
 
@@ -811,10 +819,11 @@ cdef class CCXTDataClient(LiveMarketDataClient):
             self._log.error(f"Cannot subscribe to trade ticks (no instrument for {security.symbol}).")
             return
 
-        cdef int price_precision = instrument.price_precision
-        cdef int size_precision = instrument.size_precision
+        price_exponent = _exponent(instrument.price_precision)
+        size_exponent = _exponent(instrument.size_precision)
 
-        cdef dict trade
+        cdef list ticks
+        cdef str last_trade_id = None
         cdef bint exiting = False  # Flag to stop loop
         try:
             while True:
@@ -828,18 +837,18 @@ cdef class CCXTDataClient(LiveMarketDataClient):
                     trades = self._client.watch_trades
                     exiting = True
 
-                trade = trades[0]  # Last trade only
-                self._on_trade_tick(
+                # A single update can contain many trades, these are handled
+                # as one batch by the engine.
+                ticks = self._parse_new_trade_ticks(
                     security,
-                    trade["price"],
-                    trade["amount"],
-                    trade["side"],
-                    trade["takerOrMaker"],
-                    trade["id"],
-                    trade["timestamp"],
-                    price_precision,
-                    size_precision,
+                    trades,
+                    last_trade_id,
+                    price_exponent,
+                    size_exponent,
                 )
+                if ticks:
+                    last_trade_id = ticks[-1].match_id.value
+                    self._handle_batch(ticks)
 
                 if exiting:
                     break
@@ -848,33 +857,53 @@ cdef class CCXTDataClient(LiveMarketDataClient):
         except Exception as ex:
             self._log.exception(ex)
 
-    cdef inline void _on_trade_tick(
+    cdef inline list _parse_new_trade_ticks(
         self,
         Security security,
-        double price,
-        double amount,
-        str order_side,
-        str liquidity_side,
-        str trade_match_id,
-        long timestamp,
-        int price_precision,
-        int size_precision,
-    ) except *:
-        # Determine liquidity side
-        cdef OrderSide side = OrderSide.BUY if order_side == "buy" else OrderSide.SELL
-        if liquidity_side == "maker":
-            side = OrderSide.BUY if order_side == OrderSide.SELL else OrderSide.BUY
-
-        cdef TradeTick tick = TradeTick(
-            security,
-            Price(price, price_precision),
-            Quantity(amount, size_precision),
-            side,
-            TradeMatchId(trade_match_id),
-            from_unix_time_ms(timestamp),
-        )
+        trades,
+        str last_trade_id,
+        price_exponent,
+        size_exponent,
+    ):
+        cdef int count = len(trades)
+        cdef int start = 0
+        cdef int i
+        if last_trade_id is not None:
+            # CCXT may return previously seen trades from its cache
+            for i in range(count - 1, -1, -1):
+                if trades[i]["id"] == last_trade_id:
+                    start = i + 1
+                    break
 
-        self._handle_trade_tick(tick)
+        cdef dict trade
+        cdef OrderSide side
+        cdef long timestamp
+        cdef long last_timestamp = -1
+        cdef datetime timestamp_dt = None
+        cdef list ticks = []
+        for i in range(start, count):
+            trade = trades[i]
+            side = OrderSide.BUY if trade["side"] == "buy" else OrderSide.SELL
+            if trade["takerOrMaker"] == "maker":
+                # Determine aggressor side
+                side = OrderSide.SELL if side == OrderSide.BUY else OrderSide.BUY
+
+            # Trades in an update often share a timestamp
+            timestamp = trade["timestamp"]
+            if timestamp != last_timestamp:
+                last_timestamp = timestamp
+                timestamp_dt = from_unix_time_ms(timestamp)
+
+            ticks.append(TradeTick(
+                security,
+                Price.from_decimal_c(_quantize(trade["price"], price_exponent)),
+                Quantity.from_decimal_c(_quantize(trade["amount"], size_exponent)),
+                side,
+                TradeMatchId(trade["id"]),
+                timestamp_dt,
+            ))
+
+        return ticks
 
     async def _watch_ohlcv(self, BarType bar_type):
         cdef Instrument instrument = self._instrument_provider.get(bar_type.security)
@@ -969,12 +998,12 @@ cdef class CCXTDataClient(LiveMarketDataClient):
         await asyncio.sleep(delay)
         return await coro
 
-    async def _load_instruments(self):
-        await self._instrument_provider.load_all_async()
+    async def _load_instruments(self, bint reload=False):
+        await self._instrument_provider.load_all_async(reload)
         self._log.info(f"Updated {self._instrument_provider.count} instruments.")
 
     async def _request_instrument(self, Security security, UUID correlation_id):
-        await self._load_instruments()
+        await self._load_instruments(reload=True)
         cdef Instrument instrument = self._instrument_provider.get(security)
         if instrument is not None:
             self._handle_instruments([instrument], correlation_id)
@@ -982,20 +1011,28 @@ cdef class CCXTDataClient(LiveMarketDataClient):
             self._log.error(f"Could not find instrument {security.symbol}.")
 
     async def _request_instruments(self, correlation_id):
-        await self._load_instruments()
+        await self._load_instruments(reload=True)
         cdef list instruments = list(self._instrument_provider.get_all().values())
         self._handle_instruments(instruments, correlation_id)
 
     async def _subscribed_instruments_update(self, delay):
-        await self._instrument_provider.load_all_async()
+        try:
+            await self._instrument_provider.load_all_async(reload=True)
+        except CCXTError as ex:
+            self._log_ccxt_error(ex, self._subscribed_instruments_update.__name__)
+        else:
+            # Only publish instruments which were added or changed since the
+            # last publish (the provider may be shared and reloaded elsewhere).
+            changed = self._instrument_provider.changed(self._published_instruments)
+            if changed:
+                self._log.info(f"Updated {len(changed)} changed instruments.")
+            for instrument in changed:
+                self._handle_instrument(instrument)
+            self._published_instruments = self._instrument_provider.get_all()
 
         cdef Security security
-        cdef Instrument instrument
         for security in self._subscribed_instruments:
-            instrument = self._instrument_provider.get(security)
-            if instrument is not None:
-                self._handle_instrument(instrument)
-            else:
+            if self._instrument_provider.get(security) is None:
                 self._log.error(f"Could not find instrument {security.symbol}.")
 
         # Reschedule subscribed instruments update
@@ -31,7 +31,6 @@ from nautilus_trader.core.datetime cimport to_unix_time_ms
 from nautilus_trader.execution.reports cimport ExecutionStateReport
 from nautilus_trader.live.execution_client cimport LiveExecutionClient
 from nautilus_trader.live.execution_engine cimport LiveExecutionEngine
-from nautilus_trader.live.providers cimport InstrumentProvider
 from nautilus_trader.model.c_enums.liquidity_side cimport LiquiditySide
 from nautilus_trader.model.c_enums.order_side cimport OrderSideParser
 from nautilus_trader.model.c_enums.order_state cimport OrderState
@@ -70,6 +69,7 @@ cdef class CCXTExecutionClient(LiveExecutionClient):
         LiveExecutionEngine engine not None,
         LiveClock clock not None,
         Logger logger not None,
+        CCXTInstrumentProvider instrument_provider=None,
     ):
         """
         Initialize a new instance of the `CCXTExecutionClient` class.
@@ -86,12 +86,16 @@ cdef class CCXTExecutionClient(LiveExecutionClient):
             The clock for the client.
         logger : Logger
             The logger for the client.
+        instrument_provider : CCXTInstrumentProvider, optional
+            The instrument provider for the client (can be shared with the
+            data client). If None then a new provider is created.
 
         """
-        cdef InstrumentProvider instrument_provider = CCXTInstrumentProvider(
-            client=client,
-            load_all=False,
-        )
+        if instrument_provider is None:
+            instrument_provider = CCXTInstrumentProvider(
+                client=client,
+                load_all=False,
+            )
 
         super().__init__(
             Exchange(client.name.upper()),
@@ -333,7 +337,7 @@ cdef class CCXTExecutionClient(LiveExecutionClient):
         """
         Condition.not_none(command, "command")
 
-        self._loop.create_task(self._submit_order(command.order))
+        self._loop.create_task(self._submit_order(command))
 
     cpdef void submit_bracket_order(self, SubmitBracketOrder command) except *:
         """
@@ -376,7 +380,7 @@ cdef class CCXTExecutionClient(LiveExecutionClient):
         """
         Condition.not_none(command, "command")
 
-        self._loop.create_task(self._cancel_order(command.cl_ord_id))
+        self._loop.create_task(self._cancel_order(command))
 
 # -- INTERNAL --------------------------------------------------------------------------------------
 
@@ -394,7 +398,10 @@ cdef class CCXTExecutionClient(LiveExecutionClient):
         self._log.info(f"Updated {self._instrument_provider.count} instruments.")
 
     async def _update_instruments(self, delay):
-        await self._load_instruments()
+        try:
+            await self._instrument_provider.load_all_async(reload=True)
+        except CCXTError as ex:
+            self._log_ccxt_error(ex, self._update_instruments.__name__)
 
         # Reschedule instruments update
         update = self._run_after_delay(delay, self._update_instruments(delay))
@@ -464,7 +471,8 @@ cdef class CCXTExecutionClient(LiveExecutionClient):
 
 # -- COMMANDS --------------------------------------------------------------------------------------
 
-    async def _submit_order(self, Order order):
+    async def _submit_order(self, SubmitOrder command):
+        cdef Order order = command.order
         self._log.debug(f"Submitted {order}.")
 
         # Generate event here to ensure it is processed before OrderAccepted
@@ -475,6 +483,7 @@ cdef class CCXTExecutionClient(LiveExecutionClient):
 
         try:
             # Submit order and await response
+            self._record_sent(command)
             await self._client.create_order(
                 symbol=order.security.symbol.value,
                 type=OrderTypeParser.to_str(order.type).lower(),
@@ -489,10 +498,10 @@ cdef class CCXTExecutionClient(LiveExecutionClient):
                 timestamp=self._clock.utc_now_c(),
             )
 
-    async def _cancel_order(self, ClientOrderId cl_ord_id):
-        cdef Order order = self._engine.cache.order(cl_ord_id)
+    async def _cancel_order(self, CancelOrder command):
+        cdef Order order = self._engine.cache.order(command.cl_ord_id)
         if order is None:
-            self._log.error(f"Cannot cancel order, {repr(cl_ord_id)} not found.")
+            self._log.error(f"Cannot cancel order, {repr(command.cl_ord_id)} not found.")
             return  # Cannot cancel
 
         if not order.is_working_c():
@@ -500,6 +509,7 @@ cdef class CCXTExecutionClient(LiveExecutionClient):
             return  # Cannot cancel
 
         try:
+            self._record_sent(command)
             await self._client.cancel_order(
                 id=order.id.value,
                 symbol=order.security.symbol.value,
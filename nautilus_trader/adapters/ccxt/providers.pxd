@@ -21,7 +21,10 @@ from nautilus_trader.model.instrument cimport Instrument
 
 cdef class CCXTInstrumentProvider(InstrumentProvider):
     cdef object _client
+    cdef object _loading
 
+    cdef bint _load_cached(self) except *
+    cdef void _load_markets(self) except *
     cdef void _load_instruments(self) except *
     cdef void _load_currencies(self) except *
     cdef inline int _tick_size_to_precision(self, double tick_size) except *
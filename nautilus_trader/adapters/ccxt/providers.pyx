@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import asyncio
 from datetime import datetime
 from decimal import Decimal
 
@@ -38,7 +39,13 @@ cdef class CCXTInstrumentProvider(InstrumentProvider):
     Provides a means of loading `Instrument` objects from a unified CCXT exchange.
     """
 
-    def __init__(self, client not None: ccxt.Exchange, bint load_all=False):
+    def __init__(
+        self,
+        client not None: ccxt.Exchange,
+        bint load_all=False,
+        str cache_dir=None,
+        double cache_ttl=3600,
+    ):
         """
         Initialize a new instance of the `CCXTInstrumentProvider` class.
 
@@ -48,26 +55,92 @@ cdef class CCXTInstrumentProvider(InstrumentProvider):
             The client for the provider.
         load_all : bool, optional
             If all instruments should be loaded at instantiation.
+        cache_dir : str, optional
+            The directory for the on-disk instrument cache.
+        cache_ttl : double, optional
+            The maximum age (seconds) of the on-disk cache.
 
         """
         self._client = client  # Assign first as `load_all` will call it
-        super().__init__(venue=Exchange(client.name.upper()), load_all=load_all)
+        self._loading = None
+        super().__init__(
+            venue=Exchange(client.name.upper()),
+            load_all=load_all,
+            cache_dir=cache_dir,
+            cache_ttl=cache_ttl,
+        )
 
-    async def load_all_async(self):
+    @staticmethod
+    def from_config(client not None: ccxt.Exchange, dict config not None):
         """
-        Load all instruments for the venue asynchronously.
+        Create a provider for the given client from the clients configuration.
+
+        The clients factories share the one provider between their data and
+        execution clients, so instruments are loaded once (optionally from the
+        on-disk cache at `instrument_cache_dir`).
+
+        Parameters
+        ----------
+        client : ccxt.Exchange
+            The client for the provider.
+        config : dict
+            The configuration dictionary.
+
+        Returns
+        -------
+        CCXTInstrumentProvider
+
         """
-        await self._client.load_markets(reload=True)
-        self._load_currencies()
-        self._load_instruments()
+        return CCXTInstrumentProvider(
+            client=client,
+            load_all=False,
+            cache_dir=config.get("instrument_cache_dir"),
+            cache_ttl=config.get("instrument_cache_ttl", 3600),
+        )
 
-    cpdef void load_all(self) except *:
+    async def load_all_async(self, bint reload=False):
+        """
+        Load all instruments for the venue asynchronously.
+
+        Unless reloading, a valid on-disk cache is used in place of the
+        exchange. Concurrent calls share a single in-flight load.
+
+        Parameters
+        ----------
+        reload : bool, optional
+            If the instruments should be reloaded from the exchange.
+
+        """
+        if self._loading is None:
+            if not reload and self._load_cached():
+                return
+            self._loading = asyncio.ensure_future(self._load_all_from_exchange())
+
+        loading = self._loading  # Join any in-flight load
+        try:
+            await loading
+        finally:
+            if self._loading is loading:
+                self._loading = None
+
+    cpdef void load_all(self, bint reload=False) except *:
         """
         Load all instruments for the venue.
+
+        Unless reloading, a valid on-disk cache is used in place of the
+        exchange.
+
+        Parameters
+        ----------
+        reload : bool, optional
+            If the instruments should be reloaded from the exchange.
+
         """
+        if not reload and self._load_cached():
+            return
+
         self._client.load_markets(reload=True)
-        self._load_currencies()
-        self._load_instruments()
+        self._load_markets()
 
     cpdef dict get_all(self):
         """
@@ -102,6 +175,32 @@ cdef class CCXTInstrumentProvider(InstrumentProvider):
         # Provides fast C level access assuming the venue is correct
         return self._instruments.get(symbol)
 
+    async def _load_all_from_exchange(self):
+        await self._client.load_markets(reload=True)
+        self._load_markets()
+
+    cdef bint _load_cached(self) except *:
+        cdef dict cached = self.read_cache()
+        if cached is None:
+            return False
+
+        self._client.set_markets(cached["markets"], cached["currencies"])
+        self._load_currencies()
+        self._load_instruments()
+        return True
+
+    cdef void _load_markets(self) except *:
+        cdef dict payload = {
+            "markets": self._client.markets,
+            "currencies": self._client.currencies,
+        }
+
+        if not self.update_cache(payload) and self.count > 0:
+            return  # Markets unchanged since the last load
+
+        self._load_currencies()
+        self._load_instruments()
+
     cdef void _load_instruments(self) except *:
         cdef str k
         cdef dict v
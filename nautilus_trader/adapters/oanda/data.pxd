@@ -13,54 +13,28 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from cpython.datetime cimport datetime
-
-import threading
-
+from nautilus_trader.adapters.oanda.http cimport OandaHttpClient
 from nautilus_trader.adapters.oanda.providers cimport OandaInstrumentProvider
-from nautilus_trader.core.uuid cimport UUID
 from nautilus_trader.live.data_client cimport LiveMarketDataClient
 from nautilus_trader.model.bar cimport Bar
-from nautilus_trader.model.bar cimport BarType
 from nautilus_trader.model.c_enums.price_type cimport PriceType
 from nautilus_trader.model.identifiers cimport Security
 from nautilus_trader.model.instrument cimport Instrument
 from nautilus_trader.model.tick cimport QuoteTick
-from nautilus_trader.model.tick cimport TradeTick
 
 
 cdef class OandaDataClient(LiveMarketDataClient):
-    cdef object _client
+    cdef OandaHttpClient _client
     cdef str _account_id
     cdef set _subscribed_instruments
     cdef dict _subscribed_quote_ticks
     cdef OandaInstrumentProvider _instrument_provider
-    cdef object _update_instruments_handle
+    cdef str _instrument_cache_dir
+    cdef double _instrument_cache_ttl
+    cdef object _update_instruments_task
+    cdef object _price_stream_task
 
-    cpdef void _load_instruments(self) except *
-    cpdef void _request_instrument(self, Security security, UUID correlation_id) except *
-    cpdef void _request_instruments(self, UUID correlation_id) except *
-    cpdef void _subscribed_instruments_update(self) except *
-    cpdef void _subscribed_instruments_load_and_send(self) except *
-    cpdef void _request_bars(
-        self,
-        BarType bar_type,
-        datetime from_datetime,
-        datetime to_datetime,
-        int limit,
-        UUID correlation_id,
-    ) except *
-    cpdef void _stream_prices(self, Security security, event: threading.Event) except *
+    cdef inline void _log_http_error(self, ex, str method_name) except *
+    cdef inline void _restart_price_stream(self) except *
     cdef inline QuoteTick _parse_quote_tick(self, Security security, dict values)
     cdef inline Bar _parse_bar(self, Instrument instrument, dict values, PriceType price_type)
-
-# -- PYTHON WRAPPERS -------------------------------------------------------------------------------
-
-    cpdef void _handle_instrument_py(self, Instrument instrument) except *
-    cpdef void _handle_quote_tick_py(self, QuoteTick tick) except *
-    cpdef void _handle_trade_tick_py(self, TradeTick tick) except *
-    cpdef void _handle_bar_py(self, BarType bar_type, Bar bar) except *
-    cpdef void _handle_instruments_py(self, list instruments, UUID correlation_id) except *
-    cpdef void _handle_quote_ticks_py(self, Security security, list ticks, UUID correlation_id) except *
-    cpdef void _handle_trade_ticks_py(self, Security security, list ticks, UUID correlation_id) except *
-    cpdef void _handle_bars_py(self, BarType bar_type, list bars, Bar partial, UUID correlation_id) except *
@@ -17,15 +17,12 @@ import asyncio
 
 from cpython.datetime cimport datetime
 
-import threading
-
-import oandapyV20
-from oandapyV20.endpoints.instruments import InstrumentsCandles
-from oandapyV20.endpoints.pricing import PricingStream
+import aiohttp
 import pandas as pd
 
 from nautilus_trader.adapters.oanda.providers import OandaInstrumentProvider
 
+from nautilus_trader.adapters.oanda.http cimport OandaHttpClient
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.core.constants cimport *  # str constants only
@@ -35,7 +32,6 @@ from nautilus_trader.core.uuid cimport UUID
 from nautilus_trader.live.data_client cimport LiveMarketDataClient
 from nautilus_trader.live.data_engine cimport LiveDataEngine
 from nautilus_trader.model.bar cimport Bar
-from nautilus_trader.model.bar cimport BarData
 from nautilus_trader.model.bar cimport BarType
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregation
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregationParser
@@ -49,28 +45,40 @@ from nautilus_trader.model.tick cimport QuoteTick
 
 
 cdef int _SECONDS_IN_HOUR = 60 * 60
+cdef double _STREAM_RETRY_DELAY = 1.0
+
+
+cdef inline str _instrument_name(Security security):
+    # The Oanda instrument name for the security (e.g. 'AUD_USD')
+    return security.symbol.value.replace('/', '_', 1)
 
 
 cdef class OandaDataClient(LiveMarketDataClient):
     """
     Provides a data client for the `Oanda` brokerage.
+
+    All requests run as tasks on the event loop over the pooled connections of
+    an `OandaHttpClient`. Quote ticks for every subscribed security arrive on a
+    single pricing stream, which is restarted when the subscriptions change.
     """
 
     def __init__(
         self,
-        client not None: oandapyV20.API,
+        OandaHttpClient client not None,
         str account_id not None,
         LiveDataEngine engine not None,
         LiveClock clock not None,
         Logger logger not None,
+        str instrument_cache_dir=None,
+        double instrument_cache_ttl=3600,
     ):
         """
         Initialize a new instance of the `OandaDataClient` class.
 
         Parameters
         ----------
-        client : oandapyV20.API
-            The Oanda client.
+        client : OandaHttpClient
+            The Oanda HTTP client.
         account_id : str
             The Oanda account identifier.
         engine : LiveDataEngine
@@ -79,6 +87,10 @@ cdef class OandaDataClient(LiveMarketDataClient):
             The clock for the client.
         logger : Logger
             The logger for the client.
+        instrument_cache_dir : str, optional
+            The directory for the on-disk instrument cache.
+        instrument_cache_ttl : double, optional
+            The maximum age (seconds) of the on-disk instrument cache.
 
         """
         super().__init__(
@@ -97,20 +109,25 @@ cdef class OandaDataClient(LiveMarketDataClient):
 
         self._client = client
         self._account_id = account_id
+        self._instrument_cache_dir = instrument_cache_dir
+        self._instrument_cache_ttl = instrument_cache_ttl
         self._instrument_provider = OandaInstrumentProvider(
             client=self._client,
             account_id=self._account_id,
             load_all=False,
+            cache_dir=self._instrument_cache_dir,
+            cache_ttl=self._instrument_cache_ttl,
         )
 
         self.is_connected = False
 
         # Subscriptions
         self._subscribed_instruments = set()
-        self._subscribed_quote_ticks = {}  # type: dict[Security, (threading.Event, asyncio.Future)]
+        self._subscribed_quote_ticks = {}  # type: dict[str, Security] keyed by Oanda instrument name
+        self._price_stream_task = None
 
         # Scheduled tasks
-        self._update_instruments_handle: asyncio.Handle = None
+        self._update_instruments_task = None
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}"
@@ -137,7 +154,7 @@ cdef class OandaDataClient(LiveMarketDataClient):
         list[Security]
 
         """
-        return sorted(list(self._subscribed_quote_ticks.keys()))
+        return sorted(list(self._subscribed_quote_ticks.values()))
 
     cpdef void connect(self) except *:
         """
@@ -145,33 +162,47 @@ cdef class OandaDataClient(LiveMarketDataClient):
         """
         self._log.info("Connecting...")
 
-        self._loop.run_in_executor(None, self._connect)
-
-    def _connect(self):
         # Schedule subscribed instruments update
-        self._load_instruments()
+        delay = _SECONDS_IN_HOUR
+        update = self._run_after_delay(delay, self._subscribed_instruments_update(delay))
+        self._update_instruments_task = self._loop.create_task(update)
 
-        self._update_instruments_handle: asyncio.Handle = self._loop.call_later(
-            delay=_SECONDS_IN_HOUR,  # Every hour
-            callback=self._subscribed_instruments_update,
-        )
+        self._loop.create_task(self._connect())
 
-        self.is_connected = True
+    async def _connect(self):
+        try:
+            await self._client.connect()
+            await self._load_instruments()
+        except aiohttp.ClientError as ex:
+            self._log_http_error(ex, self._connect.__name__)
+            return
+
+        cdef Instrument instrument
+        for instrument in self._instrument_provider.get_all().values():
+            self._handle_instrument(instrument)
 
+        self.is_connected = True
         self._log.info("Connected.")
 
     cpdef void disconnect(self) except *:
         """
         Disconnect the client.
         """
+        self._loop.create_task(self._disconnect())
+
+    async def _disconnect(self):
         self._log.info("Disconnecting...")
 
-        for security in self._subscribed_quote_ticks.copy():
-            self.unsubscribe_quote_ticks(security)
+        # Cancel update instruments
+        if self._update_instruments_task is not None:
+            self._update_instruments_task.cancel()
+            self._update_instruments_task = None
+
+        # Cancel price stream (once for all subscriptions)
+        self._subscribed_quote_ticks.clear()
+        self._restart_price_stream()
 
-        if self._update_instruments_handle is not None:
-            self._update_instruments_handle.cancel()
-            self._log.debug(f"{self._update_instruments_handle}")
+        await self._client.disconnect()
 
         self.is_connected = False
         self._log.info("Disconnected.")
@@ -180,16 +211,25 @@ cdef class OandaDataClient(LiveMarketDataClient):
         """
         Reset the client.
         """
-        self._client = oandapyV20.API(access_token=self._client.access_token)
+        if self.is_connected:
+            self._log.error("Cannot reset a connected data client.")
+            return
+
+        self._log.info("Resetting...")
+
         self._instrument_provider = OandaInstrumentProvider(
             client=self._client,
             account_id=self._account_id,
             load_all=False,
+            cache_dir=self._instrument_cache_dir,
+            cache_ttl=self._instrument_cache_ttl,
         )
 
         self._subscribed_instruments = set()
         self._subscribed_quote_ticks = {}
 
+        self._log.info("Reset.")
+
     cpdef void dispose(self) except *:
         """
         Dispose the client.
@@ -228,10 +268,10 @@ cdef class OandaDataClient(LiveMarketDataClient):
         """
         Condition.not_none(security, "security")
 
-        if security not in self._subscribed_quote_ticks:
-            event = threading.Event()
-            future = self._loop.run_in_executor(None, self._stream_prices, security, event)
-            self._subscribed_quote_ticks[security] = (event, future)
+        cdef str instrument = _instrument_name(security)
+        if instrument not in self._subscribed_quote_ticks:
+            self._subscribed_quote_ticks[instrument] = security
+            self._restart_price_stream()
 
             self._log.debug(f"Subscribed to quote ticks for {security}.")
 
@@ -290,10 +330,10 @@ cdef class OandaDataClient(LiveMarketDataClient):
         """
         Condition.not_none(security, "security")
 
-        if security in self._subscribed_quote_ticks:
-            event, future = self._subscribed_quote_ticks.pop(security)
-            event.set()
-            future.cancel()
+        cdef str instrument = _instrument_name(security)
+        if instrument in self._subscribed_quote_ticks:
+            del self._subscribed_quote_ticks[instrument]
+            self._restart_price_stream()
 
             self._log.debug(f"Unsubscribed from quote ticks for {security}.")
 
@@ -343,7 +383,7 @@ cdef class OandaDataClient(LiveMarketDataClient):
         Condition.not_none(security, "security")
         Condition.not_none(correlation_id, "correlation_id")
 
-        self._loop.run_in_executor(None, self._request_instrument, security, correlation_id)
+        self._loop.create_task(self._request_instrument(security, correlation_id))
 
     cpdef void request_instruments(self, UUID correlation_id) except *:
         """
@@ -357,7 +397,7 @@ cdef class OandaDataClient(LiveMarketDataClient):
         """
         Condition.not_none(correlation_id, "correlation_id")
 
-        self._loop.run_in_executor(None, self._request_instruments, correlation_id)
+        self._loop.create_task(self._request_instruments(correlation_id))
 
     cpdef void request_quote_ticks(
         self,
@@ -463,66 +503,78 @@ cdef class OandaDataClient(LiveMarketDataClient):
                               f"argument of `{to_datetime}` when not supported by the brokerage "
                               f"(will use `limit` of {limit}).")
 
-        self._loop.run_in_executor(
-            None,
-            self._request_bars,
+        self._loop.create_task(self._request_bars(
             bar_type,
             from_datetime,
             to_datetime,
             limit,
             correlation_id,
-        )
+        ))
 
 # -- INTERNAL --------------------------------------------------------------------------------------
 
-    cpdef void _load_instruments(self) except *:
-        try:
-            self._instrument_provider.load_all()
-        except Exception as ex:
-            self._log.error(f"{type(ex).__name__}: {ex} in _load_instruments")
-            return
+    cdef inline void _log_http_error(self, ex, str method_name) except *:
+        self._log.warning(f"{type(ex).__name__}: {ex} in {method_name}")
+
+    async def _run_after_delay(self, double delay, coro):
+        await asyncio.sleep(delay)
+        return await coro
 
+    async def _load_instruments(self, bint reload=False):
+        await self._instrument_provider.load_all_async(reload)
         self._log.info(f"Updated {self._instrument_provider.count} instruments.")
 
-    cpdef void _request_instrument(self, Security security, UUID correlation_id) except *:
-        self._load_instruments()
+    async def _request_instrument(self, Security security, UUID correlation_id):
+        try:
+            await self._load_instruments(reload=True)
+        except aiohttp.ClientError as ex:
+            self._log_http_error(ex, self._request_instrument.__name__)
+            return
+
         cdef Instrument instrument = self._instrument_provider.get(security)
         if instrument is not None:
-            self._loop.call_soon_threadsafe(self._handle_instruments_py, [instrument], correlation_id)
+            self._handle_instruments([instrument], correlation_id)
         else:
             self._log.error(f"Could not find instrument {security.symbol}.")
 
-    cpdef void _request_instruments(self, UUID correlation_id) except *:
-        self._load_instruments()
-        cdef list instruments = list(self._instrument_provider.get_all().values())
-        self._loop.call_soon_threadsafe(self._handle_instruments_py, instruments, correlation_id)
+    async def _request_instruments(self, UUID correlation_id):
+        try:
+            await self._load_instruments(reload=True)
+        except aiohttp.ClientError as ex:
+            self._log_http_error(ex, self._request_instruments.__name__)
+            return
 
-    cpdef void _subscribed_instruments_update(self) except *:
-        self._loop.run_in_executor(None, self._subscribed_instruments_load_and_send)
+        cdef list instruments = list(self._instrument_provider.get_all().values())
+        self._handle_instruments(instruments, correlation_id)
 
-    cpdef void _subscribed_instruments_load_and_send(self) except *:
-        self._instrument_provider.load_all()
+    async def _subscribed_instruments_update(self, double delay):
+        cdef dict previous = self._instrument_provider.get_all()
+        try:
+            await self._load_instruments(reload=True)
+        except aiohttp.ClientError as ex:
+            self._log_http_error(ex, self._subscribed_instruments_update.__name__)
+        else:
+            # Only send instruments which were added or changed
+            for instrument in self._instrument_provider.changed(previous):
+                self._handle_instrument(instrument)
 
         cdef Security security
-        cdef Instrument instrument
         for security in self._subscribed_instruments:
-            instrument = self._instrument_provider.get(security)
-            if instrument is not None:
-                self._loop.call_soon_threadsafe(self._handle_instrument_py, instrument)
-            else:
+            if self._instrument_provider.get(security) is None:
                 self._log.error(f"Could not find instrument {security.symbol}.")
 
-        # Reschedule subscribed instruments update in one hour
-        self._loop.call_later(_SECONDS_IN_HOUR, self._subscribed_instruments_update)
+        # Reschedule subscribed instruments update
+        update = self._run_after_delay(delay, self._subscribed_instruments_update(delay))
+        self._update_instruments_task = self._loop.create_task(update)
 
-    cpdef void _request_bars(
+    async def _request_bars(
         self,
         BarType bar_type,
         datetime from_datetime,
         datetime to_datetime,
         int limit,
         UUID correlation_id,
-    ) except *:
+    ):
         cdef Instrument instrument = self._instrument_provider.get(bar_type.security)
         if instrument is None:
             self._log.error(f"Cannot request bars (no instrument for {bar_type.security}).")
@@ -601,10 +653,9 @@ cdef class OandaDataClient(LiveMarketDataClient):
 
         cdef dict res
         try:
-            req = InstrumentsCandles(instrument=oanda_name, params=params)
-            res = self._client.request(req)
-        except Exception as ex:
-            self._log.error(str(ex))
+            res = await self._client.candles(oanda_name, params)
+        except aiohttp.ClientError as ex:
+            self._log_http_error(ex, self._request_bars.__name__)
             return
 
         cdef list data = res.get("candles", [])
@@ -626,38 +677,40 @@ cdef class OandaDataClient(LiveMarketDataClient):
         if not last_values["complete"]:
             partial_bar = self._parse_bar(instrument, last_values, bar_type.spec.price_type)
 
-        self._loop.call_soon_threadsafe(
-            self._handle_bars_py,
-            bar_type,
-            bars,
-            partial_bar,
-            correlation_id,
-        )
+        self._handle_bars(bar_type, bars, partial_bar, correlation_id)
 
-    cpdef void _stream_prices(self, Security security, event: threading.Event) except *:
-        cdef dict res
-        cdef dict best_bid
-        cdef dict best_ask
-        cdef QuoteTick tick
-        try:
-            params = {
-                "instruments": security.symbol.replace('/', '_', 1),
-                "sessionId": f"{security.symbol}-001",
-            }
+    cdef inline void _restart_price_stream(self) except *:
+        # One stream serves every subscribed instrument, so it is restarted
+        # with the new instrument list whenever the subscriptions change
+        if self._price_stream_task is not None:
+            self._price_stream_task.cancel()
+            self._price_stream_task = None
 
-            req = PricingStream(accountID=self._account_id, params=params)
+        if self._subscribed_quote_ticks:
+            self._price_stream_task = self._loop.create_task(
+                self._stream_prices(sorted(self._subscribed_quote_ticks.keys())),
+            )
 
+    async def _stream_prices(self, list instruments):
+        cdef dict res
+        cdef Security security
+        try:
             while True:
-                for res in self._client.request(req):
-                    if event.is_set():
-                        raise asyncio.CancelledError("Price stream stopped")
-                    if res["type"] != "PRICE":
-                        # Heartbeat
-                        continue
-                    tick = self._parse_quote_tick(security, res)
-                    self._handle_quote_tick_py(tick)
+                try:
+                    async for res in self._client.stream_pricing(self._account_id, instruments):
+                        if res["type"] != "PRICE":
+                            continue  # Heartbeat
+                        security = self._subscribed_quote_ticks.get(res["instrument"])
+                        if security is None:
+                            continue  # Unsubscribed while streaming
+                        self._handle_quote_tick(self._parse_quote_tick(security, res))
+                except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                    self._log_http_error(ex, self._stream_prices.__name__)
+
+                # Stream ended, dropped or went silent so reconnect after a delay
+                await asyncio.sleep(_STREAM_RETRY_DELAY)
         except asyncio.CancelledError:
-            pass  # Expected cancellation
+            self._log.debug(f"Cancelled `_stream_prices` for {instruments}.")
         except Exception as ex:
             self._log.exception(ex)
 
@@ -688,29 +741,3 @@ cdef class OandaDataClient(LiveMarketDataClient):
             Quantity(values["volume"], instrument.size_precision),
             pd.to_datetime(values["time"]),
         )
-
-# -- PYTHON WRAPPERS -------------------------------------------------------------------------------
-
-    cpdef void _handle_instrument_py(self, Instrument instrument) except *:
-        self._engine.process(instrument)
-
-    cpdef void _handle_quote_tick_py(self, QuoteTick tick) except *:
-        self._engine.process(tick)
-
-    cpdef void _handle_trade_tick_py(self, TradeTick tick) except *:
-        self._engine.process(tick)
-
-    cpdef void _handle_bar_py(self, BarType bar_type, Bar bar) except *:
-        self._engine.process(BarData(bar_type, bar))
-
-    cpdef void _handle_instruments_py(self, list instruments, UUID correlation_id) except *:
-        self._handle_instruments(instruments, correlation_id)
-
-    cpdef void _handle_quote_ticks_py(self, Security security, list ticks, UUID correlation_id) except *:
-        self._handle_quote_ticks(security, ticks, correlation_id)
-
-    cpdef void _handle_trade_ticks_py(self, Security security, list ticks, UUID correlation_id) except *:
-        self._handle_trade_ticks(security, ticks, correlation_id)
-
-    cpdef void _handle_bars_py(self, BarType bar_type, list bars, Bar partial, UUID correlation_id) except *:
-        self._handle_bars(bar_type, bars, partial, correlation_id)
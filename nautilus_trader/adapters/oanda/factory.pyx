@@ -15,9 +15,8 @@
 
 import os
 
-import oandapyV20
-
 from nautilus_trader.adapters.oanda.data cimport OandaDataClient
+from nautilus_trader.adapters.oanda.http cimport OandaHttpClient
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.logging cimport LiveLogger
 from nautilus_trader.data.engine cimport DataEngine
@@ -59,7 +58,11 @@ cdef class OandaDataClientFactory:
         oanda_account_id = os.getenv(config.get("account_id", ""), "")
 
         # Create client
-        client = oandapyV20.API(access_token=oanda_api_token)
+        client = OandaHttpClient(
+            access_token=oanda_api_token,
+            environment=config.get("environment", "practice"),
+            read_timeout=config.get("read_timeout", 30.0),
+        )
 
         return OandaDataClient(
             client=client,
@@ -67,4 +70,6 @@ cdef class OandaDataClientFactory:
             engine=data_engine,
             clock=clock,
             logger=logger,
+            instrument_cache_dir=config.get("instrument_cache_dir"),
+            instrument_cache_ttl=config.get("instrument_cache_ttl", 3600),
         )
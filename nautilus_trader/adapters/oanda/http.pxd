@@ -0,0 +1,26 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+
+cdef class OandaHttpClient:
+    cdef object _session
+    cdef str _access_token
+    cdef int _max_connections
+    cdef double _read_timeout
+
+    cdef readonly str rest_url
+    """The base URL for REST requests.\n\n:returns: `str`"""
+    cdef readonly str stream_url
+    """The base URL for streaming requests.\n\n:returns: `str`"""
@@ -0,0 +1,201 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import json
+
+import aiohttp
+
+from nautilus_trader.core.correctness cimport Condition
+
+_ENVIRONMENTS = {
+    "practice": ("https://api-fxpractice.oanda.com", "https://stream-fxpractice.oanda.com"),
+    "live": ("https://api-fxtrade.oanda.com", "https://stream-fxtrade.oanda.com"),
+}
+
+
+cdef class OandaHttpClient:
+    """
+    Provides an asyncio HTTP client for the Oanda v20 REST and streaming API.
+
+    All requests share one `aiohttp.ClientSession`, so connections are pooled
+    and kept alive between requests. The session is opened on the event loop
+    which first uses the client.
+
+    Reads time out when a connection receives no data for the read timeout.
+    The pricing stream sends a heartbeat every 5 seconds, so a stalled stream
+    raises rather than waiting forever.
+    """
+
+    def __init__(
+        self,
+        str access_token not None,
+        str environment="practice",
+        int max_connections=10,
+        double read_timeout=30.0,
+        str rest_url=None,
+        str stream_url=None,
+    ):
+        """
+        Initialize a new instance of the `OandaHttpClient` class.
+
+        Parameters
+        ----------
+        access_token : str
+            The Oanda API access token.
+        environment : str, optional
+            The Oanda environment ('practice' or 'live').
+        max_connections : int, optional
+            The maximum number of pooled connections.
+        read_timeout : double, optional
+            The maximum time (seconds) to wait for data on a connection.
+        rest_url : str, optional
+            The base URL for REST requests (overrides the environment).
+        stream_url : str, optional
+            The base URL for streaming requests (overrides the environment).
+
+        Raises
+        ------
+        KeyError
+            If environment is not 'practice' or 'live'.
+        ValueError
+            If max_connections is not positive (> 0).
+        ValueError
+            If read_timeout is not positive (> 0).
+
+        """
+        Condition.is_in(environment, _ENVIRONMENTS, "environment", "_ENVIRONMENTS")
+        Condition.positive_int(max_connections, "max_connections")
+        Condition.positive(read_timeout, "read_timeout")
+
+        default_rest_url, default_stream_url = _ENVIRONMENTS[environment]
+
+        self._session = None
+        self._access_token = access_token
+        self._max_connections = max_connections
+        self._read_timeout = read_timeout
+
+        self.rest_url = rest_url or default_rest_url
+        self.stream_url = stream_url or default_stream_url
+
+    @property
+    def is_connected(self):
+        """
+        If the client has an open session.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._session is not None and not self._session.closed
+
+    async def connect(self):
+        """
+        Open the client session.
+        """
+        if self.is_connected:
+            return
+
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self._max_connections),
+            headers={
+                "Authorization": f"Bearer {self._access_token}",
+                "Accept-Datetime-Format": "RFC3339",
+            },
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=self._read_timeout),
+        )
+
+    async def disconnect(self):
+        """
+        Close the client session.
+        """
+        if self._session is None:
+            return
+
+        await self._session.close()
+        self._session = None
+
+    async def account_instruments(self, str account_id):
+        """
+        Request the tradeable instruments for the given account.
+
+        Parameters
+        ----------
+        account_id : str
+            The Oanda account identifier.
+
+        Returns
+        -------
+        dict
+
+        """
+        return await self._get(f"{self.rest_url}/v3/accounts/{account_id}/instruments")
+
+    async def candles(self, str instrument, dict params):
+        """
+        Request candles for the given instrument.
+
+        Parameters
+        ----------
+        instrument : str
+            The Oanda instrument name (e.g. 'AUD_USD').
+        params : dict
+            The query parameters for the request.
+
+        Returns
+        -------
+        dict
+
+        """
+        return await self._get(f"{self.rest_url}/v3/instruments/{instrument}/candles", params)
+
+    async def stream_pricing(self, str account_id, list instruments):
+        """
+        Stream prices for the given instruments.
+
+        Yields each message (including heartbeats) of the stream as it arrives.
+
+        Parameters
+        ----------
+        account_id : str
+            The Oanda account identifier.
+        instruments : list[str]
+            The Oanda instrument names to stream.
+
+        Yields
+        ------
+        dict
+
+        """
+        if not self.is_connected:
+            await self.connect()
+
+        async with self._session.get(
+            f"{self.stream_url}/v3/accounts/{account_id}/pricing/stream",
+            params={"instruments": ",".join(instruments)},
+        ) as response:
+            response.raise_for_status()
+            async for line in response.content:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+    async def _get(self, str url, dict params=None):
+        if not self.is_connected:
+            await self.connect()
+
+        async with self._session.get(url, params=params) as response:
+            response.raise_for_status()
+            return await response.json()
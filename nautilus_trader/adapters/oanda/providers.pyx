@@ -16,9 +16,9 @@
 from datetime import datetime
 from decimal import Decimal
 
-import oandapyV20
 from oandapyV20.endpoints.accounts import AccountInstruments
 
+from nautilus_trader.live.providers cimport InstrumentProvider
 from nautilus_trader.model.c_enums.asset_class cimport AssetClass
 from nautilus_trader.model.c_enums.asset_class cimport AssetClassParser
 from nautilus_trader.model.c_enums.asset_type cimport AssetType
@@ -31,54 +31,93 @@ from nautilus_trader.model.instrument cimport Instrument
 from nautilus_trader.model.objects cimport Quantity
 
 
-cdef class OandaInstrumentProvider:
+cdef class OandaInstrumentProvider(InstrumentProvider):
     """
     Provides a means of loading `Instrument` objects through Oanda.
     """
 
     def __init__(
         self,
-        client not None: oandapyV20.API,
+        client not None,
         str account_id not None,
         bint load_all=False,
+        str cache_dir=None,
+        double cache_ttl=3600,
     ):
         """
         Initialize a new instance of the `OandaInstrumentProvider` class.
 
         Parameters
         ----------
-        client : oandapyV20.API
-            The Oanda client.
+        client : oandapyV20.API or OandaHttpClient
+            The Oanda client (an `OandaHttpClient` for `load_all_async`).
         account_id : str
             The Oanda account identifier.
         load_all : bool, optional
             If all instruments should be loaded at instantiation.
+        cache_dir : str, optional
+            The directory for the on-disk instrument cache.
+        cache_ttl : double, optional
+            The maximum age (seconds) of the on-disk cache.
 
         """
-        self.venue = Venue("OANDA")
-        self.count = 0
-        self._instruments = {}  # type: dict[Security, Instrument]
-        self._client = client
+        self._client = client  # Assign first as `load_all` will call it
         self._account_id = account_id
+        super().__init__(
+            venue=Venue("OANDA"),
+            load_all=load_all,
+            cache_dir=cache_dir,
+            cache_ttl=cache_ttl,
+        )
+
+    async def load_all_async(self, bint reload=False):
+        """
+        Load all instruments for the venue asynchronously.
+
+        Requires the client to be an `OandaHttpClient`. Unless reloading, a
+        valid on-disk cache is used in place of the Oanda API.
 
-        if load_all:
-            self.load_all()
+        Parameters
+        ----------
+        reload : bool, optional
+            If the instruments should be reloaded from the Oanda API.
 
-    cpdef void load_all(self) except *:
+        """
+        cdef dict res = None
+        if not reload:
+            res = self.read_cache()
+
+        if res is None:
+            res = await self._client.account_instruments(self._account_id)
+            if not self.update_cache(res) and self.count > 0:
+                return  # Instruments unchanged since the last load
+
+        self._load_instruments(res)
+
+    cpdef void load_all(self, bint reload=False) except *:
         """
         Load all instruments for the venue.
+
+        Requires the client to be an `oandapyV20.API`. Unless reloading, a
+        valid on-disk cache is used in place of the Oanda API.
+
+        Parameters
+        ----------
+        reload : bool, optional
+            If the instruments should be reloaded from the Oanda API.
+
         """
-        req = AccountInstruments(accountID=self._account_id)
-        res = self._client.request(req)
+        cdef dict res = None
+        if not reload:
+            res = self.read_cache()
 
-        cdef list instruments = res.get("instruments", {})
-        cdef dict values
-        cdef Instrument instrument
-        for values in instruments:
-            instrument = self._parse_instrument(values)
-            self._instruments[instrument.security] = instrument
+        if res is None:
+            req = AccountInstruments(accountID=self._account_id)
+            res = self._client.request(req)
+            if not self.update_cache(res) and self.count > 0:
+                return  # Instruments unchanged since the last load
 
-        self.count = len(self._instruments)
+        self._load_instruments(res)
 
     cpdef dict get_all(self):
         """
@@ -109,6 +148,16 @@ cdef class OandaInstrumentProvider:
         """
         return self._instruments.get(security)
 
+    cdef void _load_instruments(self, dict res) except *:
+        cdef list instruments = res.get("instruments", [])
+        cdef dict values
+        cdef Instrument instrument
+        for values in instruments:
+            instrument = self._parse_instrument(values)
+            self._instruments[instrument.security] = instrument
+
+        self.count = len(self._instruments)
+
     cdef Instrument _parse_instrument(self, dict values):
         cdef str oanda_name = values["name"]
         cdef str oanda_type = values["type"]
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from cpython.datetime cimport date
 from cpython.datetime cimport datetime
 
 from nautilus_trader.model.currency cimport Currency
@@ -21,11 +22,75 @@ from nautilus_trader.model.objects cimport Money
 from nautilus_trader.trading.account cimport Account
 
 
+cdef struct ReturnsAggregate:
+    int count
+    double mean
+    double m2
+    double downside_sq
+    double cum
+    double peak
+    double max_drawdown
+
+
+cdef class RealizedPnLs:
+    cdef dict _index
+    cdef list _position_ids
+    cdef double[:] _values
+    cdef object _series
+    cdef double _winners_sum
+    cdef double _losers_sum
+    cdef double _max
+    cdef double _min
+    cdef double _min_winner
+    cdef double _max_loser
+
+    cdef readonly int count
+    """The count of realized PnLs.\n\n:returns: `int`"""
+    cdef readonly int winners_count
+    """The count of winning realized PnLs.\n\n:returns: `int`"""
+    cdef readonly int losers_count
+    """The count of losing realized PnLs.\n\n:returns: `int`"""
+
+    cpdef void add(self, str position_id, double value) except *
+    cpdef object to_series(self)
+    cpdef double max_winner(self) except *
+    cpdef double max_loser(self) except *
+    cpdef double min_winner(self) except *
+    cpdef double min_loser(self) except *
+    cpdef double avg_winner(self) except *
+    cpdef double avg_loser(self) except *
+    cpdef double win_rate(self) except *
+
+    cdef inline void _apply(self, double value) except *
+    cdef inline void _recalculate(self) except *
+
+
+cdef class DailyReturns:
+    cdef dict _index
+    cdef list _dates
+    cdef double[:] _values
+    cdef object _series
+    cdef ReturnsAggregate _closed
+
+    cdef readonly int count
+    """The count of daily returns.\n\n:returns: `int`"""
+
+    cpdef void add(self, date index_date, double value) except *
+    cpdef object to_series(self)
+    cpdef double mean(self) except *
+    cpdef double variance(self, int ddof=*) except *
+    cpdef double downside_deviation(self) except *
+    cpdef double cum_return(self) except *
+    cpdef double max_drawdown(self) except *
+
+    cdef inline ReturnsAggregate _aggregate(self) except *
+
+
 cdef class PerformanceAnalyzer:
     cdef dict _account_balances_starting
     cdef dict _account_balances
     cdef dict _realized_pnls
-    cdef object _daily_returns
+    cdef DailyReturns _daily_returns
 
     cpdef void calculate_statistics(self, Account account, list positions) except *
     cpdef void add_positions(self, list positions) except *
@@ -63,6 +128,8 @@ cdef class PerformanceAnalyzer:
     cpdef double alpha(self) except *
     cpdef double beta(self) except *
 
+    cdef inline RealizedPnLs _get_realized_pnls(self, Currency currency)
+
     cpdef dict get_performance_stats_pnls(self, Currency currency=*)
     cpdef list get_performance_stats_pnls_formatted(self, Currency currency=*)
     cpdef dict get_performance_stats_returns(self)
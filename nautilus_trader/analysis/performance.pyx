@@ -15,17 +15,16 @@
 
 from cpython.datetime cimport date
 from cpython.datetime cimport datetime
+from libc.math cimport INFINITY
+from libc.math cimport NAN
+from libc.math cimport copysign
+from libc.math cimport isinf
+from libc.math cimport pow
+from libc.math cimport sqrt
 
 from empyrical import alpha
-from empyrical import annual_return
-from empyrical import annual_volatility
 from empyrical import beta
-from empyrical import calmar_ratio
-from empyrical import cum_returns_final
-from empyrical import max_drawdown
 from empyrical import omega_ratio
-from empyrical import sharpe_ratio
-from empyrical import sortino_ratio
 from empyrical import stability_of_timeseries
 from empyrical import tail_ratio
 import numpy as np
@@ -35,17 +34,439 @@ from scipy.stats import kurtosis
 from scipy.stats import skew
 
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.core.functions cimport fast_mean
 from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.trading.account cimport Account
 
 
+cdef int _TRADING_DAYS = 252
+cdef int _INITIAL_CAPACITY = 64
+
+
+cdef inline void _fold_return(ReturnsAggregate* aggregate, double value) except *:
+    # Welford online update of the mean and sum of squared differences, with
+    # the running compounded return, peak and maximum drawdown
+    aggregate.count += 1
+    cdef double delta = value - aggregate.mean
+    aggregate.mean += delta / aggregate.count
+    aggregate.m2 += delta * (value - aggregate.mean)
+    if value < 0:
+        aggregate.downside_sq += value * value
+    aggregate.cum *= 1 + value
+    if aggregate.cum > aggregate.peak:
+        aggregate.peak = aggregate.cum
+    cdef double drawdown = (aggregate.cum - aggregate.peak) / aggregate.peak
+    if drawdown < aggregate.max_drawdown:
+        aggregate.max_drawdown = drawdown
+
+
+cdef inline ReturnsAggregate _empty_aggregate() except *:
+    cdef ReturnsAggregate aggregate
+    aggregate.count = 0
+    aggregate.mean = 0
+    aggregate.m2 = 0
+    aggregate.downside_sq = 0
+    aggregate.cum = 1
+    aggregate.peak = 1
+    aggregate.max_drawdown = 0
+    return aggregate
+
+
+cdef inline object _grow(double[:] values, int count):
+    buffer = np.zeros(max(_INITIAL_CAPACITY, 2 * values.shape[0]), dtype=float64)
+    buffer[:count] = np.asarray(values[:count])
+    return buffer
+
+
+cdef inline double _divide(double numerator, double denominator) except *:
+    # Follows numpy semantics for a zero denominator rather than raising
+    if denominator == 0:
+        if numerator == 0:
+            return NAN
+        return copysign(INFINITY, numerator)
+
+    return numerator / denominator
+
+
+cdef class RealizedPnLs:
+    """
+    Provides a growable buffer of realized PnLs keyed by position, with running
+    winner and loser statistics.
+
+    The buffer is only materialized as a `pd.Series` on request.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new instance of the `RealizedPnLs` class.
+        """
+        self._index = {}          # type: dict[str, int]
+        self._position_ids = []   # type: list[str]
+        self._values = np.zeros(_INITIAL_CAPACITY, dtype=float64)
+        self._series = None
+        self._winners_sum = 0
+        self._losers_sum = 0
+        self._max = 0
+        self._min = 0
+        self._min_winner = 0
+        self._max_loser = 0
+
+        self.count = 0
+        self.winners_count = 0
+        self.losers_count = 0
+
+    cpdef void add(self, str position_id, double value) except *:
+        """
+        Add the realized PnL for the given position.
+
+        If a PnL was already added for the position then it is replaced.
+
+        Parameters
+        ----------
+        position_id : str
+            The position identifier value for the PnL.
+        value : double
+            The realized PnL value.
+
+        """
+        Condition.not_none(position_id, "position_id")
+
+        self._series = None
+
+        cdef int row = self._index.get(position_id, -1)
+        if row != -1:
+            # Replacing a value invalidates the running statistics
+            self._values[row] = value
+            self._recalculate()
+            return
+
+        if self.count == self._values.shape[0]:
+            self._values = _grow(self._values, self.count)
+
+        self._index[position_id] = self.count
+        self._position_ids.append(position_id)
+        self._values[self.count] = value
+        self.count += 1
+
+        self._apply(value)
+
+    cpdef object to_series(self):
+        """
+        Return the realized PnLs indexed by position identifier value.
+
+        Returns
+        -------
+        pd.Series
+
+        """
+        if self._series is None:
+            self._series = pd.Series(
+                np.asarray(self._values[:self.count]).copy(),
+                index=self._position_ids.copy(),
+                dtype=float64,
+            )
+
+        return self._series
+
+    cpdef double max_winner(self) except *:
+        """
+        Return the maximum realized PnL.
+
+        Returns
+        -------
+        double
+
+        """
+        return self._max
+
+    cpdef double max_loser(self) except *:
+        """
+        Return the minimum realized PnL.
+
+        Returns
+        -------
+        double
+
+        """
+        return self._min
+
+    cpdef double min_winner(self) except *:
+        """
+        Return the minimum winning realized PnL.
+
+        Returns
+        -------
+        double
+
+        """
+        return self._min_winner
+
+    cpdef double min_loser(self) except *:
+        """
+        Return the least losing realized PnL.
+
+        Returns
+        -------
+        double
+
+        """
+        return self._max_loser
+
+    cpdef double avg_winner(self) except *:
+        """
+        Return the average winning realized PnL.
+
+        Returns
+        -------
+        double
+
+        """
+        if self.winners_count == 0:
+            return 0
+
+        return self._winners_sum / self.winners_count
+
+    cpdef double avg_loser(self) except *:
+        """
+        Return the average losing realized PnL.
+
+        Returns
+        -------
+        double
+
+        """
+        if self.losers_count == 0:
+            return 0
+
+        return self._losers_sum / self.losers_count
+
+    cpdef double win_rate(self) except *:
+        """
+        Return the ratio of winning realized PnLs.
+
+        Returns
+        -------
+        double
+
+        """
+        if self.count == 0:
+            return 0
+
+        return self.winners_count / <double>self.count
+
+    cdef inline void _apply(self, double value) except *:
+        if self.winners_count + self.losers_count == 0:
+            self._max = value
+            self._min = value
+        elif value > self._max:
+            self._max = value
+        elif value < self._min:
+            self._min = value
+
+        if value > 0:
+            if self.winners_count == 0 or value < self._min_winner:
+                self._min_winner = value
+            self._winners_sum += value
+            self.winners_count += 1
+        else:
+            if self.losers_count == 0 or value > self._max_loser:
+                self._max_loser = value
+            self._losers_sum += value
+            self.losers_count += 1
+
+    cdef inline void _recalculate(self) except *:
+        self._winners_sum = 0
+        self._losers_sum = 0
+        self._max = 0
+        self._min = 0
+        self._min_winner = 0
+        self._max_loser = 0
+        self.winners_count = 0
+        self.losers_count = 0
+
+        cdef int i
+        for i in range(self.count):
+            self._apply(self._values[i])
+
+
+cdef class DailyReturns:
+    """
+    Provides a growable buffer of returns aggregated by date, with running
+    statistics.
+
+    Statistics are maintained online (Welford's algorithm for the variance,
+    with the running compounded return and peak for the drawdown) over all
+    dates except the latest, which can still receive returns and is folded in
+    on each query. The buffer is only materialized as a `pd.Series` on request.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new instance of the `DailyReturns` class.
+        """
+        self._index = {}  # type: dict[date, int]
+        self._dates = []  # type: list[date]
+        self._values = np.zeros(_INITIAL_CAPACITY, dtype=float64)
+        self._series = None
+        self._closed = _empty_aggregate()
+
+        self.count = 0
+
+    cpdef void add(self, date index_date, double value) except *:
+        """
+        Add the given return value to the given date.
+
+        Parameters
+        ----------
+        index_date : date
+            The date for the return.
+        value : double
+            The return value to add.
+
+        """
+        Condition.not_none(index_date, "index_date")
+
+        self._series = None
+
+        cdef int row = self._index.get(index_date, -1)
+        if row != -1:
+            self._values[row] += value
+            if row < self._closed.count:
+                # Amended a closed date, fold the closed dates again
+                self._closed = _empty_aggregate()
+                for row in range(self.count - 1):
+                    _fold_return(&self._closed, self._values[row])
+            return
+
+        if self.count > 0:
+            # Close the previous latest date
+            _fold_return(&self._closed, self._values[self.count - 1])
+
+        if self.count == self._values.shape[0]:
+            self._values = _grow(self._values, self.count)
+
+        self._index[index_date] = self.count
+        self._dates.append(index_date)
+        self._values[self.count] = value
+        self.count += 1
+
+    cpdef object to_series(self):
+        """
+        Return the returns indexed by date.
+
+        Returns
+        -------
+        pd.Series
+
+        """
+        if self._series is None:
+            self._series = pd.Series(
+                np.asarray(self._values[:self.count]).copy(),
+                index=self._dates.copy(),
+                dtype=float64,
+            )
+
+        return self._series
+
+    cpdef double mean(self) except *:
+        """
+        Return the mean of the returns.
+
+        Returns
+        -------
+        double
+            NaN if no returns.
+
+        """
+        if self.count == 0:
+            return NAN
+
+        return self._aggregate().mean
+
+    cpdef double variance(self, int ddof=0) except *:
+        """
+        Return the variance of the returns.
+
+        Parameters
+        ----------
+        ddof : int
+            The delta degrees of freedom.
+
+        Returns
+        -------
+        double
+            NaN if insufficient returns.
+
+        """
+        if self.count - ddof <= 0:
+            return NAN
+
+        return self._aggregate().m2 / (self.count - ddof)
+
+    cpdef double downside_deviation(self) except *:
+        """
+        Return the root mean square of the negative returns.
+
+        Returns
+        -------
+        double
+            NaN if no returns.
+
+        """
+        if self.count == 0:
+            return NAN
+
+        return sqrt(self._aggregate().downside_sq / self.count)
+
+    cpdef double cum_return(self) except *:
+        """
+        Return the compounded cumulative return.
+
+        Returns
+        -------
+        double
+            NaN if no returns.
+
+        """
+        if self.count == 0:
+            return NAN
+
+        return self._aggregate().cum - 1
+
+    cpdef double max_drawdown(self) except *:
+        """
+        Return the maximum drawdown of the compounded returns.
+
+        Returns
+        -------
+        double
+            NaN if no returns.
+
+        """
+        if self.count == 0:
+            return NAN
+
+        return self._aggregate().max_drawdown
+
+    cdef inline ReturnsAggregate _aggregate(self) except *:
+        cdef ReturnsAggregate aggregate = self._closed
+        if self.count > 0:
+            _fold_return(&aggregate, self._values[self.count - 1])
+
+        return aggregate
+
+
 cdef class PerformanceAnalyzer:
     """
     Provides a performance analyzer for tracking and generating performance
     metrics and statistics.
+
+    Realized PnLs and daily returns are held in preallocated buffers which
+    maintain running statistics as data is added, so the PnL statistics and
+    the moment based return statistics are available without recomputing over
+    the full history. The remaining return statistics are calculated from a
+    `pd.Series` which is only materialized when first requested after new data.
     """
 
     def __init__(self):
@@ -55,7 +476,7 @@ cdef class PerformanceAnalyzer:
         self._account_balances_starting = {}
         self._account_balances = {}
         self._realized_pnls = {}
-        self._daily_returns = pd.Series(dtype=float64)
+        self._daily_returns = DailyReturns()
 
     cpdef void calculate_statistics(self, Account account, list positions) except *:
         """
@@ -75,7 +496,7 @@ cdef class PerformanceAnalyzer:
         self._account_balances_starting = account.starting_balances()
         self._account_balances = account.balances()
         self._realized_pnls = {}
-        self._daily_returns = pd.Series(dtype=float64)
+        self._daily_returns = DailyReturns()
 
         self.add_positions(positions)
 
@@ -112,9 +533,12 @@ cdef class PerformanceAnalyzer:
         Condition.not_none(realized_pnl, "realized_pnl")
 
         cdef Currency currency = realized_pnl.currency
-        realized_pnls = self._realized_pnls.get(currency, pd.Series(dtype=float64))
-        realized_pnls.loc[position_id.value] = realized_pnl.as_double()
-        self._realized_pnls[currency] = realized_pnls
+        cdef RealizedPnLs realized_pnls = self._realized_pnls.get(currency)
+        if realized_pnls is None:
+            realized_pnls = RealizedPnLs()
+            self._realized_pnls[currency] = realized_pnls
+
+        realized_pnls.add(position_id.value, realized_pnl.as_double())
 
     cpdef void add_return(self, datetime timestamp, double value) except *:
         """
@@ -130,11 +554,7 @@ cdef class PerformanceAnalyzer:
         """
         Condition.not_none(timestamp, "time")
 
-        cdef date index_date = timestamp.date()
-        if index_date not in self._daily_returns:
-            self._daily_returns.loc[index_date] = 0
-
-        self._daily_returns.loc[index_date] += value
+        self._daily_returns.add(timestamp.date(), value)
 
     cpdef void reset(self) except *:
         """
@@ -145,7 +565,7 @@ cdef class PerformanceAnalyzer:
         self._account_balances_starting = {}
         self._account_balances = {}
         self._realized_pnls = {}
-        self._daily_returns = pd.Series(dtype=float64)
+        self._daily_returns = DailyReturns()
 
     cpdef object get_realized_pnls(self, Currency currency=None):
         """
@@ -158,9 +578,12 @@ cdef class PerformanceAnalyzer:
         """
         if len(self._realized_pnls) == 0:
             return pd.Series(dtype=float64)
-        if currency is None:
-            return next(iter(self._realized_pnls.values()))
-        return self._realized_pnls.get(currency)
+
+        cdef RealizedPnLs realized_pnls = self._get_realized_pnls(currency)
+        if realized_pnls is None:
+            return None
+
+        return realized_pnls.to_series()
 
     cpdef double total_pnl(self, Currency currency=None) except *:
         """
@@ -216,14 +639,11 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.get_realized_pnls(currency)
+        cdef RealizedPnLs realized_pnls = self._get_realized_pnls(currency)
         if realized_pnls is None:
             return 0
 
-        if len(realized_pnls.index) == 0:
-            return 0
-
-        return max(realized_pnls)
+        return realized_pnls.max_winner()
 
     cpdef double max_loser(self, Currency currency=None) except *:
         """
@@ -234,14 +654,11 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.get_realized_pnls(currency)
+        cdef RealizedPnLs realized_pnls = self._get_realized_pnls(currency)
         if realized_pnls is None:
             return 0
 
-        if len(realized_pnls.index) == 0:
-            return 0
-
-        return min(realized_pnls)
+        return realized_pnls.max_loser()
 
     cpdef double min_winner(self, Currency currency=None) except *:
         """
@@ -252,15 +669,11 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.get_realized_pnls(currency)
+        cdef RealizedPnLs realized_pnls = self._get_realized_pnls(currency)
         if realized_pnls is None:
             return 0
 
-        cdef list winners = [x for x in realized_pnls if x > 0]
-        if realized_pnls is None or len(winners) == 0:
-            return 0
-
-        return min(winners)
+        return realized_pnls.min_winner()
 
     cpdef double min_loser(self, Currency currency=None) except *:
         """
@@ -271,15 +684,11 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.get_realized_pnls(currency)
+        cdef RealizedPnLs realized_pnls = self._get_realized_pnls(currency)
         if realized_pnls is None:
             return 0
 
-        cdef list losers = [x for x in realized_pnls if x <= 0]
-        if len(losers) == 0:
-            return 0
-
-        return max(losers)  # max is least loser
+        return realized_pnls.min_loser()
 
     cpdef double avg_winner(self, Currency currency=None) except *:
         """
@@ -290,15 +699,11 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.get_realized_pnls(currency)
+        cdef RealizedPnLs realized_pnls = self._get_realized_pnls(currency)
         if realized_pnls is None:
             return 0
 
-        cdef list winners = [x for x in realized_pnls if x > 0]
-        if len(winners) == 0:
-            return 0
-
-        return fast_mean(winners)
+        return realized_pnls.avg_winner()
 
     cpdef double avg_loser(self, Currency currency=None) except *:
         """
@@ -309,15 +714,11 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.get_realized_pnls(currency)
+        cdef RealizedPnLs realized_pnls = self._get_realized_pnls(currency)
         if realized_pnls is None:
             return 0
 
-        cdef list losers = [x for x in realized_pnls if x <= 0]
-        if len(losers) == 0:
-            return 0
-
-        return fast_mean(losers)
+        return realized_pnls.avg_loser()
 
     cpdef double win_rate(self, Currency currency=None) except *:
         """
@@ -328,17 +729,11 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.get_realized_pnls(currency)
+        cdef RealizedPnLs realized_pnls = self._get_realized_pnls(currency)
         if realized_pnls is None:
             return 0
 
-        if len(realized_pnls) == 0:
-            return 0
-
-        cdef list winners = [x for x in realized_pnls if x > 0]
-        cdef list losers = [x for x in realized_pnls if x <= 0]
-
-        return len(winners) / float(max(1, (len(winners) + len(losers))))
+        return realized_pnls.win_rate()
 
     cpdef double expectancy(self, Currency currency=None) except *:
         """
@@ -349,17 +744,22 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        realized_pnls = self.get_realized_pnls(currency)
-        if realized_pnls is None:
-            return 0
-
-        if len(realized_pnls) == 0:
+        cdef RealizedPnLs realized_pnls = self._get_realized_pnls(currency)
+        if realized_pnls is None or realized_pnls.count == 0:
             return 0
 
-        cdef double win_rate = self.win_rate()
+        cdef double win_rate = realized_pnls.win_rate()
         cdef double loss_rate = 1 - win_rate
 
-        return (self.avg_winner() * win_rate) + (self.avg_loser() * loss_rate)
+        return (realized_pnls.avg_winner() * win_rate) + (realized_pnls.avg_loser() * loss_rate)
+
+    cdef inline RealizedPnLs _get_realized_pnls(self, Currency currency):
+        if currency is None:
+            if len(self._realized_pnls) == 0:
+                return None
+            return next(iter(self._realized_pnls.values()))
+
+        return self._realized_pnls.get(currency)
 
     cpdef object get_daily_returns(self):
         """
@@ -369,7 +769,7 @@ cdef class PerformanceAnalyzer:
         -------
         pd.Series
         """
-        return self._daily_returns
+        return self._daily_returns.to_series()
 
     cpdef double annual_return(self) except *:
         """
@@ -384,7 +784,11 @@ cdef class PerformanceAnalyzer:
         This is equivalent to the compound annual growth rate.
 
         """
-        return annual_return(returns=self._daily_returns)
+        if self._daily_returns.count == 0:
+            return NAN
+
+        cdef double years = self._daily_returns.count / <double>_TRADING_DAYS
+        return pow(self._daily_returns.cum_return() + 1, 1 / years) - 1
 
     cpdef double cum_return(self) except *:
         """
@@ -395,7 +799,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return cum_returns_final(returns=self._daily_returns)
+        return self._daily_returns.cum_return()
 
     cpdef double max_drawdown_return(self) except *:
         """
@@ -406,7 +810,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return max_drawdown(returns=self._daily_returns)
+        return self._daily_returns.max_drawdown()
 
     cpdef double annual_volatility(self) except *:
         """
@@ -417,7 +821,10 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return annual_volatility(returns=self._daily_returns)
+        if self._daily_returns.count < 2:
+            return NAN
+
+        return sqrt(self._daily_returns.variance(ddof=1)) * sqrt(_TRADING_DAYS)
 
     cpdef double sharpe_ratio(self) except *:
         """
@@ -428,7 +835,13 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return sharpe_ratio(returns=self._daily_returns)
+        if self._daily_returns.count < 2:
+            return NAN
+
+        return _divide(
+            self._daily_returns.mean(),
+            sqrt(self._daily_returns.variance(ddof=1)),
+        ) * sqrt(_TRADING_DAYS)
 
     cpdef double calmar_ratio(self) except *:
         """
@@ -439,7 +852,15 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return calmar_ratio(returns=self._daily_returns)
+        cdef double max_drawdown = self._daily_returns.max_drawdown()
+        if not max_drawdown < 0:
+            return NAN
+
+        cdef double ratio = self.annual_return() / -max_drawdown
+        if isinf(ratio):
+            return NAN
+
+        return ratio
 
     cpdef double sortino_ratio(self) except *:
         """
@@ -450,7 +871,13 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return sortino_ratio(returns=self._daily_returns)
+        if self._daily_returns.count < 2:
+            return NAN
+
+        return _divide(
+            self._daily_returns.mean() * _TRADING_DAYS,
+            self._daily_returns.downside_deviation() * sqrt(_TRADING_DAYS),
+        )
 
     cpdef double omega_ratio(self) except *:
         """
@@ -461,7 +888,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return omega_ratio(returns=self._daily_returns)
+        return omega_ratio(returns=self._daily_returns.to_series())
 
     cpdef double stability_of_timeseries(self) except *:
         """
@@ -472,7 +899,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return stability_of_timeseries(returns=self._daily_returns)
+        return stability_of_timeseries(returns=self._daily_returns.to_series())
 
     cpdef double returns_mean(self) except *:
         """
@@ -483,7 +910,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return np.mean(self._daily_returns)
+        return self._daily_returns.mean()
 
     cpdef double returns_variance(self) except *:
         """
@@ -494,7 +921,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return np.var(self._daily_returns)
+        return self._daily_returns.variance()
 
     cpdef double returns_skew(self) except *:
         """
@@ -505,7 +932,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return skew(self._daily_returns)
+        return skew(self._daily_returns.to_series())
 
     cpdef double returns_kurtosis(self) except *:
         """
@@ -516,7 +943,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return kurtosis(self._daily_returns)
+        return kurtosis(self._daily_returns.to_series())
 
     cpdef double returns_tail_ratio(self) except *:
         """
@@ -527,7 +954,7 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return tail_ratio(self._daily_returns)
+        return tail_ratio(self._daily_returns.to_series())
 
     cpdef double alpha(self) except *:
         """
@@ -538,7 +965,8 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return alpha(returns=self._daily_returns, factor_returns=self._daily_returns)
+        cdef object returns = self._daily_returns.to_series()
+        return alpha(returns=returns, factor_returns=returns)
 
     cpdef double beta(self) except *:
         """
@@ -549,7 +977,8 @@ cdef class PerformanceAnalyzer:
         double
 
         """
-        return beta(returns=self._daily_returns, factor_returns=self._daily_returns)
+        cdef object returns = self._daily_returns.to_series()
+        return beta(returns=returns, factor_returns=returns)
 
     cpdef dict get_performance_stats_pnls(self, Currency currency=None):
         """
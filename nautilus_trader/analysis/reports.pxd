@@ -14,8 +14,6 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.model.events cimport AccountState
-from nautilus_trader.model.order.base cimport Order
-from nautilus_trader.model.position cimport Position
 from nautilus_trader.trading.account cimport Account
 
 
@@ -24,7 +22,13 @@ cdef class ReportProvider:
     cpdef object generate_order_fills_report(self, list orders)
     cpdef object generate_positions_report(self, list positions)
     cpdef object generate_account_report(self, Account account)
+    cpdef int write_orders_report(self, list orders, str path, int chunk_size=*) except *
+    cpdef int write_order_fills_report(self, list orders, str path, int chunk_size=*) except *
+    cpdef int write_positions_report(self, list positions, str path, int chunk_size=*) except *
 
-    cdef dict _order_to_dict(self, Order order)
-    cdef dict _position_to_dict(self, Position position)
+    cdef dict _orders_columns(self, list orders, bint as_double)
+    cdef dict _positions_columns(self, list positions, bint as_double)
+    cdef object _orders_frame(self, dict columns)
+    cdef object _write_chunk(self, writer, str path, dict columns, schema)
+    cdef void _write_empty(self, str path, schema) except *
     cdef dict _account_state_to_dict(self, AccountState event)
@@ -13,7 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from datetime import timedelta
+
+import numpy as np
+from numpy import float64
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.model.c_enums.order_side cimport OrderSideParser
@@ -24,10 +30,51 @@ from nautilus_trader.model.order.base cimport Order
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.trading.account cimport Account
 
+# Parquet schemas for the written reports (quantities are written as doubles,
+# durations as integer microseconds as pyarrow cannot write duration types)
+_ORDERS_SCHEMA = pa.schema([
+    ("cl_ord_id", pa.string()),
+    ("order_id", pa.string()),
+    ("security", pa.string()),
+    ("side", pa.string()),
+    ("type", pa.string()),
+    ("quantity", pa.float64()),
+    ("avg_price", pa.float64()),
+    ("slippage", pa.float64()),
+    ("timestamp", pa.timestamp("us", tz="UTC")),
+])
+
+_POSITIONS_SCHEMA = pa.schema([
+    ("position_id", pa.string()),
+    ("security", pa.string()),
+    ("strategy_id", pa.string()),
+    ("entry", pa.string()),
+    ("peak_quantity", pa.float64()),
+    ("opened_time", pa.timestamp("us", tz="UTC")),
+    ("closed_time", pa.timestamp("us", tz="UTC")),
+    ("duration_us", pa.int64()),
+    ("avg_open", pa.float64()),
+    ("avg_close", pa.float64()),
+    ("realized_points", pa.float64()),
+    ("realized_return", pa.float64()),
+    ("realized_pnl", pa.float64()),
+    ("currency", pa.string()),
+])
+
+_MICROSECOND = timedelta(microseconds=1)
+
 
 cdef class ReportProvider:
     """
     Provides various trading reports.
+
+    Order and position reports are assembled column by column in a single pass
+    over the given objects, with numeric fields filled into typed arrays. The
+    same columns can be written directly to a Parquet file in chunks, so large
+    reports do not need to be held in memory as a single `pd.DataFrame`.
+
+    Quantities are `Quantity` objects in the `pd.DataFrame` reports, and are
+    written as doubles in the Parquet reports.
     """
 
     def __init__(self):
@@ -54,9 +101,7 @@ cdef class ReportProvider:
         if not orders:
             return pd.DataFrame()
 
-        cdef list orders_all = [self._order_to_dict(o) for o in orders]
-
-        return pd.DataFrame(data=orders_all).set_index("cl_ord_id").sort_index()
+        return self._orders_frame(self._orders_columns(orders, False))
 
     cpdef object generate_order_fills_report(self, list orders):
         """
@@ -77,14 +122,12 @@ cdef class ReportProvider:
         if not orders:
             return pd.DataFrame()
 
-        cdef list filled_orders = [
-            self._order_to_dict(o) for o in orders if o.state == OrderState.FILLED
-        ]
+        cdef list filled_orders = [o for o in orders if o.state == OrderState.FILLED]
 
         if not filled_orders:
             return pd.DataFrame()
 
-        return pd.DataFrame(data=filled_orders).set_index("cl_ord_id").sort_index()
+        return self._orders_frame(self._orders_columns(filled_orders, False))
 
     cpdef object generate_positions_report(self, list positions):
         """
@@ -105,12 +148,12 @@ cdef class ReportProvider:
         if not positions:
             return pd.DataFrame()
 
-        cdef list trades = [self._position_to_dict(p) for p in positions if p.is_closed]
+        cdef list trades = [p for p in positions if p.is_closed]
 
         if not trades:
             return pd.DataFrame()
 
-        return pd.DataFrame(data=trades).set_index("position_id").sort_values(
+        return pd.DataFrame(data=self._positions_columns(trades, False)).set_index("position_id").sort_values(
             ['opened_time', 'closed_time', 'position_id'],
         )
 
@@ -142,37 +185,262 @@ cdef class ReportProvider:
 
         return pd.DataFrame(data=account_events).set_index("timestamp").sort_index()
 
-    cdef dict _order_to_dict(self, Order order):
+    cpdef int write_orders_report(self, list orders, str path, int chunk_size=100000) except *:
+        """
+        Write an orders report to the given Parquet file path.
+
+        The orders are written in chunks of the given size, in the order given.
+        Orders without an average price are written with a NaN `avg_price`.
+        If there are no orders then an empty file with the report schema is
+        written.
+
+        Parameters
+        ----------
+        orders : list[Order]
+            The orders for the report.
+        path : str
+            The path for the Parquet file.
+        chunk_size : int
+            The number of orders to write per row group.
+
+        Returns
+        -------
+        int
+            The number of rows written.
+
+        Raises
+        ------
+        ValueError
+            If path is not a valid string.
+        ValueError
+            If chunk_size is not positive (> 0).
+
+        """
+        Condition.not_none(orders, "orders")
+        Condition.valid_string(path, "path")
+        Condition.positive_int(chunk_size, "chunk_size")
+
+        writer = None
+        cdef int i
+        try:
+            for i in range(0, len(orders), chunk_size):
+                writer = self._write_chunk(
+                    writer,
+                    path,
+                    self._orders_columns(orders[i:i + chunk_size], True),
+                    _ORDERS_SCHEMA,
+                )
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is None:
+            self._write_empty(path, _ORDERS_SCHEMA)
+
+        return len(orders)
+
+    cpdef int write_order_fills_report(self, list orders, str path, int chunk_size=100000) except *:
+        """
+        Write an order fills report to the given Parquet file path.
+
+        Only filled orders are written, in chunks of the given size and in the
+        order given. If there are no filled orders then an empty file with the
+        report schema is written.
+
+        Parameters
+        ----------
+        orders : list[Order]
+            The orders for the report.
+        path : str
+            The path for the Parquet file.
+        chunk_size : int
+            The number of filled orders to write per row group.
+
+        Returns
+        -------
+        int
+            The number of rows written.
+
+        Raises
+        ------
+        ValueError
+            If path is not a valid string.
+        ValueError
+            If chunk_size is not positive (> 0).
+
+        """
+        Condition.not_none(orders, "orders")
+
+        return self.write_orders_report(
+            [o for o in orders if o.state == OrderState.FILLED],
+            path,
+            chunk_size,
+        )
+
+    cpdef int write_positions_report(self, list positions, str path, int chunk_size=100000) except *:
+        """
+        Write a positions report to the given Parquet file path.
+
+        Only closed positions are written, in chunks of the given size and in
+        the order given. If there are no closed positions then an empty file
+        with the report schema is written. The open duration of each position
+        is written as integer microseconds to the 'duration_us' column.
+
+        Parameters
+        ----------
+        positions : list[Position]
+            The positions for the report.
+        path : str
+            The path for the Parquet file.
+        chunk_size : int
+            The number of positions to write per row group.
+
+        Returns
+        -------
+        int
+            The number of rows written.
+
+        Raises
+        ------
+        ValueError
+            If path is not a valid string.
+        ValueError
+            If chunk_size is not positive (> 0).
+
+        """
+        Condition.not_none(positions, "positions")
+        Condition.valid_string(path, "path")
+        Condition.positive_int(chunk_size, "chunk_size")
+
+        cdef list trades = [p for p in positions if p.is_closed]
+
+        writer = None
+        cdef int i
+        cdef dict columns
+        try:
+            for i in range(0, len(trades), chunk_size):
+                columns = self._positions_columns(trades[i:i + chunk_size], True)
+                columns["duration_us"] = [d // _MICROSECOND for d in columns.pop("duration")]
+                writer = self._write_chunk(writer, path, columns, _POSITIONS_SCHEMA)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is None:
+            self._write_empty(path, _POSITIONS_SCHEMA)
+
+        return len(trades)
+
+    cdef dict _orders_columns(self, list orders, bint as_double):
+        cdef int count = len(orders)
+        cdef list cl_ord_ids = [None] * count
+        cdef list order_ids = [None] * count
+        cdef list securities = [None] * count
+        cdef list sides = [None] * count
+        cdef list types = [None] * count
+        cdef list timestamps = [None] * count
+        cdef list quantities = [None] * count
+        cdef double[:] avg_prices = np.empty(count, dtype=float64)
+        cdef double[:] slippages = np.empty(count, dtype=float64)
+
+        cdef int i
+        cdef Order order
+        for i in range(count):
+            order = orders[i]
+            cl_ord_ids[i] = order.cl_ord_id.value
+            order_ids[i] = order.id.value
+            securities[i] = order.security.value
+            sides[i] = OrderSideParser.to_str(order.side)
+            types[i] = OrderTypeParser.to_str(order.type)
+            quantities[i] = order.quantity.as_double() if as_double else order.quantity
+            avg_prices[i] = np.nan if order.avg_price is None else float(order.avg_price)
+            slippages[i] = float(order.slippage)
+            timestamps[i] = order.last_event_c().timestamp
+
         return {
-            "cl_ord_id": order.cl_ord_id.value,
-            "order_id": order.id.value,
-            "security": order.security.value,
-            "side": OrderSideParser.to_str(order.side),
-            "type": OrderTypeParser.to_str(order.type),
-            "quantity": order.quantity,
-            "avg_price": "None" if order.avg_price is None else float(order.avg_price),
-            "slippage": float(order.slippage),
-            "timestamp": order.last_event_c().timestamp,
+            "cl_ord_id": cl_ord_ids,
+            "order_id": order_ids,
+            "security": securities,
+            "side": sides,
+            "type": types,
+            "quantity": quantities,
+            "avg_price": np.asarray(avg_prices),
+            "slippage": np.asarray(slippages),
+            "timestamp": timestamps,
         }
 
-    cdef dict _position_to_dict(self, Position position):
+    cdef dict _positions_columns(self, list positions, bint as_double):
+        cdef int count = len(positions)
+        cdef list position_ids = [None] * count
+        cdef list securities = [None] * count
+        cdef list strategy_ids = [None] * count
+        cdef list entries = [None] * count
+        cdef list opened_times = [None] * count
+        cdef list closed_times = [None] * count
+        cdef list durations = [None] * count
+        cdef list currencies = [None] * count
+        cdef list peak_quantities = [None] * count
+        cdef double[:] avg_opens = np.empty(count, dtype=float64)
+        cdef double[:] avg_closes = np.empty(count, dtype=float64)
+        cdef double[:] realized_points = np.empty(count, dtype=float64)
+        cdef double[:] realized_returns = np.empty(count, dtype=float64)
+        cdef double[:] realized_pnls = np.empty(count, dtype=float64)
+
+        cdef int i
+        cdef Position position
+        for i in range(count):
+            position = positions[i]
+            position_ids[i] = position.id.value
+            securities[i] = position.security.value
+            strategy_ids[i] = position.strategy_id.tag.value
+            entries[i] = OrderSideParser.to_str(position.entry)
+            peak_quantities[i] = position.peak_quantity.as_double() if as_double else position.peak_quantity
+            opened_times[i] = position.opened_time
+            closed_times[i] = position.closed_time
+            durations[i] = position.open_duration
+            avg_opens[i] = float(position.avg_open)
+            avg_closes[i] = float(position.avg_close)
+            realized_points[i] = float(position.realized_points)
+            realized_returns[i] = float(position.realized_return)
+            realized_pnls[i] = position.realized_pnl.as_double()
+            currencies[i] = position.quote_currency.code
+
         return {
-            "position_id": position.id.value,
-            "security": position.security.value,
-            "strategy_id": position.strategy_id.tag.value,
-            "entry": OrderSideParser.to_str(position.entry),
-            "peak_quantity": position.peak_quantity,
-            "opened_time": position.opened_time,
-            "closed_time": position.closed_time,
-            "duration": position.open_duration,
-            "avg_open": float(position.avg_open),
-            "avg_close": float(position.avg_close),
-            "realized_points": float(position.realized_points),
-            "realized_return": float(position.realized_return),
-            "realized_pnl": float(position.realized_pnl),
-            "currency": str(position.quote_currency),
+            "position_id": position_ids,
+            "security": securities,
+            "strategy_id": strategy_ids,
+            "entry": entries,
+            "peak_quantity": peak_quantities,
+            "opened_time": opened_times,
+            "closed_time": closed_times,
+            "duration": durations,
+            "avg_open": np.asarray(avg_opens),
+            "avg_close": np.asarray(avg_closes),
+            "realized_points": np.asarray(realized_points),
+            "realized_return": np.asarray(realized_returns),
+            "realized_pnl": np.asarray(realized_pnls),
+            "currency": currencies,
         }
 
+    cdef object _orders_frame(self, dict columns):
+        report = pd.DataFrame(data=columns).set_index("cl_ord_id").sort_index()
+        report["avg_price"] = report["avg_price"].astype(object).where(report["avg_price"].notna(), "None")
+
+        return report
+
+    cdef object _write_chunk(self, writer, str path, dict columns, schema):
+        table = pa.Table.from_pydict(columns, schema=schema)
+        if writer is None:
+            writer = pq.ParquetWriter(path, schema)
+
+        writer.write_table(table)
+
+        return writer
+
+    cdef void _write_empty(self, str path, schema) except *:
+        # Write the schema so readers of the report do not fail
+        pq.write_table(schema.empty_table(), path)
+
     cdef dict _account_state_to_dict(self, AccountState event):
         cdef dict data = {"timestamp": event.timestamp}
         for balance in event.balances:
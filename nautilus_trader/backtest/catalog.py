@@ -0,0 +1,641 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+"""
+The `ParquetDataCatalog` stores backtest and research data as a partitioned
+Parquet dataset.
+
+Data is written under the catalog root, partitioned by data kind, venue,
+security (and bar specification) and UTC date::
+
+    <root>/quote_ticks/venue=SIM/security=AUD~2FUSD.SIM,FX,SPOT/date=2020-01-02/part-00000.parquet
+    <root>/bars/venue=SIM/security=.../aggregation=MINUTE/price_type=BID/date=.../part-00000.parquet
+
+Each date holds one or more part files, numbered in the order written (data
+appended to a date is written as the next part).
+
+Partition values are serializable strings with any characters which are not
+safe in a path escaped as '~XX' (the hex value of each UTF-8 byte). The escape
+is decoded by the catalog itself rather than by the hive partitioning, as
+versions of pyarrow differ in whether partition values are URI decoded.
+
+Reads are filtered on the partition keys before any file is opened, and the
+time range filter is pushed down to the Parquet row group statistics, so only
+the data requested is read.
+"""
+
+import os
+import re
+from typing import Dict, Iterator, List, Optional, Set
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from nautilus_trader.backtest.data_container import BacktestDataContainer
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.model.c_enums.bar_aggregation import BarAggregationParser
+from nautilus_trader.model.c_enums.price_type import PriceTypeParser
+from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.identifiers import Security
+from nautilus_trader.model.instrument import Instrument
+
+QUOTE_TICKS = "quote_ticks"
+TRADE_TICKS = "trade_ticks"
+BARS = "bars"
+
+_TIMESTAMP = "timestamp"
+_PARQUET_VERSION = "2.0"  # The pyarrow default of '1.0' coerces nanosecond timestamps to microseconds
+_PARTITION_COLUMNS = ("venue", "security", "aggregation", "price_type", "date")
+_PARTITION_SAFE = frozenset(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.,_-")
+_PARTITION_ESCAPE = re.compile(r"~([0-9A-F]{2})")
+
+_TICK_PARTITIONING = ds.partitioning(
+    pa.schema([("venue", pa.string()), ("security", pa.string()), ("date", pa.string())]),
+    flavor="hive",
+)
+_BAR_PARTITIONING = ds.partitioning(
+    pa.schema([
+        ("venue", pa.string()),
+        ("security", pa.string()),
+        ("aggregation", pa.string()),
+        ("price_type", pa.string()),
+        ("date", pa.string()),
+    ]),
+    flavor="hive",
+)
+
+
+class ParquetDataCatalog:
+    """
+    Provides a catalog of tick and bar data stored as a Parquet dataset
+    partitioned by venue, security and date.
+
+    Data is read back as pandas DataFrames with a UTC `DatetimeIndex` named
+    'timestamp', in the form accepted by the `BacktestDataContainer`.
+    """
+
+    def __init__(self, path: str, row_group_size: int = 100_000):
+        """
+        Initialize a new instance of the `ParquetDataCatalog` class.
+
+        Parameters
+        ----------
+        path : str
+            The root directory of the catalog (created if it does not exist).
+        row_group_size : int
+            The maximum number of rows per Parquet row group written, which
+            bounds the size of each batch when streaming.
+
+        Raises
+        ------
+        ValueError
+            If path is not a valid string.
+        ValueError
+            If row_group_size is not positive (> 0).
+
+        """
+        PyCondition.valid_string(path, "path")
+        PyCondition.positive_int(row_group_size, "row_group_size")
+
+        self.path = path
+        self.row_group_size = row_group_size
+        os.makedirs(path, exist_ok=True)
+
+# -- WRITING ---------------------------------------------------------------------------------------
+
+    def write_quote_ticks(self, security: Security, data: pd.DataFrame, append: bool = False) -> None:
+        """
+        Write the given quote tick data to the catalog.
+
+        Existing data for the same security and dates is replaced, unless
+        appending (such as when writing consecutive chunks of a file).
+
+        Parameters
+        ----------
+        security : Security
+            The security identifier for the data.
+        data : pd.DataFrame
+            The quote tick data with a `DatetimeIndex` (assumed UTC if tz-naive).
+        append : bool
+            If the data should be appended to existing data for the same dates.
+
+        """
+        self._write(QUOTE_TICKS, self._partition_path(QUOTE_TICKS, security), data, append)
+
+    def write_trade_ticks(self, security: Security, data: pd.DataFrame, append: bool = False) -> None:
+        """
+        Write the given trade tick data to the catalog.
+
+        Existing data for the same security and dates is replaced, unless
+        appending (such as when writing consecutive chunks of a file).
+
+        Parameters
+        ----------
+        security : Security
+            The security identifier for the data.
+        data : pd.DataFrame
+            The trade tick data with a `DatetimeIndex` (assumed UTC if tz-naive).
+        append : bool
+            If the data should be appended to existing data for the same dates.
+
+        """
+        self._write(TRADE_TICKS, self._partition_path(TRADE_TICKS, security), data, append)
+
+    def write_bars(
+        self,
+        security: Security,
+        aggregation: BarAggregation,
+        price_type: PriceType,
+        data: pd.DataFrame,
+        append: bool = False,
+    ) -> None:
+        """
+        Write the given bar data to the catalog.
+
+        Existing data for the same security, bar specification and dates is
+        replaced, unless appending (such as when writing consecutive chunks).
+
+        Parameters
+        ----------
+        security : Security
+            The security identifier for the data.
+        aggregation : BarAggregation
+            The bar aggregation of the data.
+        price_type : PriceType
+            The price type of the data.
+        data : pd.DataFrame
+            The bar data with a `DatetimeIndex` (assumed UTC if tz-naive).
+        append : bool
+            If the data should be appended to existing data for the same dates.
+
+        """
+        path = os.path.join(
+            self._partition_path(BARS, security),
+            f"aggregation={BarAggregationParser.to_str_py(aggregation)}",
+            f"price_type={PriceTypeParser.to_str_py(price_type)}",
+        )
+        self._write(BARS, path, data, append)
+
+# -- READING ---------------------------------------------------------------------------------------
+
+    def securities(self, kind: str) -> List[Security]:
+        """
+        Return the securities with data of the given kind in the catalog.
+
+        Parameters
+        ----------
+        kind : str
+            The data kind ('quote_ticks', 'trade_ticks' or 'bars').
+
+        Returns
+        -------
+        list[Security]
+
+        """
+        dataset = self._dataset(kind)
+        if dataset is None:
+            return []
+
+        values = {_partition_keys(fragment.path)["security"] for fragment in dataset.get_fragments()}
+        return sorted(Security.from_serializable_str(_decode(value)) for value in values)
+
+    def quote_ticks(
+        self,
+        securities: Optional[List[Security]] = None,
+        start: Optional[pd.Timestamp] = None,
+        stop: Optional[pd.Timestamp] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Dict[Security, pd.DataFrame]:
+        """
+        Return the quote tick data from the catalog for the given filters.
+
+        Parameters
+        ----------
+        securities : list[Security], optional
+            The securities to read (if None then all securities).
+        start : datetime, optional
+            The start (inclusive) of the time range to read.
+        stop : datetime, optional
+            The stop (inclusive) of the time range to read.
+        columns : list[str], optional
+            The data columns to read (if None then all columns).
+
+        Returns
+        -------
+        dict[Security, pd.DataFrame]
+
+        """
+        return self._read(QUOTE_TICKS, securities, start, stop, columns)
+
+    def trade_ticks(
+        self,
+        securities: Optional[List[Security]] = None,
+        start: Optional[pd.Timestamp] = None,
+        stop: Optional[pd.Timestamp] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Dict[Security, pd.DataFrame]:
+        """
+        Return the trade tick data from the catalog for the given filters.
+
+        Parameters
+        ----------
+        securities : list[Security], optional
+            The securities to read (if None then all securities).
+        start : datetime, optional
+            The start (inclusive) of the time range to read.
+        stop : datetime, optional
+            The stop (inclusive) of the time range to read.
+        columns : list[str], optional
+            The data columns to read (if None then all columns).
+
+        Returns
+        -------
+        dict[Security, pd.DataFrame]
+
+        """
+        return self._read(TRADE_TICKS, securities, start, stop, columns)
+
+    def bars(
+        self,
+        aggregation: BarAggregation,
+        price_type: PriceType,
+        securities: Optional[List[Security]] = None,
+        start: Optional[pd.Timestamp] = None,
+        stop: Optional[pd.Timestamp] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Dict[Security, pd.DataFrame]:
+        """
+        Return the bar data from the catalog for the given filters.
+
+        Parameters
+        ----------
+        aggregation : BarAggregation
+            The bar aggregation to read.
+        price_type : PriceType
+            The price type to read.
+        securities : list[Security], optional
+            The securities to read (if None then all securities).
+        start : datetime, optional
+            The start (inclusive) of the time range to read.
+        stop : datetime, optional
+            The stop (inclusive) of the time range to read.
+        columns : list[str], optional
+            The data columns to read (if None then all columns).
+
+        Returns
+        -------
+        dict[Security, pd.DataFrame]
+
+        """
+        spec = (ds.field("aggregation") == BarAggregationParser.to_str_py(aggregation)) \
+            & (ds.field("price_type") == PriceTypeParser.to_str_py(price_type))
+        return self._read(BARS, securities, start, stop, columns, spec)
+
+    def stream(
+        self,
+        kind: str,
+        securities: Optional[List[Security]] = None,
+        start: Optional[pd.Timestamp] = None,
+        stop: Optional[pd.Timestamp] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Return a generator of data batches from the catalog for the given
+        filters.
+
+        Each security is read a row group at a time, and the data for all
+        securities is merged so that batches are yielded in time order (data
+        with equal timestamps is ordered by security). Memory use is bounded
+        by the row group size times the number of securities, as is the size
+        of each batch. Each batch includes a 'security' column.
+
+        The backtest engine does not consume this stream, and loads data in
+        full with `load_container`.
+
+        Parameters
+        ----------
+        kind : str
+            The data kind ('quote_ticks' or 'trade_ticks').
+        securities : list[Security], optional
+            The securities to read (if None then all securities).
+        start : datetime, optional
+            The start (inclusive) of the time range to read.
+        stop : datetime, optional
+            The stop (inclusive) of the time range to read.
+        columns : list[str], optional
+            The data columns to read (if None then all columns).
+
+        Returns
+        -------
+        Generator[pd.DataFrame]
+
+        Raises
+        ------
+        KeyError
+            If kind is not 'quote_ticks' or 'trade_ticks'.
+
+        """
+        PyCondition.is_in(kind, (QUOTE_TICKS, TRADE_TICKS), "kind", "streamable kinds")
+
+        dataset = self._dataset(kind)
+        if dataset is None:
+            return
+
+        dates: Dict[str, Set[str]] = {}
+        for fragment in dataset.get_fragments(filter=self._filter(securities, start, stop)):
+            keys = _partition_keys(fragment.path)
+            dates.setdefault(keys["security"], set()).add(keys["date"])  # Once per date (of many parts)
+
+        scan_columns = self._scan_columns(dataset, columns, [])
+        yield from _merge_batches([
+            self._stream_security(dataset, value, sorted(dates[value]), scan_columns, start, stop)
+            for value in sorted(dates)
+        ])
+
+    def load_container(
+        self,
+        container: BacktestDataContainer,
+        instruments: List[Instrument],
+        start: Optional[pd.Timestamp] = None,
+        stop: Optional[pd.Timestamp] = None,
+    ) -> None:
+        """
+        Load all tick and bar data for the given instruments into the given
+        backtest data container.
+
+        Parameters
+        ----------
+        container : BacktestDataContainer
+            The container to load into.
+        instruments : list[Instrument]
+            The instruments to load (which are also added to the container).
+        start : datetime, optional
+            The start (inclusive) of the time range to load.
+        stop : datetime, optional
+            The stop (inclusive) of the time range to load.
+
+        """
+        PyCondition.not_none(container, "container")
+        PyCondition.not_none(instruments, "instruments")
+
+        securities = [instrument.security for instrument in instruments]
+        for instrument in instruments:
+            container.add_instrument(instrument)
+
+        for security, data in self.quote_ticks(securities, start, stop).items():
+            container.add_quote_ticks(security, data)
+        for security, data in self.trade_ticks(securities, start, stop).items():
+            container.add_trade_ticks(security, data)
+
+        dataset = self._dataset(BARS)
+        if dataset is None:
+            return
+
+        specs = set()
+        for fragment in dataset.get_fragments(filter=self._filter(securities, start, stop)):
+            keys = _partition_keys(fragment.path)
+            specs.add((keys["aggregation"], keys["price_type"]))
+
+        for aggregation_str, price_type_str in sorted(specs):
+            aggregation = BarAggregationParser.from_str_py(aggregation_str)
+            price_type = PriceTypeParser.from_str_py(price_type_str)
+            for security, data in self.bars(aggregation, price_type, securities, start, stop).items():
+                container.add_bars(security, aggregation, price_type, data)
+
+# --------------------------------------------------------------------------------------------------
+
+    def _partition_path(self, kind: str, security: Security) -> str:
+        PyCondition.not_none(security, "security")
+
+        return os.path.join(
+            self.path,
+            kind,
+            f"venue={_encode(security.venue.value)}",
+            f"security={_encode(security.to_serializable_str())}",
+        )
+
+    def _write(self, kind: str, path: str, data: pd.DataFrame, append: bool) -> None:
+        PyCondition.not_none(data, "data")
+        PyCondition.type(data, pd.DataFrame, "data")
+        PyCondition.type(data.index, pd.DatetimeIndex, "data.index")
+
+        if data.empty:
+            return
+
+        if data.index.tz is None:
+            data = data.tz_localize("UTC")
+        elif str(data.index.tz) != "UTC":
+            data = data.tz_convert("UTC")
+
+        data = data.sort_index(kind="mergesort")  # Stable to preserve order of equal timestamps
+        data.index.name = _TIMESTAMP
+        data = data.reset_index()
+
+        # Partitions must not also be data columns
+        data = data.drop(columns=[c for c in _PARTITION_COLUMNS if c in data.columns])
+
+        dates = data[_TIMESTAMP].dt.strftime("%Y-%m-%d")
+        for date, frame in data.groupby(dates.values, sort=True):
+            date_path = os.path.join(path, f"date={date}")
+            os.makedirs(date_path, exist_ok=True)
+            pq.write_table(
+                pa.Table.from_pandas(frame, preserve_index=False),
+                _next_part_path(date_path, append),
+                row_group_size=self.row_group_size,
+                version=_PARQUET_VERSION,
+            )
+
+    def _dataset(self, kind: str) -> Optional[ds.Dataset]:
+        PyCondition.is_in(kind, (QUOTE_TICKS, TRADE_TICKS, BARS), "kind", "kinds")
+
+        path = os.path.join(self.path, kind)
+        if not os.path.exists(path):
+            return None
+
+        return ds.dataset(
+            path,
+            format="parquet",
+            partitioning=_BAR_PARTITIONING if kind == BARS else _TICK_PARTITIONING,
+        )
+
+    def _filter(
+        self,
+        securities: Optional[List[Security]],
+        start: Optional[pd.Timestamp],
+        stop: Optional[pd.Timestamp],
+    ) -> Optional[ds.Expression]:
+        expression = None
+
+        if securities is not None:
+            expression = ds.field("security").isin([_encode(security.to_serializable_str()) for security in securities])
+
+        if start is not None:
+            start = _as_utc(start)
+            # The date partition filter prunes files, the timestamp filter rows
+            partition = ds.field("date") >= start.strftime("%Y-%m-%d")
+            rows = ds.field(_TIMESTAMP) >= pa.scalar(start.value, pa.timestamp("ns", tz="UTC"))
+            expression = _and(expression, partition & rows)
+
+        if stop is not None:
+            stop = _as_utc(stop)
+            partition = ds.field("date") <= stop.strftime("%Y-%m-%d")
+            rows = ds.field(_TIMESTAMP) <= pa.scalar(stop.value, pa.timestamp("ns", tz="UTC"))
+            expression = _and(expression, partition & rows)
+
+        return expression
+
+    def _scan_columns(self, dataset, columns: Optional[List[str]], extra: List[str]) -> Optional[List[str]]:
+        if columns is None:
+            return [name for name in dataset.schema.names if name not in _PARTITION_COLUMNS] + extra
+        return [_TIMESTAMP] + [c for c in columns if c != _TIMESTAMP] + extra
+
+    def _read(
+        self,
+        kind: str,
+        securities: Optional[List[Security]],
+        start: Optional[pd.Timestamp],
+        stop: Optional[pd.Timestamp],
+        columns: Optional[List[str]],
+        spec: Optional[ds.Expression]=None,
+    ) -> Dict[Security, pd.DataFrame]:
+        dataset = self._dataset(kind)
+        if dataset is None:
+            return {}
+
+        table = dataset.to_table(
+            columns=self._scan_columns(dataset, columns, ["security", "date"]),
+            filter=_and(self._filter(securities, start, stop), spec),
+        )
+        if table.num_rows == 0:
+            return {}
+
+        df = table.to_pandas()
+        data = {}
+        for security_str, frame in df.groupby("security", sort=True, observed=True):
+            # Files are read in any order, so restore time order (stable within each date)
+            frame = frame.sort_values(["date", _TIMESTAMP], kind="mergesort")
+            security = Security.from_serializable_str(_decode(security_str))
+            data[security] = _to_frame(frame.drop(columns=["security", "date"]))
+        return data
+
+    def _stream_security(
+        self,
+        dataset: ds.Dataset,
+        value: str,
+        dates: List[str],
+        columns: List[str],
+        start: Optional[pd.Timestamp],
+        stop: Optional[pd.Timestamp],
+    ) -> Iterator[pd.DataFrame]:
+        # Yield the batches of one security in time order, one date at a time
+        security_str = _decode(value)
+        rows = self._filter(None, start, stop)
+        for date in dates:
+            for batch in dataset.to_batches(
+                columns=columns,
+                filter=_and((ds.field("security") == value) & (ds.field("date") == date), rows),
+                use_threads=False,  # Preserve the row order within each file
+            ):
+                if batch.num_rows == 0:
+                    continue
+                frame = _to_frame(batch.to_pandas())
+                frame["security"] = security_str
+                yield frame
+
+
+def _next_part_path(date_path: str, append: bool) -> str:
+    # Part files are numbered in the order written, so a date is read in order
+    parts = sorted(name for name in os.listdir(date_path) if name.endswith(".parquet"))
+    if not append:
+        for name in parts:
+            os.remove(os.path.join(date_path, name))  # Replace existing data
+        parts = []
+
+    index = len(parts)
+    while os.path.exists(os.path.join(date_path, f"part-{index:05d}.parquet")):
+        index += 1
+
+    return os.path.join(date_path, f"part-{index:05d}.parquet")
+
+
+def _encode(value: str) -> str:
+    return "".join(chr(b) if b in _PARTITION_SAFE else f"~{b:02X}" for b in value.encode())
+
+
+def _decode(value: str) -> str:
+    return _PARTITION_ESCAPE.sub(lambda m: chr(int(m.group(1), 16)), value).encode("latin-1").decode()
+
+
+def _partition_keys(path: str) -> Dict[str, str]:
+    # Parsed from the path, as pyarrow versions differ in how (and whether)
+    # the partition keys of a fragment are exposed
+    keys = {}
+    for segment in path.replace(os.sep, "/").split("/"):
+        key, sep, value = segment.partition("=")
+        if sep and key in _PARTITION_COLUMNS:
+            keys[key] = value
+    return keys
+
+
+def _merge_batches(streams: List[Iterator[pd.DataFrame]]) -> Iterator[pd.DataFrame]:
+    # Merge the given time ordered streams of batches into one, yielding the
+    # rows of every buffered batch up to the earliest last timestamp of them
+    heads = []
+    for stream in streams:
+        head = next(stream, None)
+        if head is not None:
+            heads.append((stream, head))
+
+    while heads:
+        watermark = min(head.index[-1] for _, head in heads)
+        parts = []
+        remaining = []
+        for stream, head in heads:
+            split = head.index.searchsorted(watermark, side="right")
+            parts.append(head.iloc[:split])
+            if split < len(head):
+                remaining.append((stream, head.iloc[split:]))
+            else:
+                head = next(stream, None)
+                if head is not None:
+                    remaining.append((stream, head))
+        heads = remaining
+
+        batch = pd.concat(parts) if len(parts) > 1 else parts[0]
+        yield batch.sort_index(kind="mergesort")  # Stable to keep equal timestamps ordered by security
+
+
+def _as_utc(timestamp) -> pd.Timestamp:
+    timestamp = pd.Timestamp(timestamp)
+    if timestamp.tz is None:
+        return timestamp.tz_localize("UTC")
+    return timestamp.tz_convert("UTC")
+
+
+def _and(left: Optional[ds.Expression], right: Optional[ds.Expression]) -> Optional[ds.Expression]:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return left & right
+
+
+def _to_frame(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.set_index(_TIMESTAMP)
+    df.index = pd.DatetimeIndex(df.index).tz_convert("UTC")
+    return df
@@ -28,6 +28,8 @@ cdef class DataProducerFacade:
     cpdef void setup(self, datetime start, datetime stop) except *
     cpdef void reset(self) except *
     cpdef Tick next_tick(self)
+    cpdef void before_fork(self) except *
+    cpdef void after_fork(self) except *
 
 
 cdef class BacktestDataProducer(DataProducerFacade):
@@ -39,6 +41,11 @@ cdef class BacktestDataProducer(DataProducerFacade):
     cdef object _trade_tick_data
     cdef dict _security_index
     cdef bint _is_connected
+    cdef object _chunk_size
+    cdef object _executor
+    cdef object _next_chunk
+    cdef datetime _chunk_stop
+    cdef datetime _stream_stop
 
     cdef unsigned short[:] _quote_securities
     cdef str[:] _quote_bids
@@ -70,7 +77,14 @@ cdef class BacktestDataProducer(DataProducerFacade):
     cpdef void reset(self) except *
     cpdef void clear(self) except *
     cpdef Tick next_tick(self)
+    cpdef void before_fork(self) except *
+    cpdef void after_fork(self) except *
 
+    cpdef tuple _prepare_chunk(self, datetime start, datetime stop, bint first)
+    cdef void _load_chunk(self, tuple chunk) except *
+    cdef void _load_next_chunk(self) except *
+    cdef void _prefetch_chunk(self) except *
+    cdef void _stop_streaming(self) except *
     cdef inline QuoteTick _generate_quote_tick(self, int index)
     cdef inline TradeTick _generate_trade_tick(self, int index)
     cdef inline void _iterate_quote_ticks(self) except *
@@ -18,6 +18,7 @@ This module provides a data producer for backtesting.
 """
 
 from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 import gc
 import time
 
@@ -32,7 +33,6 @@ from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.functions cimport format_bytes
 from nautilus_trader.core.functions cimport get_size_of
-from nautilus_trader.core.functions cimport slice_dataframe
 from nautilus_trader.data.engine cimport DataEngine
 from nautilus_trader.data.wrangling cimport QuoteTickDataWrangler
 from nautilus_trader.data.wrangling cimport TradeTickDataWrangler
@@ -62,6 +62,18 @@ cdef class DataProducerFacade:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")
 
+    cpdef void before_fork(self) except *:
+        """
+        Prepare the producer for the process being forked.
+        """
+        pass  # Override if the producer holds any threads
+
+    cpdef void after_fork(self) except *:
+        """
+        Restore the producer in the forked child process.
+        """
+        pass  # Override if the producer holds any threads
+
 
 cdef class BacktestDataProducer(DataProducerFacade):
     """
@@ -74,6 +86,7 @@ cdef class BacktestDataProducer(DataProducerFacade):
         DataEngine engine not None,
         Clock clock not None,
         Logger logger not None,
+        timedelta chunk_size=None,
     ):
         """
         Initialize a new instance of the `BacktestDataProducer` class.
@@ -88,8 +101,21 @@ cdef class BacktestDataProducer(DataProducerFacade):
             The clock for the component.
         logger : Logger
             The logger for the component.
+        chunk_size : timedelta, optional
+            The time range of each chunk of the data stream. If None then the
+            whole data stream is prepared on setup, otherwise the stream is
+            prepared a chunk at a time with the next chunk being prepared in a
+            background thread.
+
+        Raises
+        ------
+        ValueError
+            If chunk_size is not positive (> 0).
 
         """
+        if chunk_size is not None:
+            Condition.positive(chunk_size.total_seconds(), "chunk_size")
+
         self._clock = clock
         self._log = LoggerAdapter(type(self).__name__, logger)
         self._data_engine = engine
@@ -218,6 +244,12 @@ cdef class BacktestDataProducer(DataProducerFacade):
         self._trade_index_last = 0
         self._next_trade_tick = None
 
+        self._chunk_size = chunk_size
+        self._executor = None
+        self._next_chunk = None
+        self._chunk_stop = None
+        self._stream_stop = None
+
         self.has_tick_data = False
 
         self._log.info(f"Prepared {len(self._quote_tick_data) + len(self._trade_tick_data):,} "
@@ -257,67 +289,28 @@ cdef class BacktestDataProducer(DataProducerFacade):
 
         self._log.info(f"Pre-processing data stream...")
 
-        # Calculate data size
-        cdef long total_size = 0
+        self._stop_streaming()
 
-        # Build quote tick data stream
-        if not self._quote_tick_data.empty:
-            time_buffer = timedelta(milliseconds=1)  # To ensure we don't pickup an `unwanted` generated tick
-            # See slice_dataframe function comments on why [:] isn't used
-            quote_ticks_slice = slice_dataframe(self._quote_tick_data, start + time_buffer, stop)
-
-            self._quote_securities = quote_ticks_slice["security"].to_numpy(dtype=np.ushort)
-            self._quote_bids = quote_ticks_slice["bid"].values
-            self._quote_asks = quote_ticks_slice["ask"].values
-            self._quote_bid_sizes = quote_ticks_slice["bid_size"].values
-            self._quote_ask_sizes = quote_ticks_slice["ask_size"].values
-            self._quote_timestamps = np.asarray([<datetime>dt for dt in quote_ticks_slice.index])
-
-            # Calculate cumulative data size
-            total_size += get_size_of(self._quote_securities)
-            total_size += get_size_of(self._quote_bids)
-            total_size += get_size_of(self._quote_asks)
-            total_size += get_size_of(self._quote_bid_sizes)
-            total_size += get_size_of(self._quote_ask_sizes)
-            total_size += get_size_of(self._quote_timestamps)
-
-            # Set indexing
-            self._quote_index = 0
-            self._quote_index_last = len(quote_ticks_slice) - 1
-
-            # Prepare initial tick
-            self._iterate_quote_ticks()
-
-        # Build trade tick data stream
-        if not self._trade_tick_data.empty:
-            # See slice_dataframe function comments on why [:] isn't used
-            trade_ticks_slice = slice_dataframe(self._trade_tick_data, start, stop)
-
-            self._trade_securities = trade_ticks_slice["security"].to_numpy(dtype=np.ushort)
-            self._trade_prices = trade_ticks_slice["price"].values
-            self._trade_sizes = trade_ticks_slice["quantity"].values
-            self._trade_match_ids = trade_ticks_slice["match_id"].values
-            self._trade_sides = trade_ticks_slice["side"].values
-            self._trade_timestamps = np.asarray([<datetime>dt for dt in trade_ticks_slice.index])
-
-            # Calculate cumulative data size
-            total_size += get_size_of(self._trade_securities)
-            total_size += get_size_of(self._trade_prices)
-            total_size += get_size_of(self._trade_sizes)
-            total_size += get_size_of(self._trade_match_ids)
-            total_size += get_size_of(self._trade_sides)
-            total_size += get_size_of(self._trade_timestamps)
-
-            # Set indexing
-            self._trade_index = 0
-            self._trade_index_last = len(trade_ticks_slice) - 1
+        if self._chunk_size is None:
+            chunk = self._prepare_chunk(start, stop, True)
+            self._load_chunk(chunk)
+            self._log.info(f"Data stream size: {format_bytes(chunk[2])}")
+            return
 
-            # Prepare initial tick
-            self._iterate_trade_ticks()
+        # Stream the data in chunks, preparing the next chunk in the
+        # background while the current chunk is being consumed.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._stream_stop = stop
+        self._chunk_stop = min(start + self._chunk_size, stop)
 
-        self.has_tick_data = True
+        chunk = self._prepare_chunk(start, self._chunk_stop, True)
+        self._load_chunk(chunk)
+        self._prefetch_chunk()
+        if not self.has_tick_data:
+            self._load_next_chunk()
 
-        self._log.info(f"Data stream size: {format_bytes(total_size)}")
+        self._log.info(f"Streaming data in {self._chunk_size} chunks "
+                       f"(first chunk size: {format_bytes(chunk[2])}).")
 
     cpdef void reset(self) except *:
         """
@@ -327,6 +320,8 @@ cdef class BacktestDataProducer(DataProducerFacade):
         """
         self._log.info(f"Resetting...")
 
+        self._stop_streaming()
+
         self._quote_securities = None
         self._quote_bids = None
         self._quote_asks = None
@@ -393,6 +388,163 @@ cdef class BacktestDataProducer(DataProducerFacade):
             self._iterate_trade_ticks()
             return next_tick
 
+    cpdef void before_fork(self) except *:
+        """
+        Prepare the producer for the process being forked.
+
+        Waits for any chunk being prepared in the background, as the
+        background thread does not exist in the forked child process.
+        """
+        if self._next_chunk is not None:
+            self._next_chunk.result()
+
+    cpdef void after_fork(self) except *:
+        """
+        Restore the producer in the forked child process.
+
+        Replaces the background thread for preparing any subsequent chunks.
+        """
+        if self._executor is not None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+
+    cpdef tuple _prepare_chunk(self, datetime start, datetime stop, bint first):
+        # Slice and convert the tick data between the given start and stop.
+        # The first chunk includes the start, subsequent chunks exclude it so
+        # consecutive chunks never overlap. Called from the background thread
+        # when streaming, so must not log or modify any state.
+        cdef tuple quotes = None
+        cdef tuple trades = None
+        cdef long total_size = 0
+
+        # Build quote tick data stream
+        if not self._quote_tick_data.empty:
+            time_buffer = timedelta(milliseconds=1)  # To ensure we don't pickup an `unwanted` generated tick
+            quote_ticks_slice = _slice_ticks(
+                self._quote_tick_data,
+                start + time_buffer if first else start,
+                stop,
+                first,
+            )
+
+            if not quote_ticks_slice.empty:
+                quotes = (
+                    quote_ticks_slice["security"].to_numpy(dtype=np.ushort),
+                    quote_ticks_slice["bid"].values,
+                    quote_ticks_slice["ask"].values,
+                    quote_ticks_slice["bid_size"].values,
+                    quote_ticks_slice["ask_size"].values,
+                    np.asarray([<datetime>dt for dt in quote_ticks_slice.index]),
+                )
+
+                # Calculate cumulative data size
+                for array in quotes:
+                    total_size += get_size_of(array)
+
+        # Build trade tick data stream
+        if not self._trade_tick_data.empty:
+            trade_ticks_slice = _slice_ticks(self._trade_tick_data, start, stop, first)
+
+            if not trade_ticks_slice.empty:
+                trades = (
+                    trade_ticks_slice["security"].to_numpy(dtype=np.ushort),
+                    trade_ticks_slice["price"].values,
+                    trade_ticks_slice["quantity"].values,
+                    trade_ticks_slice["match_id"].values,
+                    trade_ticks_slice["side"].values,
+                    np.asarray([<datetime>dt for dt in trade_ticks_slice.index]),
+                )
+
+                # Calculate cumulative data size
+                for array in trades:
+                    total_size += get_size_of(array)
+
+        return quotes, trades, total_size
+
+    cdef void _load_chunk(self, tuple chunk) except *:
+        cdef tuple quotes = chunk[0]
+        cdef tuple trades = chunk[1]
+
+        # Release the previous chunk
+        self._quote_securities = None
+        self._quote_bids = None
+        self._quote_asks = None
+        self._quote_bid_sizes = None
+        self._quote_ask_sizes = None
+        self._quote_timestamps = None
+        self._quote_index = 0
+        self._quote_index_last = -1
+        self._next_quote_tick = None
+
+        self._trade_securities = None
+        self._trade_prices = None
+        self._trade_sizes = None
+        self._trade_match_ids = None
+        self._trade_sides = None
+        self._trade_timestamps = None
+        self._trade_index = 0
+        self._trade_index_last = -1
+        self._next_trade_tick = None
+
+        if quotes is not None:
+            self._quote_securities = quotes[0]
+            self._quote_bids = quotes[1]
+            self._quote_asks = quotes[2]
+            self._quote_bid_sizes = quotes[3]
+            self._quote_ask_sizes = quotes[4]
+            self._quote_timestamps = quotes[5]
+            self._quote_index_last = len(quotes[5]) - 1
+
+            # Prepare initial tick
+            self._next_quote_tick = self._generate_quote_tick(0)
+            self._quote_index = 1
+
+        if trades is not None:
+            self._trade_securities = trades[0]
+            self._trade_prices = trades[1]
+            self._trade_sizes = trades[2]
+            self._trade_match_ids = trades[3]
+            self._trade_sides = trades[4]
+            self._trade_timestamps = trades[5]
+            self._trade_index_last = len(trades[5]) - 1
+
+            # Prepare initial tick
+            self._next_trade_tick = self._generate_trade_tick(0)
+            self._trade_index = 1
+
+        self.has_tick_data = self._next_quote_tick is not None or self._next_trade_tick is not None
+
+    cdef void _load_next_chunk(self) except *:
+        # Load the next chunk of the stream (skipping any empty chunks),
+        # blocking until the background thread has prepared it.
+        cdef tuple chunk
+        while self._next_chunk is not None:
+            chunk = self._next_chunk.result()
+            self._next_chunk = None
+            self._prefetch_chunk()
+            self._load_chunk(chunk)
+            if self.has_tick_data:
+                self._log.debug(f"Loaded data chunk ({format_bytes(chunk[2])}).")
+                return
+
+        self.has_tick_data = False
+
+    cdef void _prefetch_chunk(self) except *:
+        if self._chunk_stop >= self._stream_stop:
+            self._stop_streaming()  # Final chunk already prepared
+            return
+
+        cdef datetime start = self._chunk_stop
+        self._chunk_stop = min(start + self._chunk_size, self._stream_stop)
+        self._next_chunk = self._executor.submit(self._prepare_chunk, start, self._chunk_stop, False)
+
+    cdef void _stop_streaming(self) except *:
+        if self._next_chunk is not None:
+            self._next_chunk.cancel()
+            self._next_chunk = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     cdef inline QuoteTick _generate_quote_tick(self, int index):
         return QuoteTick(
             self._security_index[self._quote_securities[index]],
@@ -420,7 +572,7 @@ cdef class BacktestDataProducer(DataProducerFacade):
         else:
             self._next_quote_tick = None
             if self._next_trade_tick is None:
-                self.has_tick_data = False
+                self._load_next_chunk()
 
     cdef inline void _iterate_trade_ticks(self) except *:
         if self._trade_index <= self._trade_index_last:
@@ -429,7 +581,16 @@ cdef class BacktestDataProducer(DataProducerFacade):
         else:
             self._next_trade_tick = None
             if self._next_quote_tick is None:
-                self.has_tick_data = False
+                self._load_next_chunk()
+
+
+cdef inline object _slice_ticks(frame, datetime start, datetime stop, bint include_start):
+    # Slice the time sorted frame by position between the start and stop
+    index = frame.index
+    return frame.iloc[
+        index.searchsorted(start, side="left" if include_start else "right"):
+        index.searchsorted(stop, side="right")
+    ]
 
 
 cdef class CachedProducer(DataProducerFacade):
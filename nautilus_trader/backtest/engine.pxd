@@ -22,11 +22,13 @@ from nautilus_trader.backtest.models cimport FillModel
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.common.profiler cimport Profiler
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.data.engine cimport DataEngine
 from nautilus_trader.execution.engine cimport ExecutionEngine
 from nautilus_trader.model.c_enums.oms_type cimport OMSType
 from nautilus_trader.model.identifiers cimport Venue
+from nautilus_trader.model.tick cimport Tick
 from nautilus_trader.trading.portfolio cimport Portfolio
 from nautilus_trader.trading.trader cimport Trader
 
@@ -44,6 +46,10 @@ cdef class BacktestEngine:
     cdef bint _log_to_file
     cdef bint _exec_db_flush
     cdef dict _exchanges
+    cdef Tick _pending_tick
+    cdef datetime _run_started
+    cdef datetime _run_start
+    cdef datetime _run_stop
 
     cdef readonly Trader trader
     cdef readonly datetime created_time
@@ -51,6 +57,8 @@ cdef class BacktestEngine:
     cdef readonly int iteration
     cdef readonly Portfolio portfolio
     cdef readonly PerformanceAnalyzer analyzer
+    cdef readonly Profiler profiler
+    cdef readonly datetime snapshot_time
 
     cpdef ExecutionEngine get_exec_engine(self)
     cpdef void add_exchange(
@@ -74,7 +82,35 @@ cdef class BacktestEngine:
         list strategies=*,
         bint print_log_store=*,
     ) except *
+    cpdef void snapshot(
+        self,
+        datetime split,
+        datetime start=*,
+        datetime stop=*,
+        list strategies=*,
+    ) except *
+    cpdef list fork(self, list branches, collect, int max_processes=*)
 
+    cdef tuple _fork_branch(self, branch, collect)
+    cdef bytes _reap_branch(self, int pid, int reader)
+    cdef tuple _run_range(self, datetime start, datetime stop, list strategies)
+    cdef void _setup_run(
+        self,
+        datetime run_started,
+        datetime start,
+        datetime stop,
+        list strategies,
+    ) except *
+    cdef void _run_loop(self) except *
+    cdef void _finish_run(
+        self,
+        datetime run_started,
+        datetime start,
+        datetime stop,
+        bint print_log_store,
+    ) except *
+    cdef inline void _process_tick(self, Tick tick) except *
+    cdef void _run_profiled(self) except *
     cdef inline void _advance_time(self, datetime now) except *
     cdef inline void _process_modules(self, datetime now) except *
     cdef inline void _log_header(
@@ -13,9 +13,16 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import os
+import pickle
+import sys
+import traceback
+
 import pytz
 
 from cpython.datetime cimport datetime
+from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
 
 from nautilus_trader.analysis.performance cimport PerformanceAnalyzer
 from nautilus_trader.backtest.data_client cimport BacktestMarketDataClient
@@ -34,6 +41,7 @@ from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.logging cimport TestLogger
 from nautilus_trader.common.logging cimport log_memory
 from nautilus_trader.common.logging cimport nautilus_header
+from nautilus_trader.common.profiler cimport Profiler
 from nautilus_trader.common.timer cimport TimeEventHandler
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.core.correctness cimport Condition
@@ -42,6 +50,7 @@ from nautilus_trader.core.datetime cimport format_iso8601
 from nautilus_trader.core.functions cimport format_bytes
 from nautilus_trader.core.functions cimport get_size_of
 from nautilus_trader.core.functions cimport pad_string
+from nautilus_trader.core.time cimport monotonic_ns
 from nautilus_trader.execution.database cimport BypassExecutionDatabase
 from nautilus_trader.execution.engine cimport ExecutionEngine
 from nautilus_trader.model.c_enums.oms_type cimport OMSType
@@ -70,6 +79,7 @@ cdef class BacktestEngine:
         int tick_capacity=1000,
         int bar_capacity=1000,
         bint use_tick_cache=False,
+        timedelta chunk_size=None,
         str exec_db_type not None="in-memory",
         bint exec_db_flush=True,
         bint bypass_logging=False,
@@ -80,6 +90,7 @@ cdef class BacktestEngine:
         bint log_thread=False,
         bint log_to_file=False,
         str log_file_path not None="backtests/",
+        bint profile=False,
     ):
         """
         Initialize a new instance of the `BacktestEngine` class.
@@ -98,6 +109,12 @@ cdef class BacktestEngine:
             The length for the data engines internal bars deque (> 0).
         use_tick_cache : bool, optional
             If use cache for DataProducer (increased performance with repeated backtests on same data).
+        chunk_size : timedelta, optional
+            The time range of each chunk when streaming the data for a run. If
+            None then all data for the run is prepared up front, otherwise the
+            run is processed in consecutive chunks with the next chunk being
+            prepared in a background thread (bounds the memory used by the
+            data stream).
         exec_db_type : str, optional
             The type for the execution cache (can be the default 'in-memory' or redis).
         exec_db_flush : bool, optional
@@ -118,6 +135,10 @@ cdef class BacktestEngine:
             If log messages should log to a file.
         log_file_path : str, optional
             The name of the log file (cannot be None if log_to_file is True).
+        profile : bool, optional
+            If the cumulative time and call counts of each stage of the main
+            backtest loop, strategy handler and indicator update should be
+            recorded, and logged in the run footer.
 
         Raises
         ------
@@ -125,6 +146,8 @@ cdef class BacktestEngine:
             If tick_capacity is not positive (> 0).
         ValueError
             If bar_capacity is not positive (> 0).
+        ValueError
+            If chunk_size is not positive (> 0).
         TypeError
             If strategies contains a type other than TradingStrategy.
         ValueError
@@ -148,6 +171,7 @@ cdef class BacktestEngine:
         self._uuid_factory = UUIDFactory()
 
         self.analyzer = PerformanceAnalyzer()
+        self.profiler = Profiler() if profile else None
 
         self._logger = TestLogger(
             clock=LiveClock(),
@@ -226,6 +250,7 @@ cdef class BacktestEngine:
             engine=self._data_engine,
             clock=self._test_clock,
             logger=self._test_logger,
+            chunk_size=chunk_size,
         )
 
         if use_tick_cache:
@@ -256,6 +281,7 @@ cdef class BacktestEngine:
         )
 
         self._exec_engine.load_cache()
+        self._exec_engine.register_profiler(self.profiler)
 
         self.trader = Trader(
             trader_id=trader_id,
@@ -272,6 +298,11 @@ cdef class BacktestEngine:
         self._test_clock.set_time(self._clock.utc_now_c())  # For logging consistency
 
         self.iteration = 0
+        self.snapshot_time = None
+        self._pending_tick = None
+        self._run_started = None
+        self._run_start = None
+        self._run_stop = None
 
         self.time_to_initialize = self._clock.delta(self.created_time)
         self._log.info(f"Initialized in {self.time_to_initialize.total_seconds():.3f}s.")
@@ -412,6 +443,8 @@ cdef class BacktestEngine:
             self._exec_engine.flush_db()
         self._exec_engine.reset()
 
+        if self.trader.state_c() == ComponentState.RUNNING:
+            self.trader.stop()  # Paused at a snapshot
         self.trader.reset()
 
         for exchange in self._exchanges.values():
@@ -420,7 +453,12 @@ cdef class BacktestEngine:
         self._logger.clear_log_store()
         self._test_logger.clear_log_store()
 
+        if self.profiler is not None:
+            self.profiler.reset()
+
         self.iteration = 0
+        self.snapshot_time = None
+        self._pending_tick = None
 
         self._log.info("Reset.")
 
@@ -486,6 +524,199 @@ cdef class BacktestEngine:
             If the stop is >= the start datetime.
 
         """
+        start, stop = self._run_range(start, stop, strategies)
+        cdef datetime run_started = self._clock.utc_now_c()
+
+        self._setup_run(run_started, start, stop, strategies)
+        self._run_loop()
+        self._finish_run(run_started, start, stop, print_log_store)
+
+    cpdef void snapshot(
+        self,
+        datetime split,
+        datetime start=None,
+        datetime stop=None,
+        list strategies=None,
+    ) except *:
+        """
+        Run a backtest from the start datetime up to the split datetime, then
+        pause at that point so continuations can be forked from it.
+
+        The engine remains paused with its full state (clocks, exchanges,
+        execution cache, portfolio, strategies and indicators, data stream
+        position) until the next call to `run`, `snapshot` or `reset`.
+
+        Parameters
+        ----------
+        split : datetime
+            The datetime (UTC) to pause the run at (ticks at the split are
+            processed before pausing).
+        start : datetime, optional
+            The start (UTC) for the backtest run. If None engine will run from the start of the data.
+        stop : datetime, optional
+            The stop (UTC) for the continuations. If None continuations will run to the end of the data.
+        strategies : list, optional
+            The strategies for the backtest run (if None will use previous).
+
+        Raises
+        ------
+        ValueError
+            If the stop is >= the start datetime.
+        ValueError
+            If split is not within the start and stop datetimes.
+
+        See Also
+        --------
+        fork
+
+        """
+        Condition.not_none(split, "split")
+
+        start, stop = self._run_range(start, stop, strategies)
+        split = as_utc_timestamp(split)
+        Condition.true(start <= split < stop, "split was not within the start and stop")
+
+        self._run_started = self._clock.utc_now_c()
+        self._setup_run(self._run_started, start, stop, strategies)
+
+        cdef Tick tick
+        while self._data_producer.has_tick_data:
+            tick = self._data_producer.next_tick()
+            if tick.timestamp > split:
+                self._pending_tick = tick  # Processed by the continuations
+                break
+            self._process_tick(tick)
+
+        self._run_start = start
+        self._run_stop = stop
+        self.snapshot_time = split
+
+        self._log.info(f"Snapshot taken at {format_iso8601(split)} after {self.iteration:,} iterations.")
+
+    cpdef list fork(self, list branches, collect, int max_processes=0):
+        """
+        Fork continuations of the backtest from the current snapshot.
+
+        For each branch a child process is forked from the paused engine (the
+        engine state is shared copy-on-write rather than rerun or copied up
+        front). In each child the branch is applied to the engine, the
+        backtest is run to the stop datetime, then the result of `collect` is
+        returned to the parent. The parent engine remains paused at the
+        snapshot so this method can be called repeatedly.
+
+        Only available on platforms supporting `os.fork`, and the execution
+        database should be 'in-memory' as any connections are shared with
+        the child processes.
+
+        Parameters
+        ----------
+        branches : list[callable]
+            The branches to run, each called with the engine in the child
+            before continuing (a branch can be None to continue unchanged).
+        collect : callable
+            The function called with the engine in the child once the run is
+            complete, returning a picklable result.
+        max_processes : int, optional
+            The maximum number of child processes to run at once (if 0 then
+            the number of CPUs).
+
+        Returns
+        -------
+        list[object]
+            The collected results in the order of the branches.
+
+        Raises
+        ------
+        TypeError
+            If collect is not callable.
+        ValueError
+            If no snapshot has been taken.
+        ValueError
+            If max_processes is negative (< 0).
+        RuntimeError
+            If os.fork is not supported on the platform.
+        RuntimeError
+            If a branch fails in its child process.
+
+        See Also
+        --------
+        snapshot
+
+        """
+        Condition.not_none(branches, "branches")
+        Condition.callable(collect, "collect")
+        Condition.not_negative_int(max_processes, "max_processes")
+        Condition.true(self.snapshot_time is not None, "no snapshot was taken")
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Forking backtest continuations requires os.fork")
+
+        if max_processes == 0:
+            max_processes = os.cpu_count() or 1
+
+        self._data_producer.before_fork()
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        cdef list results = []
+        cdef list children
+        cdef list payloads
+        cdef int i
+        cdef int j
+        for i in range(0, len(branches), max_processes):
+            children = []
+            payloads = []
+            try:
+                for j in range(i, min(i + max_processes, len(branches))):
+                    children.append(self._fork_branch(branches[j], collect))
+            finally:
+                # Reap every child of the batch before raising any error
+                for pid, reader in children:
+                    payloads.append(self._reap_branch(pid, reader))
+            for j, payload in enumerate(payloads, start=i):
+                if not payload:
+                    raise RuntimeError(f"Fork branch {j} exited without a result")
+                success, result = pickle.loads(payload)
+                if not success:
+                    raise RuntimeError(f"Fork branch {j} failed in child process:\n{result}")
+                results.append(result)
+
+        return results
+
+    cdef tuple _fork_branch(self, branch, collect):
+        reader, writer = os.pipe()
+        cdef int pid = os.fork()
+        if pid != 0:
+            os.close(writer)  # Parent
+            return pid, reader
+
+        # Child process (must never return from here)
+        os.close(reader)
+        try:
+            try:
+                self._data_producer.after_fork()
+                if branch is not None:
+                    branch(self)
+                self._process_tick(self._pending_tick)
+                self._run_loop()
+                self._finish_run(self._run_started, self._run_start, self._run_stop, False)
+                payload = pickle.dumps((True, collect(self)))
+            except BaseException:
+                payload = pickle.dumps((False, traceback.format_exc()))
+            with os.fdopen(writer, "wb") as pipe:
+                pipe.write(payload)
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(0)
+
+    cdef bytes _reap_branch(self, int pid, int reader):
+        try:
+            with os.fdopen(reader, "rb") as pipe:
+                return pipe.read()
+        finally:
+            os.waitpid(pid, 0)
+
+    cdef tuple _run_range(self, datetime start, datetime stop, list strategies):
         # Setup start datetime
         if start is None:
             start = self._data_producer.min_timestamp
@@ -507,8 +738,15 @@ cdef class BacktestEngine:
             Condition.not_empty(strategies, "strategies")
             Condition.list_type(strategies, TradingStrategy, "strategies")
 
-        cdef datetime run_started = self._clock.utc_now_c()
+        return start, stop
 
+    cdef void _setup_run(
+        self,
+        datetime run_started,
+        datetime start,
+        datetime stop,
+        list strategies,
+    ) except *:
         # Setup logging
         self._test_logger.clear_log_store()
         if self._log_to_file:
@@ -546,22 +784,75 @@ cdef class BacktestEngine:
         self._exec_engine.start()
         self.trader.start()
 
+        if self.profiler is not None:
+            for strategy in self.trader.strategies_c():
+                strategy.register_profiler(self.profiler)
+
+    cdef void _run_loop(self) except *:
         cdef Tick tick
-        # -- MAIN BACKTEST LOOP -----------------------------------------------#
+        if self.profiler is not None:
+            self._run_profiled()
+        else:
+            # -- MAIN BACKTEST LOOP -------------------------------------------#
+            while self._data_producer.has_tick_data:
+                tick = self._data_producer.next_tick()
+                self._advance_time(tick.timestamp)
+                self._exchanges[tick.security.venue].process_tick(tick)
+                self._data_engine.process(tick)
+                self._process_modules(tick.timestamp)
+                self.iteration += 1
+            # -----------------------------------------------------------------#
+
+    cdef void _finish_run(
+        self,
+        datetime run_started,
+        datetime start,
+        datetime stop,
+        bint print_log_store,
+    ) except *:
+        self.trader.stop()
+
+        self._log_footer(run_started, self._clock.utc_now_c(), start, stop)
+        if print_log_store:
+            self.print_log_store()
+
+    cdef inline void _process_tick(self, Tick tick) except *:
+        if tick is None:
+            return
+        self._advance_time(tick.timestamp)
+        self._exchanges[tick.security.venue].process_tick(tick)
+        self._data_engine.process(tick)
+        self._process_modules(tick.timestamp)
+        self.iteration += 1
+
+    cdef void _run_profiled(self) except *:
+        # The main backtest loop with each stage timed (times are inclusive
+        # of any nested stages, such as strategy handlers within the data engine).
+        cdef Profiler profiler = self.profiler
+        cdef Tick tick
+        cdef int64_t ts
         while self._data_producer.has_tick_data:
+            ts = monotonic_ns()
             tick = self._data_producer.next_tick()
+            profiler.record("DataProducer.next_tick", monotonic_ns() - ts)
+
+            ts = monotonic_ns()
             self._advance_time(tick.timestamp)
+            profiler.record("BacktestEngine.advance_time", monotonic_ns() - ts)
+
+            ts = monotonic_ns()
             self._exchanges[tick.security.venue].process_tick(tick)
+            profiler.record("SimulatedExchange.process_tick", monotonic_ns() - ts)
+
+            ts = monotonic_ns()
             self._data_engine.process(tick)
-            self._process_modules(tick.timestamp)
-            self.iteration += 1
-        # ---------------------------------------------------------------------#
+            profiler.record("DataEngine.process", monotonic_ns() - ts)
 
-        self.trader.stop()
+            ts = monotonic_ns()
+            self._process_modules(tick.timestamp)
+            profiler.record("SimulatedExchange.process_modules", monotonic_ns() - ts)
 
-        self._log_footer(run_started, self._clock.utc_now_c(), start, stop)
-        if print_log_store:
-            self.print_log_store()
+            self.iteration += 1
 
     cdef inline void _advance_time(self, datetime now) except *:
         cdef TradingStrategy strategy
@@ -627,6 +918,13 @@ cdef class BacktestEngine:
         self._log.info(f"Total orders: {self._exec_engine.cache.orders_total_count():,}")
         self._log.info(f"Total positions: {self._exec_engine.cache.positions_total_count():,}")
 
+        if self.profiler is not None:
+            self._log.info("=================================================================")
+            self._log.info(" PROFILE (inclusive times)")
+            self._log.info("=================================================================")
+            for line in self.profiler.breakdown():
+                self._log.info(line)
+
         for exchange in self._exchanges.values():
             self._log.info("=================================================================")
             self._log.info(f" {exchange.exec_client.account_id.value}")
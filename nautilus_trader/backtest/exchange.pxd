@@ -47,7 +47,7 @@ from nautilus_trader.model.order.market cimport MarketOrder
 from nautilus_trader.model.order.stop_limit cimport StopLimitOrder
 from nautilus_trader.model.order.stop_market cimport StopMarketOrder
 from nautilus_trader.model.tick cimport Tick
-from nautilus_trader.trading.calculators cimport ExchangeRateCalculator
+from nautilus_trader.trading.calculators cimport ExchangeRateGraph
 
 
 cdef class SimulatedExchange:
@@ -70,7 +70,7 @@ cdef class SimulatedExchange:
     cdef readonly dict account_balances_locked
     cdef readonly dict total_commissions
 
-    cdef readonly ExchangeRateCalculator xrate_calculator
+    cdef readonly ExchangeRateGraph xrate_graph
     cdef readonly FillModel fill_model
     cdef readonly list modules
 
@@ -79,6 +79,7 @@ cdef class SimulatedExchange:
 
     cdef dict _market_bids
     cdef dict _market_asks
+    cdef set _xrate_dirty
     cdef dict _slippages
 
     cdef dict _working_orders
@@ -114,8 +115,6 @@ cdef class SimulatedExchange:
     cdef inline Price get_current_bid(self, Security security)
     cdef inline Price get_current_ask(self, Security security)
     cdef inline object get_xrate(self, Currency from_currency, Currency to_currency, PriceType price_type)
-    cdef inline dict _build_current_bid_rates(self)
-    cdef inline dict _build_current_ask_rates(self)
 
 # -- EVENT HANDLING --------------------------------------------------------------------------------
 
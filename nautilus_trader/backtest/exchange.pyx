@@ -22,6 +22,7 @@ from nautilus_trader.common.clock cimport TestClock
 from nautilus_trader.common.logging cimport TestLogger
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.correctness cimport TRUSTED_MODE
 from nautilus_trader.execution.cache cimport ExecutionCache
 from nautilus_trader.model.c_enums.liquidity_side cimport LiquiditySide
 from nautilus_trader.model.c_enums.oms_type cimport OMSType
@@ -61,7 +62,7 @@ from nautilus_trader.model.order.stop_market cimport StopMarketOrder
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.model.tick cimport QuoteTick
 from nautilus_trader.model.tick cimport Tick
-from nautilus_trader.trading.calculators cimport ExchangeRateCalculator
+from nautilus_trader.trading.calculators cimport ExchangeRateGraph
 
 
 cdef class SimulatedExchange:
@@ -134,7 +135,7 @@ cdef class SimulatedExchange:
         self.account_balances_locked = {b.currency: Money(0, b.currency) for b in starting_balances}
         self.total_commissions = {}
 
-        self.xrate_calculator = ExchangeRateCalculator()
+        self.xrate_graph = ExchangeRateGraph()
         self.fill_model = fill_model
 
         # Load modules
@@ -160,6 +161,7 @@ cdef class SimulatedExchange:
         self._slippages = self._get_tick_sizes()
         self._market_bids = {}          # type: dict[Security, Price]
         self._market_asks = {}          # type: dict[Security, Price]
+        self._xrate_dirty = set()       # type: set[Security]
 
         self._working_orders = {}       # type: dict[ClientOrderId, Order]
         self._position_index = {}       # type: dict[ClientOrderId, PositionId]
@@ -235,7 +237,8 @@ cdef class SimulatedExchange:
             The tick data to process with (`QuoteTick` or `TradeTick`).
 
         """
-        Condition.not_none(tick, "tick")
+        if not TRUSTED_MODE:
+            Condition.not_none(tick, "tick")
 
         self._clock.set_time(tick.timestamp)
 
@@ -264,6 +267,8 @@ cdef class SimulatedExchange:
                 self._market_asks[security] = ask
             # tick.side must be BUY or SELL (condition checked in TradeTick)
 
+        self._xrate_dirty.add(security)  # Graph updated when a rate is next required
+
         cdef PassiveOrder order
         for order in self._working_orders.copy().values():  # Copy dict for safe loop
             if order.security != tick.security:
@@ -327,6 +332,8 @@ cdef class SimulatedExchange:
 
         self._market_bids.clear()
         self._market_asks.clear()
+        self._xrate_dirty.clear()
+        self.xrate_graph.clear()
         self._working_orders.clear()
         self._position_index.clear()
         self._child_orders.clear()
@@ -341,7 +348,8 @@ cdef class SimulatedExchange:
 # -- COMMAND HANDLERS ------------------------------------------------------------------------------
 
     cpdef void handle_submit_order(self, SubmitOrder command) except *:
-        Condition.not_none(command, "command")
+        if not TRUSTED_MODE:
+            Condition.not_none(command, "command")
 
         if command.position_id.not_null():
             self._position_index[command.order.cl_ord_id] = command.position_id
@@ -350,7 +358,8 @@ cdef class SimulatedExchange:
         self._process_order(command.order)
 
     cpdef void handle_submit_bracket_order(self, SubmitBracketOrder command) except *:
-        Condition.not_none(command, "command")
+        if not TRUSTED_MODE:
+            Condition.not_none(command, "command")
 
         cdef PositionId position_id = self._generate_position_id(command.bracket_order.entry.security)
 
@@ -373,12 +382,14 @@ cdef class SimulatedExchange:
         self._process_order(command.bracket_order.entry)
 
     cpdef void handle_cancel_order(self, CancelOrder command) except *:
-        Condition.not_none(command, "command")
+        if not TRUSTED_MODE:
+            Condition.not_none(command, "command")
 
         self._cancel_order(command.cl_ord_id)
 
     cpdef void handle_amend_order(self, AmendOrder command) except *:
-        Condition.not_none(command, "command")
+        if not TRUSTED_MODE:
+            Condition.not_none(command, "command")
 
         self._amend_order(command.cl_ord_id, command.quantity, command.price)
 
@@ -397,38 +408,44 @@ cdef class SimulatedExchange:
         self.exec_client.handle_event(self._generate_account_event())
 
     cdef inline Price get_current_bid(self, Security security):
-        Condition.not_none(security, "security")
+        if not TRUSTED_MODE:
+            Condition.not_none(security, "security")
 
         return self._market_bids.get(security)
 
     cdef inline Price get_current_ask(self, Security security):
-        Condition.not_none(security, "security")
+        if not TRUSTED_MODE:
+            Condition.not_none(security, "security")
 
         return self._market_asks.get(security)
 
     cdef inline object get_xrate(self, Currency from_currency, Currency to_currency, PriceType price_type):
-        Condition.not_none(from_currency, "from_currency")
-        Condition.not_none(to_currency, "to_currency")
-        Condition.not_equal(price_type, PriceType.UNDEFINED, "price_type", "UNDEFINED")
+        if not TRUSTED_MODE:
+            Condition.not_none(from_currency, "from_currency")
+            Condition.not_none(to_currency, "to_currency")
+            Condition.not_equal(price_type, PriceType.UNDEFINED, "price_type", "UNDEFINED")
 
-        return self.xrate_calculator.get_rate(
+        # Update the graph with the latest quotes of the securities ticked
+        # since the last rate, rather than on every tick
+        cdef Security security
+        cdef Price bid
+        cdef Price ask
+        for security in self._xrate_dirty:
+            bid = self._market_bids.get(security)
+            ask = self._market_asks.get(security)
+            if bid is None:
+                bid = ask  # Only trades on the offer so far
+            elif ask is None:
+                ask = bid  # Only trades on the bid so far
+            self.xrate_graph.update(security.symbol.value, bid.as_decimal(), ask.as_decimal())
+        self._xrate_dirty.clear()
+
+        return self.xrate_graph.get_rate(
             from_currency=from_currency,
             to_currency=to_currency,
             price_type=price_type,
-            bid_quotes=self._build_current_bid_rates(),
-            ask_quotes=self._build_current_ask_rates(),
         )
 
-    cdef inline dict _build_current_bid_rates(self):
-        cdef Security security
-        cdef QuoteTick tick
-        return {security.symbol.value: price.as_decimal() for security, price in self._market_bids.items()}
-
-    cdef inline dict _build_current_ask_rates(self):
-        cdef Security security
-        cdef QuoteTick tick
-        return {security.symbol.value: price.as_decimal() for security, price in self._market_asks.items()}
-
 # -- EVENT HANDLING --------------------------------------------------------------------------------
 
     cdef inline object _get_tick_sizes(self):
@@ -13,12 +13,58 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
 import pandas as pd
-
-from cpython.datetime cimport datetime
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 
 from nautilus_trader.core.correctness cimport Condition
 
+# Explicit column types avoid pandas inferring types (and re-scanning) per file.
+# Keys for columns not present in a file are ignored. Repeated string columns
+# are read as categories, then returned as objects (as expected by wranglers).
+_TICK_DTYPES = {
+    "bid": np.float64,
+    "ask": np.float64,
+    "bid_size": np.float64,
+    "ask_size": np.float64,
+    "price": np.float64,
+    "quantity": np.float64,
+}
+
+_BAR_DTYPES = {
+    "open": np.float64,
+    "high": np.float64,
+    "low": np.float64,
+    "close": np.float64,
+    "volume": np.float64,
+}
+
+_TARDIS_TRADE_DTYPES = {
+    "symbol": "category",
+    "local_timestamp": np.int64,
+    "id": str,
+    "side": "category",
+    "price": np.float64,
+    "amount": np.float64,
+}
+
+_TARDIS_QUOTE_DTYPES = {
+    "symbol": "category",
+    "local_timestamp": np.int64,
+    "ask_amount": np.float64,
+    "ask_price": np.float64,
+    "bid_price": np.float64,
+    "bid_amount": np.float64,
+}
+
+_PA_TYPES = {
+    "category": "dictionary",
+    np.int64: "int64",
+    np.float64: "float64",
+    str: "string",
+}
+
 
 cdef class CSVTickDataLoader:
     """
@@ -46,6 +92,7 @@ cdef class CSVTickDataLoader:
             file_path,
             index_col="timestamp",
             parse_dates=True,
+            dtype=_TICK_DTYPES,
         )
 
 
@@ -75,20 +122,21 @@ cdef class CSVBarDataLoader:
             file_path,
             index_col="timestamp",
             parse_dates=True,
+            dtype=_BAR_DTYPES,
         )
 
 
-cdef datetime _ts_parser(str time_in_secs):
-    return datetime.utcfromtimestamp(int(time_in_secs) / 1_000_000.0)
-
-
 cdef class TardisTradeDataLoader:
     """
     Provides a means of loading trade data pandas DataFrames from Tardis CSV files.
+
+    Files may be plain or gzip compressed (as downloaded), with the compression
+    inferred from the file extension. The returned data has a UTC
+    `DatetimeIndex` from the local (receipt) timestamps.
     """
 
     @staticmethod
-    def load(str file_path) -> pd.DataFrame:
+    def load(str file_path, bint use_pyarrow=True) -> pd.DataFrame:
         """
         Return the trade pandas.DataFrame loaded from the given csv file.
 
@@ -96,6 +144,8 @@ cdef class TardisTradeDataLoader:
         ----------
         file_path : str
             The absolute path to the CSV file.
+        use_pyarrow : bool, optional
+            If the pyarrow CSV reader should be used (else the pandas reader).
 
         Returns
         -------
@@ -104,21 +154,52 @@ cdef class TardisTradeDataLoader:
         """
         Condition.not_none(file_path, "file_path")
 
-        df = pd.read_csv(file_path, index_col='local_timestamp', date_parser=_ts_parser, parse_dates=True)
-        df.rename(columns={'id': 'trade_id', 'amount': 'quantity'}, inplace=True)
-        df['side'] = df.side.str.upper()
-        df = df[['symbol', 'trade_id', 'price', 'quantity', 'side']]
+        return _normalize_tardis_trades(_read_csv(file_path, _TARDIS_TRADE_DTYPES, use_pyarrow))
 
-        return df
+    @staticmethod
+    def load_chunks(str file_path, int chunk_size=1_000_000):
+        """
+        Return a generator of trade pandas.DataFrame chunks loaded from the
+        given csv file.
+
+        Only one chunk is held in memory at a time, so large (such as monthly)
+        files can be processed without loading them whole.
+
+        Parameters
+        ----------
+        file_path : str
+            The absolute path to the CSV file.
+        chunk_size : int, optional
+            The maximum number of rows per chunk.
+
+        Returns
+        -------
+        Generator[pd.DataFrame]
+
+        Raises
+        ------
+        ValueError
+            If chunk_size is not positive (> 0).
+
+        """
+        Condition.not_none(file_path, "file_path")
+        Condition.positive_int(chunk_size, "chunk_size")
+
+        for chunk in _read_csv_chunks(file_path, _TARDIS_TRADE_DTYPES, chunk_size):
+            yield _normalize_tardis_trades(chunk)
 
 
 cdef class TardisQuoteDataLoader:
     """
     Provides a means of loading quote data pandas DataFrames from Tardis CSV files.
+
+    Files may be plain or gzip compressed (as downloaded), with the compression
+    inferred from the file extension. The returned data has a UTC
+    `DatetimeIndex` from the local (receipt) timestamps.
     """
 
     @staticmethod
-    def load(str file_path) -> pd.DataFrame:
+    def load(str file_path, bint use_pyarrow=True) -> pd.DataFrame:
         """
         Return the quote pandas.DataFrame loaded from the given csv file.
 
@@ -126,6 +207,8 @@ cdef class TardisQuoteDataLoader:
         ----------
         file_path : str
             The absolute path to the CSV file.
+        use_pyarrow : bool, optional
+            If the pyarrow CSV reader should be used (else the pandas reader).
 
         Returns
         -------
@@ -134,14 +217,95 @@ cdef class TardisQuoteDataLoader:
         """
         Condition.not_none(file_path, "file_path")
 
-        df = pd.read_csv(file_path, index_col='local_timestamp', date_parser=_ts_parser, parse_dates=True)
-        df.rename(
-            columns={'ask_amount': 'ask_size', 'ask_price': 'ask', 'bid_price': 'bid', 'bid_amount': 'bid_size'},
-            inplace=True,
-        )
-        df = df[['symbol', 'ask_size', 'ask', 'bid_size', 'bid']]
+        return _normalize_tardis_quotes(_read_csv(file_path, _TARDIS_QUOTE_DTYPES, use_pyarrow))
+
+    @staticmethod
+    def load_chunks(str file_path, int chunk_size=1_000_000):
+        """
+        Return a generator of quote pandas.DataFrame chunks loaded from the
+        given csv file.
+
+        Only one chunk is held in memory at a time, so large (such as monthly)
+        files can be processed without loading them whole.
+
+        Parameters
+        ----------
+        file_path : str
+            The absolute path to the CSV file.
+        chunk_size : int, optional
+            The maximum number of rows per chunk.
+
+        Returns
+        -------
+        Generator[pd.DataFrame]
+
+        Raises
+        ------
+        ValueError
+            If chunk_size is not positive (> 0).
+
+        """
+        Condition.not_none(file_path, "file_path")
+        Condition.positive_int(chunk_size, "chunk_size")
+
+        for chunk in _read_csv_chunks(file_path, _TARDIS_QUOTE_DTYPES, chunk_size):
+            yield _normalize_tardis_quotes(chunk)
+
+
+cdef object _read_csv(str file_path, dict dtypes, bint use_pyarrow):
+    # Read only the given columns with their explicit types
+    if not use_pyarrow:
+        return pd.read_csv(file_path, usecols=list(dtypes), dtype=dtypes)
+
+    cdef dict column_types = {}
+    for name, dtype in dtypes.items():
+        if _PA_TYPES[dtype] == "dictionary":
+            column_types[name] = pa.dictionary(pa.int32(), pa.string())
+        else:
+            column_types[name] = getattr(pa, _PA_TYPES[dtype])()
+
+    table = pa_csv.read_csv(
+        file_path,
+        convert_options=pa_csv.ConvertOptions(
+            column_types=column_types,
+            include_columns=list(dtypes),
+        ),
+    )
+    return table.to_pandas()
+
+
+def _read_csv_chunks(str file_path, dict dtypes, int chunk_size):
+    with pd.read_csv(file_path, usecols=list(dtypes), dtype=dtypes, chunksize=chunk_size) as reader:
+        for chunk in reader:
+            yield chunk
+
+
+cdef object _as_utc_index(values):
+    # Vectorized conversion of Unix epoch microseconds to a UTC DatetimeIndex
+    return pd.to_datetime(values, unit="us", utc=True)
+
+
+cdef object _normalize_tardis_trades(df):
+    df.index = _as_utc_index(df["local_timestamp"].to_numpy())
+    df.index.name = "local_timestamp"
+    df.rename(columns={"id": "trade_id", "amount": "quantity"}, inplace=True)
+    df["symbol"] = df["symbol"].astype(object)
+    df["side"] = df["side"].astype(object).str.upper()
+
+    return df[["symbol", "trade_id", "price", "quantity", "side"]]
+
+
+cdef object _normalize_tardis_quotes(df):
+    df.index = _as_utc_index(df["local_timestamp"].to_numpy())
+    df.index.name = "local_timestamp"
+    df.rename(
+        columns={"ask_amount": "ask_size", "ask_price": "ask", "bid_price": "bid", "bid_amount": "bid_size"},
+        inplace=True,
+    )
+    df["symbol"] = df["symbol"].astype(object)
+
+    return df[["symbol", "ask_size", "ask", "bid_size", "bid"]]
 
-        return df
 
 cdef class ParquetTickDataLoader:
     """
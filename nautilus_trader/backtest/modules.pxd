@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from cpython.datetime cimport datetime
+from libc.stdint cimport int64_t
 
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
 from nautilus_trader.common.logging cimport LoggerAdapter
@@ -32,9 +33,16 @@ cdef class SimulationModule:
 cdef class FXRolloverInterestModule(SimulationModule):
     cdef RolloverInterestCalculator _calculator
     cdef object _rollover_spread
-    cdef datetime _rollover_time
+    cdef int64_t[:] _day_starts
+    cdef int64_t[:] _rollover_times
+    cdef int[:] _rollover_weekdays
+    cdef int _rollover_index
+    cdef int _last_index
+    cdef int64_t _day_end_ns
+    cdef int64_t _next_check_ns
     cdef bint _rollover_applied
     cdef dict _rollover_totals
-    cdef int _day_number
 
+    cdef int _schedule_index(self, int64_t now_ns) except *
+    cdef void _build_schedule(self, int64_t now_ns) except *
     cdef void _apply_rollover_interest(self, datetime timestamp, int iso_week_day) except *
@@ -14,14 +14,20 @@
 # -------------------------------------------------------------------------------------------------
 
 from cpython.datetime cimport datetime
+from cpython.datetime cimport timedelta
+from libc.stdint cimport INT64_MIN
+from libc.stdint cimport int64_t
 
 from decimal import Decimal
 
+import numpy as np
 import pandas as pd
 import pytz
 
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.correctness cimport TRUSTED_MODE
+from nautilus_trader.core.datetime cimport to_unix_time_ns
 from nautilus_trader.core.functions cimport pad_string
 from nautilus_trader.model.c_enums.asset_class cimport AssetClass
 from nautilus_trader.model.c_enums.price_type cimport PriceType
@@ -78,10 +84,16 @@ cdef class SimulationModule:
 
 
 _TZ_US_EAST = pytz.timezone("US/Eastern")
+_NANOSECONDS_IN_DAY = 86_400_000_000_000
+_SCHEDULE_DAYS = 366
 
 cdef class FXRolloverInterestModule(SimulationModule):
     """
     Provides an FX rollover interest simulation module.
+
+    Rollover occurs at 17:00 US/Eastern. The rollover times are precomputed as
+    a schedule of Unix nanosecond timestamps (extended a year at a time), so
+    that processing a tick between rollovers is a single integer comparison.
     """
 
     def __init__(self, rate_data not None: pd.DataFrame):
@@ -96,10 +108,11 @@ cdef class FXRolloverInterestModule(SimulationModule):
         """
         super().__init__()
         self._calculator = RolloverInterestCalculator(data=rate_data)
-        self._rollover_time = None  # Initialized at first rollover
-        self._rollover_applied = False
+        self._day_starts = np.empty(0, dtype=np.int64)
+        self._rollover_times = np.empty(0, dtype=np.int64)
+        self._rollover_weekdays = np.empty(0, dtype=np.int32)
         self._rollover_totals = {}
-        self._day_number = 0
+        self.reset()
 
     cpdef void process(self, datetime now) except *:
         """
@@ -111,27 +124,55 @@ cdef class FXRolloverInterestModule(SimulationModule):
             The current time in the simulated exchange.
 
         """
-        Condition.not_none(now, "now")
+        if not TRUSTED_MODE:
+            Condition.not_none(now, "now")
+
+        cdef int64_t now_ns = to_unix_time_ns(now)
+        if now_ns < self._next_check_ns:
+            return  # Nothing to do until the next day or rollover
 
-        cdef datetime rollover_local
-        if self._day_number != now.day:
+        if now_ns >= self._day_end_ns:
             # Set account statistics for new day
-            self._day_number = now.day
+            self._day_end_ns = now_ns - now_ns % _NANOSECONDS_IN_DAY + _NANOSECONDS_IN_DAY
+            self._rollover_index = self._schedule_index(now_ns)
             self._rollover_applied = False
 
-            rollover_local = now.astimezone(_TZ_US_EAST)
-            self._rollover_time = _TZ_US_EAST.localize(datetime(
-                rollover_local.year,
-                rollover_local.month,
-                rollover_local.day,
-                17),
-            ).astimezone(pytz.utc)
-
         # Check for and apply any rollover interest
-        if not self._rollover_applied and now >= self._rollover_time:
-            self._apply_rollover_interest(now, self._rollover_time.isoweekday())
+        if not self._rollover_applied and now_ns >= self._rollover_times[self._rollover_index]:
+            self._apply_rollover_interest(now, self._rollover_weekdays[self._rollover_index])
             self._rollover_applied = True
 
+        if self._rollover_applied:
+            self._next_check_ns = self._day_end_ns
+        else:
+            self._next_check_ns = min(self._rollover_times[self._rollover_index], self._day_end_ns)
+
+    cdef int _schedule_index(self, int64_t now_ns) except *:
+        # Return the schedule index for the US/Eastern date containing now_ns
+        cdef int i
+        if self._day_starts.shape[0] == 0 \
+                or now_ns < self._day_starts[0] \
+                or now_ns >= self._day_starts[self._day_starts.shape[0] - 1]:
+            self._build_schedule(now_ns)
+
+        i = self._last_index
+        while i + 1 < self._day_starts.shape[0] and self._day_starts[i + 1] <= now_ns:
+            i += 1
+        while i > 0 and self._day_starts[i] > now_ns:
+            i -= 1
+
+        self._last_index = i
+        return i
+
+    cdef void _build_schedule(self, int64_t now_ns) except *:
+        # Schedule from the day before now (US/Eastern) for the next year
+        start = pd.Timestamp(now_ns, tz="UTC").tz_convert(_TZ_US_EAST).date() - timedelta(days=1)
+        days = pd.date_range(start, periods=_SCHEDULE_DAYS, freq="D")
+        self._day_starts = days.tz_localize(_TZ_US_EAST).tz_convert("UTC").asi8.copy()
+        self._rollover_times = (days + pd.Timedelta(hours=17)).tz_localize(_TZ_US_EAST).tz_convert("UTC").asi8.copy()
+        self._rollover_weekdays = (days.dayofweek.values + 1).astype(np.int32)
+        self._last_index = 0
+
     cdef void _apply_rollover_interest(self, datetime timestamp, int iso_week_day) except *:
         cdef list open_positions = self._exchange.exec_cache.positions_open()
 
@@ -201,7 +242,9 @@ cdef class FXRolloverInterestModule(SimulationModule):
         log.info(f"Rollover interest (totals):  {rollover_interest}")
 
     cpdef void reset(self) except *:
-        self._rollover_time = None  # Initialized at first rollover
         self._rollover_applied = False
         self._rollover_totals = {}
-        self._day_number = 0
+        self._rollover_index = 0
+        self._last_index = 0
+        self._day_end_ns = INT64_MIN  # Initialized at first tick
+        self._next_check_ns = INT64_MIN
@@ -17,7 +17,6 @@ from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
 from cpython.datetime cimport tzinfo
 
-from nautilus_trader.common.timer cimport LiveTimer
 from nautilus_trader.common.timer cimport TimeEvent
 from nautilus_trader.common.timer cimport Timer
 from nautilus_trader.common.uuid cimport UUIDFactory
@@ -70,7 +69,7 @@ cdef class Clock:
         datetime start_time,
         datetime stop_time,
     )
-    cdef inline void _add_timer(self, Timer timer, handler: callable) except *
+    cdef void _add_timer(self, Timer timer, handler: callable) except *
     cdef inline void _remove_timer(self, Timer timer) except *
     cdef inline void _update_stack(self) except *
     cdef inline void _update_timing(self) except *
@@ -87,6 +86,17 @@ cdef class TestClock(Clock):
 cdef class LiveClock(Clock):
     cdef object _loop
     cdef tzinfo _utc
-    cpdef void _raise_time_event(self, LiveTimer timer) except *
+    cdef list _scheduled
+    cdef long _sequence
+    cdef object _condition
+    cdef object _handle
+    cdef datetime _handle_time
+    cdef object _thread
 
-    cdef inline void _handle_time_event(self, TimeEvent event) except *
+    cpdef void dispose(self) except *
+    cpdef void _fire_timers(self) except *
+    cpdef void _run_scheduler(self) except *
+
+    cdef inline void _schedule(self, Timer timer) except *
+    cdef inline void _arm(self) except *
+    cdef inline list _pop_due(self, datetime now)
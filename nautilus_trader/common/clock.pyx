@@ -13,6 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from heapq import heappop
+from heapq import heappush
+from threading import Condition as ThreadCondition
+from threading import Thread
+from threading import current_thread
+
 import cython
 import numpy as np
 import pytz
@@ -21,9 +27,8 @@ from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
 from cpython.datetime cimport tzinfo
 
-from nautilus_trader.common.timer cimport LoopTimer
+from nautilus_trader.common.timer cimport ScheduledTimer
 from nautilus_trader.common.timer cimport TestTimer
-from nautilus_trader.common.timer cimport ThreadTimer
 from nautilus_trader.common.timer cimport TimeEventHandler
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.core.correctness cimport Condition
@@ -339,7 +344,7 @@ cdef class Clock:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")
 
-    cdef inline void _add_timer(self, Timer timer, handler: callable) except *:
+    cdef void _add_timer(self, Timer timer, handler: callable) except *:
         self._timers[timer.name] = timer
         self._handlers[timer.name] = handler
         self._update_stack()
@@ -497,13 +502,20 @@ cdef class TestClock(Clock):
 cdef class LiveClock(Clock):
     """
     Provides a clock for live trading. All times are timezone aware UTC.
+
+    All timers are driven by a single scheduler owned by the clock, which keeps
+    the timers in a heap ordered by their next time. Only one callback is armed
+    on the event loop (or one scheduler thread runs if no loop is given) for the
+    earliest next time, and all timers due at that time fire together from the
+    same callback. Cancelling all timers (or disposing the clock) stops the
+    scheduler thread, which is started again if further timers are set.
     """
 
     def __init__(self, loop=None):
         """
         Initialize a new instance of the `LiveClock` class.
 
-        If loop is None then threads will be used for timers.
+        If loop is None then a scheduler thread will be used for timers.
 
         Parameters
         ----------
@@ -515,6 +527,14 @@ cdef class LiveClock(Clock):
         self._loop = loop
         self._utc = pytz.utc
 
+        # Scheduler
+        self._scheduled = []                   # type: list[tuple[datetime, int, Timer]]
+        self._sequence = 0
+        self._condition = ThreadCondition()
+        self._handle = None                    # Armed event loop callback
+        self._handle_time = None
+        self._thread = None                    # Scheduler thread if no loop
+
     cpdef datetime utc_now(self):
         """
         Returns
@@ -546,39 +566,150 @@ cdef class LiveClock(Clock):
         datetime start_time,
         datetime stop_time,
     ):
-        if self._loop is not None:
-            return LoopTimer(
-                loop=self._loop,
-                name=name,
-                callback=self._raise_time_event,
-                interval=interval,
-                now=now,
-                start_time=start_time,
-                stop_time=stop_time,
-            )
-        else:
-            return ThreadTimer(
-                name=name,
-                callback=self._raise_time_event,
-                interval=interval,
-                now=now,
-                start_time=start_time,
-                stop_time=stop_time,
-            )
-
-    cpdef void _raise_time_event(self, LiveTimer timer) except *:
-        cdef datetime now = self.utc_now_c()
-        cdef TimeEvent event = timer.pop_event(self._uuid_factory.generate())
-        timer.iterate_next_time(now)
-        self._handle_time_event(event)
-
-        if timer.expired:
-            self._remove_timer(timer)
-        else:  # Continue timing
-            timer.repeat(now)
+        return ScheduledTimer(
+            name=name,
+            callback=callback,
+            interval=interval,
+            start_time=start_time,
+            stop_time=stop_time,
+        )
+
+    cpdef void cancel_timer(self, str name) except *:
+        """
+        Cancel the timer corresponding to the given label.
+
+        Parameters
+        ----------
+        name : str
+            The name for the timer to cancel.
+
+        Notes
+        -----
+        Logs a warning if a timer with the given name is not found (it may have
+        already been cancelled).
+
+        """
+        with self._condition:
+            Clock.cancel_timer(self, name)
+            self._condition.notify_all()
+
+    cpdef void cancel_timers(self) except *:
+        """
+        Cancel all timers and stop the scheduler.
+        """
+        cdef object thread
+        with self._condition:
+            Clock.cancel_timers(self)
+            self._scheduled.clear()
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+                self._handle_time = None
+            # The scheduler thread exits once it is no longer the clocks thread
+            thread = self._thread
+            self._thread = None
+            self._condition.notify_all()
+
+        if thread is not None and thread is not current_thread():
+            thread.join()
+
+    cpdef void dispose(self) except *:
+        """
+        Dispose of the clock.
+
+        Cancels all timers and stops the scheduler.
+
+        """
+        self.cancel_timers()
+
+    cdef void _add_timer(self, Timer timer, handler: callable) except *:
+        with self._condition:
+            Clock._add_timer(self, timer, handler)
+            self._schedule(timer)
+            self._arm()
+
+    cpdef void _fire_timers(self) except *:
+        cdef list handlers
+        with self._condition:
+            self._handle = None
+            self._handle_time = None
+            handlers = self._pop_due(self.utc_now_c())
+            self._arm()
+
+        cdef TimeEventHandler handler
+        for handler in handlers:
+            handler.handle()
+
+    cpdef void _run_scheduler(self) except *:
+        cdef list handlers
+        cdef double timeout
+        cdef TimeEventHandler handler
+        cdef object thread = current_thread()
+        while True:
+            with self._condition:
+                while True:
+                    if self._thread is not thread:
+                        return  # Scheduler stopped
+                    if not self._scheduled:
+                        self._condition.wait()
+                        continue
+                    timeout = (self._scheduled[0][0] - self.utc_now_c()).total_seconds()
+                    if timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+                handlers = self._pop_due(self.utc_now_c())
+
+            for handler in handlers:
+                handler.handle()
+
+    cdef inline void _schedule(self, Timer timer) except *:
+        # The sequence orders timers due at the same time by when they were
+        # scheduled, so the timers themselves are never compared
+        heappush(self._scheduled, (timer.next_time, self._sequence, timer))
+        self._sequence += 1
+
+    cdef inline void _arm(self) except *:
+        if not self._scheduled:
+            return
+
+        if self._loop is None:
+            if self._thread is None:
+                self._thread = Thread(target=self._run_scheduler, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+            return
+
+        cdef datetime next_time = self._scheduled[0][0]
+        if self._handle is not None:
+            if self._handle_time <= next_time:
+                return  # Already armed for an earlier or the same time
+            self._handle.cancel()
+
+        self._handle_time = next_time
+        self._handle = self._loop.call_later(
+            (next_time - self.utc_now_c()).total_seconds(),
+            self._fire_timers,
+        )
+
+    cdef inline list _pop_due(self, datetime now):
+        cdef list handlers = []
+
+        cdef Timer timer
+        while self._scheduled and self._scheduled[0][0] <= now:
+            timer = heappop(self._scheduled)[2]
+            if timer.expired:
+                continue  # Timer was cancelled
+
+            handlers.append(TimeEventHandler(timer.pop_event(self._uuid_factory.generate()), timer.callback))
+            timer.iterate_next_time(now)
+
+            if timer.expired:
+                self._remove_timer(timer)
+            else:
+                self._schedule(timer)
+
+        if handlers:
+            # Rescheduled timers have moved on to their next times
             self._update_timing()
 
-    cdef inline void _handle_time_event(self, TimeEvent event) except *:
-        handler = self._handlers.get(event.name)
-        if handler is not None:
-            handler(event)
+        return handlers
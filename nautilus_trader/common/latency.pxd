@@ -0,0 +1,63 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+
+from nautilus_trader.model.commands cimport TradingCommand
+from nautilus_trader.model.events cimport OrderEvent
+from nautilus_trader.model.tick cimport Tick
+
+
+cdef class LatencyHistogram:
+    cdef int64_t[:] _counts
+
+    cdef readonly int64_t count
+    """The number of values recorded.\n\n:returns: `int`"""
+    cdef readonly int64_t min_ns
+    """The minimum value recorded (nanoseconds).\n\n:returns: `int`"""
+    cdef readonly int64_t max_ns
+    """The maximum value recorded (nanoseconds).\n\n:returns: `int`"""
+    cdef readonly int64_t total_ns
+    """The total of all values recorded (nanoseconds).\n\n:returns: `int`"""
+
+    cdef void record(self, int64_t value_ns) except *
+    cpdef int64_t percentile(self, double percentile) except *
+    cpdef double mean(self) except *
+    cpdef dict summary(self)
+    cpdef void reset(self) except *
+
+
+cdef class LatencyTracer:
+    cdef dict _histograms
+    cdef dict _pending
+    cdef dict _handlers
+    cdef int64_t _trace_ns
+
+    cdef readonly int max_pending
+    """The maximum number of orders awaiting a first fill which are tracked.\n\n:returns: `int`"""
+
+    cdef void begin(self, Tick tick) except *
+    cdef void end(self) except *
+    cdef void mark(self, str stage) except *
+    cdef void stamp(self, TradingCommand command) except *
+    cdef void sent(self, TradingCommand command) except *
+    cdef void event(self, OrderEvent event) except *
+    cdef void handled(self, message, int64_t start_ns) except *
+    cpdef LatencyHistogram histogram(self, str stage)
+    cpdef dict stats(self)
+    cpdef list summary(self)
+    cpdef dict handler_stats(self)
+    cpdef list handler_summary(self)
+    cpdef void reset(self) except *
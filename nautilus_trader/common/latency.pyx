@@ -0,0 +1,541 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+"""
+The `LatencyTracer` measures the internal latency of the live trading paths.
+
+A trace begins when a tick is dequeued by the `LiveDataEngine`, and its origin
+is stamped onto any trading command executed while the tick is being handled.
+The time since the origin is then recorded as the command passes each stage.
+Orders are also traced from being sent to the venue by the execution client
+until their first fill. Execution clients report the send point with
+`ExecutionClient._record_sent`, so these stages are only recorded for clients
+which do so.
+
+The stages are:
+
+- `venue_to_dequeue`: from the ticks venue timestamp to the tick being dequeued.
+- `dequeue_to_strategy`: from the tick being dequeued to the strategy handler.
+- `dequeue_to_execute`: from the tick being dequeued to `LiveExecutionEngine.execute`.
+- `dequeue_to_send`: from the tick being dequeued to the client sending the command to the venue.
+- `send_to_fill`: from the order being sent to the venue to its first fill being dequeued.
+
+All stages other than `venue_to_dequeue` are measured with the monotonic clock.
+The `venue_to_dequeue` stage compares the system clock with the venues clock,
+and so also includes any offset between the two.
+
+The time the live engines spend handling each dequeued data item, command,
+request, response and event is also recorded per message type.
+"""
+
+import numpy as np
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.time cimport monotonic_ns
+from nautilus_trader.core.time cimport unix_time
+from nautilus_trader.model.commands cimport SubmitBracketOrder
+from nautilus_trader.model.commands cimport SubmitOrder
+from nautilus_trader.model.events cimport OrderCancelled
+from nautilus_trader.model.events cimport OrderDenied
+from nautilus_trader.model.events cimport OrderExpired
+from nautilus_trader.model.events cimport OrderFilled
+from nautilus_trader.model.events cimport OrderInvalid
+from nautilus_trader.model.events cimport OrderRejected
+
+VENUE_TO_DEQUEUE = "venue_to_dequeue"
+DEQUEUE_TO_STRATEGY = "dequeue_to_strategy"
+DEQUEUE_TO_EXECUTE = "dequeue_to_execute"
+DEQUEUE_TO_SEND = "dequeue_to_send"
+SEND_TO_FILL = "send_to_fill"
+
+STAGES = (
+    VENUE_TO_DEQUEUE,
+    DEQUEUE_TO_STRATEGY,
+    DEQUEUE_TO_EXECUTE,
+    DEQUEUE_TO_SEND,
+    SEND_TO_FILL,
+)
+
+# Each power of two range is divided into 64 linear sub-buckets, giving a
+# relative error below 1/64 (~1.6%). Values are exact below 128ns and are
+# clamped at the maximum (~36 minutes).
+cdef int _SUB_BUCKET_BITS = 6
+cdef int64_t _SUB_BUCKET_HALF = 1 << _SUB_BUCKET_BITS    # 64
+cdef int64_t _SUB_BUCKET_COUNT = 2 * _SUB_BUCKET_HALF    # 128
+cdef int _MAX_BIT = 41
+cdef int64_t _MAX_VALUE = (<int64_t>1 << _MAX_BIT) - 1
+cdef int _BUCKET_COUNT = _SUB_BUCKET_COUNT + (_MAX_BIT - _SUB_BUCKET_BITS - 1) * _SUB_BUCKET_HALF
+
+
+cdef inline int _msb(uint64_t value) nogil:
+    # Return the index of the most significant set bit of the given (non-zero) value
+    cdef int msb = 0
+    if value >> 32:
+        value >>= 32
+        msb += 32
+    if value >> 16:
+        value >>= 16
+        msb += 16
+    if value >> 8:
+        value >>= 8
+        msb += 8
+    if value >> 4:
+        value >>= 4
+        msb += 4
+    if value >> 2:
+        value >>= 2
+        msb += 2
+    if value >> 1:
+        msb += 1
+    return msb
+
+
+cdef inline int _bucket_index(int64_t value) nogil:
+    if value < _SUB_BUCKET_COUNT:
+        return <int>value
+
+    cdef int shift = _msb(<uint64_t>value) - _SUB_BUCKET_BITS
+    return <int>(_SUB_BUCKET_COUNT + (shift - 1) * _SUB_BUCKET_HALF + ((value >> shift) - _SUB_BUCKET_HALF))
+
+
+cdef inline int64_t _bucket_highest(int index) nogil:
+    # Return the highest value equivalent to the given bucket index
+    if index < _SUB_BUCKET_COUNT:
+        return index
+
+    index -= _SUB_BUCKET_COUNT
+    cdef int shift = index // _SUB_BUCKET_HALF + 1
+    cdef int64_t sub_bucket = index % _SUB_BUCKET_HALF + _SUB_BUCKET_HALF
+    return ((sub_bucket + 1) << shift) - 1
+
+
+cdef class LatencyHistogram:
+    """
+    Provides a fixed memory histogram of latencies in the style of an
+    HDR histogram.
+
+    Values are counted in logarithmically sized buckets which are each divided
+    linearly, so percentiles are reported with a bounded relative error
+    (below 1/64) while the memory used stays constant regardless of the number
+    of values recorded.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new instance of the `LatencyHistogram` class.
+        """
+        self._counts = np.zeros(_BUCKET_COUNT, dtype=np.int64)
+        self.reset()
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}("
+                f"count={self.count}, "
+                f"min_ns={self.min_ns}, "
+                f"max_ns={self.max_ns})")
+
+    cdef void record(self, int64_t value_ns) except *:
+        """
+        Record the given latency value.
+
+        Negative values (possible when comparing clocks which are not
+        synchronized) are recorded as zero, and values above the maximum
+        trackable value are recorded as the maximum.
+
+        Parameters
+        ----------
+        value_ns : int64
+            The latency to record (nanoseconds).
+
+        """
+        if value_ns < 0:
+            value_ns = 0
+        elif value_ns > _MAX_VALUE:
+            value_ns = _MAX_VALUE
+
+        self._counts[_bucket_index(value_ns)] += 1
+        self.total_ns += value_ns
+        if self.count == 0 or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+        self.count += 1
+
+    def record_py(self, int64_t value_ns):
+        """
+        Python wrapper for the `record` method.
+        """
+        self.record(value_ns)
+
+    cpdef int64_t percentile(self, double percentile) except *:
+        """
+        Return the latency at the given percentile.
+
+        The value returned is the highest value equivalent to the bucket the
+        percentile falls in, bounded by the minimum and maximum recorded.
+
+        Parameters
+        ----------
+        percentile : double
+            The percentile in the range [0, 100].
+
+        Returns
+        -------
+        int64
+            The latency (nanoseconds), or zero if no values have been recorded.
+
+        Raises
+        ------
+        ValueError
+            If percentile is not in range [0, 100].
+
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"percentile was not in range [0, 100], was {percentile}")
+
+        if self.count == 0:
+            return 0
+
+        cdef int64_t target = <int64_t>(percentile / 100 * self.count + 0.5)
+        if target < 1:
+            target = 1
+
+        cdef int64_t cumulative = 0
+        cdef int index
+        for index in range(_BUCKET_COUNT):
+            cumulative += self._counts[index]
+            if cumulative >= target:
+                return max(self.min_ns, min(_bucket_highest(index), self.max_ns))
+
+        return self.max_ns
+
+    cpdef double mean(self) except *:
+        """
+        Return the mean of all values recorded.
+
+        Returns
+        -------
+        double
+            The mean (nanoseconds), or zero if no values have been recorded.
+
+        """
+        return <double>self.total_ns / self.count if self.count > 0 else 0.
+
+    cpdef dict summary(self):
+        """
+        Return a summary of the recorded latencies.
+
+        All values are in nanoseconds.
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        return {
+            "count": self.count,
+            "min": self.min_ns,
+            "mean": self.mean(),
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p99.9": self.percentile(99.9),
+            "max": self.max_ns,
+        }
+
+    cpdef void reset(self) except *:
+        """
+        Reset the histogram by clearing all recorded values.
+        """
+        self._counts[:] = 0
+        self.count = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.total_ns = 0
+
+
+cdef class LatencyTracer:
+    """
+    Provides latency tracing of the tick-to-order and order-to-fill paths of
+    a live trading node.
+
+    Each stage is recorded to a `LatencyHistogram`, so memory use is fixed
+    regardless of the message rate. The tracer is driven by the live engines,
+    execution clients and strategies it is registered with, all on the event
+    loop thread.
+    """
+
+    def __init__(self, int max_pending=10000):
+        """
+        Initialize a new instance of the `LatencyTracer` class.
+
+        Parameters
+        ----------
+        max_pending : int, optional
+            The maximum number of orders awaiting a first fill to track at once.
+
+        Raises
+        ------
+        ValueError
+            If max_pending is not positive (> 0).
+
+        """
+        if max_pending <= 0:
+            raise ValueError(f"max_pending was not positive, was {max_pending}")
+
+        self.max_pending = max_pending
+        self._histograms = {stage: LatencyHistogram() for stage in STAGES}  # type: dict[str, LatencyHistogram]
+        self._pending = {}  # type: dict[ClientOrderId, int64]
+        self._handlers = {}  # type: dict[type, LatencyHistogram]
+        self._trace_ns = 0
+
+    cdef void begin(self, Tick tick) except *:
+        """
+        Begin a trace for the given tick as it is dequeued.
+
+        Parameters
+        ----------
+        tick : Tick
+            The dequeued tick.
+
+        """
+        cdef int64_t venue_ns = <int64_t>((unix_time() - tick.unix_timestamp) * 1_000_000_000)
+        self._trace_ns = monotonic_ns()
+        (<LatencyHistogram>self._histograms[VENUE_TO_DEQUEUE]).record(venue_ns)
+
+    cdef void end(self) except *:
+        """
+        End the current trace once the dequeued tick has been handled.
+        """
+        self._trace_ns = 0
+
+    cdef void mark(self, str stage) except *:
+        """
+        Record the time since the current trace began for the given stage.
+
+        If no trace is in progress then nothing is recorded.
+
+        Parameters
+        ----------
+        stage : str
+            The stage name.
+
+        """
+        if self._trace_ns == 0:
+            return  # Not tracing
+
+        cdef int64_t elapsed_ns = monotonic_ns() - self._trace_ns
+        cdef LatencyHistogram histogram = self._histograms.get(stage)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self._histograms[stage] = histogram
+        histogram.record(elapsed_ns)
+
+    cdef void stamp(self, TradingCommand command) except *:
+        """
+        Stamp the origin of the current trace onto the given command as it is
+        executed.
+
+        Parameters
+        ----------
+        command : TradingCommand
+            The command being executed.
+
+        """
+        if self._trace_ns == 0:
+            return  # Not tracing
+
+        command.trace_ns = self._trace_ns
+        (<LatencyHistogram>self._histograms[DEQUEUE_TO_EXECUTE]).record(monotonic_ns() - self._trace_ns)
+
+    cdef void sent(self, TradingCommand command) except *:
+        """
+        Record the given command as sent to the venue by the execution client.
+
+        Parameters
+        ----------
+        command : TradingCommand
+            The command being sent.
+
+        """
+        cdef int64_t now_ns = monotonic_ns()
+        if command.trace_ns != 0:
+            (<LatencyHistogram>self._histograms[DEQUEUE_TO_SEND]).record(now_ns - command.trace_ns)
+
+        if len(self._pending) >= self.max_pending:
+            return  # Tracking limit reached
+
+        if isinstance(command, SubmitOrder):
+            self._pending[(<SubmitOrder>command).order.cl_ord_id] = now_ns
+        elif isinstance(command, SubmitBracketOrder):
+            self._pending[(<SubmitBracketOrder>command).bracket_order.entry.cl_ord_id] = now_ns
+
+    cdef void event(self, OrderEvent event) except *:
+        """
+        Record the given order event as dequeued.
+
+        Parameters
+        ----------
+        event : OrderEvent
+            The dequeued order event.
+
+        """
+        if not self._pending:
+            return  # No orders awaiting a fill
+
+        cdef int64_t sent_ns
+        if isinstance(event, OrderFilled):
+            sent_ns = self._pending.pop(event.cl_ord_id, 0)
+            if sent_ns != 0:
+                (<LatencyHistogram>self._histograms[SEND_TO_FILL]).record(monotonic_ns() - sent_ns)
+        elif isinstance(event, (OrderRejected, OrderCancelled, OrderExpired, OrderDenied, OrderInvalid)):
+            self._pending.pop(event.cl_ord_id, None)
+
+    cdef void handled(self, message, int64_t start_ns) except *:
+        """
+        Record the time taken by a live engine to handle the given message.
+
+        Parameters
+        ----------
+        message : object
+            The handled data or message.
+        start_ns : int64
+            The monotonic time the handling started (nanoseconds).
+
+        """
+        cdef int64_t elapsed_ns = monotonic_ns() - start_ns
+        cdef LatencyHistogram histogram = self._handlers.get(type(message))
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self._handlers[type(message)] = histogram
+        histogram.record(elapsed_ns)
+
+    cpdef LatencyHistogram histogram(self, str stage):
+        """
+        Return the histogram for the given stage.
+
+        Parameters
+        ----------
+        stage : str
+            The stage name.
+
+        Returns
+        -------
+        LatencyHistogram or None
+
+        """
+        return self._histograms.get(stage)
+
+    cpdef dict stats(self):
+        """
+        Return the latency summary for each stage.
+
+        All values are in nanoseconds.
+
+        Returns
+        -------
+        dict[str, dict[str, object]]
+
+        """
+        cdef str stage
+        cdef LatencyHistogram histogram
+        return {stage: histogram.summary() for stage, histogram in self._histograms.items()}
+
+    cpdef list summary(self):
+        """
+        Return the formatted lines of the latency summary for each stage with
+        recorded values.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        cdef list lines = []
+        cdef str stage
+        cdef LatencyHistogram histogram
+        for stage, histogram in self._histograms.items():
+            if histogram.count == 0:
+                continue
+            lines.append(
+                f"{stage:<19} count={histogram.count:,} "
+                f"p50={_fmt_us(histogram.percentile(50))} "
+                f"p99={_fmt_us(histogram.percentile(99))} "
+                f"p99.9={_fmt_us(histogram.percentile(99.9))} "
+                f"max={_fmt_us(histogram.max_ns)}"
+            )
+        return lines
+
+    cpdef dict handler_stats(self):
+        """
+        Return the handling time summary for each message type handled.
+
+        All values are in nanoseconds.
+
+        Returns
+        -------
+        dict[str, dict[str, object]]
+
+        """
+        cdef type message_type
+        cdef LatencyHistogram histogram
+        return {
+            message_type.__name__: histogram.summary()
+            for message_type, histogram in self._handlers.items()
+        }
+
+    cpdef list handler_summary(self):
+        """
+        Return the formatted lines of the handling time summary for each
+        message type handled, slowest (by total time) first.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        cdef list lines = []
+        cdef type message_type
+        cdef LatencyHistogram histogram
+        for message_type, histogram in sorted(self._handlers.items(), key=_total_ns, reverse=True):
+            lines.append(
+                f"{message_type.__name__:<19} count={histogram.count:,} "
+                f"mean={_fmt_us(<int64_t>histogram.mean())} "
+                f"p99={_fmt_us(histogram.percentile(99))} "
+                f"max={_fmt_us(histogram.max_ns)} "
+                f"total={_fmt_us(histogram.total_ns)}"
+            )
+        return lines
+
+    cpdef void reset(self) except *:
+        """
+        Reset the tracer by clearing all histograms and pending orders.
+        """
+        cdef LatencyHistogram histogram
+        for histogram in self._histograms.values():
+            histogram.reset()
+        self._handlers.clear()
+        self._pending.clear()
+        self._trace_ns = 0
+
+
+def _total_ns(item):
+    # Sort key for handler histograms by the total time handling
+    return (<LatencyHistogram>item[1]).total_ns
+
+
+cdef inline str _fmt_us(int64_t value_ns):
+    return f"{value_ns / 1000:,.1f}us"
@@ -0,0 +1,35 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+
+
+cdef class ProfilerStat:
+    cdef readonly str name
+    """The stats name.\n\n:returns: `str`"""
+    cdef readonly int64_t count
+    """The number of calls recorded.\n\n:returns: `int`"""
+    cdef readonly int64_t total_ns
+    """The total elapsed time recorded (nanoseconds).\n\n:returns: `int`"""
+
+
+cdef class Profiler:
+    cdef dict _stats
+
+    cdef void record(self, str name, int64_t elapsed_ns) except *
+    cpdef ProfilerStat stat(self, str name)
+    cpdef list stats(self)
+    cpdef list breakdown(self)
+    cpdef void reset(self) except *
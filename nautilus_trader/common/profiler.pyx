@@ -0,0 +1,155 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+
+
+cdef class ProfilerStat:
+    """
+    Represents the cumulative time and call count for a profiled section.
+    """
+
+    def __init__(self, str name not None):
+        """
+        Initialize a new instance of the `ProfilerStat` class.
+
+        Parameters
+        ----------
+        name : str
+            The name of the profiled section.
+
+        """
+        self.name = name
+        self.count = 0
+        self.total_ns = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name}, count={self.count}, total_ns={self.total_ns})"
+
+    @property
+    def mean_ns(self):
+        """
+        The mean elapsed time per call (nanoseconds).
+
+        Returns
+        -------
+        float
+
+        """
+        # Cast for true division as modules are compiled with cdivision
+        return <double>self.total_ns / self.count if self.count > 0 else 0.
+
+
+cdef class Profiler:
+    """
+    Provides a low overhead recorder of cumulative time and call counts for
+    named sections of code.
+
+    Elapsed times are measured by the caller with a monotonic clock (see
+    `nautilus_trader.core.time.monotonic_ns`), and recorded by name.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new instance of the `Profiler` class.
+        """
+        self._stats = {}  # type: dict[str, ProfilerStat]
+
+    cdef void record(self, str name, int64_t elapsed_ns) except *:
+        """
+        Record a call of the named section.
+
+        Parameters
+        ----------
+        name : str
+            The name of the profiled section.
+        elapsed_ns : int64
+            The elapsed time of the call (nanoseconds).
+
+        """
+        cdef ProfilerStat stat = self._stats.get(name)
+        if stat is None:
+            stat = ProfilerStat(name)
+            self._stats[name] = stat
+
+        stat.count += 1
+        stat.total_ns += elapsed_ns
+
+    def record_py(self, str name, int64_t elapsed_ns):
+        """
+        Python wrapper for the `record` method.
+        """
+        self.record(name, elapsed_ns)
+
+    cpdef ProfilerStat stat(self, str name):
+        """
+        Return the stat for the given section name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the profiled section.
+
+        Returns
+        -------
+        ProfilerStat or None
+
+        """
+        return self._stats.get(name)
+
+    cpdef list stats(self):
+        """
+        Return all stats ordered by total elapsed time (descending).
+
+        Returns
+        -------
+        list[ProfilerStat]
+
+        """
+        return sorted(self._stats.values(), key=_total_ns, reverse=True)
+
+    cpdef list breakdown(self):
+        """
+        Return the formatted lines of the profile breakdown.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        cdef list stats = self.stats()
+        if not stats:
+            return []
+
+        cdef ProfilerStat stat
+        cdef int width = 0
+        for stat in stats:
+            width = max(width, len(stat.name))
+
+        return [
+            f"{stat.name:<{width}}  {stat.count:>12,} calls  "
+            f"{stat.total_ns / 1_000_000:>12,.3f}ms  {stat.mean_ns:>10,.0f}ns/call"
+            for stat in stats
+        ]
+
+    cpdef void reset(self) except *:
+        """
+        Reset the profiler by clearing all stats.
+        """
+        self._stats.clear()
+
+
+def _total_ns(ProfilerStat stat):
+    return stat.total_ns
@@ -16,18 +16,46 @@
 
 cdef class Queue:
     cdef object _queue
+    cdef object _overflow
+    cdef object _timestamps
 
     cdef readonly int maxsize
+    """The maximum size of the queue.\n\n:returns: `int`"""
     cdef readonly int count
+    """The number of items in the queue.\n\n:returns: `int`"""
+    cdef readonly bint track_residency
+    """If the time items spend on the queue is tracked.\n\n:returns: `bool`"""
+    cdef readonly long overflow_count
+    """The total number of items placed on the overflow.\n\n:returns: `int`"""
+    cdef readonly long batch_count
+    """The number of batches removed from the queue.\n\n:returns: `int`"""
+    cdef readonly long batch_items
+    """The total number of items removed in batches.\n\n:returns: `int`"""
+    cdef readonly int max_batch_size
+    """The largest batch removed from the queue.\n\n:returns: `int`"""
+    cdef readonly double max_residency
+    """The longest time in seconds an item spent on the queue.\n\n:returns: `double`"""
+    cdef double _residency_total
+    cdef long _residency_count
 
     cpdef int qsize(self) except *
+    cpdef int overflow_qsize(self) except *
     cpdef bint empty(self) except *
     cpdef bint full(self) except *
     cpdef void put_nowait(self, item) except *
+    cpdef bint put_or_overflow(self, item) except *
     cpdef object get_nowait(self)
+    cpdef list get_batch_nowait(self, int max_items=*)
+    cpdef double mean_batch_size(self) except *
+    cpdef double mean_residency(self) except *
+    cpdef dict stats(self)
+    cpdef void reset_stats(self) except *
 
     cdef inline int _qsize(self) except *
     cdef inline bint _empty(self) except *
     cdef inline bint _full(self) except *
     cdef inline void _put_nowait(self, item) except *
+    cdef inline void _refill(self) except *
     cdef inline object _get_nowait(self)
+    cdef inline list _get_batch_nowait(self, int max_items)
+    cdef inline void _record_residency(self, double now, int size) except *
@@ -15,6 +15,7 @@
 
 import asyncio
 import collections
+import time
 import types
 
 
@@ -33,13 +34,39 @@ cdef class Queue:
     Unlike the standard library Queue, you can reliably know this Queue's size
     with qsize(), since your single-threaded asyncio application won't be
     interrupted between calling qsize() and doing an operation on the Queue.
+
+    Items can be removed in batches with get_batch(), which waits only while
+    the queue is empty and then removes everything available up to a cap. The
+    sizes of batches, and optionally the time items spend on the queue, are
+    recorded.
+
+    Callers which cannot await put() may use put_or_overflow(), which places
+    items onto an unbounded overflow while the queue is full. Items are moved
+    from the overflow onto the queue in order as slots are freed by get(), so
+    the order in which items are put is always kept.
     """
 
-    def __init__(self, maxsize=0):
+    def __init__(self, int maxsize=0, bint track_residency=False):
+        """
+        Initialize a new instance of the `Queue` class.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum size of the queue (<= 0 for an unbounded queue).
+        track_residency : bool
+            If the time items spend on the queue should be tracked.
+
+        """
         self.maxsize = maxsize
         self.count = 0
+        self.track_residency = track_residency
 
         self._queue = collections.deque()
+        self._overflow = collections.deque()
+        self._timestamps = collections.deque()
+
+        self.reset_stats()
 
     cpdef int qsize(self) except *:
         """
@@ -52,6 +79,17 @@ cdef class Queue:
         """
         return self._qsize()
 
+    cpdef int overflow_qsize(self) except *:
+        """
+        Return the number of items on the overflow awaiting a free slot.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._overflow)
+
     cpdef bint empty(self) except *:
         """
         Return a value indicating whether the queue is empty.
@@ -85,8 +123,8 @@ cdef class Queue:
         """
         Put an item into the queue.
 
-        If the queue is full, wait until a free slot is available before adding
-        item.
+        If the queue is full (or items are on the overflow), wait until a free
+        slot is available before adding item.
 
         Parameters
         ---------
@@ -94,7 +132,7 @@ cdef class Queue:
             The item to add to the queue.
 
         """
-        while self._full():
+        while self._full() or self._overflow:
             # Wait for free slot
             await self._sleep0()
             continue
@@ -108,11 +146,43 @@ cdef class Queue:
         Raises
         ------
         QueueFull
-            If no free slot is immediately available.
+            If no free slot is immediately available (or items are on the
+            overflow).
 
         """
         self._put_nowait(item)
 
+    cpdef bint put_or_overflow(self, item) except *:
+        """
+        Put an item into the queue without blocking, placing it on the overflow
+        if no free slot is immediately available.
+
+        Items on the overflow are moved onto the queue in order as free slots
+        become available. While any items are on the overflow, further items
+        are also placed on the overflow so that they are never queued ahead of
+        items put before them.
+
+        Parameters
+        ---------
+        item : object
+            The item to add to the queue.
+
+        Returns
+        -------
+        bool
+            True if the item was placed on the overflow, else False.
+
+        """
+        if not self._overflow and not self._full():
+            self._put_nowait(item)
+            return False
+
+        self._overflow.append(item)
+        if self.track_residency:
+            self._timestamps.append(time.perf_counter())
+        self.overflow_count += 1
+        return True
+
     async def get(self):
         """
         Remove and return the next item from the queue.
@@ -143,6 +213,108 @@ cdef class Queue:
         """
         return self._get_nowait()
 
+    async def get_batch(self, int max_items=0):
+        """
+        Remove and return all available items from the queue, up to the given
+        maximum number of items.
+
+        If the queue is empty, wait until an item is available.
+
+        Parameters
+        ----------
+        max_items : int
+            The maximum number of items to remove (<= 0 for no limit).
+
+        Returns
+        -------
+        list[object]
+
+        """
+        while self._empty():
+            # Wait for item to become available
+            await self._sleep0()
+            continue
+
+        return self._get_batch_nowait(max_items)
+
+    cpdef list get_batch_nowait(self, int max_items=0):
+        """
+        Remove and return all available items from the queue, up to the given
+        maximum number of items.
+
+        Parameters
+        ----------
+        max_items : int
+            The maximum number of items to remove (<= 0 for no limit).
+
+        Returns
+        -------
+        list[object]
+            The items in the order they were put (may be empty).
+
+        """
+        return self._get_batch_nowait(max_items)
+
+    cpdef double mean_batch_size(self) except *:
+        """
+        Return the mean size of batches removed from the queue.
+
+        Returns
+        -------
+        double
+
+        """
+        if self.batch_count == 0:
+            return 0.
+        return <double>self.batch_items / self.batch_count
+
+    cpdef double mean_residency(self) except *:
+        """
+        Return the mean time in seconds items spent on the queue.
+
+        Only items removed while residency is tracked are included.
+
+        Returns
+        -------
+        double
+
+        """
+        if self._residency_count == 0:
+            return 0.
+        return self._residency_total / self._residency_count
+
+    cpdef dict stats(self):
+        """
+        Return the current size, batch size and residency statistics.
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        return {
+            "qsize": self.count,
+            "overflow_qsize": len(self._overflow),
+            "overflow_count": self.overflow_count,
+            "batch_count": self.batch_count,
+            "max_batch_size": self.max_batch_size,
+            "mean_batch_size": self.mean_batch_size(),
+            "max_residency": self.max_residency,
+            "mean_residency": self.mean_residency(),
+        }
+
+    cpdef void reset_stats(self) except *:
+        """
+        Reset the batch, overflow and residency statistics of the queue.
+        """
+        self.overflow_count = 0
+        self.batch_count = 0
+        self.batch_items = 0
+        self.max_batch_size = 0
+        self.max_residency = 0.
+        self._residency_total = 0.
+        self._residency_count = 0
+
     @types.coroutine
     def _sleep0(self):
         yield  # Skip one event loop run cycle
@@ -160,14 +332,62 @@ cdef class Queue:
             return self.count >= self.maxsize
 
     cdef inline void _put_nowait(self, item) except *:
-        if self._full():
+        if self._full() or self._overflow:
             raise asyncio.QueueFull()
         self._queue.append(item)
+        if self.track_residency:
+            self._timestamps.append(time.perf_counter())
         self.count += 1
 
     cdef inline object _get_nowait(self):
         if self.empty():
             raise asyncio.QueueEmpty()
         item = self._queue.popleft()
+        if self.track_residency:
+            self._record_residency(time.perf_counter(), 1)
         self.count -= 1
+        self._refill()
         return item
+
+    cdef inline list _get_batch_nowait(self, int max_items):
+        cdef int size = self.count
+        if 0 < max_items < size:
+            size = max_items
+
+        cdef list items = [None] * size
+        cdef int i
+        for i in range(size):
+            items[i] = self._queue.popleft()
+        self.count -= size
+
+        if size == 0:
+            return items
+
+        if self.track_residency:
+            self._record_residency(time.perf_counter(), size)
+
+        self._refill()
+
+        self.batch_count += 1
+        self.batch_items += size
+        if size > self.max_batch_size:
+            self.max_batch_size = size
+
+        return items
+
+    cdef inline void _refill(self) except *:
+        # Move items from the overflow into the freed slots (in order). The
+        # overflow timestamps already follow those of the queued items.
+        while self._overflow and not self._full():
+            self._queue.append(self._overflow.popleft())
+            self.count += 1
+
+    cdef inline void _record_residency(self, double now, int size) except *:
+        cdef double residency
+        cdef int i
+        for i in range(size):
+            residency = now - self._timestamps.popleft()
+            self._residency_total += residency
+            self._residency_count += 1
+            if residency > self.max_residency:
+                self.max_residency = residency
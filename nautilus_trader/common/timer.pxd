@@ -62,6 +62,10 @@ cdef class TestTimer(Timer):
     cpdef list advance(self, datetime to_time)
 
 
+cdef class ScheduledTimer(Timer):
+    pass
+
+
 cdef class LiveTimer(Timer):
     cdef object _internal
 
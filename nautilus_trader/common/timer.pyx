@@ -297,6 +297,47 @@ cdef class TestTimer(Timer):
         self.expired = True
 
 
+cdef class ScheduledTimer(Timer):
+    """
+    Provides a timer for live trading which is driven by the scheduler of its
+    owning clock, rather than by its own thread or event loop callback.
+    """
+
+    def __init__(
+        self,
+        str name not None,
+        callback not None: callable,
+        timedelta interval not None,
+        datetime start_time not None,
+        datetime stop_time=None,
+    ):
+        """
+        Initialize a new instance of the `ScheduledTimer` class.
+
+        Parameters
+        ----------
+        name : str
+            The name for the timer.
+        callback : callable
+            The function to call at the next time.
+        interval : timedelta
+            The time interval for the timer.
+        start_time : datetime
+            The start datetime for the timer (UTC).
+        stop_time : datetime, optional
+            The stop datetime for the timer (UTC) (if None then timer repeats).
+
+        """
+        Condition.valid_string(name, "name")
+        super().__init__(name, callback, interval, start_time, stop_time)
+
+    cpdef void cancel(self) except *:
+        """
+        Cancels the timer (the timer will not generate an event).
+        """
+        self.expired = True
+
+
 cdef class LiveTimer(Timer):
     """
     The abstract base class for all live timers.
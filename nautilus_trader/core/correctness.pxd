@@ -14,6 +14,19 @@
 # -------------------------------------------------------------------------------------------------
 
 
+cdef extern from *:
+    """
+    #ifndef NAUTILUS_TRUSTED_MODE
+    #define NAUTILUS_TRUSTED_MODE 0
+    #endif
+    """
+    # If the build is in trusted mode (TRUSTED_MODE=true at build time) then
+    # precondition checks on internal engine-to-engine hot paths are compiled
+    # out, as callers within the platform guarantee their arguments.
+    # User facing API checks are always retained.
+    const bint TRUSTED_MODE "NAUTILUS_TRUSTED_MODE"
+
+
 cdef inline Exception make_exception(ex_default, ex_type, str msg):
     if type(ex_type) == type(Exception):
         return ex_type(msg)
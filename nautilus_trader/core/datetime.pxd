@@ -14,12 +14,14 @@
 # -------------------------------------------------------------------------------------------------
 
 from cpython.datetime cimport datetime
+from libc.stdint cimport int64_t
 
 
 cdef datetime UNIX_EPOCH
 
 
 cpdef long to_unix_time_ms(datetime timestamp) except *
+cpdef int64_t to_unix_time_ns(datetime timestamp) except *
 cpdef datetime from_unix_time_ms(long timestamp)
 cpdef bint is_datetime_utc(datetime timestamp) except *
 cpdef bint is_tz_aware(time_object) except *
@@ -26,6 +26,7 @@ from cpython.datetime cimport datetime
 from cpython.datetime cimport datetime_tzinfo
 from cpython.datetime cimport timedelta
 from cpython.unicode cimport PyUnicode_Contains
+from libc.stdint cimport int64_t
 
 from nautilus_trader.core.correctness cimport Condition
 
@@ -50,6 +51,27 @@ cpdef long to_unix_time_ms(datetime timestamp) except *:
     return <long>((timestamp - UNIX_EPOCH).total_seconds() * 1000)
 
 
+cpdef int64_t to_unix_time_ns(datetime timestamp) except *:
+    """
+    Return the Unix nanosecond timestamp from the given datetime.
+
+    The conversion uses integer arithmetic only, so is exact to the
+    microsecond resolution of the datetime.
+
+    Parameters
+    ----------
+    timestamp : datetime
+        The datetime for the timestamp.
+
+    Returns
+    -------
+    int64
+
+    """
+    cdef timedelta delta = timestamp - UNIX_EPOCH
+    return (<int64_t>delta.days * 86400 + delta.seconds) * 1_000_000_000 + <int64_t>delta.microseconds * 1000
+
+
 cpdef datetime from_unix_time_ms(long timestamp):
     """
     Return the datetime in UTC from the given Unix millisecond timestamp.
@@ -23,6 +23,7 @@ from libc.stdint cimport int64_t
 cdef extern from "pytime.h":
     ctypedef int64_t _PyTime_t
     _PyTime_t _PyTime_GetSystemClock() nogil
+    _PyTime_t _PyTime_GetMonotonicClock() nogil
     double _PyTime_AsSecondsDouble(_PyTime_t t) nogil
 
 
@@ -40,3 +41,8 @@ cdef inline double unix_time_ms() nogil:
 
     tic = _PyTime_GetSystemClock()
     return _PyTime_AsSecondsDouble(tic) * 1000
+
+
+cdef inline int64_t monotonic_ns() nogil:
+    # Nanoseconds from an arbitrary point, for measuring elapsed time only
+    return _PyTime_GetMonotonicClock()
@@ -24,6 +24,7 @@ from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.timer cimport TestTimer
 from nautilus_trader.common.timer cimport TimeEvent
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.correctness cimport TRUSTED_MODE
 from nautilus_trader.model.bar cimport Bar
 from nautilus_trader.model.bar cimport BarData
 from nautilus_trader.model.bar cimport BarSpecification
@@ -125,9 +126,10 @@ cdef class BarBuilder:
             The update timestamp.
 
         """
-        Condition.not_none(price, "price")
-        Condition.not_none(size, "size")
-        Condition.not_none(timestamp, "timestamp")
+        if not TRUSTED_MODE:
+            Condition.not_none(price, "price")
+            Condition.not_none(size, "size")
+            Condition.not_none(timestamp, "timestamp")
 
         if self.last_timestamp and timestamp < self.last_timestamp:
             return  # Not applicable
@@ -246,7 +248,8 @@ cdef class BarAggregator:
             The tick for the update.
 
         """
-        Condition.not_none(tick, "tick")
+        if not TRUSTED_MODE:
+            Condition.not_none(tick, "tick")
 
         self._apply_update(
             price=tick.extract_price(self._builder.bar_spec.price_type),
@@ -264,7 +267,8 @@ cdef class BarAggregator:
             The tick for the update.
 
         """
-        Condition.not_none(tick, "tick")
+        if not TRUSTED_MODE:
+            Condition.not_none(tick, "tick")
 
         self._apply_update(
             price=tick.price,
@@ -23,7 +23,7 @@ from nautilus_trader.model.instrument cimport Instrument
 from nautilus_trader.model.order_book cimport OrderBook
 from nautilus_trader.model.tick cimport QuoteTick
 from nautilus_trader.model.tick cimport TradeTick
-from nautilus_trader.trading.calculators cimport ExchangeRateCalculator
+from nautilus_trader.trading.calculators cimport ExchangeRateGraph
 
 
 cdef class DataCache(DataCacheFacade):
@@ -34,7 +34,7 @@ cdef class DataCache(DataCacheFacade):
     cdef dict _trade_ticks
     cdef dict _order_books
     cdef dict _bars
-    cdef ExchangeRateCalculator _xrate_calculator
+    cdef dict _xrate_graphs
 
     cdef readonly int tick_capacity
     """The caches tick capacity.\n\n:returns: `int`"""
@@ -52,6 +52,7 @@ cdef class DataCache(DataCacheFacade):
     cpdef void add_trade_ticks(self, list ticks) except *
     cpdef void add_bars(self, BarType bar_type, list bars) except *
 
-    cdef inline tuple _build_quote_table(self, Venue venue)
+    cdef inline ExchangeRateGraph _get_xrate_graph(self, Venue venue)
+    cdef inline void _update_xrate_graph(self, QuoteTick tick) except *
     cdef inline bint _is_crypto_spot_or_swap(self, Instrument instrument) except *
     cdef inline bint _is_fx_spot(self, Instrument instrument) except *
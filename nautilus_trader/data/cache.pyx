@@ -24,6 +24,7 @@ from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.core.constants cimport *  # str constants only
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.correctness cimport TRUSTED_MODE
 from nautilus_trader.data.base cimport DataCacheFacade
 from nautilus_trader.model.bar cimport Bar
 from nautilus_trader.model.bar cimport BarType
@@ -37,7 +38,7 @@ from nautilus_trader.model.instrument cimport Instrument
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.tick cimport QuoteTick
 from nautilus_trader.model.tick cimport TradeTick
-from nautilus_trader.trading.calculators cimport ExchangeRateCalculator
+from nautilus_trader.trading.calculators cimport ExchangeRateGraph
 
 
 cdef class DataCache(DataCacheFacade):
@@ -61,8 +62,8 @@ cdef class DataCache(DataCacheFacade):
             config = {}
 
         self._log = LoggerAdapter(type(self).__name__, logger)
-        self._xrate_calculator = ExchangeRateCalculator()
-        self._xrate_symbols = {}
+        self._xrate_symbols = {}  # type: dict[Security, str]
+        self._xrate_graphs = {}   # type: dict[Venue, ExchangeRateGraph]
 
         # Capacities (per security)
         self.tick_capacity = config.get("tick_capacity", 1000)
@@ -90,6 +91,7 @@ cdef class DataCache(DataCacheFacade):
         self._log.info("Resetting cache...")
 
         self._xrate_symbols.clear()
+        self._xrate_graphs.clear()
         self._instruments.clear()
         self._quote_ticks.clear()
         self._trade_ticks.clear()
@@ -110,6 +112,9 @@ cdef class DataCache(DataCacheFacade):
         if self._is_crypto_spot_or_swap(instrument) or self._is_fx_spot(instrument):
             self._xrate_symbols[instrument.security] = (f"{instrument.base_currency}/"
                                                         f"{instrument.quote_currency}")
+            ticks = self._quote_ticks.get(instrument.security)
+            if ticks:
+                self._update_xrate_graph(ticks[0])
 
         self._log.debug(f"Updated instrument {instrument.security}")
 
@@ -123,7 +128,8 @@ cdef class DataCache(DataCacheFacade):
             The order book to add.
 
         """
-        Condition.not_none(order_book, "order_book")
+        if not TRUSTED_MODE:
+            Condition.not_none(order_book, "order_book")
 
         self._order_books[order_book.security] = order_book
 
@@ -137,7 +143,8 @@ cdef class DataCache(DataCacheFacade):
             The tick to add.
 
         """
-        Condition.not_none(tick, "tick")
+        if not TRUSTED_MODE:
+            Condition.not_none(tick, "tick")
 
         cdef Security security = tick.security
         ticks = self._quote_ticks.get(security)
@@ -148,6 +155,7 @@ cdef class DataCache(DataCacheFacade):
             self._quote_ticks[security] = ticks
 
         ticks.appendleft(tick)
+        self._update_xrate_graph(tick)
 
     cpdef void add_trade_tick(self, TradeTick tick) except *:
         """
@@ -159,7 +167,8 @@ cdef class DataCache(DataCacheFacade):
             The received tick to add.
 
         """
-        Condition.not_none(tick, "tick")
+        if not TRUSTED_MODE:
+            Condition.not_none(tick, "tick")
 
         cdef Security security = tick.security
         ticks = self._trade_ticks.get(security)
@@ -183,8 +192,9 @@ cdef class DataCache(DataCacheFacade):
             The received bar to add.
 
         """
-        Condition.not_none(bar_type, "bar_type")
-        Condition.not_none(bar, "bar")
+        if not TRUSTED_MODE:
+            Condition.not_none(bar_type, "bar_type")
+            Condition.not_none(bar, "bar")
 
         # Update ticks
         bars = self._bars.get(bar_type)
@@ -233,6 +243,8 @@ cdef class DataCache(DataCacheFacade):
         for tick in ticks:
             cached_ticks.appendleft(tick)
 
+        self._update_xrate_graph(cached_ticks[0])
+
     cpdef void add_trade_ticks(self, list ticks) except *:
         """
         Add the given ticks to the cache, if it is empty.
@@ -719,35 +731,30 @@ cdef class DataCache(DataCacheFacade):
         if from_currency == to_currency:
             return Decimal(1)  # No conversion necessary
 
-        cdef tuple quotes = self._build_quote_table(venue)
-
-        return self._xrate_calculator.get_rate(
+        return self._get_xrate_graph(venue).get_rate(
             from_currency=from_currency,
             to_currency=to_currency,
             price_type=price_type,
-            bid_quotes=quotes[0],  # Bid
-            ask_quotes=quotes[1],  # Ask
         )
 
-    cdef inline tuple _build_quote_table(self, Venue venue):
-        cdef dict bid_quotes = {}
-        cdef dict ask_quotes = {}
+    cdef inline ExchangeRateGraph _get_xrate_graph(self, Venue venue):
+        cdef ExchangeRateGraph graph = self._xrate_graphs.get(venue)
+        if graph is None:
+            graph = ExchangeRateGraph()
+            self._xrate_graphs[venue] = graph
 
-        cdef Security security
-        cdef str base_quote
-        for security, base_quote in self._xrate_symbols.items():
-            if security.venue != venue:
-                continue
-
-            ticks = self._quote_ticks.get(security)
-            if not ticks:
-                # No quotes for security
-                continue
+        return graph
 
-            bid_quotes[base_quote] = ticks[0].bid.as_decimal()
-            ask_quotes[base_quote] = ticks[0].ask.as_decimal()
+    cdef inline void _update_xrate_graph(self, QuoteTick tick) except *:
+        cdef str base_quote = self._xrate_symbols.get(tick.security)
+        if base_quote is None:
+            return  # Not an exchange rate security
 
-        return bid_quotes, ask_quotes
+        self._get_xrate_graph(tick.security.venue).update(
+            base_quote,
+            tick.bid.as_decimal(),
+            tick.ask.as_decimal(),
+        )
 
     cdef inline bint _is_crypto_spot_or_swap(self, Instrument instrument) except *:
         return instrument.security.asset_class == AssetClass.CRYPTO \
@@ -115,6 +115,7 @@ cdef class MarketDataClient(DataClient):
     cdef void _handle_order_book(self, OrderBook order_book) except *
     cdef void _handle_quote_tick(self, QuoteTick tick) except *
     cdef void _handle_trade_tick(self, TradeTick tick) except *
+    cdef void _handle_batch(self, list data) except *
     cdef void _handle_bar(self, BarType bar_type, Bar bar) except *
 
     cdef void _handle_instruments(self, list instruments, UUID correlation_id) except *
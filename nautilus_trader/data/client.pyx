@@ -330,6 +330,9 @@ cdef class MarketDataClient(DataClient):
     def _handle_trade_tick_py(self, TradeTick tick):
         self._handle_trade_tick(tick)
 
+    def _handle_batch_py(self, list data):
+        self._handle_batch(data)
+
     def _handle_bar_py(self, BarType bar_type, Bar bar):
         self._handle_bar(bar_type, bar)
 
@@ -359,6 +362,9 @@ cdef class MarketDataClient(DataClient):
     cdef void _handle_trade_tick(self, TradeTick tick) except *:
         self._engine.process(tick)
 
+    cdef void _handle_batch(self, list data) except *:
+        self._engine.process_batch(data)
+
     cdef void _handle_bar(self, BarType bar_type, Bar bar) except *:
         self._engine.process(BarData(bar_type, bar))
 
@@ -85,6 +85,7 @@ cdef class DataEngine(Component):
 
     cpdef void execute(self, DataCommand command) except *
     cpdef void process(self, data) except *
+    cpdef void process_batch(self, list data) except *
     cpdef void send(self, DataRequest request) except *
     cpdef void receive(self, DataResponse response) except *
 
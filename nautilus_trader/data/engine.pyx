@@ -43,6 +43,7 @@ from nautilus_trader.common.logging cimport REQ
 from nautilus_trader.common.logging cimport RES
 from nautilus_trader.core.constants cimport *  # str constants only
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.correctness cimport TRUSTED_MODE
 from nautilus_trader.core.uuid cimport UUID
 from nautilus_trader.data.aggregation cimport BarAggregator
 from nautilus_trader.data.aggregation cimport BulkTickBarBuilder
@@ -391,10 +392,28 @@ cdef class DataEngine(Component):
             The data to process.
 
         """
-        Condition.not_none(data, "data")
+        if not TRUSTED_MODE:
+            Condition.not_none(data, "data")
 
         self._handle_data(data)
 
+    cpdef void process_batch(self, list data) except *:
+        """
+        Process the given batch of data in order.
+
+        Parameters
+        ----------
+        data : list[object]
+            The data to process.
+
+        """
+        if not TRUSTED_MODE:
+            Condition.not_none(data, "data")
+
+        cdef int i
+        for i in range(len(data)):
+            self._handle_data(data[i])
+
     cpdef void send(self, DataRequest request) except *:
         """
         Handle the given request.
@@ -990,6 +1009,9 @@ cdef class DataEngine(Component):
     cdef inline void _handle_trade_tick(self, TradeTick tick) except *:
         self.cache.add_trade_tick(tick)
 
+        # Send to portfolio as a priority
+        self.portfolio.update_trade_tick(tick)
+
         # Send to all registered tick handlers for that security
         cdef list tick_handlers = self._trade_tick_handlers.get(tick.security, [])
         for handler in tick_handlers:
@@ -30,6 +30,7 @@ from nautilus_trader.trading.strategy cimport TradingStrategy
 cdef class ExecutionCache(ExecutionCacheFacade):
     cdef LoggerAdapter _log
     cdef ExecutionDatabase _database
+    cdef bint _drop_archived
     cdef dict _cached_accounts
     cdef dict _cached_orders
     cdef dict _cached_positions
@@ -51,6 +52,18 @@ cdef class ExecutionCache(ExecutionCacheFacade):
     cdef set _index_positions_open
     cdef set _index_positions_closed
     cdef set _index_strategies
+    cdef set _index_orders_archived
+    cdef set _index_positions_archived
+
+    cdef object _completed_orders
+    cdef object _closed_positions
+    cdef dict _archived_orders
+    cdef dict _archived_positions
+
+    cdef readonly int completed_orders_capacity
+    """The maximum count of completed orders retained in the cache (0 for unbounded).\n\n:returns: `int`"""
+    cdef readonly int closed_positions_capacity
+    """The maximum count of closed positions retained in the cache (0 for unbounded).\n\n:returns: `int`"""
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
@@ -85,5 +98,15 @@ cdef class ExecutionCache(ExecutionCacheFacade):
     cdef void _cache_venue_account_id(self, AccountId account_id) except *
     cdef void _build_indexes_from_orders(self) except *
     cdef void _build_indexes_from_positions(self) except *
+    cdef void _archive_completed_orders(self) except *
+    cdef void _archive_closed_positions(self) except *
+    cdef void _archive_order(self, Order order) except *
+    cdef void _archive_position(self, Position position) except *
+    cdef void _drop_order(self, Order order) except *
+    cdef void _drop_position(self, Position position) except *
+    cdef Order _load_archived_order(self, ClientOrderId cl_ord_id)
+    cdef Position _load_archived_position(self, PositionId position_id)
+    cdef void _restore_order(self, Order order) except *
+    cdef void _restore_position(self, Position position) except *
     cdef inline set _build_ord_query_filter_set(self, Security security, StrategyId strategy_id)
     cdef inline set _build_pos_query_filter_set(self, Security security, StrategyId strategy_id)
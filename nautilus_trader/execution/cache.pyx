@@ -17,6 +17,7 @@
 The `ExecutionCache` provides an interface for querying on orders and positions.
 """
 
+from collections import deque
 import time
 
 from nautilus_trader.common.logging cimport LogColor
@@ -24,6 +25,7 @@ from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.execution.base cimport ExecutionCacheFacade
+from nautilus_trader.execution.database cimport BypassExecutionDatabase
 from nautilus_trader.execution.database cimport ExecutionDatabase
 from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.identifiers cimport ClientOrderId
@@ -33,19 +35,44 @@ from nautilus_trader.model.identifiers cimport Security
 from nautilus_trader.model.identifiers cimport StrategyId
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.order.base cimport Order
+from nautilus_trader.model.position cimport Position
 from nautilus_trader.trading.account cimport Account
 from nautilus_trader.trading.strategy cimport TradingStrategy
 
 
+def _completed_time(Order order):
+    # Sort key for archiving completed orders oldest first
+    return order.last_event_c().timestamp, order.cl_ord_id.value
+
+
+def _closed_time(Position position):
+    # Sort key for archiving closed positions oldest first
+    return position.closed_time, position.id.value
+
+
 cdef class ExecutionCache(ExecutionCacheFacade):
     """
     Provides a cache for the `ExecutionEngine`.
+
+    The number of completed orders and closed positions retained in the cache
+    can be bounded by the `completed_orders_capacity` and
+    `closed_positions_capacity` configuration options. Once a capacity is
+    exceeded the oldest completed orders (or closed positions) are archived out
+    of the cache and its query indexes. When the database persists them they
+    are released and reloaded from the database when first looked up by
+    identifier, with only their identifiers remaining indexed. Up to capacity
+    of the most recently looked up are held, so repeated lookups return the
+    same object. When the database does not
+    persist them (`BypassExecutionDatabase`) they are dropped along with all
+    of their index entries, so are no longer found by any query. Collection
+    queries and counts only include the objects retained in the cache.
     """
 
     def __init__(
         self,
         ExecutionDatabase database not None,
         Logger logger not None,
+        dict config=None,
     ):
         """
         Initialize a new instance of the `ExecutionCache` class.
@@ -56,12 +83,30 @@ cdef class ExecutionCache(ExecutionCacheFacade):
             The execution database adapter.
         logger : Logger
             The logger for the cache.
+        config : dict[str, object], optional
+            The configuration options.
+
+        Raises
+        ------
+        ValueError
+            If the configured completed_orders_capacity is negative (< 0).
+        ValueError
+            If the configured closed_positions_capacity is negative (< 0).
 
         """
+        if config is None:
+            config = {}
         super().__init__()
 
         self._log = LoggerAdapter("ExecCache", logger)
         self._database = database
+        self._drop_archived = isinstance(database, BypassExecutionDatabase)
+
+        # Capacities (0 for unbounded)
+        self.completed_orders_capacity = config.get("completed_orders_capacity", 0)
+        self.closed_positions_capacity = config.get("closed_positions_capacity", 0)
+        Condition.not_negative_int(self.completed_orders_capacity, "completed_orders_capacity")
+        Condition.not_negative_int(self.closed_positions_capacity, "closed_positions_capacity")
 
         # Cached objects
         self._cached_accounts = {}            # type: dict[AccountId, Account]
@@ -87,6 +132,14 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         self._index_positions_closed = set()  # type: set[PositionId]
         self._index_strategies = set()        # type: set[StrategyId]
 
+        # Archive
+        self._completed_orders = deque()        # type: deque[ClientOrderId]
+        self._closed_positions = deque()        # type: deque[PositionId]
+        self._archived_orders = {}              # type: dict[ClientOrderId, Order] (LRU)
+        self._archived_positions = {}           # type: dict[PositionId, Position] (LRU)
+        self._index_orders_archived = set()     # type: set[ClientOrderId]
+        self._index_positions_archived = set()  # type: set[PositionId]
+
         self._log.info("Initialized.")
 
 # -- COMMANDS --------------------------------------------------------------------------------------
@@ -143,6 +196,25 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         self._build_indexes_from_orders()
         self._build_indexes_from_positions()
 
+        # Archive any completed orders and closed positions beyond capacity,
+        # oldest first
+        cdef Order order
+        cdef Position position
+        if self.completed_orders_capacity > 0:
+            for order in sorted(
+                [self._cached_orders[x] for x in self._index_orders_completed],
+                key=_completed_time,
+            ):
+                self._completed_orders.append(order.cl_ord_id)
+            self._archive_completed_orders()
+        if self.closed_positions_capacity > 0:
+            for position in sorted(
+                [self._cached_positions[x] for x in self._index_positions_closed],
+                key=_closed_time,
+            ):
+                self._closed_positions.append(position.id)
+            self._archive_closed_positions()
+
         self._log.debug(f"Index built in {time.time() - ts:.3f}s.")
 
     cpdef bint check_integrity(self) except *:
@@ -237,31 +309,31 @@ cdef class ExecutionCache(ExecutionCacheFacade):
                 error_count += 1
 
         for order_id, cl_ord_id in self._index_order_ids.items():
-            if cl_ord_id not in self._cached_orders:
+            if cl_ord_id not in self._cached_orders and cl_ord_id not in self._index_orders_archived:
                 self._log.error(f"{failure} in _index_order_ids: "
                                 f"{repr(cl_ord_id)} not found in self._cached_orders")
                 error_count += 1
 
         for cl_ord_id, position_id in self._index_order_position.items():
-            if cl_ord_id not in self._cached_orders:
+            if cl_ord_id not in self._cached_orders and cl_ord_id not in self._index_orders_archived:
                 self._log.error(f"{failure} in _index_order_position: "
                                 f"{repr(cl_ord_id)} not found in self._cached_orders")
                 error_count += 1
 
         for cl_ord_id, strategy_id in self._index_order_strategy.items():
-            if cl_ord_id not in self._cached_orders:
+            if cl_ord_id not in self._cached_orders and cl_ord_id not in self._index_orders_archived:
                 self._log.error(f"{failure} in _index_order_strategy: "
                                 f"{repr(cl_ord_id)} not found in self._cached_orders")
                 error_count += 1
 
         for position_id, strategy_id in self._index_position_strategy.items():
-            if position_id not in self._cached_positions:
+            if position_id not in self._cached_positions and position_id not in self._index_positions_archived:
                 self._log.error(f"{failure} in _index_position_strategy: "
                                 f"{repr(position_id)} not found in self._cached_positions")
                 error_count += 1
 
         for position_id, cl_ord_ids in self._index_position_orders.items():
-            if position_id not in self._cached_positions:
+            if position_id not in self._cached_positions and position_id not in self._index_positions_archived:
                 self._log.error(f"{failure} in _index_position_orders: "
                                 f"{repr(position_id)} not found in self._cached_positions")
                 error_count += 1
@@ -400,6 +472,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         self._cached_accounts.clear()
         self._cached_orders.clear()
         self._cached_positions.clear()
+        self._archived_orders.clear()
+        self._archived_positions.clear()
 
         self._log.debug(f"Cleared cache.")
 
@@ -423,6 +497,10 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         self._index_positions_open.clear()
         self._index_positions_closed.clear()
         self._index_strategies.clear()
+        self._index_orders_archived.clear()
+        self._index_positions_archived.clear()
+        self._completed_orders.clear()
+        self._closed_positions.clear()
 
         self._log.debug(f"Cleared index.")
 
@@ -529,6 +607,122 @@ cdef class ExecutionCache(ExecutionCacheFacade):
             # 8: Build _index_strategies -> {StrategyId}
             self._index_strategies.add(position.strategy_id)
 
+    cdef void _archive_completed_orders(self) except *:
+        if self.completed_orders_capacity == 0:
+            return
+
+        cdef ClientOrderId cl_ord_id
+        while len(self._completed_orders) > self.completed_orders_capacity:
+            cl_ord_id = self._completed_orders.popleft()
+            if cl_ord_id in self._index_orders_completed:
+                self._archive_order(self._cached_orders[cl_ord_id])
+
+    cdef void _archive_closed_positions(self) except *:
+        if self.closed_positions_capacity == 0:
+            return
+
+        cdef PositionId position_id
+        while len(self._closed_positions) > self.closed_positions_capacity:
+            position_id = self._closed_positions.popleft()
+            if position_id in self._index_positions_closed:
+                self._archive_position(self._cached_positions[position_id])
+
+    cdef void _archive_order(self, Order order) except *:
+        del self._cached_orders[order.cl_ord_id]
+        self._index_orders.discard(order.cl_ord_id)
+        self._index_orders_completed.discard(order.cl_ord_id)
+        self._index_security_orders[order.security].discard(order.cl_ord_id)
+        self._index_strategy_orders.get(order.strategy_id, set()).discard(order.cl_ord_id)
+
+        if self._drop_archived:
+            self._drop_order(order)
+            return
+
+        self._index_orders_archived.add(order.cl_ord_id)
+
+        self._log.debug(f"Archived Order(id={order.cl_ord_id.value}).")
+
+    cdef void _archive_position(self, Position position) except *:
+        del self._cached_positions[position.id]
+        self._index_positions.discard(position.id)
+        self._index_positions_closed.discard(position.id)
+        self._index_security_positions[position.security].discard(position.id)
+        self._index_strategy_positions.get(position.strategy_id, set()).discard(position.id)
+
+        if self._drop_archived:
+            self._drop_position(position)
+            return
+
+        self._index_positions_archived.add(position.id)
+
+        self._log.debug(f"Archived Position(id={position.id.value}).")
+
+    cdef void _drop_order(self, Order order) except *:
+        # The order cannot be reloaded so remove its remaining index entries
+        if self._index_order_ids.get(order.id) == order.cl_ord_id:
+            del self._index_order_ids[order.id]
+        self._index_order_position.pop(order.cl_ord_id, None)
+        self._index_order_strategy.pop(order.cl_ord_id, None)
+
+        self._log.debug(f"Dropped Order(id={order.cl_ord_id.value}).")
+
+    cdef void _drop_position(self, Position position) except *:
+        # The position cannot be reloaded so remove its remaining index entries
+        self._index_position_strategy.pop(position.id, None)
+        self._index_position_orders.pop(position.id, None)
+
+        self._log.debug(f"Dropped Position(id={position.id.value}).")
+
+    cdef Order _load_archived_order(self, ClientOrderId cl_ord_id):
+        # Held orders form an LRU bounded by the completed orders capacity
+        cdef Order order = self._archived_orders.pop(cl_ord_id, None)
+        if order is None:
+            order = self._database.load_order(cl_ord_id)
+            if order is None:
+                return None
+
+        self._archived_orders[cl_ord_id] = order
+        while len(self._archived_orders) > self.completed_orders_capacity:
+            del self._archived_orders[next(iter(self._archived_orders))]
+
+        return order
+
+    cdef Position _load_archived_position(self, PositionId position_id):
+        # Held positions form an LRU bounded by the closed positions capacity
+        cdef Position position = self._archived_positions.pop(position_id, None)
+        if position is None:
+            position = self._database.load_position(position_id)
+            if position is None:
+                return None
+
+        self._archived_positions[position_id] = position
+        while len(self._archived_positions) > self.closed_positions_capacity:
+            del self._archived_positions[next(iter(self._archived_positions))]
+
+        return position
+
+    cdef void _restore_order(self, Order order) except *:
+        self._index_orders_archived.discard(order.cl_ord_id)
+        self._archived_orders.pop(order.cl_ord_id, None)
+
+        self._cached_orders[order.cl_ord_id] = order
+        self._index_orders.add(order.cl_ord_id)
+        self._index_security_orders.setdefault(order.security, set()).add(order.cl_ord_id)
+        self._index_strategy_orders.setdefault(order.strategy_id, set()).add(order.cl_ord_id)
+
+        self._log.debug(f"Restored Order(id={order.cl_ord_id.value}).")
+
+    cdef void _restore_position(self, Position position) except *:
+        self._index_positions_archived.discard(position.id)
+        self._archived_positions.pop(position.id, None)
+
+        self._cached_positions[position.id] = position
+        self._index_positions.add(position.id)
+        self._index_security_positions.setdefault(position.security, set()).add(position.id)
+        self._index_strategy_positions.setdefault(position.strategy_id, set()).add(position.id)
+
+        self._log.debug(f"Restored Position(id={position.id.value}).")
+
     cpdef void load_strategy(self, TradingStrategy strategy) except *:
         """
         Load the state dictionary for the given strategy from the execution cache.
@@ -583,7 +777,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(cl_ord_id, "cl_ord_id")
 
-        return self._cached_orders.get(cl_ord_id)
+        return self.order(cl_ord_id)
 
     cpdef Position load_position(self, PositionId position_id):
         """
@@ -601,7 +795,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
-        return self._cached_positions.get(position_id)
+        return self.position(position_id)
 
     cpdef void add_account(self, Account account) except *:
         """
@@ -648,6 +842,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
             If order.id is already contained in the cached_orders.
         ValueError
             If order.id is already contained in the index_orders.
+        ValueError
+            If order.id is already contained in the index_orders_archived.
         ValueError
             If order.id is already contained in the index_order_position.
         ValueError
@@ -658,6 +854,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         Condition.not_none(position_id, "position_id")
         Condition.not_in(order.cl_ord_id, self._cached_orders, "order.cl_ord_id", "cached_orders")
         Condition.not_in(order.cl_ord_id, self._index_orders, "order.cl_ord_id", "index_orders")
+        Condition.not_in(order.cl_ord_id, self._index_orders_archived, "order.cl_ord_id", "index_orders_archived")
         Condition.not_in(order.cl_ord_id, self._index_order_position, "order.cl_ord_id", "index_order_position")
         Condition.not_in(order.cl_ord_id, self._index_order_strategy, "order.cl_ord_id", "index_order_strategy")
 
@@ -802,11 +999,16 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(order, "order")
 
+        if order.cl_ord_id in self._index_orders_archived:
+            self._restore_order(order)
+
         if order.id.not_null():
             # Assumes order_id does not change
             self._index_order_ids[order.id] = order.cl_ord_id
 
         if order.is_completed_c():
+            if self.completed_orders_capacity > 0 and order.cl_ord_id not in self._index_orders_completed:
+                self._completed_orders.append(order.cl_ord_id)
             self._index_orders_completed.add(order.cl_ord_id)
             self._index_orders_working.discard(order.cl_ord_id)
         else:
@@ -817,6 +1019,8 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         # Update database
         self._database.update_order(order)
 
+        self._archive_completed_orders()
+
     cpdef void update_position(self, Position position) except *:
         """
         Update the given position in the execution cache.
@@ -829,13 +1033,23 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(position, "position")
 
+        if position.id in self._index_positions_archived:
+            self._restore_position(position)
+
         if position.is_closed_c():
+            if self.closed_positions_capacity > 0 and position.id not in self._index_positions_closed:
+                self._closed_positions.append(position.id)
             self._index_positions_closed.add(position.id)
             self._index_positions_open.discard(position.id)
+        elif position.is_open_c():
+            self._index_positions_open.add(position.id)
+            self._index_positions_closed.discard(position.id)
 
         # Update database
         self._database.update_position(position)
 
+        self._archive_closed_positions()
+
     cpdef void update_strategy(self, TradingStrategy strategy) except *:
         """
         Update the given strategy state in the execution cache.
@@ -1148,7 +1362,11 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(cl_ord_id, "cl_ord_id")
 
-        return self._cached_orders.get(cl_ord_id)
+        cdef Order order = self._cached_orders.get(cl_ord_id)
+        if order is None and cl_ord_id in self._index_orders_archived:
+            return self._load_archived_order(cl_ord_id)
+
+        return order
 
     cpdef ClientOrderId cl_ord_id(self, OrderId order_id):
         """
@@ -1176,7 +1394,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(cl_ord_id, "cl_ord_id")
 
-        cdef Order order = self._cached_orders.get(cl_ord_id)
+        cdef Order order = self.order(cl_ord_id)
         if order is None:
             return None
         return order.id
@@ -1280,7 +1498,11 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
-        return self._cached_positions.get(position_id)
+        cdef Position position = self._cached_positions.get(position_id)
+        if position is None and position_id in self._index_positions_archived:
+            return self._load_archived_position(position_id)
+
+        return position
 
     cpdef PositionId position_id(self, ClientOrderId cl_ord_id):
         """
@@ -1399,7 +1621,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(cl_ord_id, "cl_ord_id")
 
-        return cl_ord_id in self._index_orders
+        return cl_ord_id in self._index_orders or cl_ord_id in self._index_orders_archived
 
     cpdef bint is_order_working(self, ClientOrderId cl_ord_id) except *:
         """
@@ -1437,7 +1659,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(cl_ord_id, "cl_ord_id")
 
-        return cl_ord_id in self._index_orders_completed
+        return cl_ord_id in self._index_orders_completed or cl_ord_id in self._index_orders_archived
 
     cpdef int orders_total_count(self, Security security=None, StrategyId strategy_id=None) except *:
         """
@@ -1510,7 +1732,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
-        return position_id in self._index_positions
+        return position_id in self._index_positions or position_id in self._index_positions_archived
 
     cpdef bint is_position_open(self, PositionId position_id) except *:
         """
@@ -1548,7 +1770,7 @@ cdef class ExecutionCache(ExecutionCacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
-        return position_id in self._index_positions_closed
+        return position_id in self._index_positions_closed or position_id in self._index_positions_archived
 
     cpdef int positions_total_count(self, Security security=None, StrategyId strategy_id=None) except *:
         """
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.common.clock cimport Clock
+from nautilus_trader.common.latency cimport LatencyTracer
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.execution.engine cimport ExecutionEngine
@@ -21,6 +22,7 @@ from nautilus_trader.model.commands cimport AmendOrder
 from nautilus_trader.model.commands cimport CancelOrder
 from nautilus_trader.model.commands cimport SubmitBracketOrder
 from nautilus_trader.model.commands cimport SubmitOrder
+from nautilus_trader.model.commands cimport TradingCommand
 from nautilus_trader.model.events cimport Event
 from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.identifiers cimport Venue
@@ -32,6 +34,7 @@ cdef class ExecutionClient:
     cdef LoggerAdapter _log
     cdef ExecutionEngine _engine
     cdef dict _config
+    cdef LatencyTracer _tracer
 
     cdef readonly Venue venue
     """The clients venue.\n\n:returns: `Venue`"""
@@ -41,6 +44,8 @@ cdef class ExecutionClient:
     """If the client is connected.\n\n:returns: `bool`"""
 
     cpdef void _set_connected(self, bint value=*) except *
+    cpdef void _record_sent(self, TradingCommand command) except *
+    cpdef void register_tracer(self, LatencyTracer tracer) except *
     cpdef void connect(self) except *
     cpdef void disconnect(self) except *
     cpdef void reset(self) except *
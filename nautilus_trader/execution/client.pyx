@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.common.clock cimport Clock
+from nautilus_trader.common.latency cimport LatencyTracer
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.uuid cimport UUIDFactory
@@ -22,6 +23,7 @@ from nautilus_trader.model.commands cimport AmendOrder
 from nautilus_trader.model.commands cimport CancelOrder
 from nautilus_trader.model.commands cimport SubmitBracketOrder
 from nautilus_trader.model.commands cimport SubmitOrder
+from nautilus_trader.model.commands cimport TradingCommand
 from nautilus_trader.model.events cimport Event
 from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.identifiers cimport Venue
@@ -71,6 +73,7 @@ cdef class ExecutionClient:
         self._log = LoggerAdapter(config.get("name", f"ExecClient-{venue.value}"), logger)
         self._engine = engine
         self._config = config
+        self._tracer = None  # Initialized when registered with a tracer
 
         self.venue = venue
         self.account_id = account_id
@@ -93,6 +96,35 @@ cdef class ExecutionClient:
         """
         self.is_connected = value
 
+    cpdef void _record_sent(self, TradingCommand command) except *:
+        """
+        Record the given command as sent to the venue with any registered
+        latency tracer.
+
+        Implementations should call this immediately before the request for
+        the command is sent.
+
+        Parameters
+        ----------
+        command : TradingCommand
+            The command being sent.
+
+        """
+        if self._tracer is not None:
+            self._tracer.sent(command)
+
+    cpdef void register_tracer(self, LatencyTracer tracer) except *:
+        """
+        Register the client with the given latency tracer.
+
+        Parameters
+        ----------
+        tracer : LatencyTracer
+            The tracer to record to (if None then tracing is disabled).
+
+        """
+        self._tracer = tracer
+
     cpdef void connect(self) except *:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")
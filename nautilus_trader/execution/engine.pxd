@@ -15,6 +15,7 @@
 
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.generators cimport PositionIdGenerator
+from nautilus_trader.common.profiler cimport Profiler
 from nautilus_trader.execution.cache cimport ExecutionCache
 from nautilus_trader.execution.client cimport ExecutionClient
 from nautilus_trader.model.commands cimport AmendOrder
@@ -45,6 +46,7 @@ cdef class ExecutionEngine(Component):
     cdef dict _strategies
     cdef PositionIdGenerator _pos_id_generator
     cdef Portfolio _portfolio
+    cdef Profiler _profiler
 
     cdef readonly TraderId trader_id
     """The trader identifier associated with the engine.\n\n:returns: `TraderId`"""
@@ -65,6 +67,7 @@ cdef class ExecutionEngine(Component):
 # -- REGISTRATION ----------------------------------------------------------------------------------
 
     cpdef void register_client(self, ExecutionClient client) except *
+    cpdef void register_profiler(self, Profiler profiler) except *
     cpdef void register_strategy(self, TradingStrategy strategy) except *
     cpdef void deregister_client(self, ExecutionClient client) except *
     cpdef void deregister_strategy(self, TradingStrategy strategy) except *
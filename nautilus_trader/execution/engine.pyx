@@ -30,6 +30,8 @@ Alternative implementations can be written on top of the generic engine - which
 just need to override the `execute` and `process` methods.
 """
 
+from libc.stdint cimport int64_t
+
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.generators cimport PositionIdGenerator
@@ -38,8 +40,11 @@ from nautilus_trader.common.logging cimport EVT
 from nautilus_trader.common.logging cimport LogColor
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport RECV
+from nautilus_trader.common.profiler cimport Profiler
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.correctness cimport TRUSTED_MODE
 from nautilus_trader.core.fsm cimport InvalidStateTrigger
+from nautilus_trader.core.time cimport monotonic_ns
 from nautilus_trader.execution.cache cimport ExecutionCache
 from nautilus_trader.execution.client cimport ExecutionClient
 from nautilus_trader.execution.database cimport ExecutionDatabase
@@ -114,9 +119,10 @@ cdef class ExecutionEngine(Component):
             clock=clock,
         )
         self._portfolio = portfolio
+        self._profiler = None  # Initialized when registered with a profiler
 
         self.trader_id = database.trader_id
-        self.cache = ExecutionCache(database, logger)
+        self.cache = ExecutionCache(database, logger, config)
 
         # Counters
         self.command_count = 0
@@ -260,6 +266,21 @@ cdef class ExecutionEngine(Component):
         self._clients[client.venue] = client
         self._log.info(f"Registered {client}.")
 
+    cpdef void register_profiler(self, Profiler profiler) except *:
+        """
+        Register the execution engine with the given profiler.
+
+        When registered the time and count of processed events are recorded
+        by the profiler.
+
+        Parameters
+        ----------
+        profiler : Profiler
+            The profiler to record to (if None then profiling is disabled).
+
+        """
+        self._profiler = profiler
+
     cpdef void register_strategy(self, TradingStrategy strategy) except *:
         """
         Register the given strategy with the execution engine.
@@ -414,9 +435,16 @@ cdef class ExecutionEngine(Component):
             The event to process.
 
         """
-        Condition.not_none(event, "event")
+        if not TRUSTED_MODE:
+            Condition.not_none(event, "event")
+
+        if self._profiler is None:
+            self._handle_event(event)
+            return
 
+        cdef int64_t ts = monotonic_ns()
         self._handle_event(event)
+        self._profiler.record("ExecutionEngine.process", monotonic_ns() - ts)
 
     cpdef void flush_db(self) except *:
         """
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.common.latency cimport LatencyTracer
+from nautilus_trader.common.queue cimport Queue
 from nautilus_trader.data.engine cimport DataEngine
 
 
@@ -22,11 +24,26 @@ cdef class LiveDataEngine(DataEngine):
     cdef object _data_queue
     cdef object _message_queue
     cdef object _run_queues_task
+    cdef int _batch_size
+    cdef bint _conflate
+    cdef dict _quote_slots
+    cdef dict _order_book_slots
+    cdef LatencyTracer _tracer
 
     cdef readonly bint is_running
+    """If the engine is running.\n\n:returns: `bool`"""
+    cdef readonly int conflated_count
+    """The count of quote ticks and order books conflated.\n\n:returns: `int`"""
 
     cpdef void kill(self) except *
     cpdef object get_event_loop(self)
     cpdef object get_run_queue_task(self)
     cpdef int data_qsize(self) except *
     cpdef int message_qsize(self) except *
+    cpdef dict queue_stats(self)
+    cpdef void register_tracer(self, LatencyTracer tracer) except *
+
+    cdef inline void _enqueue(self, Queue queue, item) except *
+    cdef inline void _handle_data_traced(self, data) except *
+    cdef inline bint _supersede(self, dict slots, data) except *
+    cdef inline object _take_latest(self, data)
@@ -16,25 +16,49 @@
 import asyncio
 from asyncio import AbstractEventLoop
 from asyncio import CancelledError
-from asyncio import QueueFull
+
+from libc.stdint cimport int64_t
 
 from nautilus_trader.common.clock cimport LiveClock
+from nautilus_trader.common.latency cimport LatencyTracer
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.queue cimport Queue
 from nautilus_trader.core.constants cimport *  # str constants only
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.message cimport Message
 from nautilus_trader.core.message cimport MessageType
+from nautilus_trader.core.time cimport monotonic_ns
 from nautilus_trader.data.engine cimport DataEngine
 from nautilus_trader.data.messages cimport DataCommand
 from nautilus_trader.data.messages cimport DataRequest
 from nautilus_trader.data.messages cimport DataResponse
+from nautilus_trader.model.identifiers cimport Security
+from nautilus_trader.model.order_book cimport OrderBook
+from nautilus_trader.model.tick cimport QuoteTick
+from nautilus_trader.model.tick cimport Tick
 from nautilus_trader.trading.portfolio cimport Portfolio
 
 
 cdef class LiveDataEngine(DataEngine):
     """
     Provides a high-performance asynchronous live data engine.
+
+    Commands, requests and responses are placed on a message queue which takes
+    priority over the data queue. Between each batch of data the data queue
+    yields to the message queue until all queued messages are handled, so a
+    message waits for at most one batch of data.
+
+    If a queue is full then further items are held in order on its overflow
+    until slots are free (see `Queue.put_or_overflow`), the count of items
+    overflowed is included in the `queue_stats`.
+
+    With the `conflate` config option, only the latest `QuoteTick` and
+    `OrderBook` per security are processed. At most one of each is queued per
+    security, a newer quote or book replaces the one awaiting processing
+    without being queued itself, so a burst of updates for a security does not
+    grow the queue. The latest is processed at the queue position of the first
+    update of the burst, and so may be handled ahead of other data received
+    during the burst. All other data is processed in full.
     """
 
     def __init__(
@@ -72,8 +96,23 @@ cdef class LiveDataEngine(DataEngine):
         )
 
         self._loop = loop
-        self._data_queue = Queue(maxsize=config.get("qsize", 10000))
-        self._message_queue = Queue(maxsize=config.get("qsize", 10000))
+        self._data_queue = Queue(
+            maxsize=config.get("qsize", 10000),
+            track_residency=config.get("track_residency", False),
+        )
+        self._message_queue = Queue(
+            maxsize=config.get("qsize", 10000),
+            track_residency=config.get("track_residency", False),
+        )
+        self._batch_size = config.get("batch_size", 1000)
+
+        # Conflation
+        self._conflate = config.get("conflate", False)
+        self._quote_slots = {}       # type: dict[Security, QuoteTick]
+        self._order_book_slots = {}  # type: dict[Security, OrderBook]
+        self.conflated_count = 0
+
+        self._tracer = None  # Initialized when registered with a tracer
 
         self._run_queues_task = None
         self.is_running = False
@@ -122,6 +161,35 @@ cdef class LiveDataEngine(DataEngine):
         """
         return self._message_queue.qsize()
 
+    cpdef dict queue_stats(self):
+        """
+        Return the batch size and residency statistics for the internal queues.
+
+        Residency times (seconds) are only recorded with the `track_residency`
+        config option.
+
+        Returns
+        -------
+        dict[str, dict[str, object]]
+
+        """
+        return {
+            "data": self._data_queue.stats(),
+            "message": self._message_queue.stats(),
+        }
+
+    cpdef void register_tracer(self, LatencyTracer tracer) except *:
+        """
+        Register the engine with the given latency tracer.
+
+        Parameters
+        ----------
+        tracer : LatencyTracer
+            The tracer to record to (if None then tracing is disabled).
+
+        """
+        self._tracer = tracer
+
     cpdef void kill(self) except *:
         """
         Kill the engine by abruptly cancelling the queue tasks and calling stop.
@@ -138,8 +206,8 @@ cdef class LiveDataEngine(DataEngine):
         """
         Execute the given data command.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and hold
+        the item (in order) on the queue overflow until a slot is free.
 
         Parameters
         ----------
@@ -155,19 +223,18 @@ cdef class LiveDataEngine(DataEngine):
         Condition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._message_queue.put_nowait(command)
-        except QueueFull:
-            self._log.warning(f"Blocking on `_message_queue.put` as message_queue full at "
-                              f"{self._message_queue.qsize()} items.")
-            self._message_queue.put(command)  # Block until qsize reduces below maxsize
+        self._enqueue(self._message_queue, command)
 
     cpdef void process(self, data) except *:
         """
         Process the given data.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If conflating and a `QuoteTick` or `OrderBook` for the same security is
+        already awaiting processing, then it is replaced by the given data (which
+        is not queued again).
+
+        If the internal queue is already full then will log a warning and hold
+        the item (in order) on the queue overflow until a slot is free.
 
         Parameters
         ----------
@@ -183,19 +250,49 @@ cdef class LiveDataEngine(DataEngine):
         Condition.not_none(data, "data")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._data_queue.put_nowait(data)
-        except asyncio.QueueFull:
-            self._log.warning(f"Blocking on `_data_queue.put` as data_queue full at "
-                              f"{self._data_queue.qsize()} items.")
-            self._data_queue.put(data)  # Block until qsize reduces below maxsize
+        if self._conflate:
+            if type(data) is QuoteTick:
+                if self._supersede(self._quote_slots, data):
+                    return  # Already queued for the security
+            elif type(data) is OrderBook:
+                if self._supersede(self._order_book_slots, data):
+                    return  # Already queued for the security
+
+        self._enqueue(self._data_queue, data)
+
+    cpdef void process_batch(self, list data) except *:
+        """
+        Process the given batch of data.
+
+        The batch is placed on the internal queue as a single item, and will be
+        handled in order once dequeued. If the internal queue is already full
+        then will log a warning and hold the batch (in order) on the queue
+        overflow until a slot is free.
+
+        Parameters
+        ----------
+        data : list[object]
+            The data to process.
+
+        Warnings
+        --------
+        This method should only be called from the same thread the event loop is
+        running on.
+
+        """
+        Condition.not_none(data, "data")
+
+        if not data:
+            return  # Nothing to process
+
+        self._enqueue(self._data_queue, data)
 
     cpdef void send(self, DataRequest request) except *:
         """
         Handle the given request.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and hold
+        the item (in order) on the queue overflow until a slot is free.
 
         Parameters
         ----------
@@ -211,19 +308,14 @@ cdef class LiveDataEngine(DataEngine):
         Condition.not_none(request, "request")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._message_queue.put_nowait(request)
-        except asyncio.QueueFull:
-            self._log.warning(f"Blocking on `_message_queue.put` as message_queue full at "
-                              f"{self._message_queue.qsize()} items.")
-            self._message_queue.put(request)  # Block until qsize reduces below maxsize
+        self._enqueue(self._message_queue, request)
 
     cpdef void receive(self, DataResponse response) except *:
         """
         Handle the given response.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and hold
+        the item (in order) on the queue overflow until a slot is free.
 
         Parameters
         ----------
@@ -239,12 +331,12 @@ cdef class LiveDataEngine(DataEngine):
         Condition.not_none(response, "response")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._message_queue.put_nowait(response)
-        except QueueFull:
-            self._log.warning(f"Blocking on `_message_queue.put` as message_queue full at "
-                              f"{self._message_queue.qsize()} items.")
-            self._message_queue.put(response)  # Block until qsize reduces below maxsize
+        self._enqueue(self._message_queue, response)
+
+    cdef inline void _enqueue(self, Queue queue, item) except *:
+        if queue.put_or_overflow(item) and queue.overflow_qsize() == 1:
+            self._log.warning(f"Queue full at {queue.qsize()} items, "
+                              f"holding further items on the overflow.")
 
     cpdef void _on_start(self) except *:
         if not self._loop.is_running():
@@ -263,19 +355,37 @@ cdef class LiveDataEngine(DataEngine):
     cpdef void _on_stop(self) except *:
         if self.is_running:
             self.is_running = False
-            self._data_queue.put_nowait(None)     # Sentinel message pattern
-            self._message_queue.put_nowait(None)  # Sentinel message pattern
+            self._data_queue.put_or_overflow(None)     # Sentinel message pattern
+            self._message_queue.put_or_overflow(None)  # Sentinel message pattern
             self._log.debug(f"Sentinel message placed on data queue.")
             self._log.debug(f"Sentinel message placed on message queue.")
 
     async def _run_data_queue(self):
         self._log.debug(f"Data queue processing starting (qsize={self.data_qsize()})...")
+        cdef list batch
         try:
             while self.is_running:
-                data = await self._data_queue.get()
-                if data is None:  # Sentinel message (fast C-level check)
-                    continue      # Returns to the top to check `self.is_running`
-                self._handle_data(data)
+                # Drain all available data (up to batch size) before yielding
+                batch = await self._data_queue.get_batch(self._batch_size)
+                for data in batch:
+                    if data is None:  # Sentinel message (fast C-level check)
+                        continue      # Loop returns to the top to check `self.is_running`
+                    if type(data) is list:  # Batch of data (fast C-level check)
+                        for item in data:
+                            if self._tracer is not None:
+                                self._handle_data_traced(item)
+                                continue
+                            self._handle_data(item)
+                        continue
+                    if self._conflate:
+                        data = self._take_latest(data)
+                    if self._tracer is not None:
+                        self._handle_data_traced(data)
+                        continue
+                    self._handle_data(data)
+                # Give the message queue priority by yielding until it is empty
+                while self.is_running and not self._message_queue.empty():
+                    await asyncio.sleep(0)
         except CancelledError:
             if self.data_qsize() > 0:
                 self._log.warning(f"Running cancelled "
@@ -283,25 +393,65 @@ cdef class LiveDataEngine(DataEngine):
             else:
                 self._log.debug(f"Data queue processing stopped (qsize={self.data_qsize()}).")
 
+    cdef inline void _handle_data_traced(self, data) except *:
+        cdef int64_t start_ns = monotonic_ns()
+        if isinstance(data, Tick):
+            self._tracer.begin(data)
+            self._handle_data(data)
+            self._tracer.end()
+        else:
+            self._handle_data(data)
+        self._tracer.handled(data, start_ns)
+
+    cdef inline bint _supersede(self, dict slots, data) except *:
+        # Record the data as the latest for its security. Returns True if
+        # data for the security is already queued, which is then replaced.
+        cdef Security security = data.security
+        cdef bint queued = security in slots
+        slots[security] = data
+        if queued:
+            self.conflated_count += 1
+        return queued
+
+    cdef inline object _take_latest(self, data):
+        # Return the latest data for the security of the dequeued quote tick
+        # or order book, releasing its slot for the next update
+        if type(data) is QuoteTick:
+            return self._quote_slots.pop(data.security, data)
+        elif type(data) is OrderBook:
+            return self._order_book_slots.pop(data.security, data)
+        else:
+            return data
+
     async def _run_message_queue(self):
         self._log.debug(f"Message queue processing starting (qsize={self.message_qsize()})...")
+        cdef list batch
         cdef Message message
+        cdef int64_t start_ns = 0
         try:
             while self.is_running:
-                message = await self._message_queue.get()
-                if message is None:  # Sentinel message (fast C-level check)
-                    continue         # Returns to the top to check `self.is_running`
-                if message.type == MessageType.COMMAND:
-                    self._execute_command(message)
-                elif message.type == MessageType.REQUEST:
-                    self._handle_request(message)
-                elif message.type == MessageType.RESPONSE:
-                    self._handle_response(message)
-                else:
-                    self._log.error(f"Cannot handle message: unrecognized {message}.")
+                # Drain all available messages (up to batch size) before yielding
+                batch = await self._message_queue.get_batch(self._batch_size)
+                for message in batch:
+                    if message is None:  # Sentinel message (fast C-level check)
+                        continue         # Loop returns to the top to check `self.is_running`
+                    if self._tracer is not None:
+                        start_ns = monotonic_ns()
+                    if message.type == MessageType.COMMAND:
+                        self._execute_command(message)
+                    elif message.type == MessageType.REQUEST:
+                        self._handle_request(message)
+                    elif message.type == MessageType.RESPONSE:
+                        self._handle_response(message)
+                    else:
+                        self._log.error(f"Cannot handle message: unrecognized {message}.")
+                        continue
+                    if self._tracer is not None:
+                        self._tracer.handled(message, start_ns)
         except CancelledError:
             if self.message_qsize() > 0:
                 self._log.warning(f"Running cancelled "
                                   f"with {self.message_qsize()} message(s) on queue.")
             else:
                 self._log.debug(f"Message queue processing stopped (qsize={self.message_qsize()}).")
+
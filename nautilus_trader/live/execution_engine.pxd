@@ -13,13 +13,26 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.common.latency cimport LatencyTracer
+from nautilus_trader.common.queue cimport Queue
+from nautilus_trader.core.message cimport Message
 from nautilus_trader.execution.engine cimport ExecutionEngine
+from nautilus_trader.model.c_enums.order_state cimport OrderState
+from nautilus_trader.model.events cimport OrderEvent
+from nautilus_trader.model.order.base cimport Order
 
 
 cdef class LiveExecutionEngine(ExecutionEngine):
     cdef object _loop
-    cdef object _queue
+    cdef Queue _queue
+    cdef Queue _priority_queue
+    cdef bint _priority_lanes
     cdef object _run_queue_task
+    cdef int _batch_size
+    cdef double _reconciliation_timeout
+    cdef dict _unresolved
+    cdef object _reconciled
+    cdef LatencyTracer _tracer
 
     cdef readonly bint is_running
 
@@ -27,3 +40,10 @@ cdef class LiveExecutionEngine(ExecutionEngine):
     cpdef object get_event_loop(self)
     cpdef object get_run_queue_task(self)
     cpdef int qsize(self) except *
+    cpdef dict queue_stats(self)
+    cpdef list unresolved_orders(self)
+    cpdef void register_tracer(self, LatencyTracer tracer) except *
+
+    cdef inline void _enqueue(self, Queue queue, Message message) except *
+    cdef inline void _check_resolved(self, OrderEvent event) except *
+    cdef inline bint _is_resolved(self, Order order, OrderState target_state, filled_qty) except *
@@ -17,23 +17,27 @@ import asyncio
 from asyncio import AbstractEventLoop
 from asyncio import CancelledError
 
-from cpython.datetime cimport datetime
-from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
 
 from nautilus_trader.common.clock cimport LiveClock
+from nautilus_trader.common.latency cimport LatencyTracer
 from nautilus_trader.common.logging cimport LogColor
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.queue cimport Queue
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.message cimport Message
 from nautilus_trader.core.message cimport MessageType
+from nautilus_trader.core.time cimport monotonic_ns
+from nautilus_trader.execution.client cimport ExecutionClient
 from nautilus_trader.execution.database cimport ExecutionDatabase
 from nautilus_trader.execution.engine cimport ExecutionEngine
 from nautilus_trader.execution.reports cimport ExecutionStateReport
-from nautilus_trader.live.execution_client cimport LiveExecutionClient
 from nautilus_trader.model.c_enums.order_state cimport OrderState
+from nautilus_trader.model.c_enums.order_state cimport OrderStateParser
+from nautilus_trader.model.commands cimport CancelOrder
 from nautilus_trader.model.commands cimport TradingCommand
 from nautilus_trader.model.events cimport Event
+from nautilus_trader.model.events cimport OrderEvent
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.order.base cimport Order
 from nautilus_trader.trading.portfolio cimport Portfolio
@@ -42,6 +46,11 @@ from nautilus_trader.trading.portfolio cimport Portfolio
 cdef class LiveExecutionEngine(ExecutionEngine):
     """
     Provides a high-performance asynchronous live execution engine.
+
+    With priority lanes (the default) events, and cancel commands for orders
+    already known to the engine, are placed on a priority queue which is
+    always drained before the queue for all other commands. A burst of
+    commands therefore cannot delay the processing of fills.
     """
 
     def __init__(
@@ -83,7 +92,23 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         )
 
         self._loop = loop
-        self._queue = Queue(maxsize=config.get("qsize", 10000))
+        self._queue = Queue(
+            maxsize=config.get("qsize", 10000),
+            track_residency=config.get("track_residency", False),
+        )
+        self._priority_queue = Queue(
+            maxsize=config.get("priority_qsize", 10000),
+            track_residency=config.get("track_residency", False),
+        )
+        self._priority_lanes = config.get("priority_lanes", True)
+
+        # State reconciliation
+        self._reconciliation_timeout = config.get("reconciliation_timeout", 10.0)
+        self._unresolved = {}   # type: dict[ClientOrderId, tuple]
+        self._reconciled = None
+
+        self._tracer = None  # Initialized when registered with a tracer
+        self._batch_size = config.get("batch_size", 1000)
 
         self._run_queue_task = None
         self.is_running = False
@@ -112,14 +137,60 @@ cdef class LiveExecutionEngine(ExecutionEngine):
 
     cpdef int qsize(self) except *:
         """
-        Return the number of messages buffered on the internal queue.
+        Return the number of messages buffered on the internal queues.
 
         Returns
         -------
         int
 
         """
-        return self._queue.qsize()
+        return self._queue.qsize() + self._priority_queue.qsize()
+
+    cpdef dict queue_stats(self):
+        """
+        Return the batch size and residency statistics for the internal queues.
+
+        Residency times (seconds) are only recorded with the `track_residency`
+        config option.
+
+        Returns
+        -------
+        dict[str, dict[str, object]]
+
+        """
+        return {
+            "priority": self._priority_queue.stats(),
+            "message": self._queue.stats(),
+        }
+
+    cpdef list unresolved_orders(self):
+        """
+        Return the client order identifiers which were not resolved by the last
+        state reconciliation.
+
+        Returns
+        -------
+        list[ClientOrderId]
+
+        """
+        return sorted(self._unresolved.keys())
+
+    cpdef void register_tracer(self, LatencyTracer tracer) except *:
+        """
+        Register the engine and its execution clients with the given latency
+        tracer.
+
+        Parameters
+        ----------
+        tracer : LatencyTracer
+            The tracer to record to (if None then tracing is disabled).
+
+        """
+        self._tracer = tracer
+
+        cdef ExecutionClient client
+        for client in self._clients.values():
+            client.register_tracer(tracer)
 
     async def reconcile_state(self) -> bool:
         """
@@ -127,11 +198,13 @@ cdef class LiveExecutionEngine(ExecutionEngine):
 
         The execution engine will collect all cached active orders and send
         those to the relevant execution client(s) for a comparison with the
-        exchange(s) order states.
+        exchange(s) order states. State reports are requested from all clients
+        concurrently.
 
         If a cached order does not match the exchanges order status then
-        the missing events will be generated. If there is not enough information
-        to resolve a state then errors will be logged.
+        the missing events will be generated. Orders are resolved as their
+        events are processed, if any orders remain unresolved on timeout then
+        they are logged and available from `unresolved_orders`.
 
         Returns
         -------
@@ -160,39 +233,71 @@ cdef class LiveExecutionEngine(ExecutionEngine):
                                 f"execution client for active {order}.")
                 continue
 
-        cdef dict venue_reports = {}  # type: dict[Venue, ExecutionStateReport]
-
-        cdef LiveExecutionClient client
-        # Get state report from each client
-        for venue, client in self._clients.items():
-            venue_reports[venue] = await client.state_report(venue_orders[venue])
-
-        cdef int seconds = 10  # Hard coded for now
-        cdef datetime timeout = self._clock.utc_now() + timedelta(seconds=seconds)
+        # Get state report from each client concurrently
+        cdef list venues = list(self._clients.keys())
+        cdef list reports = await asyncio.gather(*[
+            self._clients[venue].state_report(venue_orders[venue])
+            for venue in venues
+        ])
+        cdef dict venue_reports = dict(zip(venues, reports))  # type: dict[Venue, ExecutionStateReport]
+
+        # Index expected states of unresolved orders
+        self._unresolved = {}
+        cdef ExecutionStateReport report
         cdef OrderState target_state
-        cdef bint resolved
-        while True:
-            if self._clock.utc_now() >= timeout:
-                self._log.error(f"Timed out ({seconds}s) waiting for "
+        for order in open_orders:
+            report = venue_reports.get(order.security.venue)
+            if report is None:
+                continue  # Already logged
+            target_state = report.order_states.get(order.id, 0)
+            filled_qty = None
+            if target_state in (OrderState.FILLED, OrderState.PARTIALLY_FILLED):
+                filled_qty = report.order_filled[order.id]
+            if not self._is_resolved(order, target_state, filled_qty):
+                self._unresolved[order.cl_ord_id] = (target_state, filled_qty)
+
+        # Wait for events to resolve orders
+        if self._unresolved:
+            self._reconciled = self._loop.create_future()
+            try:
+                await asyncio.wait_for(self._reconciled, timeout=self._reconciliation_timeout)
+            except asyncio.TimeoutError:
+                self._log.error(f"Timed out ({self._reconciliation_timeout}s) waiting for "
                                 f"execution states to resolve.")
+                for cl_ord_id, (target_state, filled_qty) in self._unresolved.items():
+                    order = self.cache.order(cl_ord_id)
+                    self._log.error(f"Unresolved {repr(cl_ord_id)}: "
+                                    f"state={order.state_string_c()}, "
+                                    f"expected={OrderStateParser.to_str(target_state)}, "
+                                    f"filled_qty={order.filled_qty}, "
+                                    f"expected_filled_qty={filled_qty}.")
                 return False
-
-            resolved = True
-            for order in open_orders:
-                target_state = venue_reports[order.security.venue].order_states.get(order.id, 0)
-                if order.state_c() != target_state:
-                    resolved = False  # Incorrect state
-                if target_state in (OrderState.FILLED, OrderState.PARTIALLY_FILLED):
-                    filled_qty = venue_reports[order.security.venue].order_filled[order.id]
-                    if order.filled_qty != filled_qty:
-                        resolved = False  # Incorrect filled quantity
-            if resolved:
-                break
-            await asyncio.sleep(0.001)  # One millisecond sleep
+            finally:
+                self._reconciled = None
 
         self._log.info(f"State reconciled.", LogColor.GREEN)
         return True  # Execution states resolved
 
+    cdef inline void _check_resolved(self, OrderEvent event) except *:
+        cdef tuple expected = self._unresolved.get(event.cl_ord_id)
+        if expected is None:
+            return  # Not awaiting resolution
+
+        cdef Order order = self.cache.order(event.cl_ord_id)
+        if order is None or not self._is_resolved(order, expected[0], expected[1]):
+            return  # Still unresolved
+
+        del self._unresolved[event.cl_ord_id]
+        if not self._unresolved and not self._reconciled.done():
+            self._reconciled.set_result(True)
+
+    cdef inline bint _is_resolved(self, Order order, OrderState target_state, filled_qty) except *:
+        if order.state_c() != target_state:
+            return False  # Incorrect state
+        if filled_qty is not None and order.filled_qty != filled_qty:
+            return False  # Incorrect filled quantity
+        return True
+
     cpdef void kill(self) except *:
         """
         Kill the engine by abruptly cancelling the queue task and calling stop.
@@ -205,12 +310,34 @@ cdef class LiveExecutionEngine(ExecutionEngine):
             self.is_running = False  # Avoids sentinel messages for queues
             self.stop()
 
+    cpdef void register_client(self, ExecutionClient client) except *:
+        """
+        Register the given execution client with the execution engine.
+
+        The client is also registered with any latency tracer.
+
+        Parameters
+        ----------
+        client : ExecutionClient
+            The execution client to register.
+
+        Raises
+        ------
+        ValueError
+            If client is already registered with the execution engine.
+
+        """
+        ExecutionEngine.register_client(self, client)
+
+        if self._tracer is not None:
+            client.register_tracer(self._tracer)
+
     cpdef void execute(self, TradingCommand command) except *:
         """
         Execute the given command.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and hold
+        the item (in order) on the queue overflow until a slot is free.
 
         Parameters
         ----------
@@ -226,18 +353,25 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         Condition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._queue.put_nowait(command)
-        except asyncio.QueueFull:
-            self._log.warning(f"Blocking on `_queue.put` as queue full at {self._queue.qsize()} items.")
-            self._queue.put(command)  # Block until qsize reduces below maxsize
+        if self._tracer is not None:
+            self._tracer.stamp(command)
+
+        if (
+            self._priority_lanes
+            and isinstance(command, CancelOrder)
+            and self.cache.order_exists(command.cl_ord_id)
+        ):
+            # The order is known so cannot be behind its submit command
+            self._enqueue(self._priority_queue, command)
+        else:
+            self._enqueue(self._queue, command)
 
     cpdef void process(self, Event event) except *:
         """
         Process the given event.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and hold
+        the item (in order) on the queue overflow until a slot is free.
 
         Parameters
         ----------
@@ -253,11 +387,15 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         Condition.not_none(event, "event")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._queue.put_nowait(event)
-        except asyncio.QueueFull:
-            self._log.warning(f"Blocking on `_queue.put` as queue full at {self._queue.qsize()} items.")
-            self._queue.put(event)  # Block until qsize reduces below maxsize
+        if self._priority_lanes:
+            self._enqueue(self._priority_queue, event)
+        else:
+            self._enqueue(self._queue, event)
+
+    cdef inline void _enqueue(self, Queue queue, Message message) except *:
+        if queue.put_or_overflow(message) and queue.overflow_qsize() == 1:
+            self._log.warning(f"Queue full at {queue.qsize()} items, "
+                              f"holding further messages on the overflow.")
 
     cpdef void _on_start(self) except *:
         if not self._loop.is_running():
@@ -271,23 +409,43 @@ cdef class LiveExecutionEngine(ExecutionEngine):
     cpdef void _on_stop(self) except *:
         if self.is_running:
             self.is_running = False
-            self._queue.put_nowait(None)  # Sentinel message pattern
+            self._queue.put_or_overflow(None)  # Sentinel message pattern
             self._log.debug(f"Sentinel message placed on message queue.")
 
     async def _run(self):
         self._log.debug(f"Message queue processing starting (qsize={self.qsize()})...")
+        cdef list batch
         cdef Message message
+        cdef int64_t start_ns = 0
         try:
             while self.is_running:
-                message = await self._queue.get()
-                if message is None:  # Sentinel message (fast C-level check)
-                    continue         # Returns to the top to check `self.is_running`
-                if message.type == MessageType.EVENT:
-                    self._handle_event(message)
-                elif message.type == MessageType.COMMAND:
-                    self._execute_command(message)
-                else:
-                    self._log.error(f"Cannot handle message: unrecognized {message}.")
+                # Drain available messages (up to batch size), always taking
+                # from the priority lane first.
+                batch = self._priority_queue.get_batch_nowait(self._batch_size)
+                if not batch:
+                    batch = self._queue.get_batch_nowait(self._batch_size)
+                if not batch:
+                    await asyncio.sleep(0)  # Wait for messages
+                    continue
+                for message in batch:
+                    if message is None:  # Sentinel message (fast C-level check)
+                        continue         # Loop returns to the top to check `self.is_running`
+                    if self._tracer is not None:
+                        start_ns = monotonic_ns()
+                    if message.type == MessageType.EVENT:
+                        self._handle_event(message)
+                        if self._reconciled is not None and isinstance(message, OrderEvent):
+                            self._check_resolved(message)
+                        if self._tracer is not None:
+                            self._tracer.handled(message, start_ns)
+                            if isinstance(message, OrderEvent):
+                                self._tracer.event(message)
+                    elif message.type == MessageType.COMMAND:
+                        self._execute_command(message)
+                        if self._tracer is not None:
+                            self._tracer.handled(message, start_ns)
+                    else:
+                        self._log.error(f"Cannot handle message: unrecognized {message}.")
         except CancelledError:
             if self.qsize() > 0:
                 self._log.warning(f"Running cancelled "
@@ -0,0 +1,221 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+from typing import Dict, Optional
+
+from nautilus_trader.common.latency import LatencyTracer
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.common.logging import LoggerAdapter
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.live.data_engine import LiveDataEngine
+from nautilus_trader.live.execution_engine import LiveExecutionEngine
+
+
+class LoopMonitor:
+    """
+    Provides a monitor for event loop scheduling lag and live engine queues.
+
+    At each interval the monitor measures how late its own callback was run by
+    the event loop (the lag), which rises as the loop becomes saturated. The
+    queue depths of the live engines are sampled at the same time. A warning is
+    logged whenever the lag exceeds the warning threshold.
+
+    When given a latency tracer, a summary of the traced latencies and of the
+    time the live engines spent handling each message type is also logged at
+    each trace log interval.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        data_engine: LiveDataEngine,
+        exec_engine: LiveExecutionEngine,
+        logger: Logger,
+        interval: float = 1.0,
+        lag_warning: float = 0.1,
+        tracer: Optional[LatencyTracer] = None,
+        trace_log_interval: float = 60.0,
+    ):
+        """
+        Initialize a new instance of the `LoopMonitor` class.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            The event loop to monitor.
+        data_engine : LiveDataEngine
+            The live data engine to monitor.
+        exec_engine : LiveExecutionEngine
+            The live execution engine to monitor.
+        logger : Logger
+            The logger for the monitor.
+        interval : float
+            The interval (seconds) between samples.
+        lag_warning : float
+            The lag (seconds) at or above which a warning is logged.
+        tracer : LatencyTracer, optional
+            The latency tracer to summarize.
+        trace_log_interval : float
+            The interval (seconds) between latency summaries being logged.
+
+        Raises
+        ------
+        ValueError
+            If interval is not positive (> 0).
+        ValueError
+            If lag_warning is not positive (> 0).
+        ValueError
+            If trace_log_interval is not positive (> 0).
+
+        """
+        PyCondition.positive(interval, "interval")
+        PyCondition.positive(lag_warning, "lag_warning")
+        PyCondition.positive(trace_log_interval, "trace_log_interval")
+
+        self._loop = loop
+        self._data_engine = data_engine
+        self._exec_engine = exec_engine
+        self._log = LoggerAdapter(component_name=self.__class__.__name__, logger=logger)
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._tracer = tracer
+        self._next_trace_log = 0.
+
+        self.interval = interval
+        self.lag_warning = lag_warning
+        self.trace_log_interval = trace_log_interval
+        self.reset()
+
+    @property
+    def is_running(self) -> bool:
+        """
+        If the monitor is running.
+
+        Returns
+        -------
+        bool
+            True if running, else False.
+
+        """
+        return self._handle is not None
+
+    def start(self) -> None:
+        """
+        Start sampling the event loop.
+        """
+        if self._handle is not None:
+            return  # Already running
+
+        self._next_trace_log = self._loop.time() + self.trace_log_interval
+        self._schedule()
+        self._log.debug(f"Monitoring event loop every {self.interval}s.")
+
+    def stop(self) -> None:
+        """
+        Stop sampling the event loop.
+        """
+        if self._handle is None:
+            return  # Not running
+
+        self._handle.cancel()
+        self._handle = None
+
+    def reset(self) -> None:
+        """
+        Reset the statistics of the monitor.
+        """
+        self.sample_count = 0
+        self.warning_count = 0
+        self.last_lag = 0.
+        self.max_lag = 0.
+        self._total_lag = 0.
+        self._last_depths = self._depths()
+        self._max_depths = dict(self._last_depths)
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Return the current statistics of the monitor.
+
+        Lag times are in seconds, traced latencies and handling times are in
+        nanoseconds.
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        stats = {
+            "sample_count": self.sample_count,
+            "warning_count": self.warning_count,
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+            "mean_lag": self._total_lag / self.sample_count if self.sample_count else 0.,
+            "qsize": dict(self._last_depths),
+            "max_qsize": dict(self._max_depths),
+            "data_engine": self._data_engine.queue_stats(),
+            "exec_engine": self._exec_engine.queue_stats(),
+        }
+
+        if self._tracer is not None:
+            stats["latency"] = self._tracer.stats()
+            stats["handlers"] = self._tracer.handler_stats()
+
+        return stats
+
+    def _schedule(self) -> None:
+        expected = self._loop.time() + self.interval
+        self._handle = self._loop.call_at(expected, self._sample, expected)
+
+    def _sample(self, expected: float) -> None:
+        lag = max(self._loop.time() - expected, 0.)
+
+        self.sample_count += 1
+        self.last_lag = lag
+        self._total_lag += lag
+        if lag > self.max_lag:
+            self.max_lag = lag
+
+        self._last_depths = self._depths()
+        for name, depth in self._last_depths.items():
+            if depth > self._max_depths[name]:
+                self._max_depths[name] = depth
+
+        if lag >= self.lag_warning:
+            self.warning_count += 1
+            self._log.warning(
+                f"Event loop lag {lag * 1000:.1f}ms ("
+                f"data_qsize={self._last_depths['data']}, "
+                f"message_qsize={self._last_depths['message']}, "
+                f"exec_qsize={self._last_depths['exec']}).",
+            )
+
+        if self._tracer is not None and self._loop.time() >= self._next_trace_log:
+            self._next_trace_log += self.trace_log_interval
+            self._log_latency()
+
+        self._schedule()
+
+    def _log_latency(self) -> None:
+        for line in self._tracer.summary():
+            self._log.info(f"Latency {line}")
+        for line in self._tracer.handler_summary():
+            self._log.info(f"Handler {line}")
+
+    def _depths(self) -> Dict[str, int]:
+        return {
+            "data": self._data_engine.data_qsize(),
+            "message": self._data_engine.message_qsize(),
+            "exec": self._exec_engine.qsize(),
+        }
@@ -31,6 +31,7 @@ from nautilus_trader.adapters.oanda.factory import OandaDataClientFactory
 from nautilus_trader.analysis.performance import PerformanceAnalyzer
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.enums import ComponentState
+from nautilus_trader.common.latency import LatencyTracer
 from nautilus_trader.common.logging import LiveLogger
 from nautilus_trader.common.logging import LogLevelParser
 from nautilus_trader.common.logging import LoggerAdapter
@@ -40,6 +41,7 @@ from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.execution.database import BypassExecutionDatabase
 from nautilus_trader.live.data_engine import LiveDataEngine
 from nautilus_trader.live.execution_engine import LiveExecutionEngine
+from nautilus_trader.live.monitor import LoopMonitor
 from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.redis.execution import RedisExecutionDatabase
 from nautilus_trader.serialization.serializers import MsgPackCommandSerializer
@@ -50,9 +52,9 @@ from nautilus_trader.trading.trader import Trader
 
 try:
     import uvloop
-    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     uvloop_version = uvloop.__version__
 except ImportError:
+    uvloop = None
     uvloop_version = None
     warnings.warn("uvloop is not available.")
 
@@ -98,8 +100,16 @@ class TradingNode:
         config_strategy = config.get("strategy", {})
         config_adapters = config.get("adapters", {})
 
+        # Run on a uvloop event loop when installed (unless disabled), the
+        # process wide event loop policy is left unchanged
+        self._use_uvloop = uvloop is not None and config_system.get("use_uvloop", True)
+
         self._uuid_factory = UUIDFactory()
-        self._loop = asyncio.get_event_loop()
+        if self._use_uvloop:
+            self._loop = uvloop.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+        else:
+            self._loop = asyncio.get_event_loop()
         self._executor = concurrent.futures.ThreadPoolExecutor()
         self._loop.set_default_executor(self._executor)
         self._clock = LiveClock(loop=self._loop)
@@ -197,6 +207,30 @@ class TradingNode:
         self._load_strategy_state = config_strategy.get("load_state", True)
         self._save_strategy_state = config_strategy.get("save_state", True)
 
+        # Latency tracing
+        self._tracer = None
+        if config_system.get("trace_latency", False):
+            self._tracer = LatencyTracer()
+            self._data_engine.register_tracer(self._tracer)
+            self._exec_engine.register_tracer(self._tracer)
+            for strategy in strategies:
+                strategy.register_tracer(self._tracer)
+
+        # Event loop monitoring (an interval of 0 disables the monitor)
+        self._monitor = None
+        monitor_interval = config_system.get("loop_monitor_interval", 1.0)
+        if monitor_interval > 0:
+            self._monitor = LoopMonitor(
+                loop=self._loop,
+                data_engine=self._data_engine,
+                exec_engine=self._exec_engine,
+                logger=self._logger,
+                interval=monitor_interval,
+                lag_warning=config_system.get("loop_lag_warning", 0.1),
+                tracer=self._tracer,
+                trace_log_interval=config_system.get("trace_log_interval", 60.0),
+            )
+
         if self._load_strategy_state:
             self.trader.load()
 
@@ -228,6 +262,36 @@ class TradingNode:
         """
         return self._loop
 
+    def get_loop_stats(self) -> Dict[str, object]:
+        """
+        Return the event loop lag and engine queue statistics of the trading node.
+
+        Returns
+        -------
+        dict[str, object]
+            The statistics (empty if the loop monitor is disabled).
+
+        """
+        if self._monitor is None:
+            return {}
+        return self._monitor.stats()
+
+    def get_latency_stats(self) -> Dict[str, Dict[str, object]]:
+        """
+        Return the traced latency statistics of the trading node.
+
+        Latencies are in nanoseconds.
+
+        Returns
+        -------
+        dict[str, dict[str, object]]
+            The statistics per stage (empty if latency tracing is disabled).
+
+        """
+        if self._tracer is None:
+            return {}
+        return self._tracer.stats()
+
     def get_logger(self) -> LiveLogger:
         """
         Return the logger for the trading node.
@@ -292,6 +356,7 @@ class TradingNode:
             self.trader.dispose()
             self._data_engine.dispose()
             self._exec_engine.dispose()
+            self._clock.dispose()
 
             self._log.info("Shutting down executor...")
             if sys.version_info >= (3, 9):
@@ -333,7 +398,7 @@ class TradingNode:
         nautilus_header(self._log)
         self._log.info(f"redis {redis.__version__}")
         self._log.info(f"msgpack {msgpack.version[0]}.{msgpack.version[1]}.{msgpack.version[2]}")
-        if uvloop_version:
+        if uvloop_version and self._use_uvloop:
             self._log.info(f"uvloop {uvloop_version}")
         self._log.info("=================================================================")
 
@@ -421,6 +486,9 @@ class TradingNode:
             self._data_engine.start()
             self._exec_engine.start()
 
+            if self._monitor is not None:
+                self._monitor.start()
+
             result: bool = await self._await_engines_connected()
             if not result:
                 return
@@ -486,6 +554,9 @@ class TradingNode:
 
         await self._await_engines_disconnected()
 
+        if self._monitor is not None:
+            self._monitor.stop()
+
         # Clean up remaining timers
         timer_names = self._clock.timer_names()
         self._clock.cancel_timers()
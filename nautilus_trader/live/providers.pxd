@@ -28,9 +28,19 @@ cdef class InstrumentProvider:
     """The venue of the provider.\n\n:returns: `Venue`"""
     cdef readonly int count
     """The count of instruments held by the provider.\n\n:returns: `int`"""
+    cdef readonly str cache_path
+    """The path of the on-disk instrument cache (if any).\n\n:returns: `str` or None"""
+    cdef readonly double cache_ttl
+    """The maximum age (seconds) of the on-disk instrument cache.\n\n:returns: `double`"""
+    cdef readonly str cache_hash
+    """The content hash of the last loaded instrument metadata.\n\n:returns: `str` or None"""
 
-    cpdef void load_all(self) except *
+    cpdef void load_all(self, bint reload=*) except *
     cpdef dict get_all(self)
     cpdef Currency currency(self, str code)
     cpdef Instrument get(self, Security security)
     cdef Instrument get_c(self, Symbol symbol)
+    cpdef dict read_cache(self)
+    cpdef bint update_cache(self, dict payload) except *
+    cpdef list changed(self, dict previous)
+    cdef str _hash_payload(self, dict payload)
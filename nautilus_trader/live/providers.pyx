@@ -13,6 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import hashlib
+import json
+import os
+import time
+
+from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.model.currency cimport Currency
 from nautilus_trader.model.identifiers cimport Security
 from nautilus_trader.model.identifiers cimport Symbol
@@ -27,7 +33,13 @@ cdef class InstrumentProvider:
     This class should not be used directly, but through its concrete subclasses.
     """
 
-    def __init__(self, Venue venue not None, bint load_all=False):
+    def __init__(
+        self,
+        Venue venue not None,
+        bint load_all=False,
+        str cache_dir=None,
+        double cache_ttl=3600,
+    ):
         """
         Initialize a new instance of the `InstrumentProvider` class.
 
@@ -37,10 +49,30 @@ cdef class InstrumentProvider:
             The venue for the provider.
         load_all : bool, optional
             If all instruments should be loaded at instantiation.
+        cache_dir : str, optional
+            The directory for the on-disk instrument cache. If None then
+            instruments are always loaded from the venue.
+        cache_ttl : double, optional
+            The maximum age (seconds) of the on-disk cache before it is
+            considered stale.
+
+        Raises
+        ------
+        ValueError
+            If cache_ttl is negative (< 0).
 
         """
+        Condition.not_negative(cache_ttl, "cache_ttl")
+
         self.venue = venue
         self.count = 0
+        self.cache_ttl = cache_ttl
+        self.cache_hash = None
+
+        if cache_dir is not None:
+            self.cache_path = os.path.join(cache_dir, f"{venue.value.lower()}-instruments.json")
+        else:
+            self.cache_path = None
 
         self._currencies = {}   # type: dict[str, Currency]
         self._instruments = {}  # type: dict[Symbol, Instrument]
@@ -52,7 +84,7 @@ cdef class InstrumentProvider:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")
 
-    cpdef void load_all(self) except *:
+    cpdef void load_all(self, bint reload=False) except *:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")
 
@@ -83,3 +115,113 @@ cdef class InstrumentProvider:
     cdef Instrument get_c(self, Symbol symbol):
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")
+
+    cpdef dict read_cache(self):
+        """
+        Return the instrument metadata held in the on-disk cache (if valid).
+
+        The cache is only valid if its content hash matches and it is not
+        older than the cache TTL. The age of the cache is taken from the
+        modification time of the file, which each update refreshes. A valid
+        read sets the `cache_hash`.
+
+        Returns
+        -------
+        dict or None
+
+        """
+        if self.cache_path is None or not os.path.isfile(self.cache_path):
+            return None
+
+        try:
+            with open(self.cache_path, "r") as cache_file:
+                cached = json.load(cache_file)
+        except (OSError, ValueError):
+            return None  # Unreadable or corrupt
+
+        cdef dict payload = cached.get("payload")
+        if payload is None or self._hash_payload(payload) != cached.get("hash"):
+            return None  # Incomplete or modified
+
+        if time.time() - os.path.getmtime(self.cache_path) > self.cache_ttl:
+            return None  # Stale
+
+        self.cache_hash = cached["hash"]
+        return payload
+
+    cpdef bint update_cache(self, dict payload) except *:
+        """
+        Update the cache with the given instrument metadata.
+
+        The metadata is identified by its content hash, which acts as an etag.
+        If the hash has not changed since the last load then the metadata is
+        not written again, only the age of the cache is refreshed. If no cache
+        directory was given then only the hash is updated.
+
+        Parameters
+        ----------
+        payload : dict
+            The raw instrument metadata from the venue.
+
+        Returns
+        -------
+        bool
+            True if the metadata changed since the last load, else False.
+
+        """
+        Condition.not_none(payload, "payload")
+
+        cdef str payload_hash = self._hash_payload(payload)
+        cdef bint changed = payload_hash != self.cache_hash
+        self.cache_hash = payload_hash
+
+        if self.cache_path is None:
+            return changed
+
+        if not changed and os.path.isfile(self.cache_path):
+            os.utime(self.cache_path)  # Refresh the age of the cache
+            return False
+
+        cdef dict cached = {
+            "hash": payload_hash,
+            "payload": payload,
+        }
+
+        # Write to a temporary file then rename to avoid a partially written cache
+        cdef str temp_path = self.cache_path + ".tmp"
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        with open(temp_path, "w") as cache_file:
+            json.dump(cached, cache_file, default=str)
+        os.replace(temp_path, self.cache_path)
+
+        return changed
+
+    cpdef list changed(self, dict previous):
+        """
+        Return the instruments which were added or changed relative to the
+        given previously loaded instruments.
+
+        Parameters
+        ----------
+        previous : dict
+            The instruments from before the latest load (from `get_all`).
+
+        Returns
+        -------
+        list[Instrument]
+
+        """
+        Condition.not_none(previous, "previous")
+
+        cdef list changed = []
+        cdef Instrument instrument
+        cdef Instrument prior
+        for key, instrument in self._instruments.items():
+            prior = previous.get(key)
+            if prior is None or prior.info != instrument.info:
+                changed.append(instrument)
+
+        return changed
+
+    cdef str _hash_payload(self, dict payload):
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport int64_t
+
 from nautilus_trader.core.message cimport Command
 from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.identifiers cimport ClientOrderId
@@ -30,6 +32,8 @@ from nautilus_trader.model.order.bracket cimport BracketOrder
 cdef class TradingCommand(Command):
     cdef readonly Venue venue
     """The venue the command relates to.\n\n:returns: `Venue`"""
+    cdef readonly int64_t trace_ns
+    """The monotonic origin of the latency trace for the command (zero if not traced).\n\n:returns: `int`"""
 
 
 cdef class SubmitOrder(TradingCommand):
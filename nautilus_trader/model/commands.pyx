@@ -55,6 +55,7 @@ cdef class TradingCommand(Command):
         super().__init__(command_id, command_timestamp)
 
         self.venue = venue
+        self.trace_ns = 0  # Stamped when traced by a `LatencyTracer`
 
 
 cdef class SubmitOrder(TradingCommand):
@@ -37,9 +37,13 @@ cdef class BaseDecimal:
 cdef class Quantity(BaseDecimal):
     cpdef str to_str(self)
 
+    @staticmethod
+    cdef Quantity from_decimal_c(object value)
+
 
 cdef class Price(BaseDecimal):
-    pass
+    @staticmethod
+    cdef Price from_decimal_c(object value)
 
 
 cdef class Money(BaseDecimal):
@@ -349,6 +349,14 @@ cdef class Quantity(BaseDecimal):
         """
         return f"{self._value:,}"
 
+    @staticmethod
+    cdef Quantity from_decimal_c(object value):
+        # Wraps an already quantized Decimal without formatting or the
+        # non-negative check, the precision is taken from its exponent
+        cdef Quantity quantity = Quantity.__new__(Quantity)
+        quantity._value = value
+        return quantity
+
 
 cdef class Price(BaseDecimal):
     """
@@ -396,6 +404,14 @@ cdef class Price(BaseDecimal):
         """
         super().__init__(value, precision, rounding)
 
+    @staticmethod
+    cdef Price from_decimal_c(object value):
+        # Wraps an already quantized Decimal without formatting, the precision
+        # is taken from its exponent
+        cdef Price price = Price.__new__(Price)
+        price._value = value
+        return price
+
 
 cdef class Money(BaseDecimal):
     """
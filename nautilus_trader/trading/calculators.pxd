@@ -31,8 +31,27 @@ cdef class ExchangeRateCalculator:
     )
 
 
+cdef class ExchangeRateGraph:
+    cdef dict _bids
+    cdef dict _asks
+    cdef dict _edges
+    cdef dict _rates
+    cdef dict _dependents
+
+    cpdef void update(self, str symbol, bid, ask) except *
+    cpdef object get_rate(self, Currency from_currency, Currency to_currency, PriceType price_type)
+    cpdef void clear(self) except *
+
+    cdef inline list _find_path(self, str from_code, str to_code)
+    cdef inline object _get_quote(self, str symbol, PriceType price_type)
+    cdef inline void _invalidate(self, str symbol) except *
+
+
 cdef class RolloverInterestCalculator:
     cdef dict _rate_data
+    cdef dict _currency_rows
+    cdef int _first_month
+    cdef double[:, :] _rates
 
     cpdef object get_rate_data(self)
     cpdef object calc_overnight_rate(self, Security security, date timestamp)
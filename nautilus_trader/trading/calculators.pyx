@@ -16,8 +16,11 @@
 from decimal import Decimal
 from itertools import permutations
 
+import numpy as np
 import pandas as pd
 
+from libc.math cimport isnan
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.model.c_enums.price_type cimport PriceType
 from nautilus_trader.model.c_enums.price_type cimport PriceTypeParser
@@ -184,12 +187,215 @@ cdef class ExchangeRateCalculator:
         return quotes.get(to_currency.code, Decimal())
 
 
+cdef class ExchangeRateGraph:
+    """
+    Provides an incrementally maintained currency conversion graph.
+
+    Each currency pair quote is an edge between two currency nodes, with the
+    edge updated in place as quotes arrive. Exchange rates are resolved along
+    the shortest conversion path and memoised, with a memoised rate only
+    invalidated when a quote on its conversion path changes.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new instance of the `ExchangeRateGraph` class.
+        """
+        self._bids = {}        # type: dict[str, Decimal]
+        self._asks = {}        # type: dict[str, Decimal]
+        self._edges = {}       # type: dict[str, dict[str, tuple[str, bool]]]
+        self._rates = {}       # type: dict[tuple[str, str, PriceType], Decimal]
+        self._dependents = {}  # type: dict[str, set[tuple[str, str, PriceType]]]
+
+    cpdef void update(self, str symbol, bid, ask) except *:
+        """
+        Update the graph with the given currency pair quote.
+
+        Parameters
+        ----------
+        symbol : str
+            The currency pair symbol of the form 'BASE/QUOTE'.
+        bid : Decimal
+            The bid rate for the currency pair.
+        ask : Decimal
+            The ask rate for the currency pair.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        cdef tuple pieces
+        cdef str code_lhs
+        cdef str code_rhs
+        last_bid = self._bids.get(symbol)
+        if last_bid is None:
+            pieces = symbol.partition('/')
+            code_lhs = pieces[0]
+            code_rhs = pieces[2]
+            if not code_rhs:
+                return  # Not a currency pair
+
+            # New edge changes the graph topology, invalidate all rates
+            self._edges.setdefault(code_lhs, {}).setdefault(code_rhs, (symbol, False))
+            self._edges.setdefault(code_rhs, {}).setdefault(code_lhs, (symbol, True))
+            self._rates.clear()
+            self._dependents.clear()
+        elif last_bid == bid and self._asks[symbol] == ask:
+            return  # Quote unchanged
+        else:
+            self._invalidate(symbol)
+
+        self._bids[symbol] = bid
+        self._asks[symbol] = ask
+
+    cpdef object get_rate(
+        self,
+        Currency from_currency,
+        Currency to_currency,
+        PriceType price_type,
+    ):
+        """
+        Return the exchange rate for the given currencies and price type.
+
+        Parameters
+        ----------
+        from_currency : Currency
+            The currency to convert from.
+        to_currency : Currency
+            The currency to convert to.
+        price_type : PriceType (Enum)
+            The price type for conversion.
+
+        Returns
+        -------
+        Decimal
+
+        Raises
+        ------
+        ValueError
+            If price_type is UNDEFINED or LAST.
+
+        Notes
+        -----
+        If insufficient data to calculate exchange rate then will return 0.
+
+        """
+        Condition.not_none(from_currency, "from_currency")
+        Condition.not_none(to_currency, "to_currency")
+        Condition.true(price_type != PriceType.UNDEFINED and price_type != PriceType.LAST, "price_type was UNDEFINED or LAST")
+
+        if from_currency == to_currency:
+            return Decimal(1)  # No conversion necessary
+
+        cdef tuple key = (from_currency.code, to_currency.code, price_type)
+        xrate = self._rates.get(key)
+        if xrate is not None:
+            return xrate
+
+        cdef list path = self._find_path(from_currency.code, to_currency.code)
+        if path is None:
+            # Not enough data (memoised until the graph topology changes)
+            xrate = Decimal()
+            self._rates[key] = xrate
+            return xrate
+
+        xrate = Decimal(1)
+        cdef str symbol
+        cdef bint inverse
+        for symbol, inverse in path:
+            if inverse:
+                xrate = xrate / self._get_quote(symbol, price_type)
+            else:
+                xrate = xrate * self._get_quote(symbol, price_type)
+            self._dependents.setdefault(symbol, set()).add(key)
+
+        self._rates[key] = xrate
+        return xrate
+
+    cpdef void clear(self) except *:
+        """
+        Clear all quotes and memoised rates from the graph.
+        """
+        self._bids.clear()
+        self._asks.clear()
+        self._edges.clear()
+        self._rates.clear()
+        self._dependents.clear()
+
+    cdef inline list _find_path(self, str from_code, str to_code):
+        # Breadth-first search for the shortest conversion path
+        if from_code not in self._edges or to_code not in self._edges:
+            return None
+
+        cdef dict parents = {from_code: None}  # type: dict[str, tuple[str, tuple[str, bool]]]
+        cdef list frontier = [from_code]
+        cdef list next_frontier
+        cdef list path
+        cdef str code
+        cdef str neighbour
+        cdef tuple edge
+        while frontier:
+            next_frontier = []
+            for code in frontier:
+                for neighbour, edge in self._edges[code].items():
+                    if neighbour in parents:
+                        continue
+                    parents[neighbour] = (code, edge)
+                    if neighbour == to_code:
+                        # Walk back to the origin to build the path
+                        path = []
+                        while parents[neighbour] is not None:
+                            neighbour, edge = parents[neighbour]
+                            path.append(edge)
+                        path.reverse()
+                        return path
+                    next_frontier.append(neighbour)
+            frontier = next_frontier
+
+        return None
+
+    cdef inline object _get_quote(self, str symbol, PriceType price_type):
+        if price_type == PriceType.BID:
+            return self._bids[symbol]
+        elif price_type == PriceType.ASK:
+            return self._asks[symbol]
+        else:  # price_type == PriceType.MID
+            return (self._bids[symbol] + self._asks[symbol]) / Decimal(2)
+
+    cdef inline void _invalidate(self, str symbol) except *:
+        cdef set dependents = self._dependents.pop(symbol, None)
+        if dependents is None:
+            return
+
+        cdef tuple key
+        for key in dependents:
+            self._rates.pop(key, None)
+
+
+_ROLLOVER_CURRENCY_LOCATIONS = {
+    "AUD": "AUS",
+    "CAD": "CAN",
+    "CHF": "CHE",
+    "EUR": "EA19",
+    "USD": "USA",
+    "JPY": "JPN",
+    "NZD": "NZL",
+    "GBP": "GBR",
+    "RUB": "RUS",
+    "NOK": "NOR",
+    "CNY": "CHN",
+    "CNH": "CHN",
+    "MXN": "MEX",
+    "ZAR": "ZAF",
+}
+
+
 cdef class RolloverInterestCalculator:
     """
     Provides rollover interest rate calculations.
 
-    If rate_data_csv_path is empty then will default to the included short-term
-    interest rate data csv (data since 1956).
+    The short-term interest rate data is compiled at initialization into a dense
+    (currency, month) rate table, with monthly values taking precedence over
+    quarterly values, so each calculation is an array lookup.
     """
 
     def __init__(self, data not None: pd.DataFrame):
@@ -203,22 +409,45 @@ cdef class RolloverInterestCalculator:
 
         """
         self._rate_data = {
-            "AUD": data.loc[data["LOCATION"] == "AUS"],
-            "CAD": data.loc[data["LOCATION"] == "CAN"],
-            "CHF": data.loc[data["LOCATION"] == "CHE"],
-            "EUR": data.loc[data["LOCATION"] == "EA19"],
-            "USD": data.loc[data["LOCATION"] == "USA"],
-            "JPY": data.loc[data["LOCATION"] == "JPN"],
-            "NZD": data.loc[data["LOCATION"] == "NZL"],
-            "GBP": data.loc[data["LOCATION"] == "GBR"],
-            "RUB": data.loc[data["LOCATION"] == "RUS"],
-            "NOK": data.loc[data["LOCATION"] == "NOR"],
-            "CNY": data.loc[data["LOCATION"] == "CHN"],
-            "CNH": data.loc[data["LOCATION"] == "CHN"],
-            "MXN": data.loc[data["LOCATION"] == "MEX"],
-            "ZAR": data.loc[data["LOCATION"] == "ZAF"],
+            currency: data.loc[data["LOCATION"] == location]
+            for currency, location in _ROLLOVER_CURRENCY_LOCATIONS.items()
         }
 
+        # Parse monthly ('YYYY-MM') and quarterly ('YYYY-Qn') periods to month numbers
+        cdef dict monthly = {}
+        cdef dict quarterly = {}
+        for currency, rates in self._rate_data.items():
+            periods = rates["TIME"].astype(str)
+            years = periods.str[:4].astype(int)
+            is_quarter = periods.str[5] == "Q"
+            is_month = ~is_quarter & (periods.str.len() == 7)
+            monthly[currency] = (
+                years[is_month].values * 12 + periods[is_month].str[5:].astype(int).values - 1,
+                rates["Value"][is_month].values,
+            )
+            quarterly[currency] = (
+                years[is_quarter].values * 12 + (periods[is_quarter].str[6:].astype(int).values - 1) * 3,
+                rates["Value"][is_quarter].values,
+            )
+
+        cdef list months = [m for m, _ in monthly.values()] + [q for q, _ in quarterly.values()]
+        months = [m for m in months if len(m) > 0]
+        self._first_month = min(m.min() for m in months) if months else 0
+        cdef int last_month = max(m.max() for m in months) + 2 if months else 0
+
+        table = np.full((len(self._rate_data), last_month - self._first_month + 1), np.nan)
+        self._currency_rows = {}
+        cdef int row
+        for row, currency in enumerate(self._rate_data):
+            self._currency_rows[currency] = row
+            quarter_months, values = quarterly[currency]
+            for offset in range(3):
+                table[row, quarter_months - self._first_month + offset] = values
+            months_index, values = monthly[currency]
+            table[row, months_index - self._first_month] = values  # Monthly takes precedence
+
+        self._rates = table
+
     cpdef object get_rate_data(self):
         """
         Return the short-term interest rate dataframe.
@@ -249,6 +478,8 @@ cdef class RolloverInterestCalculator:
         ------
         ValueError
             If security.symbol length is not in range [6, 7].
+        RuntimeError
+            If the rate for either currency is not available for the date.
 
         Notes
         -----
@@ -259,20 +490,17 @@ cdef class RolloverInterestCalculator:
         Condition.not_none(date, "timestamp")
         Condition.in_range_int(len(security.symbol.value), 6, 7, "len(security)")
 
-        cdef str base_currency = security.symbol.value[:3]
-        cdef str quote_currency = security.symbol.value[-3:]
-        cdef str time_monthly = f"{date.year}-{str(date.month).zfill(2)}"
-        cdef str time_quarter = f"{date.year}-Q{str(int(((date.month - 1) // 3) + 1)).zfill(2)}"
+        cdef int base_row = self._currency_rows[security.symbol.value[:3]]
+        cdef int quote_row = self._currency_rows[security.symbol.value[-3:]]
+        cdef int month = date.year * 12 + date.month - 1 - self._first_month
 
-        base_data = self._rate_data[base_currency].loc[self._rate_data[base_currency]['TIME'] == time_monthly]
-        if base_data.empty:
-            base_data = self._rate_data[base_currency].loc[self._rate_data[base_currency]['TIME'] == time_quarter]
+        if month < 0 or month >= self._rates.shape[1]:
+            raise RuntimeError(f"Cannot find rollover interest rate for {security} on {date}")
 
-        quote_data = self._rate_data[quote_currency].loc[self._rate_data[quote_currency]['TIME'] == time_monthly]
-        if quote_data.empty:
-            quote_data = self._rate_data[quote_currency].loc[self._rate_data[quote_currency]['TIME'] == time_quarter]
+        cdef double base_rate = self._rates[base_row, month]
+        cdef double quote_rate = self._rates[quote_row, month]
 
-        if base_data.empty and quote_data.empty:
+        if isnan(base_rate) or isnan(quote_rate):
             raise RuntimeError(f"Cannot find rollover interest rate for {security} on {date}")
 
-        return Decimal(((<double>base_data['Value'] - <double>quote_data['Value']) / 365) / 100)
+        return Decimal(((base_rate - quote_rate) / 365) / 100)
@@ -47,6 +47,10 @@ cdef class EconomicNewsEventFilter:
     cdef datetime _unfiltered_data_end
     cdef list _currencies
     cdef list _impacts
+    cdef list _events
+    cdef dict _indexes
 
-    cpdef NewsEvent next_event(self, datetime time_now)
-    cpdef NewsEvent prev_event(self, datetime time_now)
+    cpdef NewsEvent next_event(self, datetime time_now, str currency=*, str impact=*)
+    cpdef NewsEvent prev_event(self, datetime time_now, str currency=*, str impact=*)
+    cpdef list events_between(self, datetime start, datetime end, str currency=*, str impact=*)
+    cdef void _check_time_now(self, datetime time_now) except *
@@ -15,17 +15,20 @@
 
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 import pytz
 
 from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
 
 from enum import Enum
 from enum import unique
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport is_datetime_utc
+from nautilus_trader.core.datetime cimport to_unix_time_ns
 
 
 @unique
@@ -358,9 +361,42 @@ cdef class NewsEvent:
         self.currency = currency
 
 
+cdef inline Py_ssize_t _bisect_left(int64_t[:] values, int64_t x):
+    # Index of the first value >= x
+    cdef Py_ssize_t lo = 0
+    cdef Py_ssize_t hi = values.shape[0]
+    cdef Py_ssize_t mid
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if values[mid] < x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+cdef inline Py_ssize_t _bisect_right(int64_t[:] values, int64_t x):
+    # Index of the first value > x
+    cdef Py_ssize_t lo = 0
+    cdef Py_ssize_t hi = values.shape[0]
+    cdef Py_ssize_t mid
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if values[mid] <= x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
 cdef class EconomicNewsEventFilter:
     """
     Provides methods to help filter trading strategy rules based on economic news events.
+
+    The filtered news events are indexed once at initialization as sorted
+    int64 timestamp arrays (overall, per currency, per impact and per currency
+    and impact), so each query is a binary search rather than a scan of the
+    news data.
     """
 
     def __init__(
@@ -382,6 +418,9 @@ cdef class EconomicNewsEventFilter:
             The economic news data .
 
         """
+        if not news_data.index.is_monotonic_increasing:
+            news_data = news_data.sort_index(kind="mergesort")
+
         self._currencies = currencies
         self._impacts = impacts
 
@@ -392,6 +431,33 @@ cdef class EconomicNewsEventFilter:
             news_data["Currency"].isin(currencies) & news_data["Impact"].isin(impacts)
         ]
 
+        # Build events and indexes
+        self._events = [
+            NewsEvent(timestamp, impact, name, currency)
+            for timestamp, impact, name, currency in zip(
+                self._news_data.index,
+                self._news_data["Impact"],
+                self._news_data["Name"],
+                self._news_data["Currency"],
+            )
+        ]
+
+        timestamps = self._news_data.index.values.astype(np.int64)
+        positions = np.arange(len(timestamps), dtype=np.int64)
+        event_currencies = self._news_data["Currency"].values
+        event_impacts = self._news_data["Impact"].values
+
+        self._indexes = {(None, None): (timestamps, positions)}  # type: dict[tuple, tuple]
+        for currency in currencies:
+            mask = event_currencies == currency
+            self._indexes[(currency, None)] = (timestamps[mask], positions[mask])
+            for impact in impacts:
+                mask_both = mask & (event_impacts == impact)
+                self._indexes[(currency, impact)] = (timestamps[mask_both], positions[mask_both])
+        for impact in impacts:
+            mask = event_impacts == impact
+            self._indexes[(None, impact)] = (timestamps[mask], positions[mask])
+
     @property
     def unfiltered_data_start(self):
         """
@@ -440,7 +506,7 @@ cdef class EconomicNewsEventFilter:
         """
         return self._impacts
 
-    cpdef NewsEvent next_event(self, datetime time_now):
+    cpdef NewsEvent next_event(self, datetime time_now, str currency=None, str impact=None):
         """
         Return the next news event matching the filter conditions.
         Will return None if no news events match the filter conditions.
@@ -448,6 +514,11 @@ cdef class EconomicNewsEventFilter:
         Parameters
         ----------
         time_now : datetime
+            The time now (UTC).
+        currency : str, optional
+            The currency to further narrow the filtered events.
+        impact : str, optional
+            The impact level to further narrow the filtered events.
 
         Returns
         -------
@@ -464,26 +535,20 @@ cdef class EconomicNewsEventFilter:
             If time_now is not tz aware UTC.
 
         """
-        Condition.true(is_datetime_utc(time_now), "time_now was not tz aware UTC")
-
-        if time_now < self._unfiltered_data_start:
-            raise ValueError(f"The given time_now at {time_now} was prior to the "
-                             f"available news data start at {self._unfiltered_data_start}")
-
-        if time_now > self._unfiltered_data_end:
-            raise ValueError(f"The given time_now at {time_now} was after the "
-                             f"available news data end at {self._unfiltered_data_end}")
+        self._check_time_now(time_now)
 
-        events = self._news_data[self._news_data.index >= time_now]
+        cdef tuple index = self._indexes.get((currency, impact))
+        if index is None:
+            return None
 
-        if events.empty:
+        cdef int64_t[:] timestamps = index[0]
+        cdef Py_ssize_t i = _bisect_left(timestamps, to_unix_time_ns(time_now))
+        if i == timestamps.shape[0]:
             return None
 
-        cdef int index = 0
-        row = events.iloc[index]
-        return NewsEvent(events.index[index], row["Impact"], row["Name"], row["Currency"])
+        return self._events[index[1][i]]
 
-    cpdef NewsEvent prev_event(self, datetime time_now):
+    cpdef NewsEvent prev_event(self, datetime time_now, str currency=None, str impact=None):
         """
         Return the previous news event matching the initial filter conditions.
         Will return None if no news events match the filter conditions.
@@ -491,6 +556,11 @@ cdef class EconomicNewsEventFilter:
         Parameters
         ----------
         time_now : datetime
+            The time now (UTC).
+        currency : str, optional
+            The currency to further narrow the filtered events.
+        impact : str, optional
+            The impact level to further narrow the filtered events.
 
         Returns
         -------
@@ -507,6 +577,70 @@ cdef class EconomicNewsEventFilter:
             If time_now is not tz aware UTC.
 
         """
+        self._check_time_now(time_now)
+
+        cdef tuple index = self._indexes.get((currency, impact))
+        if index is None:
+            return None
+
+        cdef int64_t[:] timestamps = index[0]
+        cdef Py_ssize_t i = _bisect_right(timestamps, to_unix_time_ns(time_now)) - 1
+        if i < 0:
+            return None
+
+        return self._events[index[1][i]]
+
+    cpdef list events_between(
+        self,
+        datetime start,
+        datetime end,
+        str currency=None,
+        str impact=None,
+    ):
+        """
+        Return the news events matching the filter conditions in the range
+        [start, end).
+
+        Parameters
+        ----------
+        start : datetime
+            The start of the range (UTC, inclusive).
+        end : datetime
+            The end of the range (UTC, exclusive).
+        currency : str, optional
+            The currency to further narrow the filtered events.
+        impact : str, optional
+            The impact level to further narrow the filtered events.
+
+        Returns
+        -------
+        list[NewsEvent]
+            The news events in time order.
+
+        Raises
+        ------
+        ValueError
+            If start or end is not tz aware UTC.
+        ValueError
+            If start > end.
+
+        """
+        Condition.true(is_datetime_utc(start), "start was not tz aware UTC")
+        Condition.true(is_datetime_utc(end), "end was not tz aware UTC")
+        Condition.true(start <= end, "start was > end")
+
+        cdef tuple index = self._indexes.get((currency, impact))
+        if index is None:
+            return []
+
+        cdef int64_t[:] timestamps = index[0]
+        cdef Py_ssize_t i_start = _bisect_left(timestamps, to_unix_time_ns(start))
+        cdef Py_ssize_t i_end = _bisect_left(timestamps, to_unix_time_ns(end))
+
+        cdef list events = self._events
+        return [events[position] for position in index[1][i_start:i_end]]
+
+    cdef void _check_time_now(self, datetime time_now) except *:
         Condition.true(is_datetime_utc(time_now), "time_now was not tz aware UTC")
 
         if time_now < self._unfiltered_data_start:
@@ -516,11 +650,3 @@ cdef class EconomicNewsEventFilter:
         if time_now > self._unfiltered_data_end:
             raise ValueError(f"The given time_now at {time_now} was after the "
                              f"available news data end at {self._unfiltered_data_end}")
-
-        events = self._news_data[self._news_data.index <= time_now]
-        if events.empty:
-            return None
-
-        cdef int index = -1
-        row = events.iloc[index]
-        return NewsEvent(events.index[index], row["Impact"], row["Name"], row["Currency"])
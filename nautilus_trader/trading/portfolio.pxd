@@ -30,6 +30,7 @@ from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.order.base cimport Order
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.model.tick cimport QuoteTick
+from nautilus_trader.model.tick cimport TradeTick
 from nautilus_trader.trading.account cimport Account
 
 
@@ -65,7 +66,18 @@ cdef class Portfolio(PortfolioFacade):
     cdef dict _orders_working
     cdef dict _positions_open
     cdef dict _positions_closed
+    cdef dict _security_positions
+    cdef dict _venue_securities
+    cdef dict _stale_securities
+    cdef dict _settlement_currencies
+    cdef dict _xrate_dependents
+    cdef dict _xrate_indirect
     cdef dict _unrealized_pnls
+    cdef dict _market_values
+    cdef dict _maint_margins
+    cdef dict _venue_unrealized_pnls
+    cdef dict _venue_market_values
+    cdef dict _venue_maint_margins
     cdef dict _net_positions
 
 # -- REGISTRATION ----------------------------------------------------------------------------------
@@ -78,6 +90,7 @@ cdef class Portfolio(PortfolioFacade):
     cpdef void initialize_orders(self, set orders) except *
     cpdef void initialize_positions(self, set positions) except *
     cpdef void update_tick(self, QuoteTick tick) except *
+    cpdef void update_trade_tick(self, TradeTick tick) except *
     cpdef void update_order(self, Order order) except *
     cpdef void update_position(self, PositionEvent event) except *
     cpdef void reset(self) except *
@@ -85,13 +98,21 @@ cdef class Portfolio(PortfolioFacade):
 # -- INTERNAL --------------------------------------------------------------------------------------
 
     cdef inline object _net_position(self, Security security)
-    cdef inline set _securities_open_for_venue(self, Venue venue)
+    cdef inline void _add_position_open(self, Position position) except *
+    cdef inline void _index_conversion(self, Security security) except *
+    cdef inline void _unindex_conversion(self, Security security) except *
+    cdef inline void _refresh_stale(self, Venue venue) except *
+    cdef inline void _invalidate_converted(self, Security updated) except *
+    cdef inline void _refresh_security(self, Security security) except *
+    cdef inline void _apply_delta(self, dict venue_totals, Venue venue, Money old, Money new) except *
     cdef inline void _handle_position_opened(self, PositionOpened event) except *
     cdef inline void _handle_position_changed(self, PositionChanged event) except *
     cdef inline void _handle_position_closed(self, PositionClosed event) except *
-    cdef inline void _update_net_position(self, Security security, set positions_open) except *
+    cdef inline void _update_net_position(self, Security security) except *
     cdef inline void _update_initial_margin(self, Venue venue) except *
-    cdef inline void _update_maint_margin(self, Venue venue) except *
+    cdef inline void _update_maint_margin(self, Venue venue, Money last, Money margin) except *
     cdef Money _calculate_unrealized_pnl(self, Security security)
+    cdef Money _calculate_market_value(self, Security security)
+    cdef Money _calculate_maint_margin(self, Security security)
     cdef object _calculate_xrate(self, Instrument instrument, Account account, OrderSide side)
     cdef inline Price _get_last_price(self, Position position)
@@ -30,6 +30,7 @@ from nautilus_trader.common.logging cimport LogColor
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.correctness cimport TRUSTED_MODE
 from nautilus_trader.model.c_enums.order_side cimport OrderSide
 from nautilus_trader.model.c_enums.position_side cimport PositionSide
 from nautilus_trader.model.c_enums.position_side cimport PositionSideParser
@@ -112,6 +113,16 @@ cdef class Portfolio(PortfolioFacade):
     Provides a trading portfolio.
 
     Currently there is a limitation of one account per venue.
+
+    Unrealized PnLs, market values and maintenance margins are cached per
+    security and aggregated per venue by delta. Each tick which changes the
+    price of a security with open positions recalculates only that security
+    and applies the difference to the venue totals (and the account
+    maintenance margins), so venue level queries are O(1) in the number of
+    securities. A tick for a currency pair marks stale only the open
+    securities whose settlement currency is converted through that pair.
+    Securities which could not be valued (such as from missing exchange rates)
+    remain stale and are retried on the next query.
     """
 
     def __init__(self, Clock clock not None, Logger logger=None):
@@ -131,13 +142,24 @@ cdef class Portfolio(PortfolioFacade):
         self._log = LoggerAdapter(type(self).__name__, logger)
         self._data = None  # Initialized when cache registered
 
-        self._ticks = {}             # type: dict[Security: QuoteTick]
-        self._accounts = {}          # type: dict[Venue: Account]
-        self._orders_working = {}    # type: dict[Venue: set[Order]]
-        self._positions_open = {}    # type: dict[Venue: set[Position]]
-        self._positions_closed = {}  # type: dict[Venue: set[Position]]
-        self._unrealized_pnls = {}   # type: dict[Security: Money]
-        self._net_positions = {}     # type: dict[Security: Decimal]
+        self._ticks = {}                  # type: dict[Security: QuoteTick]
+        self._accounts = {}               # type: dict[Venue: Account]
+        self._orders_working = {}         # type: dict[Venue: set[Order]]
+        self._positions_open = {}         # type: dict[Venue: set[Position]]
+        self._positions_closed = {}       # type: dict[Venue: set[Position]]
+        self._security_positions = {}     # type: dict[Security: set[Position]]
+        self._venue_securities = {}       # type: dict[Venue: set[Security]]
+        self._stale_securities = {}       # type: dict[Venue: set[Security]]
+        self._settlement_currencies = {}  # type: dict[Security: Currency]
+        self._xrate_dependents = {}       # type: dict[str: set[Security]]  (keyed by pair security value)
+        self._xrate_indirect = {}         # type: dict[Venue: set[Security]]
+        self._unrealized_pnls = {}        # type: dict[Security: Money]
+        self._market_values = {}          # type: dict[Security: Money]
+        self._maint_margins = {}          # type: dict[Security: Money]
+        self._venue_unrealized_pnls = {}  # type: dict[Venue: dict[Currency: list]]
+        self._venue_market_values = {}    # type: dict[Venue: dict[Currency: list]]
+        self._venue_maint_margins = {}    # type: dict[Venue: dict[Currency: list]]
+        self._net_positions = {}          # type: dict[Security: Decimal]
 
 # -- COMMANDS --------------------------------------------------------------------------------------
 
@@ -174,10 +196,17 @@ cdef class Portfolio(PortfolioFacade):
         Condition.not_in(account.id.issuer, self._accounts, "venue", "self._accounts")
 
         cdef AccountId account_id = account.id
-        self._accounts[account_id.issuer_as_venue()] = account
+        cdef Venue venue = account_id.issuer_as_venue()
+        self._accounts[venue] = account
         account.register_portfolio(self)
         self._log.debug(f"Registered account {account_id}.")
 
+        # Index any open securities at the venue which were awaiting the account
+        cdef Security security
+        for security in self._venue_securities.get(venue, set()):
+            if security not in self._settlement_currencies:
+                self._index_conversion(security)
+
     cpdef void initialize_orders(self, set orders) except *:
         """
         Initialize the portfolio with the given orders.
@@ -228,19 +257,26 @@ cdef class Portfolio(PortfolioFacade):
         # Clean slate
         self._positions_open.clear()
         self._positions_closed.clear()
+        self._security_positions.clear()
+        self._venue_securities.clear()
+        self._stale_securities.clear()
+        self._settlement_currencies.clear()
+        self._xrate_dependents.clear()
+        self._xrate_indirect.clear()
         self._unrealized_pnls.clear()
+        self._market_values.clear()
+        self._maint_margins.clear()
+        self._venue_unrealized_pnls.clear()
+        self._venue_market_values.clear()
+        self._venue_maint_margins.clear()
 
         cdef Position position
-        cdef set positions_open
         cdef set positions_closed
         cdef int open_count = 0
         cdef int closed_count = 0
         for position in positions:
             if position.is_open_c():
-                positions_open = self._positions_open.get(position.security.venue, set())
-                positions_open.add(position)
-                self._positions_open[position.security.venue] = positions_open
-                self._update_net_position(position.security, positions_open)
+                self._add_position_open(position)
                 self._log.debug(f"Added {position}")
                 open_count += 1
             elif position.is_closed_c():
@@ -249,12 +285,10 @@ cdef class Portfolio(PortfolioFacade):
                 self._positions_closed[position.security.venue] = positions_closed
                 closed_count += 1
 
-        cdef Venue venue
         cdef Security security
-        for venue in self._positions_open.keys():
-            self._update_maint_margin(venue)
-            for security in self._securities_open_for_venue(venue):
-                self._unrealized_pnls[security] = self._calculate_unrealized_pnl(security)
+        for security in list(self._security_positions.keys()):
+            self._update_net_position(security)
+            self._refresh_security(security)
 
         self._log.info(
             f"Initialized {open_count} open position{'' if open_count == 1 else 's'}.",
@@ -275,14 +309,45 @@ cdef class Portfolio(PortfolioFacade):
             The tick to update with.
 
         """
-        Condition.not_none(tick, "tick")
+        if not TRUSTED_MODE:
+            Condition.not_none(tick, "tick")
+
+        cdef Security security = tick.security
+        cdef QuoteTick last = self._ticks.get(security)
+        self._ticks[security] = tick
+
+        if last is not None and tick.bid == last.bid and tick.ask == last.ask:
+            return  # No change in value
+
+        # The tick may change an exchange rate used to value other securities
+        self._invalidate_converted(security)
+
+        if security in self._security_positions:
+            # Apply the change in value to the venue totals
+            self._refresh_security(security)
+
+    cpdef void update_trade_tick(self, TradeTick tick) except *:
+        """
+        Update the portfolio with the given trade tick.
+
+        Only securities without quotes are valued from their last trade.
+
+        Parameters
+        ----------
+        tick : TradeTick
+            The tick to update with.
+
+        """
+        if not TRUSTED_MODE:
+            Condition.not_none(tick, "tick")
 
-        cdef QuoteTick last = self._ticks.get(tick.security)
-        self._ticks[tick.security] = tick
+        cdef Security security = tick.security
+        if security in self._ticks:
+            return  # Valued from quotes
 
-        if last is not None and (tick.bid != last.bid or tick.ask != last.ask):
-            # Clear cached unrealized PnLs
-            self._unrealized_pnls[tick.security] = None
+        if security in self._security_positions:
+            # Apply the change in value to the venue totals
+            self._refresh_security(security)
 
     cpdef void update_order(self, Order order) except *:
         """
@@ -329,9 +394,7 @@ cdef class Portfolio(PortfolioFacade):
 
         self._log.debug(f"Updated {event.position}.")
 
-        cdef Security security = event.position.security
-        self._update_maint_margin(security.venue)
-        self._unrealized_pnls[security] = self._calculate_unrealized_pnl(security)
+        self._refresh_security(event.position.security)
 
     cpdef void reset(self) except *:
         """
@@ -346,8 +409,19 @@ cdef class Portfolio(PortfolioFacade):
         self._orders_working.clear()
         self._positions_open.clear()
         self._positions_closed.clear()
+        self._security_positions.clear()
+        self._venue_securities.clear()
+        self._stale_securities.clear()
+        self._settlement_currencies.clear()
+        self._xrate_dependents.clear()
+        self._xrate_indirect.clear()
         self._net_positions.clear()
         self._unrealized_pnls.clear()
+        self._market_values.clear()
+        self._maint_margins.clear()
+        self._venue_unrealized_pnls.clear()
+        self._venue_market_values.clear()
+        self._venue_maint_margins.clear()
 
         self._log.info("Reset.")
 
@@ -421,6 +495,8 @@ cdef class Portfolio(PortfolioFacade):
                             f"(no account registered for {venue}).")
             return None
 
+        self._refresh_stale(venue)
+
         return account.maint_margins()
 
     cpdef dict unrealized_pnls(self, Venue venue):
@@ -439,27 +515,20 @@ cdef class Portfolio(PortfolioFacade):
         """
         Condition.not_none(venue, "venue")
 
-        cdef set securities = self._securities_open_for_venue(venue)
-        if not securities:
+        if not self._venue_securities.get(venue):
             return {}  # Nothing to calculate
 
-        cdef dict unrealized_pnls = {}  # type: dict[Currency, Decimal]
+        self._refresh_stale(venue)
 
         cdef Security security
-        cdef Money pnl
-        for security in securities:
-            pnl = self._unrealized_pnls.get(security)
-            if pnl is not None:
-                # PnL already calculated
-                unrealized_pnls[pnl.currency] = unrealized_pnls.get(pnl.currency, Decimal(0)) + pnl
-                continue  # To next security
-            # Calculate PnL
-            pnl = self._calculate_unrealized_pnl(security)
-            if pnl is None:
-                return None  # Error already logged in `_calculate_unrealized_pnl`
-            unrealized_pnls[pnl.currency] = unrealized_pnls.get(pnl.currency, Decimal(0)) + pnl
+        cdef set stale = self._stale_securities.get(venue)
+        if stale:
+            for security in stale:
+                if security not in self._unrealized_pnls:
+                    return None  # Error already logged in `_calculate_unrealized_pnl`
 
-        return {k: Money(v, k) for k, v in unrealized_pnls.items()}
+        cdef dict totals = self._venue_unrealized_pnls.get(venue, {})
+        return {k: Money(v[0], k) for k, v in totals.items()}
 
     cpdef dict market_values(self, Venue venue):
         """
@@ -484,51 +553,20 @@ cdef class Portfolio(PortfolioFacade):
                             f"(no account registered for {venue}).")
             return None  # Cannot calculate
 
-        cdef set positions_open = self._positions_open.get(venue)
-        if not positions_open:
+        if not self._venue_securities.get(venue):
             return {}  # Nothing to calculate
 
-        cdef dict market_values = {}  # type: dict[Currency, Decimal]
-
-        cdef Position position
-        cdef Instrument instrument
-        cdef Price last
-        for position in positions_open:
-            instrument = self._data.instrument(position.security)
-            if instrument is None:
-                self._log.error(f"Cannot calculate market value "
-                                f"(no instrument for {position.security}).")
-                return None  # Cannot calculate
-
-            last = self._get_last_price(position)
-            if last is None:
-                self._log.error(f"Cannot calculate market value "
-                                f"(no prices for {position.security}).")
-                continue  # Cannot calculate
-
-            xrate = self._calculate_xrate(
-                instrument=instrument,
-                account=account,
-                side=position.entry,
-            )
-
-            if xrate == 0:
-                self._log.error(f"Cannot calculate market value (insufficient data for "
-                                f"{instrument.quote_currency}/{account.default_currency}).")
-                return None  # Cannot calculate
-
-            market_value = market_values.get(instrument.settlement_currency, Decimal(0))
-            market_value += instrument.market_value(
-                position.quantity,
-                last,
-            ) * xrate
+        self._refresh_stale(venue)
 
-            if account.default_currency is not None:
-                market_values[account.default_currency] = market_value
-            else:
-                market_values[instrument.settlement_currency] = market_value
+        cdef Security security
+        cdef set stale = self._stale_securities.get(venue)
+        if stale:
+            for security in stale:
+                if security not in self._market_values:
+                    return None  # Error already logged in `_calculate_market_value`
 
-        return {k: Money(v, k) for k, v in market_values.items()}
+        cdef dict totals = self._venue_market_values.get(venue, {})
+        return {k: Money(v[0], k) for k, v in totals.items()}
 
     cpdef Money unrealized_pnl(self, Security security):
         """
@@ -547,14 +585,14 @@ cdef class Portfolio(PortfolioFacade):
         Condition.not_none(security, "security")
         Condition.not_none(self._data, "self._data")
 
-        cdef Money pnl = self._unrealized_pnls.get(security)
-        if pnl is not None:
-            return pnl
+        if security not in self._security_positions:
+            return self._calculate_unrealized_pnl(security)
 
-        pnl = self._calculate_unrealized_pnl(security)
-        self._unrealized_pnls[security] = pnl
+        cdef set stale = self._stale_securities.get(security.venue)
+        if stale and security in stale:
+            self._refresh_security(security)
 
-        return pnl
+        return self._unrealized_pnls.get(security)
 
     cpdef Money market_value(self, Security security):
         """
@@ -573,62 +611,14 @@ cdef class Portfolio(PortfolioFacade):
         Condition.not_none(security, "security")
         Condition.not_none(self._data, "self._data")
 
-        cdef Account account = self._accounts.get(security.venue)
-        if account is None:
-            self._log.error(f"Cannot calculate market value "
-                            f"(no account registered for {security.venue}).")
-            return None  # Cannot calculate
-
-        cdef instrument = self._data.instrument(security)
-        if instrument is None:
-            self._log.error(f"Cannot calculate market value "
-                            f"(no instrument for {security}).")
-            return None  # Cannot calculate
-
-        cdef set positions_open = self._positions_open.get(security.venue)
-        if not positions_open:
-            return Money(0, instrument.quote_currency)
-
-        market_value: Decimal = Decimal(0)
-
-        cdef Currency currency
-        if account.default_currency is not None:
-            currency = account.default_currency
-        else:
-            currency = instrument.base_currency
+        if security not in self._security_positions:
+            return self._calculate_market_value(security)
 
-        cdef Position position
-        cdef Price last
-        for position in positions_open:
-            if position.security != security:
-                continue
+        cdef set stale = self._stale_securities.get(security.venue)
+        if stale and security in stale:
+            self._refresh_security(security)
 
-            last = self._get_last_price(position)
-            if last is None:
-                self._log.error(f"Cannot calculate market value "
-                                f"(no prices for {position.security}).")
-                continue  # Cannot calculate
-
-            xrate = self._calculate_xrate(
-                instrument=instrument,
-                account=account,
-                side=position.entry,
-            )
-
-            if xrate == 0:
-                self._log.error(f"Cannot calculate market value (insufficient data for "
-                                f"{instrument.settlement_currency}/{account.default_currency}).")
-                return None  # Cannot calculate
-
-            market_value += instrument.market_value(
-                position.quantity,
-                last,
-            ) * xrate
-
-        if account.default_currency is not None:
-            return Money(market_value, account.default_currency)
-        else:
-            return Money(market_value, instrument.settlement_currency)
+        return self._market_values.get(security)
 
     cpdef object net_position(self, Security security):
         """
@@ -728,52 +718,236 @@ cdef class Portfolio(PortfolioFacade):
     cdef inline object _net_position(self, Security security):
         return self._net_positions.get(security, Decimal(0))
 
-    cdef inline set _securities_open_for_venue(self, Venue venue):
-        cdef Position position
+    cdef inline void _add_position_open(self, Position position) except *:
+        cdef Security security = position.security
+        cdef Venue venue = security.venue
+
         cdef set positions_open = self._positions_open.get(venue)
         if positions_open is None:
-            return set()
-        return {position.security for position in positions_open}
+            positions_open = set()
+            self._positions_open[venue] = positions_open
+        positions_open.add(position)
 
-    cdef inline void _handle_position_opened(self, PositionOpened event) except *:
-        cdef Venue venue = event.position.security.venue
-        cdef Position position = event.position
+        cdef set security_positions = self._security_positions.get(security)
+        if security_positions is None:
+            security_positions = set()
+            self._security_positions[security] = security_positions
+        security_positions.add(position)
+
+        cdef set venue_securities = self._venue_securities.get(venue)
+        if venue_securities is None:
+            venue_securities = set()
+            self._venue_securities[venue] = venue_securities
+        if security not in venue_securities:
+            venue_securities.add(security)
+            self._index_conversion(security)
+
+    cdef inline void _index_conversion(self, Security security) except *:
+        # Index the security under the currency pair which converts its
+        # settlement currency to the account currency. Where no such pair is
+        # listed at the venue the rate is derived through other pairs, so the
+        # security is held as indirect and invalidated on any changed tick.
+        # Until the account and instrument are available the security is also
+        # held as indirect, and is indexed again once it can be valued.
+        cdef Venue venue = security.venue
+        cdef set indirect = self._xrate_indirect.get(venue)
+        if indirect is None:
+            indirect = set()
+            self._xrate_indirect[venue] = indirect
+        indirect.discard(security)
 
-        # Add to positions open
-        cdef set positions_open = self._positions_open.get(venue, set())
-        positions_open.add(position)
-        self._positions_open[venue] = positions_open
+        cdef Account account = self._accounts.get(venue)
+        cdef Instrument instrument = None
+        if account is not None and self._data is not None:
+            instrument = self._data.instrument(security)
+        if instrument is None:
+            indirect.add(security)  # Cannot index yet
+            return
+
+        cdef Currency currency = instrument.settlement_currency
+        self._settlement_currencies[security] = currency
+        if account.default_currency is None or currency == account.default_currency:
+            return  # No conversion applied
+
+        cdef str code_from = currency.code
+        cdef str code_to = account.default_currency.code
+        cdef tuple pairs = (f"{code_from}/{code_to}", f"{code_to}/{code_from}")
+        cdef Security pair
+        cdef set dependents
+        for pair in self._data.securities():
+            if pair.venue == venue and pair.symbol.value in pairs:
+                dependents = self._xrate_dependents.get(pair.value)
+                if dependents is None:
+                    dependents = set()
+                    self._xrate_dependents[pair.value] = dependents
+                dependents.add(security)
+                return
+
+        indirect.add(security)
+
+    cdef inline void _unindex_conversion(self, Security security) except *:
+        cdef Venue venue = security.venue
+        cdef set indirect = self._xrate_indirect.get(venue)
+        if indirect is not None:
+            indirect.discard(security)
+
+        cdef Currency currency = self._settlement_currencies.pop(security, None)
+        if currency is None:
+            return  # Not indexed
 
-        self._update_net_position(event.position.security, positions_open)
+        cdef Account account = self._accounts.get(venue)
+        if account is None or account.default_currency is None:
+            return  # No conversion applied
+
+        cdef str code_from = currency.code
+        cdef str code_to = account.default_currency.code
+        cdef str symbol
+        cdef set dependents
+        for symbol in (f"{code_from}/{code_to}", f"{code_to}/{code_from}"):
+            dependents = self._xrate_dependents.get(f"{symbol}.{venue.value}")
+            if dependents is not None:
+                dependents.discard(security)
+
+    cdef inline void _refresh_stale(self, Venue venue) except *:
+        cdef set stale = self._stale_securities.get(venue)
+        if not stale:
+            return  # Nothing to recalculate
+
+        cdef Security security
+        for security in stale.copy():
+            self._refresh_security(security)
+
+    cdef inline void _invalidate_converted(self, Security updated) except *:
+        # Mark stale the open securities whose settlement currency is converted
+        # through the updated currency pair (and those converted indirectly).
+        # These are recalculated on the next query.
+        cdef set dependents = self._xrate_dependents.get(updated.value)
+        cdef set indirect = self._xrate_indirect.get(updated.venue)
+        if not dependents and not indirect:
+            return  # No conversion through the updated prices
+
+        cdef Venue venue = updated.venue
+        cdef set stale = self._stale_securities.get(venue)
+        if stale is None:
+            stale = set()
+            self._stale_securities[venue] = stale
+
+        if dependents:
+            stale.update(dependents)
+        if indirect:
+            stale.update(indirect)
+        stale.discard(updated)  # Recalculated directly
+
+    cdef inline void _refresh_security(self, Security security) except *:
+        # Recalculate the cached values for the given security and apply the
+        # differences to the venue totals. Securities which cannot be valued
+        # remain stale and are retried on the next query.
+        cdef Venue venue = security.venue
+        cdef bint is_open = security in self._security_positions
+
+        cdef Money pnl = None
+        cdef Money market_value = None
+        cdef Money margin = None
+        if is_open:
+            pnl = self._calculate_unrealized_pnl(security)
+            market_value = self._calculate_market_value(security)
+            margin = self._calculate_maint_margin(security)
+
+        self._apply_delta(self._venue_unrealized_pnls, venue, self._unrealized_pnls.pop(security, None), pnl)
+        self._apply_delta(self._venue_market_values, venue, self._market_values.pop(security, None), market_value)
+
+        if pnl is not None:
+            self._unrealized_pnls[security] = pnl
+            if security not in self._settlement_currencies:
+                self._index_conversion(security)  # Instrument now available
+        if market_value is not None:
+            self._market_values[security] = market_value
+
+        cdef Money last_margin = self._maint_margins.pop(security, None)
+        if margin is not None:
+            self._maint_margins[security] = margin
+        if margin is None:
+            if last_margin is not None:
+                self._update_maint_margin(venue, last_margin, margin)
+        elif last_margin is None or margin != last_margin:
+            self._update_maint_margin(venue, last_margin, margin)
+
+        cdef set stale = self._stale_securities.get(venue)
+        if is_open and (pnl is None or market_value is None):
+            if stale is None:
+                stale = set()
+                self._stale_securities[venue] = stale
+            stale.add(security)
+        elif stale is not None:
+            stale.discard(security)
+
+    cdef inline void _apply_delta(self, dict venue_totals, Venue venue, Money old, Money new) except *:
+        # Venue totals are held as dict[Currency, list[Decimal, int]] being the
+        # running total and the count of securities contributing to it
+        cdef dict totals = venue_totals.get(venue)
+        if totals is None:
+            totals = {}
+            venue_totals[venue] = totals
+
+        cdef list total
+        if old is not None:
+            total = totals[old.currency]
+            if total[1] == 1:
+                del totals[old.currency]
+            else:
+                total[0] = total[0] - old.as_decimal()
+                total[1] -= 1
+
+        if new is not None:
+            total = totals.get(new.currency)
+            if total is None:
+                totals[new.currency] = [new.as_decimal(), 1]
+            else:
+                total[0] = total[0] + new.as_decimal()
+                total[1] += 1
+
+    cdef inline void _handle_position_opened(self, PositionOpened event) except *:
+        self._add_position_open(event.position)
+        self._update_net_position(event.position.security)
 
     cdef inline void _handle_position_changed(self, PositionChanged event) except *:
-        cdef Venue venue = event.position.security.venue
-        self._update_net_position(event.position.security, self._positions_open.get(venue, set()))
+        self._update_net_position(event.position.security)
 
     cdef inline void _handle_position_closed(self, PositionClosed event) except *:
-        cdef Venue venue = event.position.security.venue
         cdef Position position = event.position
+        cdef Security security = position.security
+        cdef Venue venue = security.venue
 
         # Remove from positions open if found
         cdef set positions_open = self._positions_open.get(venue)
         if positions_open is not None:
             positions_open.discard(position)
 
+        cdef set security_positions = self._security_positions.get(security)
+        if security_positions is not None:
+            security_positions.discard(position)
+            if not security_positions:
+                del self._security_positions[security]
+                self._venue_securities[venue].discard(security)
+                self._unindex_conversion(security)
+
         # Add to positions closed
         cdef set positions_closed = self._positions_closed.get(venue, set())
         positions_closed.add(position)
         self._positions_closed[venue] = positions_closed
 
-        self._update_net_position(event.position.security, positions_open)
+        self._update_net_position(security)
 
-    cdef inline void _update_net_position(self, Security security, set positions_open) except *:
+    cdef inline void _update_net_position(self, Security security) except *:
         net_position = Decimal()
-        for position in positions_open:
-            if position.security == security:
+
+        cdef Position position
+        cdef set positions_open = self._security_positions.get(security)
+        if positions_open is not None:
+            for position in positions_open:
                 net_position += position.relative_quantity
 
         self._net_positions[security] = net_position
-        self._update_maint_margin(security.venue)
         self._log.info(f"{security} net_position={net_position}")
 
     cdef inline void _update_initial_margin(self, Venue venue) except *:
@@ -837,33 +1011,64 @@ cdef class Portfolio(PortfolioFacade):
 
             self._log.info(f"{venue} initial_margin={total_margin_money}")
 
-    cdef inline void _update_maint_margin(self, Venue venue) except *:
+    cdef inline void _update_maint_margin(self, Venue venue, Money last, Money margin) except *:
+        # Apply the change in the securities maintenance margin to the venue
+        # totals, and update the account margins for the affected currencies
         cdef Account account = self._accounts.get(venue)
         if account is None:
             self._log.error(f"Cannot update position maintenance margin "
                             f"(no account registered for {venue}).")
             return  # Cannot calculate
 
-        cdef set open_positions = self._positions_open.get(venue)
-        if open_positions is None:
-            return  # Nothing to calculate
+        self._apply_delta(self._venue_maint_margins, venue, last, margin)
 
-        cdef dict margins = {}  # type: dict[Currency, Decimal]
+        cdef dict totals = self._venue_maint_margins[venue]
+        cdef set currencies = set()
+        if last is not None:
+            currencies.add(last.currency)
+        if margin is not None:
+            currencies.add(margin.currency)
 
-        cdef Position position
-        cdef Instrument instrument
-        cdef Price last
         cdef Currency currency
-        for position in open_positions:
-            instrument = self._data.instrument(position.security)
-            if instrument is None:
-                self._log.error(f"Cannot calculate position maintenance margin "
-                                f"(no instrument for {position.security}).")
-                continue  # Cannot calculate
+        cdef list total
+        cdef Money total_margin_money
+        for currency in currencies:
+            total = totals.get(currency)
+            total_margin_money = Money(total[0] if total is not None else 0, currency)
+            account.update_maint_margin(total_margin_money)
 
-            if instrument.leverage == 1:
-                continue  # No margin necessary
+            self._log.debug(f"{venue} maint_margin={total_margin_money}")
+
+    cdef Money _calculate_maint_margin(self, Security security):
+        cdef set positions_open = self._security_positions.get(security)
+        if not positions_open:
+            return None  # Nothing to calculate
+
+        cdef Account account = self._accounts.get(security.venue)
+        if account is None:
+            return None  # Cannot calculate (error logged when valued)
+
+        cdef Instrument instrument = self._data.instrument(security)
+        if instrument is None:
+            self._log.error(f"Cannot calculate position maintenance margin "
+                            f"(no instrument for {security}).")
+            return None  # Cannot calculate
+
+        if instrument.leverage == 1:
+            return None  # No margin necessary
+
+        cdef Currency currency
+        if account.default_currency is not None:
+            currency = account.default_currency
+        else:
+            currency = instrument.settlement_currency
 
+        total_margin: Decimal = Decimal(0)
+
+        cdef bint calculated = False
+        cdef Position position
+        cdef Price last
+        for position in positions_open:
             last = self._get_last_price(position)
             if last is None:
                 self._log.error(f"Cannot calculate position maintenance margin "
@@ -878,7 +1083,6 @@ cdef class Portfolio(PortfolioFacade):
             )
 
             if account.default_currency is not None:
-                currency = account.default_currency
                 xrate = self._calculate_xrate(
                     instrument=instrument,
                     account=account,
@@ -886,25 +1090,19 @@ cdef class Portfolio(PortfolioFacade):
                 )
 
                 if xrate == 0:
-                    self._log.error(f"Cannot calculate unrealized PnL (insufficient data for "
+                    self._log.error(f"Cannot calculate position maintenance margin (insufficient data for "
                                     f"{instrument.settlement_currency}/{currency}).")
                     continue  # Cannot calculate
 
                 margin *= xrate
-            else:
-                currency = instrument.settlement_currency
 
-            # Update total margin
-            total_margin = margins.get(currency, Decimal(0))
             total_margin += margin
-            margins[currency] = total_margin
+            calculated = True
 
-        cdef Money total_margin_money
-        for currency, total_margin in margins.items():
-            total_margin_money = Money(total_margin, currency)
-            account.update_maint_margin(total_margin_money)
+        if not calculated:
+            return None  # No margin calculated
 
-            self._log.info(f"{venue} maint_margin={total_margin_money}")
+        return Money(total_margin, currency)
 
     cdef Money _calculate_unrealized_pnl(self, Security security):
         cdef Account account = self._accounts.get(security.venue)
@@ -925,21 +1123,15 @@ cdef class Portfolio(PortfolioFacade):
         else:
             currency = instrument.settlement_currency
 
-        cdef set positions_open = self._positions_open.get(security.venue)
+        cdef set positions_open = self._security_positions.get(security)
         if positions_open is None:
-            if account.default_currency is not None:
-                return Money(0, account.default_currency)
-            else:
-                return Money(0, instrument.settlement_currency)
+            return Money(0, currency)
 
         total_pnl: Decimal = Decimal(0)
 
         cdef Position position
         cdef Price last
         for position in positions_open:
-            if position.security != security:
-                continue  # Nothing to calculate
-
             last = self._get_last_price(position)
             if last is None:
                 self._log.error(f"Cannot calculate unrealized PnL (no prices for {security}).")
@@ -965,6 +1157,55 @@ cdef class Portfolio(PortfolioFacade):
 
         return Money(total_pnl, currency)
 
+    cdef Money _calculate_market_value(self, Security security):
+        cdef Account account = self._accounts.get(security.venue)
+        if account is None:
+            self._log.error(f"Cannot calculate market value "
+                            f"(no account registered for {security.venue}).")
+            return None  # Cannot calculate
+
+        cdef Instrument instrument = self._data.instrument(security)
+        if instrument is None:
+            self._log.error(f"Cannot calculate market value "
+                            f"(no instrument for {security}).")
+            return None  # Cannot calculate
+
+        cdef set positions_open = self._security_positions.get(security)
+        if positions_open is None:
+            return Money(0, instrument.quote_currency)
+
+        market_value: Decimal = Decimal(0)
+
+        cdef Position position
+        cdef Price last
+        for position in positions_open:
+            last = self._get_last_price(position)
+            if last is None:
+                self._log.error(f"Cannot calculate market value "
+                                f"(no prices for {position.security}).")
+                continue  # Cannot calculate
+
+            xrate = self._calculate_xrate(
+                instrument=instrument,
+                account=account,
+                side=position.entry,
+            )
+
+            if xrate == 0:
+                self._log.error(f"Cannot calculate market value (insufficient data for "
+                                f"{instrument.settlement_currency}/{account.default_currency}).")
+                return None  # Cannot calculate
+
+            market_value += instrument.market_value(
+                position.quantity,
+                last,
+            ) * xrate
+
+        if account.default_currency is not None:
+            return Money(market_value, account.default_currency)
+        else:
+            return Money(market_value, instrument.settlement_currency)
+
     cdef object _calculate_xrate(self, Instrument instrument, Account account, OrderSide side):
         if account.default_currency is not None:
             return self._data.get_xrate(
@@ -14,12 +14,15 @@
 # -------------------------------------------------------------------------------------------------
 
 from cpython.datetime cimport datetime
+from libc.stdint cimport int64_t
 
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.factories cimport OrderFactory
+from nautilus_trader.common.latency cimport LatencyTracer
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.common.profiler cimport Profiler
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.data.base cimport Data
 from nautilus_trader.data.base cimport DataType
@@ -59,6 +62,9 @@ cdef class TradingStrategy(Component):
     cdef dict _indicators_for_quotes
     cdef dict _indicators_for_trades
     cdef dict _indicators_for_bars
+    cdef Profiler _profiler
+    cdef dict _profiler_names
+    cdef LatencyTracer _tracer
 
     cdef readonly TraderId trader_id
     """The trader identifier associated with the trading strategy.\n\n:returns: `TraderId`"""
@@ -80,6 +86,7 @@ cdef class TradingStrategy(Component):
     """The trading strategies order factory.\n\n:returns: `OrderFactory`"""
 
     cdef inline void _check_trader_registered(self) except *
+    cdef inline void _profiler_record(self, object key, int64_t start_ns) except *
 
     cpdef bint indicators_initialized(self) except *
 
@@ -112,6 +119,8 @@ cdef class TradingStrategy(Component):
     cpdef void register_data_engine(self, DataEngine engine) except *
     cpdef void register_execution_engine(self, ExecutionEngine engine) except *
     cpdef void register_portfolio(self, Portfolio portfolio) except *
+    cpdef void register_profiler(self, Profiler profiler) except *
+    cpdef void register_tracer(self, LatencyTracer tracer) except *
     cpdef void register_indicator_for_quote_ticks(self, Security security, Indicator indicator) except *
     cpdef void register_indicator_for_trade_ticks(self, Security security, Indicator indicator) except *
     cpdef void register_indicator_for_bars(self, BarType bar_type, Indicator indicator) except *
@@ -29,12 +29,14 @@ import warnings
 import cython
 
 from cpython.datetime cimport datetime
+from libc.stdint cimport int64_t
 
 from nautilus_trader.common.c_enums.component_state cimport ComponentState
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.factories cimport OrderFactory
+from nautilus_trader.common.latency cimport LatencyTracer
 from nautilus_trader.common.logging cimport CMD
 from nautilus_trader.common.logging cimport EVT
 from nautilus_trader.common.logging cimport LiveLogger
@@ -44,8 +46,11 @@ from nautilus_trader.common.logging cimport RECV
 from nautilus_trader.common.logging cimport REQ
 from nautilus_trader.common.logging cimport RES
 from nautilus_trader.common.logging cimport SENT
+from nautilus_trader.common.profiler cimport Profiler
 from nautilus_trader.core.constants cimport *  # str constants only
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.correctness cimport TRUSTED_MODE
+from nautilus_trader.core.time cimport monotonic_ns
 from nautilus_trader.data.base cimport Data
 from nautilus_trader.data.base cimport DataType
 from nautilus_trader.data.engine cimport DataEngine
@@ -138,6 +143,11 @@ cdef class TradingStrategy(Component):
         self._indicators_for_trades = {}   # type: dict[Security, list[Indicator]]
         self._indicators_for_bars = {}     # type: dict[BarType, list[Indicator]]
 
+        # Profiling
+        self._profiler = None       # Initialized when registered with a profiler
+        self._profiler_names = {}   # type: dict[object, str]
+        self._tracer = None         # Initialized when registered with a tracer
+
         # Public components
         self.clock = self._clock
         self.uuid_factory = self._uuid_factory
@@ -527,6 +537,45 @@ cdef class TradingStrategy(Component):
 
         self.portfolio = portfolio  # Assigned as PortfolioFacade
 
+    cpdef void register_profiler(self, Profiler profiler) except *:
+        """
+        Register the strategy with the given profiler.
+
+        When registered the time and call count of each strategy handler and
+        indicator update are recorded by the profiler.
+
+        Parameters
+        ----------
+        profiler : Profiler
+            The profiler to record to (if None then profiling is disabled).
+
+        Warnings
+        --------
+        System method (not intended to be called by user code).
+
+        """
+        self._profiler = profiler
+        self._profiler_names = {}
+
+    cpdef void register_tracer(self, LatencyTracer tracer) except *:
+        """
+        Register the strategy with the given latency tracer.
+
+        When registered the time from a live tick being dequeued until it is
+        passed to the strategy handler is recorded by the tracer.
+
+        Parameters
+        ----------
+        tracer : LatencyTracer
+            The tracer to record to (if None then tracing is disabled).
+
+        Warnings
+        --------
+        System method (not intended to be called by user code).
+
+        """
+        self._tracer = tracer
+
     cpdef void register_indicator_for_quote_ticks(self, Security security, Indicator indicator) except *:
         """
         Register the given indicator with the strategy to receive quote tick
@@ -1528,7 +1577,8 @@ cdef class TradingStrategy(Component):
         System method (not intended to be called by user code).
 
         """
-        Condition.not_none(instrument, "instrument")
+        if not TRUSTED_MODE:
+            Condition.not_none(instrument, "instrument")
 
         if self._fsm.state == ComponentState.RUNNING:
             try:
@@ -1553,11 +1603,19 @@ cdef class TradingStrategy(Component):
         System method (not intended to be called by user code).
 
         """
-        Condition.not_none(order_book, "order_book")
+        if not TRUSTED_MODE:
+            Condition.not_none(order_book, "order_book")
+
+        cdef int64_t ts
 
         if self._fsm.state == ComponentState.RUNNING:
             try:
-                self.on_order_book(order_book)
+                if self._profiler is None:
+                    self.on_order_book(order_book)
+                else:
+                    ts = monotonic_ns()
+                    self.on_order_book(order_book)
+                    self._profiler_record("on_order_book", ts)
             except Exception as ex:
                 self.log.exception(ex)
                 raise
@@ -1580,21 +1638,37 @@ cdef class TradingStrategy(Component):
         System method (not intended to be called by user code).
 
         """
-        Condition.not_none(tick, "tick")
+        if not TRUSTED_MODE:
+            Condition.not_none(tick, "tick")
 
         # Update indicators
         cdef list indicators = self._indicators_for_quotes.get(tick.security)  # Could be None
         cdef Indicator indicator
+        cdef int64_t ts
         if indicators is not None:
-            for indicator in indicators:
-                indicator.handle_quote_tick(tick)
+            if self._profiler is None:
+                for indicator in indicators:
+                    indicator.handle_quote_tick(tick)
+            else:
+                for indicator in indicators:
+                    ts = monotonic_ns()
+                    indicator.handle_quote_tick(tick)
+                    self._profiler_record(indicator, ts)
 
         if is_historical:
             return  # Don't pass to on_tick()
 
+        if self._tracer is not None:
+            self._tracer.mark("dequeue_to_strategy")
+
         if self._fsm.state == ComponentState.RUNNING:
             try:
-                self.on_quote_tick(tick)
+                if self._profiler is None:
+                    self.on_quote_tick(tick)
+                else:
+                    ts = monotonic_ns()
+                    self.on_quote_tick(tick)
+                    self._profiler_record("on_quote_tick", ts)
             except Exception as ex:
                 self.log.exception(ex)
                 raise
@@ -1615,7 +1689,8 @@ cdef class TradingStrategy(Component):
         System method (not intended to be called by user code).
 
         """
-        Condition.not_none(ticks, "ticks")  # Could be empty
+        if not TRUSTED_MODE:
+            Condition.not_none(ticks, "ticks")  # Could be empty
 
         cdef int length = len(ticks)
         cdef QuoteTick first = ticks[0] if length > 0 else None
@@ -1647,21 +1722,37 @@ cdef class TradingStrategy(Component):
         System method (not intended to be called by user code).
 
         """
-        Condition.not_none(tick, "tick")
+        if not TRUSTED_MODE:
+            Condition.not_none(tick, "tick")
 
         # Update indicators
         cdef list indicators = self._indicators_for_trades.get(tick.security)  # Could be None
         cdef Indicator indicator
+        cdef int64_t ts
         if indicators is not None:
-            for indicator in indicators:
-                indicator.handle_trade_tick(tick)
+            if self._profiler is None:
+                for indicator in indicators:
+                    indicator.handle_trade_tick(tick)
+            else:
+                for indicator in indicators:
+                    ts = monotonic_ns()
+                    indicator.handle_trade_tick(tick)
+                    self._profiler_record(indicator, ts)
 
         if is_historical:
             return  # Don't pass to on_tick()
 
+        if self._tracer is not None:
+            self._tracer.mark("dequeue_to_strategy")
+
         if self._fsm.state == ComponentState.RUNNING:
             try:
-                self.on_trade_tick(tick)
+                if self._profiler is None:
+                    self.on_trade_tick(tick)
+                else:
+                    ts = monotonic_ns()
+                    self.on_trade_tick(tick)
+                    self._profiler_record("on_trade_tick", ts)
             except Exception as ex:
                 self.log.exception(ex)
                 raise
@@ -1682,7 +1773,8 @@ cdef class TradingStrategy(Component):
         System method (not intended to be called by user code).
 
         """
-        Condition.not_none(ticks, "ticks")  # Could be empty
+        if not TRUSTED_MODE:
+            Condition.not_none(ticks, "ticks")  # Could be empty
 
         cdef int length = len(ticks)
         cdef TradeTick first = ticks[0] if length > 0 else None
@@ -1716,22 +1808,35 @@ cdef class TradingStrategy(Component):
         System method (not intended to be called by user code).
 
         """
-        Condition.not_none(bar_type, "bar_type")
-        Condition.not_none(bar, "bar")
+        if not TRUSTED_MODE:
+            Condition.not_none(bar_type, "bar_type")
+            Condition.not_none(bar, "bar")
 
         # Update indicators
         cdef list indicators = self._indicators_for_bars.get(bar_type)  # Could be None
         cdef Indicator indicator
+        cdef int64_t ts
         if indicators is not None:
-            for indicator in indicators:
-                indicator.handle_bar(bar)
+            if self._profiler is None:
+                for indicator in indicators:
+                    indicator.handle_bar(bar)
+            else:
+                for indicator in indicators:
+                    ts = monotonic_ns()
+                    indicator.handle_bar(bar)
+                    self._profiler_record(indicator, ts)
 
         if is_historical:
             return  # Don't pass to on_bar()
 
         if self._fsm.state == ComponentState.RUNNING:
             try:
-                self.on_bar(bar_type, bar)
+                if self._profiler is None:
+                    self.on_bar(bar_type, bar)
+                else:
+                    ts = monotonic_ns()
+                    self.on_bar(bar_type, bar)
+                    self._profiler_record("on_bar", ts)
             except Exception as ex:
                 self.log.exception(ex)
                 raise
@@ -1754,8 +1859,9 @@ cdef class TradingStrategy(Component):
         System method (not intended to be called by user code).
 
         """
-        Condition.not_none(bar_type, "bar_type")
-        Condition.not_none(bars, "bars")  # Can be empty
+        if not TRUSTED_MODE:
+            Condition.not_none(bar_type, "bar_type")
+            Condition.not_none(bars, "bars")  # Can be empty
 
         cdef int length = len(bars)
         cdef Bar first = bars[0] if length > 0 else None
@@ -1785,11 +1891,19 @@ cdef class TradingStrategy(Component):
         System method (not intended to be called by user code).
 
         """
-        Condition.not_none(data, "data")
+        if not TRUSTED_MODE:
+            Condition.not_none(data, "data")
+
+        cdef int64_t ts
 
         if self._fsm.state == ComponentState.RUNNING:
             try:
-                self.on_data(data)
+                if self._profiler is None:
+                    self.on_data(data)
+                else:
+                    ts = monotonic_ns()
+                    self.on_data(data)
+                    self._profiler_record("on_data", ts)
             except Exception as ex:
                 self.log.exception(ex)
                 raise
@@ -1813,7 +1927,10 @@ cdef class TradingStrategy(Component):
         self.handle_event_c(event)
 
     cdef void handle_event_c(self, Event event) except *:
-        Condition.not_none(event, "event")
+        if not TRUSTED_MODE:
+            Condition.not_none(event, "event")
+
+        cdef int64_t ts
 
         if isinstance(event, _WARNING_EVENTS):
             self.log.warning(f"{RECV}{EVT} {event}.")
@@ -1822,13 +1939,26 @@ cdef class TradingStrategy(Component):
 
         if self._fsm.state == ComponentState.RUNNING:
             try:
-                self.on_event(event)
+                if self._profiler is None:
+                    self.on_event(event)
+                else:
+                    ts = monotonic_ns()
+                    self.on_event(event)
+                    self._profiler_record("on_event", ts)
             except Exception as ex:
                 self.log.exception(ex)
                 raise
 
 # -- INTERNAL --------------------------------------------------------------------------------------
 
+    cdef inline void _profiler_record(self, object key, int64_t start_ns) except *:
+        cdef int64_t elapsed_ns = monotonic_ns() - start_ns
+        cdef str name = self._profiler_names.get(key)
+        if name is None:
+            name = f"{self.id.value}.{key}"
+            self._profiler_names[key] = name
+        self._profiler.record(name, elapsed_ns)
+
     cdef inline void _send_data_cmd(self, DataCommand command) except *:
         if not self.log.is_bypassed:
             self.log.info(f"{CMD}{SENT} {command}.")
@@ -51,6 +51,13 @@ def performance_tests(session: Session) -> None:
     _run_pytest(session, "tests/performance_tests/")
 
 
+@nox.session
+def benchmarks(session: Session) -> None:
+    """Run the backtest benchmark suite against the stored baseline."""
+    _setup_poetry(session)
+    session.run("poetry", "run", "python", "-m", "scripts.benchmark", *session.posargs)
+
+
 @nox.session
 def coverage(session: Session) -> None:
     """Run with test coverage."""
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+"""
+A utility script to run the backtest benchmark suite and check for regressions.
+
+Run from the repository root, e.g.
+
+    python -m scripts.benchmark --output benchmarks.json --threshold 0.2
+    python -m scripts.benchmark --threshold stages.wrangling.seconds=0.25
+    python -m scripts.benchmark --update-baseline
+
+One baseline is kept per machine architecture and Python minor version, and the
+baseline matching the current run is used unless a path is given. Exits with a
+non-zero status if any metric regressed beyond its threshold, or if the results
+could not be compared as the baseline was recorded on another machine
+architecture or Python version.
+"""
+
+import argparse
+import os
+import sys
+
+from tests.test_kit.benchmark import baseline_path
+from tests.test_kit.benchmark import compare_results
+from tests.test_kit.benchmark import default_benchmarks
+from tests.test_kit.benchmark import read_results
+from tests.test_kit.benchmark import run_benchmarks
+from tests.test_kit.benchmark import write_results
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINES_DIR = os.path.join(ROOT_DIR, "tests", "performance_tests", "baselines")
+
+
+def _parse_thresholds(values):
+    thresholds = {}
+    for value in values:
+        if "=" in value:
+            metric, threshold = value.split("=", 1)
+            thresholds[metric] = float(threshold)
+        else:
+            thresholds["default"] = float(value)
+    return thresholds
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the backtest benchmark suite.")
+    parser.add_argument("--ticks", type=int, default=100_000, help="synthetic ticks per benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark (median is kept)")
+    parser.add_argument("--output", help="path to write the results JSON")
+    parser.add_argument("--baseline", help="path of the baseline JSON (default for this machine and Python)")
+    parser.add_argument(
+        "--threshold",
+        action="append",
+        default=[],
+        help="relative regression threshold, either a default (0.2) or per metric (throughput=0.2)",
+    )
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    args = parser.parse_args()
+
+    results = run_benchmarks(default_benchmarks(args.ticks), repeat=args.repeat)
+
+    for name, result in results["benchmarks"].items():
+        latency = result["latency_ns"]
+        print(f"{name}: {result['throughput']:,.0f} ticks/s, "
+              f"latency p50={latency['p50'] / 1000:.1f}μs p99={latency['p99'] / 1000:.1f}μs")
+        for stage, values in result["stages"].items():
+            print(f"    {stage:<15} {values['seconds']:>8.3f}s  peak_rss={values['peak_rss_mb']:,.1f}MB")
+
+    if args.output:
+        write_results(results, args.output)
+
+    if args.baseline is None:
+        args.baseline = baseline_path(BASELINES_DIR, results["meta"])
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        write_results(results, args.baseline)
+        print(f"Updated baseline {args.baseline}")
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, record one with --update-baseline")
+        sys.exit(0)
+
+    try:
+        regressions = compare_results(results, read_results(args.baseline), _parse_thresholds(args.threshold))
+    except ValueError as ex:
+        print(f"ERROR: Results not compared, {ex}. "
+              "Record a baseline for this machine with --update-baseline.",
+              file=sys.stderr)
+        sys.exit(2)
+
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+
+    sys.exit(1 if regressions else 0)
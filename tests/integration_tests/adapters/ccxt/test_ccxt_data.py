@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import copy
 import json
 import unittest
 from unittest.mock import MagicMock
@@ -23,6 +24,7 @@ from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.logging import LiveLogger
 from nautilus_trader.common.logging import LogLevel
 from nautilus_trader.common.uuid import UUIDFactory
+from nautilus_trader.core.datetime import to_unix_time_ms
 from nautilus_trader.core.uuid import uuid4
 from nautilus_trader.data.base import DataType
 from nautilus_trader.data.messages import DataRequest
@@ -33,11 +35,14 @@ from nautilus_trader.model.bar import BarType
 from nautilus_trader.model.enums import AssetClass
 from nautilus_trader.model.enums import AssetType
 from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.identifiers import Exchange
 from nautilus_trader.model.identifiers import Security
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.tick import TradeTick
 from nautilus_trader.trading.portfolio import Portfolio
 from tests import TESTS_PACKAGE_ROOT
@@ -260,6 +265,68 @@ class CCXTDataClientTests(unittest.TestCase):
 
         self.loop.run_until_complete(run_test())
 
+    def test_subscribe_quote_ticks_keeps_instrument_precisions(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()  # Also starts client
+            await asyncio.sleep(0.3)  # Allow engine message queue to start
+
+            # Act
+            self.client.subscribe_quote_ticks(ETHUSDT)
+            await asyncio.sleep(0.3)
+
+            # Assert
+            instrument = self.data_engine.cache.instrument(ETHUSDT)
+            bid, bid_size = self.mock_ccxt.watch_order_book["bids"][0]
+            ask, ask_size = self.mock_ccxt.watch_order_book["asks"][0]
+            tick = self.data_engine.cache.quote_tick(ETHUSDT)
+            self.assertEqual(Price(bid, instrument.price_precision), tick.bid)
+            self.assertEqual(Price(ask, instrument.price_precision), tick.ask)
+            self.assertEqual(Quantity(bid_size, instrument.size_precision), tick.bid_size)
+            self.assertEqual(Quantity(ask_size, instrument.size_precision), tick.ask_size)
+            self.assertEqual(instrument.price_precision, tick.bid.precision)
+            self.assertEqual(instrument.size_precision, tick.ask_size.precision)
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_subscribe_quote_ticks_and_order_book_share_one_stream(self):
+        async def run_test():
+            # Arrange
+            order_book = self.mock_ccxt.watch_order_book
+            calls = []
+
+            async def watch_order_book(symbol, limit, params):
+                calls.append(symbol)
+                if len(calls) > 1:
+                    await asyncio.Event().wait()  # Block further updates
+                return order_book
+
+            self.mock_ccxt.watch_order_book = watch_order_book
+
+            self.data_engine.start()  # Also starts client
+            await asyncio.sleep(0.3)  # Allow engine message queue to start
+
+            # Act
+            self.client.subscribe_quote_ticks(ETHUSDT)
+            self.client.subscribe_order_book(ETHUSDT, level=2)
+            await asyncio.sleep(0.3)
+
+            # Assert
+            self.assertEqual(["ETH/USDT", "ETH/USDT"], calls)
+            self.assertTrue(self.data_engine.cache.has_quote_ticks(ETHUSDT))
+
+            # Tear Down
+            self.client.unsubscribe_quote_ticks(ETHUSDT)
+            self.client.unsubscribe_order_book(ETHUSDT)
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
     def test_subscribe_trade_ticks(self):
         async def run_test():
             # Arrange
@@ -273,6 +340,59 @@ class CCXTDataClientTests(unittest.TestCase):
             # Assert
             self.assertIn(ETHUSDT, self.client.subscribed_trade_ticks)
             self.assertTrue(self.data_engine.cache.has_trade_ticks(ETHUSDT))
+            self.assertEqual(100, self.data_engine.cache.trade_tick_count(ETHUSDT))
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_subscribe_trade_ticks_keeps_instrument_precisions(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()  # Also starts client
+            await asyncio.sleep(0.3)  # Allow engine message queue to start
+
+            # Act
+            self.client.subscribe_trade_ticks(ETHUSDT)
+            await asyncio.sleep(0.3)
+
+            # Assert
+            instrument = self.data_engine.cache.instrument(ETHUSDT)
+            trade = self.mock_ccxt.watch_trades[-1]
+            tick = self.data_engine.cache.trade_tick(ETHUSDT)
+            self.assertEqual(trade["id"], tick.match_id.value)
+            self.assertEqual(Price(trade["price"], instrument.price_precision), tick.price)
+            self.assertEqual(Quantity(trade["amount"], instrument.size_precision), tick.size)
+            self.assertEqual(instrument.price_precision, tick.price.precision)
+            self.assertEqual(instrument.size_precision, tick.size.precision)
+            self.assertEqual(trade["timestamp"], to_unix_time_ms(tick.timestamp))
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_subscribe_trade_ticks_when_maker_trade_sets_opposite_aggressor_side(self):
+        async def run_test():
+            # Arrange
+            trade = self.mock_ccxt.watch_trades[-1]
+            trade["side"] = "buy"
+            trade["takerOrMaker"] = "maker"  # A resting buy order was hit by a seller
+
+            self.data_engine.start()  # Also starts client
+            await asyncio.sleep(0.3)  # Allow engine message queue to start
+
+            # Act
+            self.client.subscribe_trade_ticks(ETHUSDT)
+            await asyncio.sleep(0.3)
+
+            # Assert
+            tick = self.data_engine.cache.trade_tick(ETHUSDT)
+            self.assertEqual(trade["id"], tick.match_id.value)
+            self.assertEqual(OrderSide.SELL, tick.side)
 
             # Tear Down
             self.data_engine.stop()
@@ -422,6 +542,30 @@ class CCXTDataClientTests(unittest.TestCase):
 
         self.loop.run_until_complete(run_test())
 
+    def test_subscribed_instruments_update_only_sends_changed_instruments(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()  # Also starts client
+            await asyncio.sleep(0.3)  # Allow engine message queue to start
+
+            data_count = self.data_engine.data_count
+            markets = copy.deepcopy(self.mock_ccxt.markets)
+            markets["BTC/USDT"]["taker"] = 0.002
+            self.mock_ccxt.markets = markets
+
+            # Act
+            await self.client._subscribed_instruments_update(3600)
+            await asyncio.sleep(0.3)
+
+            # Assert
+            self.assertEqual(data_count + 1, self.data_engine.data_count)
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
     def test_request_quote_ticks(self):
         async def run_test():
             # Arrange
@@ -14,7 +14,10 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import copy
 import json
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock
 
@@ -135,6 +138,143 @@ class CCXTInstrumentProviderTests(unittest.TestCase):
         loop.stop()
         loop.close()
 
+    def test_from_config_uses_instrument_cache_options(self):
+        # Arrange
+        mock_client = MagicMock()
+        mock_client.name = "Binance"
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            config = {"instrument_cache_dir": cache_dir, "instrument_cache_ttl": 60}
+
+            # Act
+            provider = CCXTInstrumentProvider.from_config(mock_client, config)
+
+            # Assert
+            self.assertEqual(0, provider.count)
+            self.assertEqual(cache_dir, os.path.dirname(provider.cache_path))
+            self.assertEqual(60, provider.cache_ttl)
+            mock_client.load_markets.assert_not_called()
+
+    def test_load_all_writes_cache_then_warm_load_skips_exchange(self):
+        # Arrange
+        with open(TEST_PATH + "markets.json") as response:
+            markets = json.load(response)
+
+        with open(TEST_PATH + "currencies.json") as response:
+            currencies = json.load(response)
+
+        mock_client = MagicMock()
+        mock_client.name = "Binance"
+        mock_client.precisionMode = 2
+        mock_client.markets = markets
+        mock_client.currencies = currencies
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            provider = CCXTInstrumentProvider(client=mock_client, cache_dir=cache_dir)
+            provider.load_all()
+
+            warm_client = MagicMock()
+            warm_client.name = "Binance"
+            warm_client.precisionMode = 2
+            warm_client.markets = markets
+            warm_client.currencies = currencies
+
+            warm_provider = CCXTInstrumentProvider(client=warm_client, cache_dir=cache_dir)
+
+            # Act
+            warm_provider.load_all()
+
+            # Assert
+            self.assertTrue(os.path.isfile(provider.cache_path))
+            self.assertEqual(provider.cache_hash, warm_provider.cache_hash)
+            self.assertEqual(provider.count, warm_provider.count)
+            warm_client.load_markets.assert_not_called()
+            warm_client.set_markets.assert_called_once_with(markets, currencies)
+
+    def test_load_all_with_reload_when_unchanged_returns_no_changed_instruments(self):
+        # Arrange
+        with open(TEST_PATH + "markets.json") as response:
+            markets = json.load(response)
+
+        with open(TEST_PATH + "currencies.json") as response:
+            currencies = json.load(response)
+
+        mock_client = MagicMock()
+        mock_client.name = "Binance"
+        mock_client.precisionMode = 2
+        mock_client.markets = markets
+        mock_client.currencies = currencies
+
+        provider = CCXTInstrumentProvider(client=mock_client, load_all=True)
+        previous = provider.get_all()
+
+        # Act
+        provider.load_all(reload=True)
+
+        # Assert
+        self.assertEqual([], provider.changed(previous))
+
+    def test_load_all_with_reload_returns_changed_instruments(self):
+        # Arrange
+        with open(TEST_PATH + "markets.json") as response:
+            markets = json.load(response)
+
+        with open(TEST_PATH + "currencies.json") as response:
+            currencies = json.load(response)
+
+        mock_client = MagicMock()
+        mock_client.name = "Binance"
+        mock_client.precisionMode = 2
+        mock_client.markets = markets
+        mock_client.currencies = currencies
+
+        provider = CCXTInstrumentProvider(client=mock_client, load_all=True)
+        previous = provider.get_all()
+
+        markets = copy.deepcopy(markets)
+        markets["BTC/USDT"]["taker"] = 0.002
+        mock_client.markets = markets
+
+        # Act
+        provider.load_all(reload=True)
+        changed = provider.changed(previous)
+
+        # Assert
+        self.assertEqual(1, len(changed))
+        self.assertEqual(Symbol("BTC/USDT"), changed[0].security.symbol)
+
+    def test_load_all_async_when_concurrent_shares_one_load(self):
+        # Fresh isolated loop testing pattern
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        async def run_test():
+            # Arrange
+            with open(TEST_PATH + "markets.json") as response:
+                markets = json.load(response)
+
+            with open(TEST_PATH + "currencies.json") as response:
+                currencies = json.load(response)
+
+            mock_client = MagicMock()
+            mock_client.name = "Binance"
+            mock_client.precisionMode = 2
+            mock_client.markets = markets
+            mock_client.currencies = currencies
+
+            provider = CCXTInstrumentProvider(client=mock_client)
+
+            # Act
+            await asyncio.gather(provider.load_all_async(), provider.load_all_async())
+
+            # Assert
+            self.assertEqual(1236, provider.count)
+            mock_client.load_markets.assert_called_once_with(reload=True)
+
+        loop.run_until_complete(run_test())
+        loop.stop()
+        loop.close()
+
     def test_get_all_when_not_loaded_returns_empty_dict(self):
         # Arrange
         mock_client = MagicMock()
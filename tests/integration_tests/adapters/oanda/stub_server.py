@@ -0,0 +1,103 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import json
+
+from aiohttp import web
+
+from tests import TESTS_PACKAGE_ROOT
+
+TEST_PATH = TESTS_PACKAGE_ROOT + "/integration_tests/adapters/oanda/responses/"
+
+
+class OandaStubServer:
+    """
+    Provides a local stub of the Oanda v20 REST and pricing stream API.
+    """
+
+    def __init__(self, prices=None):
+        with open(TEST_PATH + "instruments.json") as response:
+            self.instruments = json.load(response)
+
+        with open(TEST_PATH + "bars.json") as response:
+            self.bars = json.load(response)
+
+        self.prices = prices if prices is not None else []
+        self.heartbeats = True
+        self.requests = []  # (path, authorization, peer) for each request
+        self.stream_instruments = []  # Instruments requested by each pricing stream
+        self.open_streams = 0
+        self.url = None
+        self._runner = None
+        self._streaming = False
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/v3/accounts/{account_id}/instruments", self._handle_instruments)
+        app.router.add_get("/v3/instruments/{instrument}/candles", self._handle_candles)
+        app.router.add_get("/v3/accounts/{account_id}/pricing/stream", self._handle_pricing_stream)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+        self._streaming = True
+
+    async def stop(self):
+        self._streaming = False
+        await self._runner.cleanup()
+
+    def _record(self, request):
+        self.requests.append((
+            request.path,
+            request.headers.get("Authorization"),
+            request.transport.get_extra_info("peername"),
+        ))
+
+    async def _handle_instruments(self, request):
+        self._record(request)
+        return web.json_response(self.instruments)
+
+    async def _handle_candles(self, request):
+        self._record(request)
+        return web.json_response(self.bars)
+
+    async def _handle_pricing_stream(self, request):
+        self._record(request)
+        self.stream_instruments.append(request.query["instruments"])
+        self.open_streams += 1
+        response = web.StreamResponse()
+        await response.prepare(request)
+
+        heartbeat = {"type": "HEARTBEAT", "time": "2021-01-04T00:00:00.000000000Z"}
+        try:
+            await response.write((json.dumps(heartbeat) + "\n").encode())
+            for price in self.prices:
+                await response.write((json.dumps(price) + "\n").encode())
+
+            while self._streaming:
+                await asyncio.sleep(0.05)
+                if self.heartbeats:
+                    await response.write((json.dumps(heartbeat) + "\n").encode())
+        except (ConnectionResetError, RuntimeError):
+            pass  # Client disconnected
+        finally:
+            self.open_streams -= 1
+
+        return response
@@ -14,12 +14,10 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
-import concurrent.futures
-import json
 import unittest
-from unittest.mock import MagicMock
 
 from nautilus_trader.adapters.oanda.data import OandaDataClient
+from nautilus_trader.adapters.oanda.http import OandaHttpClient
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.logging import LiveLogger
 from nautilus_trader.common.logging import LogLevel
@@ -40,13 +38,20 @@ from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import TraderId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.trading.portfolio import Portfolio
-from tests import TESTS_PACKAGE_ROOT
+from tests.integration_tests.adapters.oanda.stub_server import OandaStubServer
 from tests.test_kit.mocks import ObjectStorer
 
-TEST_PATH = TESTS_PACKAGE_ROOT + "/integration_tests/adapters/oanda/responses/"
-
 OANDA = Venue("OANDA")
 AUDUSD = Security(Symbol("AUD/USD"), OANDA, AssetClass.FX, AssetType.SPOT)
+USDJPY = Security(Symbol("USD/JPY"), OANDA, AssetClass.FX, AssetType.SPOT)
+
+PRICE = {
+    "type": "PRICE",
+    "time": "2021-01-04T00:00:01.000000000Z",
+    "instrument": "AUD_USD",
+    "bids": [{"price": "0.76950", "liquidity": 1000000}],
+    "asks": [{"price": "0.76960", "liquidity": 1000000}],
+}
 
 
 class OandaDataClientTests(unittest.TestCase):
@@ -60,9 +65,6 @@ class OandaDataClientTests(unittest.TestCase):
         # Fresh isolated loop testing pattern
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
-        self.executor = concurrent.futures.ThreadPoolExecutor()
-        self.loop.set_default_executor(self.executor)
-        self.loop.set_debug(True)  # TODO: Development
 
         # Setup logging
         logger = LiveLogger(
@@ -87,10 +89,18 @@ class OandaDataClientTests(unittest.TestCase):
             logger=self.logger,
         )
 
-        self.mock_oanda = MagicMock()
+        # Setup local stub of the Oanda API
+        self.server = OandaStubServer(prices=[PRICE, PRICE])
+        self.loop.run_until_complete(self.server.start())
+
+        self.http_client = OandaHttpClient(
+            access_token="TOKEN",
+            rest_url=self.server.url,
+            stream_url=self.server.url,
+        )
 
         self.client = OandaDataClient(
-            client=self.mock_oanda,
+            client=self.http_client,
             account_id="001",
             engine=self.data_engine,
             clock=self.clock,
@@ -99,41 +109,73 @@ class OandaDataClientTests(unittest.TestCase):
 
         self.data_engine.register_client(self.client)
 
-        with open(TEST_PATH + "instruments.json") as response:
-            instruments = json.load(response)
-
-        self.mock_oanda.request.return_value = instruments
-
     def tearDown(self):
-        self.executor.shutdown(wait=True)
+        self.loop.run_until_complete(self.http_client.disconnect())
+        self.loop.run_until_complete(self.server.stop())
         self.loop.stop()
         self.loop.close()
 
-    # TODO: WIP
-    # def test_connect(self):
-    #     async def run_test():
-    #         # Arrange
-    #         # Act
-    #         self.data_engine.start()  # Also connects client
-    #         await asyncio.sleep(0.3)
-    #
-    #         # Assert
-    #         self.assertTrue(self.client.is_connected)
-    #
-    #         # Tear Down
-    #         self.data_engine.stop()
-    #
-    #     self.loop.run_until_complete(run_test())
+    def test_connect(self):
+        async def run_test():
+            # Arrange
+            # Act
+            self.data_engine.start()  # Also connects client
+            await asyncio.sleep(0.3)
+
+            # Assert
+            self.assertTrue(self.client.is_connected)
+            self.assertTrue(self.data_engine.data_count > 0)  # Instruments sent on connect
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
 
     def test_disconnect(self):
-        # Arrange
-        self.client.connect()
+        async def run_test():
+            # Arrange
+            self.data_engine.start()  # Also connects client
+            await asyncio.sleep(0.3)
 
-        # Act
-        self.client.disconnect()
+            # Act
+            self.client.disconnect()
+            await asyncio.sleep(0.3)
 
-        # Assert
-        self.assertFalse(self.client.is_connected)
+            # Assert
+            self.assertFalse(self.client.is_connected)
+            self.assertFalse(self.http_client.is_connected)
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_disconnect_with_quote_tick_subscriptions_closes_stream_once(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()  # Also connects client
+            await asyncio.sleep(0.3)
+
+            self.client.subscribe_quote_ticks(AUDUSD)
+            self.client.subscribe_quote_ticks(USDJPY)
+            await asyncio.sleep(0.3)
+
+            # Act
+            self.client.disconnect()
+            await asyncio.sleep(0.3)
+
+            # Assert
+            self.assertEqual([], self.client.subscribed_quote_ticks)
+            self.assertEqual(["AUD_USD,USD_JPY"], self.server.stream_instruments)
+            self.assertEqual(0, self.server.open_streams)
+
+            # Tear Down
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
 
     def test_reset(self):
         # Arrange
@@ -153,8 +195,6 @@ class OandaDataClientTests(unittest.TestCase):
 
     def test_subscribe_instrument(self):
         # Arrange
-        self.client.connect()
-
         # Act
         self.client.subscribe_instrument(AUDUSD)
 
@@ -164,8 +204,9 @@ class OandaDataClientTests(unittest.TestCase):
     def test_subscribe_quote_ticks(self):
         async def run_test():
             # Arrange
-            self.mock_oanda.request.return_value = {"type": {"HEARTBEAT": "0"}}
             self.data_engine.start()
+            await asyncio.sleep(0.3)
+            data_count = self.data_engine.data_count
 
             # Act
             self.client.subscribe_quote_ticks(AUDUSD)
@@ -173,9 +214,66 @@ class OandaDataClientTests(unittest.TestCase):
 
             # Assert
             self.assertIn(AUDUSD, self.client.subscribed_quote_ticks)
+            self.assertEqual(data_count + 2, self.data_engine.data_count)
+            self.assertEqual(
+                "/v3/accounts/001/pricing/stream",
+                self.server.requests[-1][0],
+            )
 
             # Tear Down
+            self.client.unsubscribe_quote_ticks(AUDUSD)
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_subscribe_quote_ticks_for_many_securities_shares_one_stream(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+            await asyncio.sleep(0.3)
+
+            # Act
+            self.client.subscribe_quote_ticks(AUDUSD)
+            self.client.subscribe_quote_ticks(USDJPY)
+            await asyncio.sleep(0.3)
+
+            # Assert
+            self.assertEqual([AUDUSD, USDJPY], self.client.subscribed_quote_ticks)
+            self.assertEqual(["AUD_USD,USD_JPY"], self.server.stream_instruments)
+            self.assertEqual(1, self.server.open_streams)
+
+            # Tear Down
+            self.client.unsubscribe_quote_ticks(AUDUSD)
+            self.client.unsubscribe_quote_ticks(USDJPY)
+            self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_unsubscribe_quote_ticks_restarts_stream_with_remaining_securities(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+            await asyncio.sleep(0.3)
+
+            self.client.subscribe_quote_ticks(AUDUSD)
+            self.client.subscribe_quote_ticks(USDJPY)
+            await asyncio.sleep(0.3)
+
+            # Act
+            self.client.unsubscribe_quote_ticks(USDJPY)
+            await asyncio.sleep(0.3)
+
+            # Assert
+            self.assertEqual([AUDUSD], self.client.subscribed_quote_ticks)
+            self.assertEqual("AUD_USD", self.server.stream_instruments[-1])
+            self.assertEqual(1, self.server.open_streams)
+
+            # Tear Down
+            self.client.unsubscribe_quote_ticks(AUDUSD)
             self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
 
         self.loop.run_until_complete(run_test())
 
@@ -192,24 +290,24 @@ class OandaDataClientTests(unittest.TestCase):
 
     def test_unsubscribe_instrument(self):
         # Arrange
-        self.client.connect()
+        self.client.subscribe_instrument(AUDUSD)
 
         # Act
         self.client.unsubscribe_instrument(AUDUSD)
 
         # Assert
-        self.assertTrue(True)
+        self.assertNotIn(AUDUSD, self.client.subscribed_instruments)
 
     def test_unsubscribe_quote_ticks(self):
         async def run_test():
             # Arrange
-            self.mock_oanda.request.return_value = {"type": {"HEARTBEAT": "0"}}
             self.data_engine.start()
+            await asyncio.sleep(0.3)
 
             self.client.subscribe_quote_ticks(AUDUSD)
             await asyncio.sleep(0.3)
 
-            # # Act
+            # Act
             self.client.unsubscribe_quote_ticks(AUDUSD)
             await asyncio.sleep(0.3)
 
@@ -218,6 +316,7 @@ class OandaDataClientTests(unittest.TestCase):
 
             # Tear Down
             self.data_engine.stop()
+            await self.data_engine.get_run_queue_task()
 
         self.loop.run_until_complete(run_test())
 
@@ -236,14 +335,13 @@ class OandaDataClientTests(unittest.TestCase):
         async def run_test():
             # Arrange
             self.data_engine.start()  # Also starts client
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(0.3)
 
             # Act
             self.client.request_instrument(AUDUSD, uuid4())
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(0.3)
 
             # Assert
-            # Instruments additionally requested on start
             self.assertEqual(1, self.data_engine.response_count)
 
             # Tear Down
@@ -256,14 +354,13 @@ class OandaDataClientTests(unittest.TestCase):
         async def run_test():
             # Arrange
             self.data_engine.start()  # Also starts client
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(0.3)
 
             # Act
             self.client.request_instruments(uuid4())
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(0.3)
 
             # Assert
-            # Instruments additionally requested on start
             self.assertEqual(1, self.data_engine.response_count)
 
             # Tear Down
@@ -275,15 +372,6 @@ class OandaDataClientTests(unittest.TestCase):
     def test_request_bars(self):
         async def run_test():
             # Arrange
-            with open(TEST_PATH + "instruments.json") as response:
-                instruments = json.load(response)
-
-            # Arrange
-            with open(TEST_PATH + "bars.json") as response:
-                bars = json.load(response)
-
-            self.mock_oanda.request.side_effect = [instruments, bars]
-
             handler = ObjectStorer()
             self.data_engine.start()
             await asyncio.sleep(0.3)
@@ -318,6 +406,6 @@ class OandaDataClientTests(unittest.TestCase):
 
             # Tear Down
             self.data_engine.stop()
-            self.data_engine.dispose()
+            await self.data_engine.get_run_queue_task()
 
         self.loop.run_until_complete(run_test())
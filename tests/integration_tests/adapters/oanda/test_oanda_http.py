@@ -0,0 +1,162 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import unittest
+
+from nautilus_trader.adapters.oanda.http import OandaHttpClient
+from tests.integration_tests.adapters.oanda.stub_server import OandaStubServer
+
+PRICE = {
+    "type": "PRICE",
+    "time": "2021-01-04T00:00:01.000000000Z",
+    "instrument": "AUD_USD",
+    "bids": [{"price": "0.76950", "liquidity": 1000000}],
+    "asks": [{"price": "0.76960", "liquidity": 1000000}],
+}
+
+
+class OandaHttpClientTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fresh isolated loop testing pattern
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.server = OandaStubServer(prices=[PRICE])
+        self.loop.run_until_complete(self.server.start())
+
+        self.client = OandaHttpClient(
+            access_token="TOKEN",
+            rest_url=self.server.url,
+            stream_url=self.server.url,
+        )
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.client.disconnect())
+        self.loop.run_until_complete(self.server.stop())
+        self.loop.stop()
+        self.loop.close()
+
+    def test_instantiate_with_invalid_environment_raises_key_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(KeyError, OandaHttpClient, "TOKEN", "demo")
+
+    def test_instantiate_with_environment_sets_urls(self):
+        # Arrange
+        # Act
+        client = OandaHttpClient(access_token="TOKEN", environment="live")
+
+        # Assert
+        self.assertEqual("https://api-fxtrade.oanda.com", client.rest_url)
+        self.assertEqual("https://stream-fxtrade.oanda.com", client.stream_url)
+        self.assertFalse(client.is_connected)
+
+    def test_account_instruments_returns_response(self):
+        async def run_test():
+            # Arrange
+            # Act
+            response = await self.client.account_instruments("001")
+
+            # Assert
+            self.assertEqual(self.server.instruments, response)
+            self.assertEqual("/v3/accounts/001/instruments", self.server.requests[0][0])
+            self.assertEqual("Bearer TOKEN", self.server.requests[0][1])
+
+        self.loop.run_until_complete(run_test())
+
+    def test_candles_returns_response(self):
+        async def run_test():
+            # Arrange
+            # Act
+            response = await self.client.candles("AUD_USD", {"count": 100})
+
+            # Assert
+            self.assertEqual(self.server.bars, response)
+            self.assertEqual("/v3/instruments/AUD_USD/candles", self.server.requests[0][0])
+
+        self.loop.run_until_complete(run_test())
+
+    def test_requests_reuse_pooled_connection(self):
+        async def run_test():
+            # Arrange
+            await self.client.connect()
+
+            # Act
+            await self.client.account_instruments("001")
+            await self.client.candles("AUD_USD", {"count": 100})
+
+            # Assert
+            self.assertEqual(2, len(self.server.requests))
+            self.assertEqual(self.server.requests[0][2], self.server.requests[1][2])
+
+        self.loop.run_until_complete(run_test())
+
+    def test_stream_pricing_yields_messages(self):
+        async def run_test():
+            # Arrange
+            messages = []
+
+            # Act
+            async for message in self.client.stream_pricing("001", ["AUD_USD"]):
+                messages.append(message)
+                if len(messages) == 2:
+                    break
+
+            # Assert
+            self.assertEqual("HEARTBEAT", messages[0]["type"])
+            self.assertEqual(PRICE, messages[1])
+
+        self.loop.run_until_complete(run_test())
+
+    def test_stream_pricing_when_stream_goes_silent_raises_timeout(self):
+        async def run_test():
+            # Arrange
+            self.server.heartbeats = False
+            client = OandaHttpClient(
+                access_token="TOKEN",
+                read_timeout=0.2,
+                rest_url=self.server.url,
+                stream_url=self.server.url,
+            )
+            messages = []
+
+            # Act
+            with self.assertRaises(asyncio.TimeoutError):
+                async for message in client.stream_pricing("001", ["AUD_USD"]):
+                    messages.append(message)
+
+            # Assert
+            self.assertEqual(2, len(messages))  # Initial heartbeat and price
+
+            # Tear Down
+            await client.disconnect()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_disconnect_closes_session(self):
+        async def run_test():
+            # Arrange
+            await self.client.connect()
+
+            # Act
+            await self.client.disconnect()
+
+            # Assert
+            self.assertFalse(self.client.is_connected)
+
+        self.loop.run_until_complete(run_test())
@@ -13,10 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import asyncio
 import json
+import tempfile
 import unittest
 from unittest.mock import MagicMock
 
+from nautilus_trader.adapters.oanda.http import OandaHttpClient
 from nautilus_trader.adapters.oanda.providers import OandaInstrumentProvider
 from nautilus_trader.model.currencies import AUD
 from nautilus_trader.model.currencies import USD
@@ -27,6 +30,7 @@ from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.instrument import Instrument
 from tests import TESTS_PACKAGE_ROOT
+from tests.integration_tests.adapters.oanda.stub_server import OandaStubServer
 
 TEST_PATH = TESTS_PACKAGE_ROOT + "/integration_tests/adapters/oanda/responses/"
 
@@ -50,6 +54,56 @@ class OandaInstrumentProviderTests(unittest.TestCase):
         # Assert
         self.assertTrue(provider.count > 0)  # No exceptions raised
 
+    def test_load_all_async(self):
+        # Fresh isolated loop testing pattern
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        async def run_test():
+            # Arrange
+            server = OandaStubServer()
+            await server.start()
+
+            client = OandaHttpClient(access_token="TOKEN", rest_url=server.url)
+            provider = OandaInstrumentProvider(client=client, account_id="001")
+
+            # Act
+            await provider.load_all_async()
+
+            # Assert
+            self.assertTrue(provider.count > 0)  # No exceptions raised
+
+            # Tear Down
+            await client.disconnect()
+            await server.stop()
+
+        loop.run_until_complete(run_test())
+        loop.stop()
+        loop.close()
+
+    def test_load_all_when_cache_valid_does_not_request(self):
+        # Arrange
+        mock_client = MagicMock()
+
+        with open(TEST_PATH + "instruments.json") as response:
+            instruments = json.load(response)
+
+        mock_client.request.return_value = instruments
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            provider = OandaInstrumentProvider(client=mock_client, account_id="001", cache_dir=cache_dir)
+            provider.load_all()
+
+            warm_client = MagicMock()
+            warm_provider = OandaInstrumentProvider(client=warm_client, account_id="001", cache_dir=cache_dir)
+
+            # Act
+            warm_provider.load_all()
+
+            # Assert
+            self.assertEqual(provider.count, warm_provider.count)
+            warm_client.request.assert_not_called()
+
     def test_get_all_when_not_loaded_returns_empty_dict(self):
         # Arrange
         mock_client = MagicMock()
@@ -181,7 +181,7 @@ class TradingNodeOperationTests(unittest.TestCase):
         # Act
         # Assert
         self.assertEqual(ComponentState.RUNNING, self.node.trader.state)
-        self.loop.call_soon_threadsafe(self.node.stop)
+        self.node.get_event_loop().call_soon_threadsafe(self.node.stop)
 
     def test_stop(self):
         # Arrange
@@ -189,7 +189,7 @@ class TradingNodeOperationTests(unittest.TestCase):
         run.start()
 
         time.sleep(1)  # Allow node to start
-        self.loop.call_soon_threadsafe(self.node.stop)
+        self.node.get_event_loop().call_soon_threadsafe(self.node.stop)
 
         time.sleep(0.3)  # Allow node to stop
 
@@ -203,7 +203,7 @@ class TradingNodeOperationTests(unittest.TestCase):
         run.start()
 
         time.sleep(1)  # Allow node to start
-        self.loop.call_soon_threadsafe(self.node.stop)
+        self.node.get_event_loop().call_soon_threadsafe(self.node.stop)
 
         # Allow node to stop
         time.sleep(0.3)
@@ -0,0 +1,190 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import copy
+import os
+import tempfile
+import unittest
+
+from tests.test_kit.benchmark import baseline_path
+from tests.test_kit.benchmark import compare_results
+from tests.test_kit.benchmark import default_benchmarks
+from tests.test_kit.benchmark import read_results
+from tests.test_kit.benchmark import run_benchmarks
+from tests.test_kit.benchmark import synthetic_quote_ticks
+from tests.test_kit.benchmark import write_results
+
+
+class BacktestBenchmarkTests(unittest.TestCase):
+
+    def test_synthetic_quote_ticks_are_deterministic(self):
+        # Arrange
+        # Act
+        ticks1 = synthetic_quote_ticks(1000, seed=1)
+        ticks2 = synthetic_quote_ticks(1000, seed=1)
+
+        # Assert
+        self.assertTrue(ticks1.equals(ticks2))
+        self.assertTrue((ticks1["ask"] > ticks1["bid"]).all())
+
+    def test_run_benchmarks_returns_results_for_each_stage(self):
+        # Arrange
+        # Act
+        results = run_benchmarks(default_benchmarks(ticks=5000))
+
+        # Assert
+        for name in ("empty_strategy", "ema_cross"):
+            result = results["benchmarks"][name]
+            self.assertTrue(result["throughput"] > 0)
+            self.assertEqual({"p50", "p90", "p99", "max"}, set(result["latency_ns"]))
+            self.assertEqual(
+                {"wrangling", "producer_setup", "main_loop", "analysis"},
+                set(result["stages"]),
+            )
+
+    def test_results_round_trip_and_compare_equal_to_themselves(self):
+        # Arrange
+        results = run_benchmarks(default_benchmarks(ticks=5000)[:1])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "results.json")
+
+            # Act
+            write_results(results, path)
+            baseline = read_results(path)
+
+        # Assert
+        self.assertEqual([], compare_results(results, baseline))
+
+    def test_compare_results_with_regressions_returns_descriptions(self):
+        # Arrange
+        baseline = {
+            "benchmarks": {
+                "test": {
+                    "throughput": 100_000.,
+                    "latency_ns": {"p50": 10_000.},
+                    "stages": {"main_loop": {"seconds": 1., "peak_rss_mb": 100.}},
+                },
+            },
+        }
+        results = copy.deepcopy(baseline)
+        results["benchmarks"]["test"]["throughput"] = 75_000.                    # 25% worse
+        results["benchmarks"]["test"]["stages"]["main_loop"]["seconds"] = 1.15    # 15% worse
+        results["benchmarks"]["test"]["stages"]["main_loop"]["peak_rss_mb"] = 50.  # Better
+
+        # Act
+        regressions = compare_results(results, baseline, {"default": 0.2})
+
+        # Assert
+        self.assertEqual(1, len(regressions))
+        self.assertTrue(regressions[0].startswith("test throughput regressed 25.0%"))
+        self.assertEqual(2, len(compare_results(results, baseline, {"stages.main_loop.seconds": 0.1})))
+
+    def test_compare_results_ignores_stages_shorter_than_minimum(self):
+        # Arrange
+        baseline = {
+            "benchmarks": {
+                "test": {
+                    "throughput": 100_000.,
+                    "latency_ns": {"p50": 10_000.},
+                    "stages": {"analysis": {"seconds": 0.01, "peak_rss_mb": 100.}},
+                },
+            },
+        }
+        results = copy.deepcopy(baseline)
+        results["benchmarks"]["test"]["stages"]["analysis"]["seconds"] = 0.05  # 400% worse
+
+        # Act
+        regressions = compare_results(results, baseline)
+
+        # Assert
+        self.assertEqual([], regressions)
+
+    def test_compare_results_from_different_machines_raises_value_error(self):
+        # Arrange
+        results = {"meta": {"machine": "x86_64", "platform": "Linux"}, "benchmarks": {}}
+        baseline = {"meta": {"machine": "arm64", "platform": "Linux"}, "benchmarks": {}}
+
+        # Act
+        # Assert
+        self.assertRaises(ValueError, compare_results, results, baseline)
+
+    def test_compare_results_from_different_python_minor_version_raises_value_error(self):
+        # Arrange
+        results = {"meta": {"machine": "x86_64", "python": "3.9.1"}, "benchmarks": {}}
+        baseline = {"meta": {"machine": "x86_64", "python": "3.8.7"}, "benchmarks": {}}
+
+        # Act
+        # Assert
+        self.assertRaises(ValueError, compare_results, results, baseline)
+
+    def test_baseline_path_selects_by_machine_and_python_minor_version(self):
+        # Arrange
+        meta1 = {"machine": "x86_64", "python": "3.9.1", "platform": "Linux-5.4.0-42-generic-x86_64"}
+        meta2 = {"machine": "x86_64", "python": "3.9.2", "platform": "Linux-5.8.0-1-generic-x86_64"}
+        meta3 = {"machine": "x86_64", "python": "3.8.7", "platform": "Linux-5.4.0-42-generic-x86_64"}
+
+        # Act
+        path1 = baseline_path("baselines", meta1)
+        path2 = baseline_path("baselines", meta2)
+        path3 = baseline_path("baselines", meta3)
+
+        # Assert
+        self.assertEqual(os.path.join("baselines", "backtest-x86_64-py3.9.json"), path1)
+        self.assertEqual(path1, path2)
+        self.assertNotEqual(path1, path3)
+
+    def test_compare_results_from_different_platform_builds_compares_results(self):
+        # Arrange
+        baseline = {
+            "meta": {"machine": "x86_64", "python": "3.9.1", "platform": "Linux-5.4.0-42-generic-x86_64"},
+            "benchmarks": {
+                "test": {
+                    "throughput": 100_000.,
+                    "latency_ns": {"p50": 10_000.},
+                    "stages": {},
+                },
+            },
+        }
+        results = copy.deepcopy(baseline)
+        results["meta"]["python"] = "3.9.2"
+        results["meta"]["platform"] = "Linux-5.8.0-1-generic-x86_64"
+        results["benchmarks"]["test"]["throughput"] = 50_000.  # 50% worse
+
+        # Act
+        regressions = compare_results(results, baseline)
+
+        # Assert
+        self.assertEqual(1, len(regressions))
+
+    def test_run_benchmarks_with_repeat_returns_median_of_runs(self):
+        # Arrange
+        benchmark = default_benchmarks(ticks=5000)[0]
+        throughputs = iter([3., 1., 2.])
+        run = benchmark.run
+
+        def run_with_throughput():
+            result = run()
+            result["throughput"] = next(throughputs)
+            return result
+
+        benchmark.run = run_with_throughput
+
+        # Act
+        results = run_benchmarks([benchmark], repeat=3)
+
+        # Assert
+        self.assertEqual(2., results["benchmarks"]["empty_strategy"]["throughput"])
+        self.assertEqual(3, results["meta"]["repeat"])
@@ -0,0 +1,587 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+"""
+Provides a reproducible benchmark suite for the backtest loop.
+
+Each benchmark runs a fixed strategy over deterministic synthetic quote ticks,
+and reports throughput, per-tick latency percentiles and peak RSS per stage.
+Results are plain dicts which can be written as JSON and compared against a
+stored baseline.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+import json
+import os
+import platform
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import psutil
+import pytz
+
+from nautilus_trader.backtest.data_container import BacktestDataContainer
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.model.bar import BarSpecification
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.enums import OMSType
+from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instrument import Instrument
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.tick import QuoteTick
+from nautilus_trader.trading.strategy import TradingStrategy
+from tests.test_kit.providers import TestInstrumentProvider
+from tests.test_kit.strategies import EMACross
+
+# Metrics where a higher value is better (all others are lower is better)
+HIGHER_IS_BETTER = {"throughput"}
+
+DEFAULT_THRESHOLD = 0.20
+
+# Stages shorter than this (seconds) are dominated by timer noise, so their
+# durations are not compared against the baseline
+MIN_STAGE_SECONDS = 0.1
+
+# Tail latencies are noisy between runs, so are only flagged on large changes
+DEFAULT_METRIC_THRESHOLDS = {
+    "latency_ns.p99": 0.50,
+    "latency_ns.max": float("inf"),
+    # One-off setup stages take well under a second, so are equally noisy
+    "stages.wrangling.seconds": 0.50,
+    "stages.producer_setup.seconds": 0.50,
+}
+
+
+def synthetic_quote_ticks(
+    count: int,
+    seed: int=0,
+    start: datetime=datetime(2020, 1, 1, tzinfo=pytz.utc),
+    interval_ms: int=500,
+    initial_price: float=1.0,
+    volatility: float=0.0001,
+    spread: float=0.0001,
+    precision: int=5,
+) -> pd.DataFrame:
+    """
+    Return deterministic synthetic quote tick data as a random walk.
+
+    Parameters
+    ----------
+    count : int
+        The number of ticks to generate.
+    seed : int
+        The seed for the random number generator.
+    start : datetime
+        The timestamp of the first tick.
+    interval_ms : int
+        The interval between ticks (milliseconds).
+    initial_price : float
+        The initial mid price.
+    volatility : float
+        The standard deviation of the mid price changes.
+    spread : float
+        The bid/ask spread.
+    precision : int
+        The price precision to round to.
+
+    Returns
+    -------
+    pd.DataFrame
+        With 'bid', 'ask', 'bid_size' and 'ask_size' columns and a UTC
+        'timestamp' index.
+
+    """
+    rng = np.random.default_rng(seed)
+    mid = initial_price + np.cumsum(rng.normal(0., volatility, count))
+    index = pd.date_range(start, periods=count, freq=pd.Timedelta(milliseconds=interval_ms), name="timestamp")
+
+    return pd.DataFrame(
+        {
+            "bid": np.round(mid - spread / 2, precision),
+            "ask": np.round(mid + spread / 2, precision),
+            "bid_size": np.full(count, 1_000_000.),
+            "ask_size": np.full(count, 1_000_000.),
+        },
+        index=index,
+    )
+
+
+class LatencyProbe(TradingStrategy):
+    """
+    Records the wall time at which each quote tick reaches a strategy.
+
+    The intervals between successive ticks measure the processing latency of
+    one iteration of the backtest loop.
+    """
+
+    def __init__(self, instrument: Instrument):
+        """
+        Initialize a new instance of the `LatencyProbe` class.
+
+        Parameters
+        ----------
+        instrument : Instrument
+            The instrument to subscribe to.
+
+        """
+        super().__init__(order_id_tag="PROBE")
+        self.instrument = instrument
+        self.times: List[int] = []
+
+    def on_start(self):
+        self.subscribe_quote_ticks(self.instrument.security)
+
+    def on_quote_tick(self, tick: QuoteTick):
+        self.times.append(time.perf_counter_ns())
+
+    def on_reset(self):
+        self.times = []
+
+
+class _RSSSampler:
+    # Samples the resident set size of the process on a background thread
+
+    def __init__(self, interval: float=0.01):
+        self._process = psutil.Process()
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+        self.samples: List[tuple] = []  # (perf_counter_ns, rss)
+
+    @property
+    def peak(self) -> int:
+        return max(rss for _, rss in self.samples)
+
+    def peak_between(self, start_ns: int, stop_ns: int) -> int:
+        # The peak over the window, including the last sample before it starts
+        # as the resident set size at the start of the window
+        peak = self.samples[0][1]
+        for ts, rss in self.samples:
+            if ts > stop_ns:
+                break
+            peak = rss if ts <= start_ns else max(peak, rss)
+        return peak
+
+    def _sample(self):
+        self.samples.append((time.perf_counter_ns(), self._process.memory_info().rss))
+
+    def __enter__(self):
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            self._sample()
+
+
+class BacktestBenchmark:
+    """
+    Provides a single benchmark of the backtest loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        strategy_factory: Callable[[Instrument], List[TradingStrategy]],
+        ticks: int,
+        seed: int=0,
+    ):
+        """
+        Initialize a new instance of the `BacktestBenchmark` class.
+
+        Parameters
+        ----------
+        name : str
+            The name of the benchmark.
+        strategy_factory : callable
+            The factory returning the strategies to run for an instrument.
+        ticks : int
+            The number of synthetic quote ticks to run.
+        seed : int
+            The seed for the synthetic data.
+
+        """
+        self.name = name
+        self.strategy_factory = strategy_factory
+        self.ticks = ticks
+        self.seed = seed
+
+    def run(self) -> Dict[str, object]:
+        """
+        Run the benchmark.
+
+        Stage times are in seconds, latencies in nanoseconds, and peak RSS in
+        megabytes.
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        quotes = synthetic_quote_ticks(self.ticks, seed=self.seed)
+        probe = LatencyProbe(instrument)
+        stages = {}
+
+        with _RSSSampler() as rss:
+            ts = time.perf_counter()
+            data = BacktestDataContainer()
+            data.add_instrument(instrument)
+            data.add_quote_ticks(instrument.security, quotes)
+
+            engine = BacktestEngine(
+                data=data,
+                strategies=self.strategy_factory(instrument) + [probe],
+                bypass_logging=True,
+            )
+
+            engine.add_exchange(
+                venue=Venue("SIM"),
+                oms_type=OMSType.HEDGING,
+                starting_balances=[Money(1_000_000, USD)],
+            )
+        stages["wrangling"] = {"seconds": time.perf_counter() - ts, "peak_rss_mb": rss.peak / 1e6}
+
+        with _RSSSampler() as rss:
+            run_start = time.perf_counter_ns()
+            engine.run(print_log_store=False)
+            run_stop = time.perf_counter_ns()
+
+        times = np.asarray(probe.times, dtype=np.int64)
+        if len(times) < 2:
+            raise RuntimeError(f"Benchmark {self.name} processed no ticks")
+
+        # The probe brackets the main loop, setup is everything before the first tick
+        stages["producer_setup"] = {
+            "seconds": (times[0] - run_start) / 1e9,
+            "peak_rss_mb": rss.peak_between(run_start, times[0]) / 1e6,
+        }
+        stages["main_loop"] = {
+            "seconds": (times[-1] - times[0]) / 1e9,
+            "peak_rss_mb": rss.peak_between(times[0], times[-1]) / 1e6,
+        }
+
+        with _RSSSampler() as rss:
+            ts = time.perf_counter()
+            engine.trader.generate_order_fills_report()
+            engine.trader.generate_positions_report()
+            engine.trader.generate_account_report(Venue("SIM"))
+            engine.analyzer.get_performance_stats_returns()
+        stages["analysis"] = {
+            "seconds": time.perf_counter() - ts + (run_stop - times[-1]) / 1e9,
+            "peak_rss_mb": rss.peak / 1e6,
+        }
+
+        latencies = np.diff(times)
+        result = {
+            "ticks": engine.iteration,
+            "throughput": (len(times) - 1) / stages["main_loop"]["seconds"],
+            "latency_ns": {
+                "p50": float(np.percentile(latencies, 50)),
+                "p90": float(np.percentile(latencies, 90)),
+                "p99": float(np.percentile(latencies, 99)),
+                "max": float(latencies.max()),
+            },
+            "stages": stages,
+        }
+
+        return result
+
+
+def default_benchmarks(ticks: int=100_000) -> List[BacktestBenchmark]:
+    """
+    Return the fixed benchmarks of the suite.
+
+    Parameters
+    ----------
+    ticks : int
+        The number of synthetic quote ticks per benchmark.
+
+    Returns
+    -------
+    list[BacktestBenchmark]
+
+    """
+    def empty_strategy(instrument):
+        return [TradingStrategy("001")]
+
+    def ema_cross(instrument):
+        return [
+            EMACross(
+                security=instrument.security,
+                bar_spec=BarSpecification(1, BarAggregation.MINUTE, PriceType.BID),
+                trade_size=Decimal(1_000_000),
+                fast_ema=10,
+                slow_ema=20,
+            ),
+        ]
+
+    return [
+        BacktestBenchmark("empty_strategy", empty_strategy, ticks),
+        BacktestBenchmark("ema_cross", ema_cross, ticks),
+    ]
+
+
+def _median_result(runs: List[Dict[str, object]]) -> Dict[str, object]:
+    # Return the result with each metric the median over the given runs
+    if isinstance(runs[0], dict):
+        return {key: _median_result([run[key] for run in runs]) for key in runs[0]}
+    return type(runs[0])(np.median(runs))
+
+
+def run_benchmarks(benchmarks: List[BacktestBenchmark], repeat: int=1) -> Dict[str, object]:
+    """
+    Run the given benchmarks and return the results.
+
+    Where repeated, each metric is the median over the runs of each benchmark,
+    so a single noisy run cannot move the results.
+
+    Parameters
+    ----------
+    benchmarks : list[BacktestBenchmark]
+        The benchmarks to run.
+    repeat : int
+        The number of runs for each benchmark.
+
+    Returns
+    -------
+    dict[str, object]
+
+    """
+    results = {}
+    for benchmark in benchmarks:
+        runs = [benchmark.run() for _ in range(repeat)]
+        results[benchmark.name] = _median_result(runs)
+
+    return {
+        "meta": {
+            "created": datetime.now(tz=pytz.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "repeat": repeat,
+        },
+        "benchmarks": results,
+    }
+
+
+def flatten_metrics(result: Dict[str, object]) -> Dict[str, float]:
+    """
+    Return the metrics of a single benchmark result keyed by dotted name.
+
+    Parameters
+    ----------
+    result : dict[str, object]
+        The benchmark result.
+
+    Returns
+    -------
+    dict[str, float]
+
+    """
+    metrics = {"throughput": result["throughput"]}
+    for percentile, value in result["latency_ns"].items():
+        metrics[f"latency_ns.{percentile}"] = value
+    for stage, values in result["stages"].items():
+        for metric, value in values.items():
+            metrics[f"stages.{stage}.{metric}"] = value
+    return metrics
+
+
+def check_comparable(results: Dict[str, object], baseline: Dict[str, object]) -> None:
+    """
+    Check the given results can be compared against the baseline.
+
+    Results are only comparable when recorded on the same machine architecture
+    with the same Python minor version (other platform details such as the
+    kernel build are not considered).
+
+    Parameters
+    ----------
+    results : dict[str, object]
+        The benchmark results.
+    baseline : dict[str, object]
+        The baseline benchmark results.
+
+    Raises
+    ------
+    ValueError
+        If the results and baseline were recorded on a different machine or Python version.
+
+    """
+    current = results.get("meta", {})
+    recorded = baseline.get("meta", {})
+    for key, normalize in (("machine", str), ("python", _python_minor)):
+        if current.get(key) is None or recorded.get(key) is None:
+            continue  # Not recorded
+        if normalize(current[key]) != normalize(recorded[key]):
+            raise ValueError(
+                f"cannot compare results against a baseline from another {key} "
+                f"(baseline={recorded[key]}, current={current[key]})",
+            )
+
+
+def baseline_path(directory: str, meta: Dict[str, object]) -> str:
+    """
+    Return the path of the baseline for the given results metadata.
+
+    One baseline is stored per machine architecture and Python minor version,
+    as only results from the same pair are comparable (see `check_comparable`).
+
+    Parameters
+    ----------
+    directory : str
+        The directory of the baselines.
+    meta : dict[str, object]
+        The metadata of the benchmark results.
+
+    Returns
+    -------
+    str
+
+    """
+    return os.path.join(directory, f"backtest-{meta['machine']}-py{_python_minor(meta['python'])}.json")
+
+
+def compare_results(
+    results: Dict[str, object],
+    baseline: Dict[str, object],
+    thresholds: Optional[Dict[str, float]]=None,
+) -> List[str]:
+    """
+    Compare the given results against the baseline.
+
+    A metric has regressed when it is worse than the baseline by more than its
+    relative threshold. Thresholds are keyed by metric name (e.g. 'throughput'
+    or 'stages.main_loop.seconds'), falling back to `DEFAULT_METRIC_THRESHOLDS`
+    and then the 'default' threshold. Stage durations shorter than
+    `MIN_STAGE_SECONDS` in the baseline are not compared.
+
+    Parameters
+    ----------
+    results : dict[str, object]
+        The benchmark results.
+    baseline : dict[str, object]
+        The baseline benchmark results.
+    thresholds : dict[str, float], optional
+        The relative regression thresholds.
+
+    Returns
+    -------
+    list[str]
+        The descriptions of the regressions found (empty if none).
+
+    Raises
+    ------
+    ValueError
+        If the results and baseline are not comparable (see `check_comparable`).
+
+    """
+    check_comparable(results, baseline)
+
+    if thresholds is None:
+        thresholds = {}
+
+    regressions = []
+    for name, result in results["benchmarks"].items():
+        base_result = baseline["benchmarks"].get(name)
+        if base_result is None:
+            continue  # New benchmark
+        regressions += _compare_benchmark(name, result, base_result, thresholds)
+
+    return regressions
+
+
+def _python_minor(version: str) -> str:
+    return ".".join(version.split(".")[:2])
+
+
+def _compare_benchmark(
+    name: str,
+    result: Dict[str, object],
+    base_result: Dict[str, object],
+    thresholds: Dict[str, float],
+) -> List[str]:
+    default = thresholds.get("default", DEFAULT_THRESHOLD)
+    base_metrics = flatten_metrics(base_result)
+
+    regressions = []
+    for metric, value in flatten_metrics(result).items():
+        base_value = base_metrics.get(metric)
+        if not base_value:
+            continue  # Not comparable
+        if metric.endswith(".seconds") and base_value < MIN_STAGE_SECONDS:
+            continue  # Too short to compare
+
+        change = (value - base_value) / base_value
+        if metric in HIGHER_IS_BETTER:
+            change = -change
+
+        threshold = thresholds.get(metric, DEFAULT_METRIC_THRESHOLDS.get(metric, default))
+        if change > threshold:
+            regressions.append(
+                f"{name} {metric} regressed {change:.1%} "
+                f"(baseline={base_value:,.3f}, current={value:,.3f}, threshold={threshold:.0%})",
+            )
+
+    return regressions
+
+
+def write_results(results: Dict[str, object], path: str) -> None:
+    """
+    Write the given results to the given path as JSON.
+
+    Parameters
+    ----------
+    results : dict[str, object]
+        The benchmark results.
+    path : str
+        The path to write to.
+
+    """
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def read_results(path: str) -> Dict[str, object]:
+    """
+    Return the results read from the given JSON path.
+
+    Parameters
+    ----------
+    path : str
+        The path to read from.
+
+    Returns
+    -------
+    dict[str, object]
+
+    """
+    with open(path) as f:
+        return json.load(f)
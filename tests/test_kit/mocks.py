@@ -447,18 +447,22 @@ class MockExecutionClient(ExecutionClient):
     def submit_order(self, command) -> None:
         self.calls.append(inspect.currentframe().f_code.co_name)
         self.commands.append(command)
+        self._record_sent(command)
 
     def submit_bracket_order(self, command) -> None:
         self.calls.append(inspect.currentframe().f_code.co_name)
         self.commands.append(command)
+        self._record_sent(command)
 
     def amend_order(self, command) -> None:
         self.calls.append(inspect.currentframe().f_code.co_name)
         self.commands.append(command)
+        self._record_sent(command)
 
     def cancel_order(self, command) -> None:
         self.calls.append(inspect.currentframe().f_code.co_name)
         self.commands.append(command)
+        self._record_sent(command)
 
 
 class MockExecutionDatabase(ExecutionDatabase):
@@ -13,10 +13,21 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from datetime import date
 from datetime import datetime
 import unittest
 
+from empyrical import annual_return
+from empyrical import annual_volatility
+from empyrical import calmar_ratio
+from empyrical import max_drawdown
+from empyrical import sharpe_ratio
+from empyrical import sortino_ratio
+import numpy as np
+
+from nautilus_trader.analysis.performance import DailyReturns
 from nautilus_trader.analysis.performance import PerformanceAnalyzer
+from nautilus_trader.analysis.performance import RealizedPnLs
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.factories import OrderFactory
 from nautilus_trader.model.enums import OrderSide
@@ -165,3 +176,117 @@ class AnalyzerTests(unittest.TestCase):
         self.assertEqual(2, len(result))
         self.assertEqual(6.0, result['P-1'])
         self.assertEqual(16.0, result['P-2'])
+
+    def test_returns_statistics_match_series_calculations(self):
+        # Arrange
+        values = [0.05, -0.10, 0.10, -0.21, 0.22, -0.23, 0.24, -0.25, 0.26, -0.20]
+        for day, value in enumerate(values):
+            self.analyzer.add_return(datetime(year=2010, month=1, day=day + 1), value)
+
+        returns = self.analyzer.get_daily_returns()
+
+        # Act
+        # Assert
+        self.assertAlmostEqual(annual_return(returns), self.analyzer.annual_return())
+        self.assertAlmostEqual(max_drawdown(returns), self.analyzer.max_drawdown_return())
+        self.assertAlmostEqual(annual_volatility(returns), self.analyzer.annual_volatility())
+        self.assertAlmostEqual(sharpe_ratio(returns), self.analyzer.sharpe_ratio())
+        self.assertAlmostEqual(calmar_ratio(returns), self.analyzer.calmar_ratio())
+        self.assertAlmostEqual(sortino_ratio(returns), self.analyzer.sortino_ratio())
+        self.assertAlmostEqual(np.mean(returns), self.analyzer.returns_mean())
+        self.assertAlmostEqual(np.var(returns), self.analyzer.returns_variance())
+
+    def test_returns_statistics_when_no_data_returns_nan(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertTrue(np.isnan(self.analyzer.annual_return()))
+        self.assertTrue(np.isnan(self.analyzer.cum_return()))
+        self.assertTrue(np.isnan(self.analyzer.sharpe_ratio()))
+        self.assertTrue(np.isnan(self.analyzer.returns_mean()))
+
+
+class RealizedPnLsTests(unittest.TestCase):
+
+    def test_instantiated_buffer_is_empty(self):
+        # Arrange
+        pnls = RealizedPnLs()
+
+        # Act
+        # Assert
+        self.assertEqual(0, pnls.count)
+        self.assertTrue(pnls.to_series().empty)
+        self.assertEqual(0, pnls.win_rate())
+        self.assertEqual(0, pnls.avg_winner())
+
+    def test_add_values_updates_statistics(self):
+        # Arrange
+        pnls = RealizedPnLs()
+
+        # Act
+        pnls.add("P-1", 10.0)
+        pnls.add("P-2", -5.0)
+        pnls.add("P-3", 20.0)
+        pnls.add("P-4", -1.0)
+
+        # Assert
+        self.assertEqual(4, pnls.count)
+        self.assertEqual(2, pnls.winners_count)
+        self.assertEqual(2, pnls.losers_count)
+        self.assertEqual(20.0, pnls.max_winner())
+        self.assertEqual(-5.0, pnls.max_loser())
+        self.assertEqual(10.0, pnls.min_winner())
+        self.assertEqual(-1.0, pnls.min_loser())
+        self.assertEqual(15.0, pnls.avg_winner())
+        self.assertEqual(-3.0, pnls.avg_loser())
+        self.assertEqual(0.5, pnls.win_rate())
+
+    def test_add_for_existing_position_replaces_value(self):
+        # Arrange
+        pnls = RealizedPnLs()
+        pnls.add("P-1", 10.0)
+        pnls.add("P-2", -5.0)
+
+        # Act
+        pnls.add("P-1", -2.0)
+
+        # Assert
+        self.assertEqual(2, pnls.count)
+        self.assertEqual(0, pnls.winners_count)
+        self.assertEqual(-2.0, pnls.min_loser())
+        self.assertEqual(-2.0, pnls.to_series()["P-1"])
+
+    def test_add_beyond_initial_capacity_grows_buffer(self):
+        # Arrange
+        pnls = RealizedPnLs()
+
+        # Act
+        for i in range(200):
+            pnls.add(f"P-{i}", float(i))
+
+        # Assert
+        self.assertEqual(200, pnls.count)
+        self.assertEqual(199.0, pnls.to_series()["P-199"])
+        self.assertEqual(199.0, pnls.max_winner())
+
+
+class DailyReturnsTests(unittest.TestCase):
+
+    def test_add_to_closed_date_recalculates_statistics(self):
+        # Arrange
+        returns = DailyReturns()
+        returns.add(date(2010, 1, 1), 0.10)
+        returns.add(date(2010, 1, 2), -0.20)
+        returns.add(date(2010, 1, 3), 0.05)
+
+        # Act
+        returns.add(date(2010, 1, 1), 0.10)
+
+        # Assert
+        expected = returns.to_series()
+        self.assertEqual(3, returns.count)
+        self.assertAlmostEqual(0.20, expected.iloc[0])
+        self.assertAlmostEqual(np.mean(expected), returns.mean())
+        self.assertAlmostEqual(np.var(expected, ddof=1), returns.variance(ddof=1))
+        self.assertAlmostEqual(max_drawdown(expected), returns.max_drawdown())
+        self.assertAlmostEqual(1.2 * 0.8 * 1.05 - 1, returns.cum_return())
@@ -13,8 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from datetime import timedelta
+import os
+import tempfile
 import unittest
 
+import pandas as pd
+
 from nautilus_trader.analysis.reports import ReportProvider
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.factories import OrderFactory
@@ -149,7 +154,7 @@ class ReportProviderTests(unittest.TestCase):
         self.assertEqual("AUD/USD.SIM", report.iloc[0]["security"])
         self.assertEqual("BUY", report.iloc[0]["side"])
         self.assertEqual("LIMIT", report.iloc[0]["type"])
-        self.assertEqual(1500000, report.iloc[0]["quantity"])
+        self.assertEqual(Quantity(1500000), report.iloc[0]["quantity"])
         self.assertEqual(0.80011, report.iloc[0]["avg_price"])
         self.assertEqual(0.00001, report.iloc[0]["slippage"])
         self.assertEqual("None", report.iloc[1]["avg_price"])
@@ -253,10 +258,154 @@ class ReportProviderTests(unittest.TestCase):
         self.assertEqual(position1.id.value, report.index[0])
         self.assertEqual("AUD/USD.SIM", report.iloc[0]["security"])
         self.assertEqual("BUY", report.iloc[0]["entry"])
-        self.assertEqual(100000, report.iloc[0]["peak_quantity"])
+        self.assertEqual(Quantity(100000), report.iloc[0]["peak_quantity"])
         self.assertEqual(1.0001, report.iloc[0]["avg_open"])
         self.assertEqual(1.0001, report.iloc[0]["avg_close"])
         self.assertEqual(UNIX_EPOCH, report.iloc[0]["opened_time"])
         self.assertEqual(UNIX_EPOCH, report.iloc[0]["closed_time"])
         self.assertEqual(0, report.iloc[0]["realized_points"])
         self.assertEqual(0, report.iloc[0]["realized_return"])
+
+    def test_write_orders_report_in_chunks_writes_all_rows(self):
+        # Arrange
+        report_provider = ReportProvider()
+
+        order1 = self.order_factory.limit(
+            AUDUSD_SIM.security,
+            OrderSide.BUY,
+            Quantity(1500000),
+            Price("0.80010"),
+        )
+
+        order1.apply(TestStubs.event_order_submitted(order1))
+        order1.apply(TestStubs.event_order_accepted(order1))
+
+        order2 = self.order_factory.limit(
+            AUDUSD_SIM.security,
+            OrderSide.SELL,
+            Quantity(1500000),
+            Price("0.80000"),
+        )
+
+        order2.apply(TestStubs.event_order_submitted(order2))
+        order2.apply(TestStubs.event_order_accepted(order2))
+
+        order3 = self.order_factory.market(
+            GBPUSD_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        order1.apply(TestStubs.event_order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            fill_price=Price("0.80011"),
+        ))
+
+        orders = [order1, order2, order3]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "orders.parquet")
+
+            # Act
+            result = report_provider.write_orders_report(orders, path, chunk_size=2)
+            report = pd.read_parquet(path)
+
+        # Assert
+        self.assertEqual(3, result)
+        self.assertEqual(3, len(report))
+        self.assertEqual(order1.cl_ord_id.value, report.iloc[0]["cl_ord_id"])
+        self.assertEqual("GBP/USD.SIM", report.iloc[2]["security"])
+        self.assertEqual(1500000, report.iloc[0]["quantity"])
+        self.assertEqual(0.80011, report.iloc[0]["avg_price"])
+        self.assertTrue(pd.isna(report.iloc[1]["avg_price"]))
+
+    def test_write_positions_report_writes_closed_positions(self):
+        # Arrange
+        report_provider = ReportProvider()
+
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        order2 = self.order_factory.market(
+            AUDUSD_SIM.security,
+            OrderSide.SELL,
+            Quantity(100000),
+        )
+
+        fill1 = TestStubs.event_order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123456"),
+            strategy_id=StrategyId("S", "001"),
+            fill_price=Price("1.00010"),
+        )
+
+        fill2 = TestStubs.event_order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123457"),
+            strategy_id=StrategyId("S", "001"),
+            fill_price=Price("1.00010"),
+        )
+
+        position1 = Position(fill1)
+        position1.apply(fill2)
+
+        position2 = Position(fill1)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "positions.parquet")
+
+            # Act
+            result = report_provider.write_positions_report([position1, position2], path)
+            report = pd.read_parquet(path)
+
+        # Assert
+        self.assertEqual(1, result)
+        self.assertEqual(1, len(report))
+        self.assertEqual(position1.id.value, report.iloc[0]["position_id"])
+        self.assertEqual("BUY", report.iloc[0]["entry"])
+        self.assertEqual(1.0001, report.iloc[0]["avg_open"])
+        self.assertEqual("USD", report.iloc[0]["currency"])
+        self.assertEqual(position1.open_duration // timedelta(microseconds=1), report.iloc[0]["duration_us"])
+
+    def test_write_positions_report_with_no_closed_positions_writes_empty_file(self):
+        # Arrange
+        report_provider = ReportProvider()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "positions.parquet")
+
+            # Act
+            result = report_provider.write_positions_report([], path)
+            report = pd.read_parquet(path)
+
+        # Assert
+        self.assertEqual(0, result)
+        self.assertEqual(0, len(report))
+        self.assertIn("peak_quantity", report.columns)
+        self.assertEqual("float64", report["peak_quantity"].dtype)
+        self.assertEqual("int64", report["duration_us"].dtype)
+
+    def test_write_orders_report_with_no_orders_writes_empty_file(self):
+        # Arrange
+        report_provider = ReportProvider()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "orders.parquet")
+
+            # Act
+            result = report_provider.write_order_fills_report([], path)
+            report = pd.read_parquet(path)
+
+        # Assert
+        self.assertEqual(0, result)
+        self.assertEqual(
+            ["cl_ord_id", "order_id", "security", "side", "type", "quantity", "avg_price", "slippage", "timestamp"],
+            list(report.columns),
+        )
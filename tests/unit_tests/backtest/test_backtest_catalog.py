@@ -0,0 +1,242 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+from nautilus_trader.backtest.catalog import ParquetDataCatalog
+from nautilus_trader.backtest.catalog import QUOTE_TICKS
+from nautilus_trader.backtest.data_container import BacktestDataContainer
+from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.enums import PriceType
+from tests.test_kit.providers import TestDataProvider
+from tests.test_kit.providers import TestInstrumentProvider
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+
+
+class ParquetDataCatalogTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+
+        self.catalog = ParquetDataCatalog(self.path, row_group_size=100)
+        self.ticks = TestDataProvider.usdjpy_ticks()
+        self.bars = TestDataProvider.usdjpy_1min_bid().iloc[:20000]  # 2013-02-01 to 2013-02-20
+
+    def test_read_from_empty_catalog_returns_empty(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertEqual({}, self.catalog.quote_ticks())
+        self.assertEqual({}, self.catalog.trade_ticks())
+        self.assertEqual({}, self.catalog.bars(BarAggregation.MINUTE, PriceType.BID))
+        self.assertEqual([], self.catalog.securities(QUOTE_TICKS))
+        self.assertEqual([], list(self.catalog.stream(QUOTE_TICKS)))
+
+    def test_write_data_with_non_datetime_index_raises_type_error(self):
+        # Arrange
+        data = self.ticks.reset_index()
+
+        # Act
+        # Assert
+        self.assertRaises(TypeError, self.catalog.write_quote_ticks, USDJPY_SIM.security, data)
+
+    def test_write_and_read_quote_ticks_round_trips(self):
+        # Arrange
+        self.catalog.write_quote_ticks(USDJPY_SIM.security, self.ticks)
+
+        # Act
+        data = self.catalog.quote_ticks()
+
+        # Assert
+        self.assertEqual([USDJPY_SIM.security], list(data.keys()))
+        self.assertEqual([USDJPY_SIM.security], self.catalog.securities(QUOTE_TICKS))
+        pd.testing.assert_frame_equal(self.ticks, data[USDJPY_SIM.security])
+
+    def test_write_and_read_nanosecond_timestamps_round_trips(self):
+        # Arrange
+        data = self.ticks.iloc[:3].copy()
+        data.index = data.index + pd.to_timedelta([1, 2, 999], unit="ns")
+        data.index.name = "timestamp"  # The name is dropped by the shift
+        self.catalog.write_quote_ticks(USDJPY_SIM.security, data)
+
+        # Act
+        result = self.catalog.quote_ticks()[USDJPY_SIM.security]
+
+        # Assert
+        self.assertEqual(list(data.index.asi8), list(result.index.asi8))
+        pd.testing.assert_frame_equal(data, result)
+
+    def test_write_tz_naive_data_is_assumed_utc(self):
+        # Arrange
+        self.catalog.write_quote_ticks(USDJPY_SIM.security, self.ticks.tz_localize(None))
+
+        # Act
+        data = self.catalog.quote_ticks()
+
+        # Assert
+        pd.testing.assert_frame_equal(self.ticks, data[USDJPY_SIM.security])
+
+    def test_write_replaces_existing_data_for_same_dates(self):
+        # Arrange
+        self.catalog.write_quote_ticks(USDJPY_SIM.security, self.ticks)
+
+        # Act
+        self.catalog.write_quote_ticks(USDJPY_SIM.security, self.ticks.iloc[:10])
+
+        # Assert
+        self.assertEqual(10, len(self.catalog.quote_ticks()[USDJPY_SIM.security]))
+
+    def test_write_with_append_keeps_existing_data_for_same_dates(self):
+        # Arrange
+        chunk1 = self.ticks.iloc[:10]
+        chunk2 = self.ticks.iloc[10:20]  # Same date as the first chunk
+        self.catalog.write_quote_ticks(USDJPY_SIM.security, chunk1)
+
+        # Act
+        self.catalog.write_quote_ticks(USDJPY_SIM.security, chunk2, append=True)
+
+        # Assert
+        result = self.catalog.quote_ticks()[USDJPY_SIM.security]
+        self.assertEqual(1, len(set(self.ticks.iloc[:20].index.date)))
+        pd.testing.assert_frame_equal(self.ticks.iloc[:20], result)
+        self.assertEqual(20, sum(len(frame) for frame in self.catalog.stream(QUOTE_TICKS)))
+
+    def test_read_filters_by_security(self):
+        # Arrange
+        self.catalog.write_quote_ticks(USDJPY_SIM.security, self.ticks)
+        self.catalog.write_quote_ticks(AUDUSD_SIM.security, self.ticks.iloc[:10])
+
+        # Act
+        data = self.catalog.quote_ticks([AUDUSD_SIM.security])
+
+        # Assert
+        self.assertEqual([AUDUSD_SIM.security], list(data.keys()))
+        self.assertEqual(10, len(data[AUDUSD_SIM.security]))
+        self.assertEqual(
+            sorted([AUDUSD_SIM.security, USDJPY_SIM.security]),
+            self.catalog.securities(QUOTE_TICKS),
+        )
+
+    def test_read_bars_filters_by_time_range_and_projects_columns(self):
+        # Arrange
+        self.catalog.write_bars(USDJPY_SIM.security, BarAggregation.MINUTE, PriceType.BID, self.bars)
+        start = pd.Timestamp("2013-02-05", tz="UTC")
+        stop = pd.Timestamp("2013-02-08 12:00", tz="UTC")
+
+        # Act
+        data = self.catalog.bars(
+            BarAggregation.MINUTE,
+            PriceType.BID,
+            start=start,
+            stop=stop,
+            columns=["close"],
+        )
+
+        # Assert
+        expected = self.bars.loc[start:stop, ["close"]]
+        pd.testing.assert_frame_equal(expected, data[USDJPY_SIM.security])
+
+    def test_read_bars_for_other_specification_returns_empty(self):
+        # Arrange
+        self.catalog.write_bars(USDJPY_SIM.security, BarAggregation.MINUTE, PriceType.BID, self.bars)
+
+        # Act
+        data = self.catalog.bars(BarAggregation.MINUTE, PriceType.ASK)
+
+        # Assert
+        self.assertEqual({}, data)
+
+    def test_stream_yields_batches_bounded_by_row_group_size(self):
+        # Arrange
+        self.catalog.write_quote_ticks(USDJPY_SIM.security, self.ticks)
+        start = pd.Timestamp("2013-01-01 22:30", tz="UTC")
+
+        # Act
+        batches = list(self.catalog.stream(QUOTE_TICKS, start=start))
+
+        # Assert
+        self.assertTrue(all(len(batch) <= 100 for batch in batches))
+        data = pd.concat(batches)
+        self.assertEqual(["bid", "ask", "security"], list(data.columns))
+        self.assertEqual(USDJPY_SIM.security.to_serializable_str(), data["security"].iloc[0])
+        pd.testing.assert_frame_equal(self.ticks.loc[start:], data.drop(columns=["security"]))
+
+    def test_stream_merges_securities_in_time_order(self):
+        # Arrange
+        self.catalog.write_quote_ticks(USDJPY_SIM.security, self.ticks)
+        offset = self.ticks.copy()
+        offset.index = offset.index + pd.Timedelta(milliseconds=1)
+        self.catalog.write_quote_ticks(AUDUSD_SIM.security, offset)
+
+        # Act
+        batches = list(self.catalog.stream(QUOTE_TICKS))
+
+        # Assert
+        data = pd.concat(batches)
+        self.assertEqual(2 * len(self.ticks), len(data))
+        self.assertTrue(data.index.is_monotonic_increasing)
+        self.assertEqual(
+            [AUDUSD_SIM.security.to_serializable_str(), USDJPY_SIM.security.to_serializable_str()],
+            sorted(data["security"].unique()),
+        )
+        pd.testing.assert_frame_equal(
+            self.ticks,
+            data[data["security"] == USDJPY_SIM.security.to_serializable_str()].drop(columns=["security"]),
+        )
+
+    def test_write_partition_values_are_not_uri_encoded(self):
+        # Arrange
+        self.catalog.write_quote_ticks(USDJPY_SIM.security, self.ticks.iloc[:10])
+
+        # Act
+        paths = [os.path.relpath(root, self.path) for root, _, _ in os.walk(self.path)]
+
+        # Assert
+        self.assertIn(os.path.join(QUOTE_TICKS, "venue=SIM", "security=USD~2FJPY.SIM,FX,SPOT"), paths)
+        self.assertFalse(any("%" in path for path in paths))
+        self.assertEqual([USDJPY_SIM.security], self.catalog.securities(QUOTE_TICKS))
+
+    def test_stream_bars_raises_key_error(self):
+        # Arrange
+        # Act
+        # Assert
+        with self.assertRaises(KeyError):
+            list(self.catalog.stream("bars"))
+
+    def test_load_container_adds_instruments_and_data(self):
+        # Arrange
+        self.catalog.write_quote_ticks(USDJPY_SIM.security, self.ticks)
+        self.catalog.write_bars(USDJPY_SIM.security, BarAggregation.MINUTE, PriceType.BID, self.bars)
+        self.catalog.write_bars(USDJPY_SIM.security, BarAggregation.MINUTE, PriceType.ASK, self.bars)
+        container = BacktestDataContainer()
+
+        # Act
+        self.catalog.load_container(container, [USDJPY_SIM])
+
+        # Assert
+        self.assertEqual({USDJPY_SIM.security: USDJPY_SIM}, container.instruments)
+        self.assertTrue(container.has_quote_data(USDJPY_SIM.security))
+        self.assertFalse(container.has_trade_data(USDJPY_SIM.security))
+        self.assertEqual([BarAggregation.MINUTE], list(container.bars_bid[USDJPY_SIM.security]))
+        self.assertEqual([BarAggregation.MINUTE], list(container.bars_ask[USDJPY_SIM.security]))
@@ -0,0 +1,146 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from datetime import timedelta
+import unittest
+
+import pandas as pd
+
+from nautilus_trader.backtest.data_container import BacktestDataContainer
+from nautilus_trader.backtest.data_producer import BacktestDataProducer
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.data.engine import DataEngine
+from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.enums import PriceType
+from nautilus_trader.trading.portfolio import Portfolio
+from tests.test_kit.providers import TestDataProvider
+from tests.test_kit.providers import TestInstrumentProvider
+
+BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+
+
+class BacktestDataProducerTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = TestLogger(self.clock, bypass_logging=True)
+
+        self.portfolio = Portfolio(
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.data_engine = DataEngine(
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.data = BacktestDataContainer()
+        self.data.add_instrument(USDJPY_SIM)
+        self.data.add_instrument(BTCUSDT_BINANCE)
+        self.data.add_bars(USDJPY_SIM.security, BarAggregation.MINUTE, PriceType.BID, TestDataProvider.usdjpy_1min_bid()[:2000])
+        self.data.add_bars(USDJPY_SIM.security, BarAggregation.MINUTE, PriceType.ASK, TestDataProvider.usdjpy_1min_ask()[:2000])
+
+        # Shift the trades to interleave with the quotes
+        trades = TestDataProvider.parquet_btcusdt_trades()
+        trades.index = trades.index - (trades.index[0] - pd.Timestamp("2013-02-01 12:00", tz="UTC"))
+        self.data.add_trade_ticks(BTCUSDT_BINANCE.security, trades)
+
+    def create_producer(self, chunk_size=None):
+        return BacktestDataProducer(
+            data=self.data,
+            engine=self.data_engine,
+            clock=self.clock,
+            logger=self.logger,
+            chunk_size=chunk_size,
+        )
+
+    @staticmethod
+    def consume(producer):
+        ticks = []
+        while producer.has_tick_data:
+            ticks.append(producer.next_tick())
+        return ticks
+
+    def test_instantiate_with_non_positive_chunk_size_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, self.create_producer, timedelta(0))
+
+    def test_setup_and_consume_all_ticks(self):
+        # Arrange
+        producer = self.create_producer()
+        producer.setup(producer.min_timestamp, producer.max_timestamp)
+
+        # Act
+        ticks = self.consume(producer)
+
+        # Assert
+        self.assertEqual(7999 + 2001, len(ticks))
+        self.assertEqual(sorted(ticks, key=lambda tick: tick.timestamp), ticks)
+        self.assertFalse(producer.has_tick_data)
+
+    def test_streaming_in_chunks_produces_same_ticks_as_full_setup(self):
+        # Arrange
+        producer = self.create_producer()
+        producer.setup(producer.min_timestamp, producer.max_timestamp)
+        expected = self.consume(producer)
+
+        # Chunks smaller than the gaps in the data to exercise empty chunks
+        streaming = self.create_producer(chunk_size=timedelta(minutes=5))
+
+        # Act
+        streaming.setup(streaming.min_timestamp, streaming.max_timestamp)
+        ticks = self.consume(streaming)
+
+        # Assert
+        self.assertEqual(expected, ticks)
+        self.assertFalse(streaming.has_tick_data)
+
+    def test_streaming_within_range_produces_same_ticks_as_full_setup(self):
+        # Arrange
+        producer = self.create_producer()
+        start = producer.min_timestamp + timedelta(hours=3)
+        stop = producer.max_timestamp - timedelta(hours=3)
+        producer.setup(start, stop)
+        expected = self.consume(producer)
+
+        streaming = self.create_producer(chunk_size=timedelta(hours=1))
+
+        # Act
+        streaming.setup(start, stop)
+        ticks = self.consume(streaming)
+
+        # Assert
+        self.assertTrue(len(expected) > 0)
+        self.assertEqual(expected, ticks)
+
+    def test_reset_while_streaming_then_setup_restarts_stream(self):
+        # Arrange
+        producer = self.create_producer(chunk_size=timedelta(hours=1))
+        producer.setup(producer.min_timestamp, producer.max_timestamp)
+        first = [producer.next_tick() for _ in range(10_000)]
+
+        # Act
+        producer.reset()
+        producer.setup(producer.min_timestamp, producer.max_timestamp)
+
+        # Assert
+        self.assertEqual(first, [producer.next_tick() for _ in range(10_000)])
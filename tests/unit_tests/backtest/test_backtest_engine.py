@@ -13,7 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from datetime import datetime
+from datetime import timedelta
+from decimal import Decimal
+import os
 import unittest
+from unittest.mock import patch
+
+import pytz
 
 from nautilus_trader.backtest.data_container import BacktestDataContainer
 from nautilus_trader.backtest.engine import BacktestEngine
@@ -27,6 +34,7 @@ from nautilus_trader.model.objects import Money
 from nautilus_trader.trading.strategy import TradingStrategy
 from tests.test_kit.providers import TestDataProvider
 from tests.test_kit.providers import TestInstrumentProvider
+from tests.test_kit.strategies import EMACross
 from tests.test_kit.stubs import TestStubs
 
 USDJPY_SIM = TestStubs.security_usdjpy()
@@ -91,3 +99,269 @@ class BacktestEngineTests(unittest.TestCase):
 
         # Assert
         self.assertTrue(True)  # No exception raised
+
+
+def ema_cross_engine(**kwargs):
+    # Return an engine running an EMA cross strategy on the USD/JPY bars, with
+    # the given engine keyword arguments (e.g. `chunk_size` or `profile`)
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    data = BacktestDataContainer()
+    data.add_instrument(usdjpy)
+    data.add_bars(usdjpy.security, BarAggregation.MINUTE, PriceType.BID, TestDataProvider.usdjpy_1min_bid()[:2000])
+    data.add_bars(usdjpy.security, BarAggregation.MINUTE, PriceType.ASK, TestDataProvider.usdjpy_1min_ask()[:2000])
+
+    strategy = EMACross(
+        security=usdjpy.security,
+        bar_spec=TestStubs.bar_spec_1min_bid(),
+        trade_size=Decimal(1_000_000),
+        fast_ema=10,
+        slow_ema=20,
+    )
+
+    engine = BacktestEngine(
+        data=data,
+        strategies=[strategy],
+        bypass_logging=True,
+        **kwargs,
+    )
+
+    engine.add_exchange(
+        venue=Venue("SIM"),
+        oms_type=OMSType.HEDGING,
+        starting_balances=[Money(1_000_000, USD)],
+    )
+
+    return engine, strategy
+
+
+class BacktestEngineStreamingTests(unittest.TestCase):
+
+    def run_engine(self, chunk_size):
+        engine, _ = ema_cross_engine(chunk_size=chunk_size)
+        engine.run()
+        self.addCleanup(engine.dispose)
+        return engine
+
+    def test_run_streaming_in_chunks_gives_same_results_as_full_run(self):
+        # Arrange
+        expected = self.run_engine(chunk_size=None)
+
+        # Act
+        engine = self.run_engine(chunk_size=timedelta(hours=4))
+
+        # Assert
+        self.assertEqual(expected.iteration, engine.iteration)
+        self.assertEqual(expected.get_exec_engine().event_count, engine.get_exec_engine().event_count)
+        self.assertEqual(
+            expected.get_exec_engine().cache.positions_total_count(),
+            engine.get_exec_engine().cache.positions_total_count(),
+        )
+        self.assertEqual(
+            expected.analyzer.get_performance_stats_pnls(USD),
+            engine.analyzer.get_performance_stats_pnls(USD),
+        )
+
+    def test_run_streaming_twice_gives_same_results(self):
+        # Arrange
+        engine = self.run_engine(chunk_size=timedelta(hours=4))
+        iterations = engine.iteration
+
+        # Act
+        engine.run()
+
+        # Assert
+        self.assertEqual(iterations, engine.iteration)
+
+
+def collect_results(engine):
+    return (
+        engine.iteration,
+        engine.get_exec_engine().event_count,
+        engine.get_exec_engine().cache.positions_total_count(),
+    )
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+class BacktestEngineForkTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.engine, self.strategy = ema_cross_engine(chunk_size=timedelta(hours=4))
+        self.split = datetime(2013, 2, 2, 12, 0, tzinfo=pytz.utc)
+
+    def tearDown(self):
+        self.engine.reset()
+        self.engine.dispose()
+
+    def test_fork_without_snapshot_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, self.engine.fork, [None], collect_results)
+
+    def test_snapshot_with_split_outside_run_raises_value_error(self):
+        # Arrange
+        split = datetime(2014, 1, 1, tzinfo=pytz.utc)
+
+        # Act
+        # Assert
+        self.assertRaises(ValueError, self.engine.snapshot, split)
+
+    def test_snapshot_pauses_run_at_split(self):
+        # Arrange
+        # Act
+        self.engine.snapshot(self.split)
+
+        # Assert
+        self.assertEqual(self.split, self.engine.snapshot_time)
+        self.assertTrue(0 < self.engine.iteration < 7999)
+        self.assertTrue(self.strategy.fast_ema.initialized)
+        self.assertTrue(self.strategy.clock.utc_now() <= self.split)
+
+    def test_fork_unchanged_continuation_gives_same_results_as_full_run(self):
+        # Arrange
+        self.engine.run()
+        expected = collect_results(self.engine)
+        self.engine.snapshot(self.split)
+
+        # Act
+        results = self.engine.fork([None], collect_results)
+
+        # Assert
+        self.assertEqual([expected], results)
+
+    def test_fork_branches_run_from_same_snapshot(self):
+        # Arrange
+        self.engine.snapshot(self.split)
+        iterations = self.engine.iteration
+
+        def halve_trade_size(engine):
+            self.strategy.trade_size = Decimal(500_000)
+
+        # Act
+        results = self.engine.fork(
+            [None, halve_trade_size],
+            lambda engine: (engine.iteration, self.strategy.trade_size),
+            max_processes=1,
+        )
+
+        # Assert
+        self.assertEqual([(7999, Decimal(1_000_000)), (7999, Decimal(500_000))], results)
+        self.assertEqual(iterations, self.engine.iteration)
+        self.assertEqual(Decimal(1_000_000), self.strategy.trade_size)
+
+    def test_fork_repeatedly_gives_same_results(self):
+        # Arrange
+        self.engine.snapshot(self.split)
+
+        # Act
+        first = self.engine.fork([None, None], collect_results)
+        second = self.engine.fork([None], collect_results)
+
+        # Assert
+        self.assertEqual(first[0], first[1])
+        self.assertEqual(first[0], second[0])
+
+    def test_fork_when_branch_raises_then_raises_runtime_error(self):
+        # Arrange
+        self.engine.snapshot(self.split)
+
+        def fail(engine):
+            raise KeyError("bad branch")
+
+        # Act
+        # Assert
+        with self.assertRaises(RuntimeError) as context:
+            self.engine.fork([fail], collect_results)
+        self.assertIn("bad branch", str(context.exception))
+
+    def test_fork_when_branch_raises_then_reaps_all_children_before_raising(self):
+        # Arrange
+        self.engine.snapshot(self.split)
+
+        def fail(engine):
+            raise KeyError("bad branch")
+
+        # Record the children forked (other tests may leave children of their own)
+        pids = []
+        fork = os.fork
+
+        def recording_fork():
+            pid = fork()
+            if pid != 0:
+                pids.append(pid)
+            return pid
+
+        # Act
+        with patch("os.fork", recording_fork):
+            with self.assertRaises(RuntimeError):
+                self.engine.fork([fail, None, None], collect_results, max_processes=3)
+
+        # Assert
+        self.assertEqual(3, len(pids))
+        for pid in pids:
+            with self.assertRaises(ChildProcessError):
+                os.waitpid(pid, os.WNOHANG)  # Already reaped, not left as a zombie
+
+
+class BacktestEngineProfilingTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.engine, self.strategy = ema_cross_engine(profile=True)
+
+    def tearDown(self):
+        self.engine.reset()
+        self.engine.dispose()
+
+    def test_profiler_is_none_by_default(self):
+        # Arrange
+        data = BacktestDataContainer()
+        data.add_instrument(TestInstrumentProvider.default_fx_ccy("USD/JPY"))
+
+        # Act
+        engine = BacktestEngine(data=data, bypass_logging=True)
+
+        # Assert
+        self.assertIsNone(engine.profiler)
+
+    def test_run_with_profile_records_loop_stages(self):
+        # Arrange
+        # Act
+        self.engine.run()
+
+        # Assert
+        profiler = self.engine.profiler
+        for name in (
+            "DataProducer.next_tick",
+            "BacktestEngine.advance_time",
+            "SimulatedExchange.process_tick",
+            "DataEngine.process",
+            "SimulatedExchange.process_modules",
+        ):
+            self.assertEqual(self.engine.iteration, profiler.stat(name).count)
+            self.assertTrue(profiler.stat(name).total_ns > 0)
+
+    def test_run_with_profile_records_strategy_handlers_indicators_and_events(self):
+        # Arrange
+        # Act
+        self.engine.run()
+
+        # Assert
+        profiler = self.engine.profiler
+        on_bar = profiler.stat(f"{self.strategy.id.value}.on_bar")
+        fast_ema = profiler.stat(f"{self.strategy.id.value}.{self.strategy.fast_ema}")
+        self.assertIsNotNone(on_bar)
+        self.assertEqual(on_bar.count, fast_ema.count)
+        self.assertIsNotNone(profiler.stat(f"{self.strategy.id.value}.on_event"))
+        self.assertEqual(self.engine.get_exec_engine().event_count, profiler.stat("ExecutionEngine.process").count)
+
+    def test_reset_clears_profile(self):
+        # Arrange
+        self.engine.run()
+
+        # Act
+        self.engine.reset()
+
+        # Assert
+        self.assertEqual([], self.engine.profiler.stats())
@@ -14,8 +14,17 @@
 # -------------------------------------------------------------------------------------------------
 
 from decimal import Decimal
+import gzip
+import os
+import shutil
+import tempfile
 import unittest
 
+import pandas as pd
+import pytz
+
+from nautilus_trader.backtest.loaders import TardisQuoteDataLoader
+from nautilus_trader.backtest.loaders import TardisTradeDataLoader
 from nautilus_trader.model.currency import Currency
 from nautilus_trader.model.enums import AssetClass
 from nautilus_trader.model.enums import AssetType
@@ -23,6 +32,7 @@ from nautilus_trader.model.enums import CurrencyType
 from nautilus_trader.model.identifiers import Security
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import Venue
+from tests.test_kit import PACKAGE_ROOT
 from tests.test_kit.providers import TestDataProvider
 from tests.test_kit.providers import TestInstrumentProvider
 
@@ -85,3 +95,108 @@ class ParquetTickDataLoadersTests(unittest.TestCase):
         self.assertIn('bid', quote_ticks.columns)
         self.assertEqual(quote_ticks.iloc[0]['ask'], 39433.62)
         self.assertEqual(quote_ticks.iloc[0]['bid'], 39432.99)
+
+
+class TardisDataLoadersTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.trades_path = PACKAGE_ROOT + "/data/tardis_trades.csv"
+        self.quotes_path = PACKAGE_ROOT + "/data/tardis_quotes.csv"
+
+    def test_load_trades_returns_normalized_frame(self):
+        # Arrange
+        # Act
+        trades = TardisTradeDataLoader.load(self.trades_path)
+
+        # Assert
+        self.assertEqual(9999, len(trades))
+        self.assertEqual(["symbol", "trade_id", "price", "quantity", "side"], list(trades.columns))
+        self.assertEqual(pytz.utc, trades.index.tz)
+        self.assertEqual(pd.Timestamp("2020-02-22 00:00:02.418379", tz="UTC"), trades.index[0])
+        self.assertEqual("42377944", trades.iloc[0]["trade_id"])
+        self.assertEqual(9682.0, trades.iloc[0]["price"])
+        self.assertEqual(0.132, trades.iloc[0]["quantity"])
+        self.assertEqual("BUY", trades.iloc[0]["side"])
+
+    def test_load_quotes_returns_normalized_frame(self):
+        # Arrange
+        # Act
+        quotes = TardisQuoteDataLoader.load(self.quotes_path)
+
+        # Assert
+        self.assertEqual(9999, len(quotes))
+        self.assertEqual(["symbol", "ask_size", "ask", "bid_size", "bid"], list(quotes.columns))
+        self.assertEqual(pytz.utc, quotes.index.tz)
+        self.assertEqual(pd.Timestamp("2020-02-22 00:00:03.502092", tz="UTC"), quotes.index[0])
+        self.assertEqual(9682.0, quotes.iloc[0]["ask"])
+        self.assertEqual(9681.92, quotes.iloc[0]["bid"])
+
+    def test_load_with_and_without_pyarrow_returns_equal_frames(self):
+        # Arrange
+        # Act
+        trades1 = TardisTradeDataLoader.load(self.trades_path, use_pyarrow=True)
+        trades2 = TardisTradeDataLoader.load(self.trades_path, use_pyarrow=False)
+        quotes1 = TardisQuoteDataLoader.load(self.quotes_path, use_pyarrow=True)
+        quotes2 = TardisQuoteDataLoader.load(self.quotes_path, use_pyarrow=False)
+
+        # Assert
+        pd.testing.assert_frame_equal(trades1, trades2, check_categorical=False)
+        pd.testing.assert_frame_equal(quotes1, quotes2, check_categorical=False)
+
+    def test_load_chunks_returns_chunks_equal_to_whole_file(self):
+        # Arrange
+        # Act
+        chunks = list(TardisTradeDataLoader.load_chunks(self.trades_path, chunk_size=4000))
+
+        # Assert
+        self.assertEqual([4000, 4000, 1999], [len(chunk) for chunk in chunks])
+        pd.testing.assert_frame_equal(
+            TardisTradeDataLoader.load(self.trades_path, use_pyarrow=False),
+            pd.concat(chunks),
+            check_categorical=False,
+        )
+
+    def test_load_chunks_with_invalid_chunk_size_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        with self.assertRaises(ValueError):
+            list(TardisQuoteDataLoader.load_chunks(self.quotes_path, chunk_size=0))
+
+    def test_load_trades_with_mixed_case_sides_returns_upper_case_sides(self):
+        # Arrange
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        path = os.path.join(temp_dir, "tardis_trades.csv")
+        with open(path, "w") as f:
+            f.write("exchange,symbol,timestamp,local_timestamp,id,side,price,amount\n")
+            f.write("binance-futures,BTCUSDT,1582329602111000,1582329602418379,1,buy,9682,0.132\n")
+            f.write("binance-futures,BTCUSDT,1582329602116000,1582329602418420,2,BUY,9682,0.412\n")
+            f.write("binance-futures,BTCUSDT,1582329602117000,1582329602418421,3,sell,9681,0.100\n")
+
+        # Act
+        trades1 = TardisTradeDataLoader.load(path, use_pyarrow=True)
+        trades2 = TardisTradeDataLoader.load(path, use_pyarrow=False)
+
+        # Assert
+        self.assertEqual(["BUY", "BUY", "SELL"], list(trades1["side"]))
+        pd.testing.assert_frame_equal(trades1, trades2)
+
+    def test_load_gzip_file_returns_same_frame_as_plain_file(self):
+        # Arrange
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        gzip_path = os.path.join(temp_dir, "tardis_quotes.csv.gz")
+        with open(self.quotes_path, "rb") as f_in, gzip.open(gzip_path, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+
+        # Act
+        quotes1 = TardisQuoteDataLoader.load(gzip_path)
+        quotes2 = TardisQuoteDataLoader.load(self.quotes_path)
+        chunks = list(TardisQuoteDataLoader.load_chunks(gzip_path))
+
+        # Assert
+        pd.testing.assert_frame_equal(quotes2, quotes1)
+        self.assertEqual(1, len(chunks))
+        self.assertEqual(9999, len(chunks[0]))
@@ -0,0 +1,298 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from datetime import datetime
+from datetime import timedelta
+import os
+import unittest
+
+import pandas as pd
+import pytz
+
+from nautilus_trader.backtest.exchange import SimulatedExchange
+from nautilus_trader.backtest.execution import BacktestExecClient
+from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.backtest.modules import FXRolloverInterestModule
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.data.engine import DataEngine
+from nautilus_trader.execution.database import BypassExecutionDatabase
+from nautilus_trader.execution.engine import ExecutionEngine
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import OMSType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import AccountId
+from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.trading.portfolio import Portfolio
+from tests.test_kit import PACKAGE_ROOT
+from tests.test_kit.mocks import MockStrategy
+from tests.test_kit.providers import TestInstrumentProvider
+from tests.test_kit.stubs import TestStubs
+
+SIM = Venue("SIM")
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+
+_TZ_US_EAST = pytz.timezone("US/Eastern")
+
+
+def previous_rollover_ticks(ticks):
+    # The rollover logic prior to the precomputed schedule, kept as the reference
+    fired = []
+    day_number = 0
+    rollover_time = None
+    rollover_applied = False
+    for now in ticks:
+        if day_number != now.day:
+            day_number = now.day
+            rollover_applied = False
+            rollover_local = now.astimezone(_TZ_US_EAST)
+            rollover_time = _TZ_US_EAST.localize(datetime(
+                rollover_local.year,
+                rollover_local.month,
+                rollover_local.day,
+                17),
+            ).astimezone(pytz.utc)
+
+        if not rollover_applied and now >= rollover_time:
+            fired.append(now)
+            rollover_applied = True
+
+    return fired
+
+
+class FXRolloverInterestModuleTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = TestLogger(self.clock)
+
+        self.portfolio = Portfolio(
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.data_engine = DataEngine(
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.data_engine.cache.add_instrument(USDJPY_SIM)
+        self.portfolio.register_cache(self.data_engine.cache)
+
+        self.exec_engine = ExecutionEngine(
+            database=BypassExecutionDatabase(
+                trader_id=TraderId("TESTER", "000"),
+                logger=self.logger,
+            ),
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        rate_data = pd.read_csv(os.path.join(PACKAGE_ROOT + "/data/", "short-term-interest.csv"))
+        self.module = FXRolloverInterestModule(rate_data=rate_data)
+
+        self.exchange = SimulatedExchange(
+            venue=SIM,
+            oms_type=OMSType.HEDGING,
+            generate_position_ids=False,
+            is_frozen_account=False,
+            starting_balances=[Money(1_000_000, USD)],
+            instruments=[USDJPY_SIM],
+            modules=[self.module],
+            fill_model=FillModel(),
+            exec_cache=self.exec_engine.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.exec_client = BacktestExecClient(
+            exchange=self.exchange,
+            account_id=AccountId("SIM", "001"),
+            engine=self.exec_engine,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.exec_engine.register_client(self.exec_client)
+        self.exchange.register_client(self.exec_client)
+
+        self.strategy = MockStrategy(bar_type=TestStubs.bartype_usdjpy_1min_bid())
+        self.strategy.register_trader(
+            TraderId("TESTER", "000"),
+            self.clock,
+            self.logger,
+        )
+
+        self.data_engine.register_strategy(self.strategy)
+        self.exec_engine.register_strategy(self.strategy)
+        self.data_engine.start()
+        self.exec_engine.start()
+        self.strategy.start()
+
+        # Open a position for rollover interest to apply to
+        tick = TestStubs.quote_tick_3decimal(
+            security=USDJPY_SIM.security,
+            bid=Price("110.002"),
+            ask=Price("110.005"),
+        )
+        self.data_engine.process(tick)
+        self.exchange.process_tick(tick)
+
+        order = self.strategy.order_factory.market(
+            USDJPY_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+        self.strategy.submit_order(order)
+
+    def process_ticks(self, ticks):
+        # Return the ticks at which rollover interest was applied
+        fired = []
+        for now in ticks:
+            balance = self.exchange.account_balances[USD]
+            self.module.process(now)
+            if self.exchange.account_balances[USD] != balance:
+                fired.append(now)
+
+        return fired
+
+    def test_process_before_rollover_does_not_apply_interest(self):
+        # Arrange
+        now = datetime(2019, 6, 3, 20, 59, tzinfo=pytz.utc)  # 16:59 EDT
+
+        # Act
+        fired = self.process_ticks([now])
+
+        # Assert
+        self.assertEqual([], fired)
+
+    def test_process_applies_interest_once_per_day(self):
+        # Arrange
+        start = datetime(2019, 6, 3, 20, 0, tzinfo=pytz.utc)
+        ticks = [start + timedelta(minutes=30 * i) for i in range(8)]
+
+        # Act
+        fired = self.process_ticks(ticks)
+
+        # Assert
+        self.assertEqual([datetime(2019, 6, 3, 21, 0, tzinfo=pytz.utc)], fired)
+
+    def test_rollover_on_spring_forward_day_is_at_21_00_utc(self):
+        # Arrange: 2019-03-10 02:00 EST becomes 03:00 EDT
+        ticks = [
+            datetime(2019, 3, 9, 21, 0, tzinfo=pytz.utc),   # 16:00 EST
+            datetime(2019, 3, 9, 22, 0, tzinfo=pytz.utc),   # 17:00 EST
+            datetime(2019, 3, 10, 20, 59, tzinfo=pytz.utc),  # 16:59 EDT
+            datetime(2019, 3, 10, 21, 0, tzinfo=pytz.utc),   # 17:00 EDT
+            datetime(2019, 3, 10, 22, 0, tzinfo=pytz.utc),
+        ]
+
+        # Act
+        fired = self.process_ticks(ticks)
+
+        # Assert
+        self.assertEqual(
+            [
+                datetime(2019, 3, 9, 22, 0, tzinfo=pytz.utc),
+                datetime(2019, 3, 10, 21, 0, tzinfo=pytz.utc),
+            ],
+            fired,
+        )
+        self.assertEqual(previous_rollover_ticks(ticks), fired)
+
+    def test_rollover_on_fall_back_day_is_at_22_00_utc(self):
+        # Arrange: 2019-11-03 02:00 EDT becomes 01:00 EST
+        ticks = [
+            datetime(2019, 11, 2, 21, 0, tzinfo=pytz.utc),   # 17:00 EDT
+            datetime(2019, 11, 3, 21, 0, tzinfo=pytz.utc),   # 16:00 EST
+            datetime(2019, 11, 3, 21, 59, tzinfo=pytz.utc),  # 16:59 EST
+            datetime(2019, 11, 3, 22, 0, tzinfo=pytz.utc),   # 17:00 EST
+        ]
+
+        # Act
+        fired = self.process_ticks(ticks)
+
+        # Assert
+        self.assertEqual(
+            [
+                datetime(2019, 11, 2, 21, 0, tzinfo=pytz.utc),
+                datetime(2019, 11, 3, 22, 0, tzinfo=pytz.utc),
+            ],
+            fired,
+        )
+        self.assertEqual(previous_rollover_ticks(ticks), fired)
+
+    def test_rollover_fires_on_same_ticks_as_previous_logic_across_dst(self):
+        # Arrange: Ticks every 7 minutes through both 2019 DST transitions
+        start = datetime(2019, 3, 1, tzinfo=pytz.utc)
+        end = datetime(2019, 11, 15, tzinfo=pytz.utc)
+        ticks = []
+        now = start
+        while now < end:
+            ticks.append(now)
+            now += timedelta(minutes=7)
+
+        # Act
+        fired = self.process_ticks(ticks)
+
+        # Assert
+        self.assertEqual(previous_rollover_ticks(ticks), fired)
+        self.assertEqual((end - start).days, len(fired))
+
+    def test_rollover_fires_on_same_ticks_as_previous_logic_across_schedule_rebuild(self):
+        # Arrange: Hourly ticks for longer than one schedule year
+        start = datetime(2017, 12, 30, 0, 0, tzinfo=pytz.utc)
+        ticks = [start + timedelta(hours=i) for i in range(24 * 400)]
+
+        # Act
+        fired = self.process_ticks(ticks)
+
+        # Assert
+        self.assertEqual(previous_rollover_ticks(ticks), fired)
+        self.assertEqual(400, len(fired))
+
+    def test_rollover_after_gap_beyond_schedule_rebuilds_schedule(self):
+        # Arrange: Second batch of ticks is more than a schedule year later
+        first = datetime(2017, 7, 3, 18, 0, tzinfo=pytz.utc)
+        second = datetime(2019, 3, 8, 18, 0, tzinfo=pytz.utc)
+        ticks = [first + timedelta(hours=i) for i in range(48)]
+        ticks += [second + timedelta(hours=i) for i in range(72)]
+
+        # Act
+        fired = self.process_ticks(ticks)
+
+        # Assert
+        self.assertEqual(previous_rollover_ticks(ticks), fired)
+        self.assertIn(datetime(2017, 7, 3, 21, 0, tzinfo=pytz.utc), fired)  # 17:00 EDT
+        self.assertIn(datetime(2019, 3, 8, 22, 0, tzinfo=pytz.utc), fired)  # 17:00 EST
+
+    def test_reset_clears_rollover_state(self):
+        # Arrange
+        now = datetime(2019, 6, 3, 21, 0, tzinfo=pytz.utc)
+        self.process_ticks([now])
+
+        # Act
+        self.module.reset()
+        fired = self.process_ticks([now])
+
+        # Assert
+        self.assertEqual([now], fired)
@@ -16,6 +16,7 @@
 import asyncio
 from datetime import datetime
 from datetime import timedelta
+import threading
 import time
 import unittest
 
@@ -535,6 +536,82 @@ class LiveClockWithThreadTimerTests(unittest.TestCase):
         # Assert
         self.assertTrue(len(self.handler) >= 8)
 
+    def test_set_timers_with_same_start_time_fire_in_order_set(self):
+        # Arrange
+        interval = timedelta(milliseconds=100)
+        start_time = self.clock.utc_now()
+        stop_time = start_time + interval
+        names = [f"TEST_TIMER{i}" for i in range(100)]
+
+        # Act
+        for name in names:
+            self.clock.set_timer(
+                name=name,
+                interval=interval,
+                start_time=start_time,
+                stop_time=stop_time,
+            )
+
+        time.sleep(0.5)
+
+        # Assert
+        self.assertEqual([], self.clock.timer_names())
+        self.assertEqual(names, [event.name for event in self.handler])
+
+    def test_repeating_timer_updates_next_event_time(self):
+        # Arrange
+        interval = timedelta(milliseconds=100)
+        start_time = self.clock.utc_now()
+
+        self.clock.set_timer(
+            name="TEST_TIMER",
+            interval=interval,
+            start_time=start_time,
+            stop_time=None,
+        )
+
+        # Act
+        time.sleep(0.35)
+
+        # Assert
+        self.assertTrue(len(self.handler) >= 3)
+        self.assertEqual(self.clock.timer("TEST_TIMER").next_time, self.clock.next_event_time)
+        self.assertTrue(self.clock.next_event_time > start_time + 2 * interval)
+
+    def test_cancel_timers_stops_scheduler_thread(self):
+        # Arrange
+        threads = threading.active_count()
+
+        self.clock.set_timer(
+            name="TEST_TIMER",
+            interval=timedelta(milliseconds=100),
+            start_time=self.clock.utc_now(),
+            stop_time=None,
+        )
+
+        time.sleep(0.15)
+        self.assertEqual(threads + 1, threading.active_count())
+
+        # Act
+        self.clock.cancel_timers()
+
+        # Assert
+        self.assertEqual(threads, threading.active_count())
+        self.assertIsNone(self.clock.next_event_time)
+
+    def test_set_timer_after_dispose_restarts_scheduler(self):
+        # Arrange
+        self.clock.set_time_alert("TEST_ALERT1", self.clock.utc_now() + timedelta(milliseconds=50))
+        time.sleep(0.1)
+        self.clock.dispose()
+
+        # Act
+        self.clock.set_time_alert("TEST_ALERT2", self.clock.utc_now() + timedelta(milliseconds=50))
+        time.sleep(0.1)
+
+        # Assert
+        self.assertEqual(["TEST_ALERT1", "TEST_ALERT2"], [event.name for event in self.handler])
+
 
 class LiveClockWithLoopTimerTests(unittest.TestCase):
     def setUp(self):
@@ -770,3 +847,26 @@ class LiveClockWithLoopTimerTests(unittest.TestCase):
             self.assertTrue(len(self.handler) >= 8)
 
         self.loop.run_until_complete(run_test())
+
+    def test_set_timers_fire_in_order_of_next_time(self):
+        async def run_test():
+            # Arrange
+            interval = timedelta(milliseconds=100)
+            start_time = self.clock.utc_now()
+
+            # Act
+            self.clock.set_time_alert("TEST_ALERT2", start_time + 2 * interval)
+            self.clock.set_time_alert("TEST_ALERT3", start_time + 3 * interval)
+            self.clock.set_time_alert("TEST_ALERT1", start_time + interval)
+            self.clock.set_time_alert("TEST_ALERT4", start_time + 2 * interval)
+
+            await asyncio.sleep(0.5)
+
+            # Assert
+            self.assertEqual([], self.clock.timer_names())
+            self.assertEqual(
+                ["TEST_ALERT1", "TEST_ALERT2", "TEST_ALERT4", "TEST_ALERT3"],
+                [event.name for event in self.handler],
+            )
+
+        self.loop.run_until_complete(run_test())
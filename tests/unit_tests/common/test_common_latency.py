@@ -0,0 +1,478 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import unittest
+
+from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.latency import DEQUEUE_TO_EXECUTE
+from nautilus_trader.common.latency import DEQUEUE_TO_SEND
+from nautilus_trader.common.latency import DEQUEUE_TO_STRATEGY
+from nautilus_trader.common.latency import LatencyHistogram
+from nautilus_trader.common.latency import LatencyTracer
+from nautilus_trader.common.latency import SEND_TO_FILL
+from nautilus_trader.common.latency import STAGES
+from nautilus_trader.common.latency import VENUE_TO_DEQUEUE
+from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.execution.database import BypassExecutionDatabase
+from nautilus_trader.live.data_engine import LiveDataEngine
+from nautilus_trader.live.execution_engine import LiveExecutionEngine
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import AccountId
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.trading.portfolio import Portfolio
+from nautilus_trader.trading.strategy import TradingStrategy
+from tests.test_kit.mocks import MockExecutionClient
+from tests.test_kit.mocks import MockMarketDataClient
+from tests.test_kit.providers import TestInstrumentProvider
+from tests.test_kit.stubs import TestStubs
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+AUDUSD_OTHER = TestInstrumentProvider.default_fx_ccy("AUD/USD", Venue("OTHER"))
+
+
+class SubmitOnQuoteStrategy(TradingStrategy):
+
+    def __init__(self):
+        super().__init__(order_id_tag="001")
+        self.orders = []
+
+    def on_start(self):
+        self.subscribe_quote_ticks(AUDUSD_SIM.security)
+
+    def on_quote_tick(self, tick):
+        order = self.order_factory.market(
+            tick.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+        self.orders.append(order)
+        self.submit_order(order)
+
+
+class LatencyHistogramTests(unittest.TestCase):
+
+    def test_instantiate_histogram(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        # Assert
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0, histogram.percentile(50))
+        self.assertEqual(0., histogram.mean())
+
+    def test_percentile_with_out_of_range_value_raises_value_error(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        # Assert
+        self.assertRaises(ValueError, histogram.percentile, -1)
+        self.assertRaises(ValueError, histogram.percentile, 101)
+
+    def test_record_small_values_are_exact(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        for value in range(1, 101):
+            histogram.record_py(value)
+
+        # Assert
+        self.assertEqual(100, histogram.count)
+        self.assertEqual(1, histogram.min_ns)
+        self.assertEqual(100, histogram.max_ns)
+        self.assertEqual(50.5, histogram.mean())
+        self.assertEqual(50, histogram.percentile(50))
+        self.assertEqual(99, histogram.percentile(99))
+        self.assertEqual(1, histogram.percentile(0))
+        self.assertEqual(100, histogram.percentile(100))
+
+    def test_record_large_values_percentiles_within_relative_error(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        for value in range(1, 10001):
+            histogram.record_py(value * 1000)  # 1us to 10ms
+
+        # Assert
+        for percentile in (50, 90, 99, 99.9):
+            expected = percentile / 100 * 10_000_000
+            self.assertAlmostEqual(expected, histogram.percentile(percentile), delta=expected / 64)
+        self.assertEqual(10_000_000, histogram.percentile(100))
+
+    def test_record_negative_value_records_zero(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        histogram.record_py(-1000)
+
+        # Assert
+        self.assertEqual(1, histogram.count)
+        self.assertEqual(0, histogram.max_ns)
+
+    def test_record_value_beyond_max_is_clamped(self):
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        histogram.record_py(2 ** 62)
+
+        # Assert
+        self.assertEqual(1, histogram.count)
+        self.assertEqual(2 ** 41 - 1, histogram.max_ns)
+        self.assertEqual(2 ** 41 - 1, histogram.percentile(50))
+
+    def test_summary(self):
+        # Arrange
+        histogram = LatencyHistogram()
+        histogram.record_py(10)
+        histogram.record_py(30)
+
+        # Act
+        summary = histogram.summary()
+
+        # Assert
+        self.assertEqual(
+            {
+                "count": 2,
+                "min": 10,
+                "mean": 20.,
+                "p50": 10,
+                "p90": 30,
+                "p99": 30,
+                "p99.9": 30,
+                "max": 30,
+            },
+            summary,
+        )
+
+    def test_reset(self):
+        # Arrange
+        histogram = LatencyHistogram()
+        histogram.record_py(1000)
+
+        # Act
+        histogram.reset()
+
+        # Assert
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0, histogram.max_ns)
+        self.assertEqual(0, histogram.percentile(99))
+
+
+class LatencyTracerTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.clock = LiveClock()
+        self.logger = TestLogger(self.clock)
+
+        # Fresh isolated loop testing pattern
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.portfolio = Portfolio(
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.data_engine = LiveDataEngine(
+            loop=self.loop,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.portfolio.register_cache(self.data_engine.cache)
+
+        self.exec_engine = LiveExecutionEngine(
+            loop=self.loop,
+            database=BypassExecutionDatabase(trader_id=TestStubs.trader_id(), logger=self.logger),
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.data_client = MockMarketDataClient(
+            name="SIM",
+            engine=self.data_engine,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.exec_client = MockExecutionClient(
+            AUDUSD_SIM.security.venue,
+            TestStubs.account_id(),
+            self.exec_engine,
+            self.clock,
+            self.logger,
+        )
+
+        self.data_engine.register_client(self.data_client)
+        self.exec_engine.register_client(self.exec_client)
+        self.exec_engine.process(TestStubs.event_account_state())
+
+        self.strategy = SubmitOnQuoteStrategy()
+        self.strategy.register_trader(
+            TestStubs.trader_id(),
+            self.clock,
+            self.logger,
+        )
+        self.data_engine.register_strategy(self.strategy)
+        self.exec_engine.register_strategy(self.strategy)
+
+        self.tracer = LatencyTracer()
+        self.data_engine.register_tracer(self.tracer)
+        self.exec_engine.register_tracer(self.tracer)
+        self.strategy.register_tracer(self.tracer)
+
+    def tearDown(self):
+        self.loop.stop()
+        self.loop.close()
+
+    def test_instantiate_tracer(self):
+        # Arrange
+        tracer = LatencyTracer()
+
+        # Act
+        stats = tracer.stats()
+
+        # Assert
+        self.assertEqual(list(STAGES), list(stats.keys()))
+        self.assertTrue(all(stats[stage]["count"] == 0 for stage in STAGES))
+        self.assertEqual([], tracer.summary())
+
+    def test_instantiate_with_invalid_max_pending_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(ValueError, LatencyTracer, 0)
+
+    def test_quote_tick_to_order_records_each_stage(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+            self.exec_engine.start()
+            self.strategy.start()
+            await asyncio.sleep(0.1)
+
+            # Act
+            self.data_engine.process(TestStubs.quote_tick_5decimal(AUDUSD_SIM.security))
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual(1, len(self.exec_client.commands))
+            self.assertTrue(self.exec_client.commands[0].trace_ns > 0)
+            for stage in (VENUE_TO_DEQUEUE, DEQUEUE_TO_STRATEGY, DEQUEUE_TO_EXECUTE, DEQUEUE_TO_SEND):
+                self.assertEqual(1, self.tracer.histogram(stage).count)
+            strategy_ns = self.tracer.histogram(DEQUEUE_TO_STRATEGY).max_ns
+            execute_ns = self.tracer.histogram(DEQUEUE_TO_EXECUTE).max_ns
+            send_ns = self.tracer.histogram(DEQUEUE_TO_SEND).max_ns
+            self.assertTrue(strategy_ns <= execute_ns <= send_ns)
+            self.assertEqual(0, self.tracer.histogram(SEND_TO_FILL).count)
+            self.assertEqual(4, len(self.tracer.summary()))
+
+            # Tear Down
+            self.strategy.stop()
+            self.data_engine.stop()
+            self.exec_engine.stop()
+            await asyncio.sleep(0.1)
+
+        self.loop.run_until_complete(run_test())
+
+    def test_order_fill_records_send_to_fill(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+            self.exec_engine.start()
+            self.strategy.start()
+            await asyncio.sleep(0.1)
+
+            self.data_engine.process(TestStubs.quote_tick_5decimal(AUDUSD_SIM.security))
+            await asyncio.sleep(0.1)
+            order = self.strategy.orders[0]
+
+            self.exec_engine.process(TestStubs.event_order_submitted(order))
+            self.exec_engine.process(TestStubs.event_order_accepted(order))
+            await asyncio.sleep(0.1)
+
+            # Act
+            self.exec_engine.process(TestStubs.event_order_filled(order, AUDUSD_SIM))
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual(1, self.tracer.histogram(SEND_TO_FILL).count)
+
+            # Tear Down
+            self.strategy.stop()
+            self.data_engine.stop()
+            self.exec_engine.stop()
+            await asyncio.sleep(0.1)
+
+        self.loop.run_until_complete(run_test())
+
+    def test_command_held_by_client_records_send_when_client_sends(self):
+        async def run_test():
+            # Arrange
+            held = []
+            self.exec_client.submit_order = held.append  # Client does not send yet
+
+            self.data_engine.start()
+            self.exec_engine.start()
+            self.strategy.start()
+            await asyncio.sleep(0.1)
+
+            self.data_engine.process(TestStubs.quote_tick_5decimal(AUDUSD_SIM.security))
+            await asyncio.sleep(0.1)
+            sent_count = self.tracer.histogram(DEQUEUE_TO_SEND).count
+
+            # Act
+            self.exec_client._record_sent(held[0])
+
+            # Assert
+            self.assertEqual(1, self.tracer.histogram(DEQUEUE_TO_EXECUTE).count)
+            self.assertEqual(0, sent_count)
+            self.assertEqual(1, self.tracer.histogram(DEQUEUE_TO_SEND).count)
+            # Includes the time the client held the command
+            self.assertTrue(self.tracer.histogram(DEQUEUE_TO_SEND).max_ns >= 100_000_000 * 0.9)
+
+            # Tear Down
+            self.strategy.stop()
+            self.data_engine.stop()
+            self.exec_engine.stop()
+            await asyncio.sleep(0.1)
+
+        self.loop.run_until_complete(run_test())
+
+    def test_client_registered_after_tracer_records_send_to_fill(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.cache.add_instrument(AUDUSD_OTHER)
+            client = MockExecutionClient(
+                AUDUSD_OTHER.security.venue,
+                AccountId("OTHER", "000"),
+                self.exec_engine,
+                self.clock,
+                self.logger,
+            )
+            self.exec_engine.register_client(client)
+            self.exec_engine.process(TestStubs.event_account_state(AccountId("OTHER", "000")))
+            self.exec_engine.start()
+            await asyncio.sleep(0.1)
+
+            order = self.strategy.order_factory.market(
+                AUDUSD_OTHER.security,
+                OrderSide.BUY,
+                Quantity(100000),
+            )
+            self.strategy.submit_order(order)
+            await asyncio.sleep(0.1)
+
+            self.exec_engine.process(TestStubs.event_order_submitted(order))
+            self.exec_engine.process(TestStubs.event_order_accepted(order))
+            await asyncio.sleep(0.1)
+
+            # Act
+            self.exec_engine.process(TestStubs.event_order_filled(order, AUDUSD_OTHER))
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertIn("submit_order", client.calls)
+            self.assertEqual(1, self.tracer.histogram(SEND_TO_FILL).count)
+
+            # Tear Down
+            self.exec_engine.stop()
+            await asyncio.sleep(0.1)
+
+        self.loop.run_until_complete(run_test())
+
+    def test_command_executed_outside_trace_is_not_stamped(self):
+        async def run_test():
+            # Arrange
+            self.exec_engine.start()
+            await asyncio.sleep(0.1)
+
+            order = self.strategy.order_factory.market(
+                AUDUSD_SIM.security,
+                OrderSide.BUY,
+                Quantity(100000),
+            )
+
+            # Act
+            self.strategy.submit_order(order)
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual(0, self.exec_client.commands[0].trace_ns)
+            self.assertEqual(0, self.tracer.histogram(DEQUEUE_TO_EXECUTE).count)
+            self.assertEqual(0, self.tracer.histogram(DEQUEUE_TO_SEND).count)
+
+            # Tear Down
+            self.exec_engine.stop()
+            await asyncio.sleep(0.1)
+
+        self.loop.run_until_complete(run_test())
+
+    def test_quote_tick_to_order_records_handler_time_per_message_type(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+            self.exec_engine.start()
+            self.strategy.start()
+            await asyncio.sleep(0.1)
+
+            # Act
+            self.data_engine.process(TestStubs.quote_tick_5decimal(AUDUSD_SIM.security))
+            await asyncio.sleep(0.1)
+
+            # Assert
+            stats = self.tracer.handler_stats()
+            self.assertEqual(1, stats["QuoteTick"]["count"])
+            self.assertEqual(1, stats["SubmitOrder"]["count"])
+            self.assertTrue(stats["QuoteTick"]["max"] > 0)
+            self.assertEqual(len(stats), len(self.tracer.handler_summary()))
+
+            # Tear Down
+            self.strategy.stop()
+            self.data_engine.stop()
+            self.exec_engine.stop()
+            await asyncio.sleep(0.1)
+
+        self.loop.run_until_complete(run_test())
+
+    def test_reset_clears_histograms(self):
+        async def run_test():
+            # Arrange
+            self.data_engine.start()
+            self.data_engine.process(TestStubs.quote_tick_5decimal(AUDUSD_SIM.security))
+            await asyncio.sleep(0.1)
+
+            # Act
+            self.tracer.reset()
+
+            # Assert
+            self.assertEqual(0, self.tracer.histogram(VENUE_TO_DEQUEUE).count)
+            self.assertEqual({}, self.tracer.handler_stats())
+
+            # Tear Down
+            self.data_engine.stop()
+            await asyncio.sleep(0.1)
+
+        self.loop.run_until_complete(run_test())
@@ -0,0 +1,103 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import unittest
+
+from nautilus_trader.common.profiler import Profiler
+from nautilus_trader.common.profiler import ProfilerStat
+
+
+class ProfilerTests(unittest.TestCase):
+
+    def test_stat_when_no_records_returns_none(self):
+        # Arrange
+        profiler = Profiler()
+
+        # Act
+        # Assert
+        self.assertIsNone(profiler.stat("unknown"))
+        self.assertEqual([], profiler.stats())
+        self.assertEqual([], profiler.breakdown())
+
+    def test_record_accumulates_count_and_total(self):
+        # Arrange
+        profiler = Profiler()
+
+        # Act
+        profiler.record_py("stage", 100)
+        profiler.record_py("stage", 301)
+
+        # Assert
+        stat = profiler.stat("stage")
+        self.assertEqual(2, stat.count)
+        self.assertEqual(401, stat.total_ns)
+        self.assertEqual(200.5, stat.mean_ns)
+
+    def test_stat_mean_when_no_records_returns_zero(self):
+        # Arrange
+        stat = ProfilerStat("stage")
+
+        # Act
+        # Assert
+        self.assertEqual(0., stat.mean_ns)
+
+    def test_stat_mean_with_non_integral_mean_returns_fractional_value(self):
+        # Arrange
+        profiler = Profiler()
+        profiler.record_py("stage", 1)
+        profiler.record_py("stage", 2)
+        profiler.record_py("stage", 2)
+
+        # Act
+        mean = profiler.stat("stage").mean_ns
+
+        # Assert
+        self.assertAlmostEqual(5 / 3, mean)
+
+    def test_stats_returns_stats_ordered_by_total_descending(self):
+        # Arrange
+        profiler = Profiler()
+        profiler.record_py("fast", 10)
+        profiler.record_py("slow", 1000)
+
+        # Act
+        stats = profiler.stats()
+
+        # Assert
+        self.assertEqual(["slow", "fast"], [stat.name for stat in stats])
+
+    def test_breakdown_returns_line_per_stat(self):
+        # Arrange
+        profiler = Profiler()
+        profiler.record_py("stage", 2_000_000)
+
+        # Act
+        lines = profiler.breakdown()
+
+        # Assert
+        self.assertEqual(1, len(lines))
+        self.assertTrue(lines[0].startswith("stage"))
+        self.assertIn("2.000ms", lines[0])
+
+    def test_reset_clears_stats(self):
+        # Arrange
+        profiler = Profiler()
+        profiler.record_py("stage", 100)
+
+        # Act
+        profiler.reset()
+
+        # Assert
+        self.assertIsNone(profiler.stat("stage"))
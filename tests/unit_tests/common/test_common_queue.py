@@ -144,3 +144,182 @@ class QueueTests(unittest.TestCase):
             self.assertEqual("A", item)
 
         self.loop.run_until_complete(run_test())
+
+    def test_get_batch_nowait_from_empty_queue_returns_empty_list(self):
+        # Arrange
+        queue = Queue()
+
+        # Act
+        items = queue.get_batch_nowait()
+
+        # Assert
+        self.assertEqual([], items)
+        self.assertEqual(0, queue.batch_count)
+
+    def test_get_batch_nowait_returns_all_items_in_order(self):
+        # Arrange
+        queue = Queue()
+        queue.put_nowait("A")
+        queue.put_nowait("B")
+        queue.put_nowait("C")
+
+        # Act
+        items = queue.get_batch_nowait()
+
+        # Assert
+        self.assertEqual(["A", "B", "C"], items)
+        self.assertEqual(0, queue.qsize())
+        self.assertTrue(queue.empty())
+
+    def test_get_batch_nowait_with_max_items_leaves_remaining_items(self):
+        # Arrange
+        queue = Queue()
+        queue.put_nowait("A")
+        queue.put_nowait("B")
+        queue.put_nowait("C")
+
+        # Act
+        items1 = queue.get_batch_nowait(max_items=2)
+        items2 = queue.get_batch_nowait(max_items=2)
+
+        # Assert
+        self.assertEqual(["A", "B"], items1)
+        self.assertEqual(["C"], items2)
+        self.assertEqual(2, queue.batch_count)
+        self.assertEqual(2, queue.max_batch_size)
+        self.assertEqual(1.5, queue.mean_batch_size())
+
+    def test_residency_when_not_tracked_returns_zero(self):
+        # Arrange
+        queue = Queue()
+        queue.put_nowait("A")
+
+        # Act
+        queue.get_batch_nowait()
+
+        # Assert
+        self.assertFalse(queue.track_residency)
+        self.assertEqual(0, queue.max_residency)
+        self.assertEqual(0, queue.mean_residency())
+
+    def test_residency_when_tracked_records_time_on_queue(self):
+        # Arrange
+        queue = Queue(track_residency=True)
+        queue.put_nowait("A")
+        queue.put_nowait("B")
+
+        # Act
+        queue.get_nowait()
+        queue.get_batch_nowait()
+
+        # Assert
+        self.assertTrue(queue.max_residency > 0)
+        self.assertTrue(queue.mean_residency() > 0)
+        self.assertTrue(queue.mean_residency() <= queue.max_residency)
+
+    def test_reset_stats(self):
+        # Arrange
+        queue = Queue(track_residency=True)
+        queue.put_nowait("A")
+        queue.get_batch_nowait()
+
+        # Act
+        queue.reset_stats()
+
+        # Assert
+        self.assertEqual(
+            {
+                "qsize": 0,
+                "overflow_qsize": 0,
+                "overflow_count": 0,
+                "batch_count": 0,
+                "max_batch_size": 0,
+                "mean_batch_size": 0,
+                "max_residency": 0,
+                "mean_residency": 0,
+            },
+            queue.stats(),
+        )
+
+    def test_put_or_overflow_when_not_full_puts_item_on_queue(self):
+        # Arrange
+        queue = Queue(maxsize=2)
+
+        # Act
+        result = queue.put_or_overflow("A")
+
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(1, queue.qsize())
+        self.assertEqual(0, queue.overflow_qsize())
+
+    def test_put_or_overflow_when_full_holds_items_on_overflow(self):
+        # Arrange
+        queue = Queue(maxsize=2)
+
+        # Act
+        results = [queue.put_or_overflow(x) for x in "ABCD"]
+
+        # Assert
+        self.assertEqual([False, False, True, True], results)
+        self.assertEqual(2, queue.qsize())
+        self.assertEqual(2, queue.overflow_qsize())
+        self.assertEqual(2, queue.overflow_count)
+        self.assertRaises(asyncio.QueueFull, queue.put_nowait, "E")
+
+    def test_get_batch_nowait_with_overflow_keeps_order(self):
+        # Arrange
+        queue = Queue(maxsize=2)
+        for x in "ABCDE":
+            queue.put_or_overflow(x)
+
+        # Act
+        first = queue.get_batch_nowait()
+        queue.put_or_overflow("F")  # Overflow still held so queued behind it
+        second = queue.get_batch_nowait()
+        third = queue.get_batch_nowait()
+
+        # Assert
+        self.assertEqual(["A", "B"], first)
+        self.assertEqual(["C", "D"], second)
+        self.assertEqual(["E", "F"], third)
+        self.assertEqual(0, queue.overflow_qsize())
+        self.assertTrue(queue.empty())
+
+    def test_residency_when_tracked_with_overflow_records_time_for_all_items(self):
+        # Arrange
+        queue = Queue(maxsize=1, track_residency=True)
+        for x in "ABC":
+            queue.put_or_overflow(x)
+
+        # Act
+        items = [queue.get_nowait() for _ in range(3)]
+
+        # Assert
+        self.assertEqual(["A", "B", "C"], items)
+        self.assertTrue(queue.max_residency > 0)
+
+    def test_await_get_batch(self):
+        # Fresh isolated loop testing pattern
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        async def run_test():
+            # Arrange
+            queue = Queue()
+
+            async def put_later():
+                await asyncio.sleep(0.01)
+                queue.put_nowait("A")
+                queue.put_nowait("B")
+
+            self.loop.create_task(put_later())
+
+            # Act
+            items = await queue.get_batch()
+
+            # Assert
+            self.assertEqual(0, queue.qsize())
+            self.assertEqual(["A", "B"], items)
+
+        self.loop.run_until_complete(run_test())
@@ -28,6 +28,7 @@ from nautilus_trader.core.datetime import is_datetime_utc
 from nautilus_trader.core.datetime import is_tz_aware
 from nautilus_trader.core.datetime import is_tz_naive
 from nautilus_trader.core.datetime import to_unix_time_ms
+from nautilus_trader.core.datetime import to_unix_time_ns
 from tests.test_kit.stubs import UNIX_EPOCH
 
 
@@ -48,6 +49,21 @@ class TestDatetimeFunctions:
         # Assert
         assert expected == posix
 
+    @pytest.mark.parametrize(
+        "value, expected",
+        [[datetime(1969, 12, 1, 1, 0, tzinfo=pytz.utc), -2674800000000000],
+         [datetime(1970, 1, 1, 0, 0, tzinfo=pytz.utc), 0],
+         [datetime(2013, 1, 1, 1, 0, tzinfo=pytz.utc), 1357002000000000000],
+         [datetime(2020, 1, 2, 3, 2, microsecond=1, tzinfo=pytz.utc), 1577934120000001000]],
+    )
+    def test_to_unix_time_ns_with_various_values_returns_expected_int(self, value, expected):
+        # Arrange
+        # Act
+        result = to_unix_time_ns(value)
+
+        # Assert
+        assert expected == result
+
     @pytest.mark.parametrize(
         "value, expected",
         [[-2674800000, datetime(1969, 12, 1, 1, 0, tzinfo=pytz.utc)],
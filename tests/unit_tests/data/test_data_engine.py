@@ -1073,6 +1073,47 @@ class DataEngineTests(unittest.TestCase):
         # Assert
         self.assertEqual([tick], handler)
 
+    def test_process_batch_sends_data_to_registered_handler_in_order(self):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.connect()
+
+        handler = []
+        subscribe = Subscribe(
+            provider=BINANCE.value,
+            data_type=DataType(TradeTick, metadata={"Security": ETHUSDT_BINANCE.security}),
+            handler=handler.append,
+            command_id=self.uuid_factory.generate(),
+            command_timestamp=self.clock.utc_now(),
+        )
+
+        self.data_engine.execute(subscribe)
+
+        tick1 = TradeTick(
+            ETHUSDT_BINANCE.security,
+            Price("1050.00000"),
+            Quantity(100),
+            OrderSide.BUY,
+            TradeMatchId("123456789"),
+            UNIX_EPOCH,
+        )
+
+        tick2 = TradeTick(
+            ETHUSDT_BINANCE.security,
+            Price("1051.00000"),
+            Quantity(50),
+            OrderSide.SELL,
+            TradeMatchId("123456790"),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        self.data_engine.process_batch([tick1, tick2])
+
+        # Assert
+        self.assertEqual([tick1, tick2], handler)
+        self.assertEqual(2, self.data_engine.data_count)
+
     def test_process_trade_tick_when_subscribers_then_sends_to_registered_handlers(self):
         # Arrange
         self.data_engine.register_client(self.binance_client)
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from datetime import timedelta
 from decimal import Decimal
 import unittest
 
@@ -20,6 +21,7 @@ from nautilus_trader.backtest.data_container import BacktestDataContainer
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.core.uuid import uuid4
 from nautilus_trader.execution.cache import ExecutionCache
 from nautilus_trader.execution.database import BypassExecutionDatabase
 from nautilus_trader.model.bar import BarSpecification
@@ -28,6 +30,7 @@ from nautilus_trader.model.enums import BarAggregation
 from nautilus_trader.model.enums import OMSType
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.events import OrderCancelled
 from nautilus_trader.model.identifiers import ClientOrderId
 from nautilus_trader.model.identifiers import OrderId
 from nautilus_trader.model.identifiers import PositionId
@@ -40,15 +43,31 @@ from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.position import Position
 from nautilus_trader.trading.account import Account
 from nautilus_trader.trading.strategy import TradingStrategy
+from tests.test_kit.mocks import MockExecutionDatabase
 from tests.test_kit.providers import TestDataProvider
 from tests.test_kit.providers import TestInstrumentProvider
 from tests.test_kit.strategies import EMACross
 from tests.test_kit.stubs import TestStubs
+from tests.test_kit.stubs import UNIX_EPOCH
 
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
 
 
+class CountingExecutionDatabase(MockExecutionDatabase):
+    """
+    Provides a mock execution database which counts order loads.
+    """
+
+    def __init__(self, trader_id, logger):
+        super().__init__(trader_id, logger)
+        self.order_loads = 0
+
+    def load_order(self, cl_ord_id):
+        self.order_loads += 1
+        return super().load_order(cl_ord_id)
+
+
 class ExecutionCacheTests(unittest.TestCase):
 
     def setUp(self):
@@ -495,6 +514,366 @@ class ExecutionCacheTests(unittest.TestCase):
         self.assertEqual(1, self.cache.positions_closed_count())
         self.assertEqual(1, self.cache.positions_total_count())
 
+    def test_update_order_beyond_completed_orders_capacity_drops_oldest_order(self):
+        # Arrange
+        cache = ExecutionCache(
+            database=BypassExecutionDatabase(trader_id=self.trader_id, logger=TestLogger(TestClock())),
+            logger=TestLogger(TestClock()),
+            config={"completed_orders_capacity": 1},
+        )
+
+        orders = []
+        for i in range(2):
+            order = self.strategy.order_factory.market(
+                AUDUSD_SIM.security,
+                OrderSide.BUY,
+                Quantity(100000),
+            )
+            cache.add_order(order, PositionId.null())
+            order.apply(TestStubs.event_order_submitted(order))
+            order.apply(TestStubs.event_order_accepted(order))
+            order.apply(TestStubs.event_order_filled(
+                order,
+                instrument=AUDUSD_SIM,
+                fill_price=Price("1.00001")),
+            )
+            orders.append(order)
+
+        # Act
+        cache.update_order(orders[0])
+        cache.update_order(orders[1])
+
+        # Assert
+        self.assertEqual(1, cache.completed_orders_capacity)
+        self.assertEqual([orders[1]], cache.orders())
+        self.assertEqual([orders[1]], cache.orders_completed(security=AUDUSD_SIM.security))
+        self.assertEqual(1, cache.orders_total_count())
+        self.assertFalse(cache.order_exists(orders[0].cl_ord_id))
+        self.assertFalse(cache.is_order_completed(orders[0].cl_ord_id))
+        self.assertIsNone(cache.order(orders[0].cl_ord_id))
+        self.assertIsNone(cache.strategy_id_for_order(orders[0].cl_ord_id))
+        self.assertTrue(cache.check_integrity())
+
+    def test_update_orders_beyond_completed_orders_capacity_bounds_indexes(self):
+        # Arrange
+        cache = ExecutionCache(
+            database=BypassExecutionDatabase(trader_id=self.trader_id, logger=TestLogger(TestClock())),
+            logger=TestLogger(TestClock()),
+            config={"completed_orders_capacity": 2, "closed_positions_capacity": 2},
+        )
+
+        # Act
+        orders = []
+        for i in range(10):
+            order1 = self.strategy.order_factory.market(
+                AUDUSD_SIM.security,
+                OrderSide.BUY,
+                Quantity(100000),
+            )
+            order2 = self.strategy.order_factory.market(
+                AUDUSD_SIM.security,
+                OrderSide.SELL,
+                Quantity(100000),
+            )
+
+            position_id = PositionId(f"P-{i}")
+            cache.add_order(order1, position_id)
+            cache.add_order(order2, position_id)
+            orders.append(order1)
+
+            order1.apply(TestStubs.event_order_submitted(order1))
+            order1.apply(TestStubs.event_order_accepted(order1))
+            fill1 = TestStubs.event_order_filled(
+                order1,
+                instrument=AUDUSD_SIM,
+                position_id=position_id,
+                fill_price=Price("1.00001"),
+            )
+            order1.apply(fill1)
+            cache.update_order(order1)
+
+            position = Position(fill1)
+            cache.add_position(position)
+
+            order2.apply(TestStubs.event_order_submitted(order2))
+            order2.apply(TestStubs.event_order_accepted(order2))
+            fill2 = TestStubs.event_order_filled(
+                order2,
+                instrument=AUDUSD_SIM,
+                position_id=position_id,
+                fill_price=Price("1.00001"),
+            )
+            order2.apply(fill2)
+            cache.update_order(order2)
+
+            position.apply(fill2)
+            cache.update_position(position)
+
+        # Assert
+        self.assertEqual(2, cache.orders_total_count())
+        self.assertEqual(2, cache.positions_total_count())
+        self.assertEqual(2, len(cache.order_ids(strategy_id=self.strategy.id)))
+        self.assertEqual(2, len(cache.position_ids(security=AUDUSD_SIM.security)))
+        self.assertIsNone(cache.strategy_id_for_position(PositionId("P-0")))
+        self.assertIsNone(cache.position_id(orders[0].cl_ord_id))
+        self.assertIsNone(cache.strategy_id_for_order(orders[0].cl_ord_id))
+        self.assertFalse(cache.position_exists(PositionId("P-0")))
+        self.assertTrue(cache.check_integrity())
+
+    def test_order_for_archived_order_with_database_returns_same_object(self):
+        # Arrange
+        database = CountingExecutionDatabase(trader_id=self.trader_id, logger=TestLogger(TestClock()))
+        cache = ExecutionCache(
+            database=database,
+            logger=TestLogger(TestClock()),
+            config={"completed_orders_capacity": 1},
+        )
+
+        orders = []
+        for i in range(2):
+            order = self.strategy.order_factory.market(
+                AUDUSD_SIM.security,
+                OrderSide.BUY,
+                Quantity(100000),
+            )
+            cache.add_order(order, PositionId.null())
+            order.apply(TestStubs.event_order_submitted(order))
+            order.apply(TestStubs.event_order_accepted(order))
+            order.apply(TestStubs.event_order_cancelled(order))
+            cache.update_order(order)
+            orders.append(order)
+
+        # Act
+        first = cache.order(orders[0].cl_ord_id)
+        second = cache.order(orders[0].cl_ord_id)
+
+        # Assert
+        self.assertEqual([orders[1]], cache.orders())
+        self.assertEqual(orders[0], first)
+        self.assertIs(first, second)
+        self.assertEqual(1, database.order_loads)
+
+    def test_order_for_archived_orders_beyond_capacity_reloads_least_recently_used(self):
+        # Arrange
+        database = CountingExecutionDatabase(trader_id=self.trader_id, logger=TestLogger(TestClock()))
+        cache = ExecutionCache(
+            database=database,
+            logger=TestLogger(TestClock()),
+            config={"completed_orders_capacity": 1},
+        )
+
+        orders = []
+        for i in range(3):
+            order = self.strategy.order_factory.market(
+                AUDUSD_SIM.security,
+                OrderSide.BUY,
+                Quantity(100000),
+            )
+            cache.add_order(order, PositionId.null())
+            order.apply(TestStubs.event_order_submitted(order))
+            order.apply(TestStubs.event_order_accepted(order))
+            order.apply(TestStubs.event_order_cancelled(order))
+            cache.update_order(order)
+            orders.append(order)
+
+        # Act
+        cache.order(orders[0].cl_ord_id)
+        cache.order(orders[1].cl_ord_id)  # Evicts the held orders[0]
+        cache.order(orders[1].cl_ord_id)
+        cache.order(orders[0].cl_ord_id)
+
+        # Assert
+        self.assertEqual([orders[2]], cache.orders())
+        self.assertEqual(3, database.order_loads)
+        self.assertTrue(cache.check_integrity())
+
+    def test_build_index_beyond_completed_orders_capacity_archives_earliest_completed(self):
+        # Arrange
+        database = CountingExecutionDatabase(trader_id=self.trader_id, logger=TestLogger(TestClock()))
+
+        orders = []
+        for i in range(3):
+            order = self.strategy.order_factory.market(
+                AUDUSD_SIM.security,
+                OrderSide.BUY,
+                Quantity(100000),
+            )
+            order.apply(TestStubs.event_order_submitted(order))
+            order.apply(TestStubs.event_order_accepted(order))
+            orders.append(order)
+
+        # Complete the orders in reverse order of creation
+        for i, order in enumerate(reversed(orders)):
+            cancelled_time = UNIX_EPOCH + timedelta(seconds=i + 1)
+            order.apply(OrderCancelled(
+                self.account_id,
+                order.cl_ord_id,
+                order.id,
+                cancelled_time,
+                uuid4(),
+                cancelled_time,
+            ))
+            database.add_order(order)
+
+        cache = ExecutionCache(
+            database=database,
+            logger=TestLogger(TestClock()),
+            config={"completed_orders_capacity": 2},
+        )
+        cache.cache_orders()
+
+        # Act
+        cache.build_index()
+
+        # Assert
+        self.assertEqual(2, cache.orders_total_count())
+        self.assertNotIn(orders[2], cache.orders())
+        self.assertTrue(cache.is_order_completed(orders[2].cl_ord_id))
+        self.assertTrue(cache.check_integrity())
+
+    def test_update_position_beyond_closed_positions_capacity_drops_oldest_position(self):
+        # Arrange
+        cache = ExecutionCache(
+            database=BypassExecutionDatabase(trader_id=self.trader_id, logger=TestLogger(TestClock())),
+            logger=TestLogger(TestClock()),
+            config={"closed_positions_capacity": 1},
+        )
+
+        positions = []
+        for i in range(2):
+            order1 = self.strategy.order_factory.market(
+                AUDUSD_SIM.security,
+                OrderSide.BUY,
+                Quantity(100000),
+            )
+            order2 = self.strategy.order_factory.market(
+                AUDUSD_SIM.security,
+                OrderSide.SELL,
+                Quantity(100000),
+            )
+
+            position_id = PositionId(f"P-{i}")
+            cache.add_order(order1, position_id)
+            cache.add_order(order2, position_id)
+
+            position = Position(TestStubs.event_order_filled(
+                order1,
+                instrument=AUDUSD_SIM,
+                position_id=position_id,
+                fill_price=Price("1.00001"),
+            ))
+            cache.add_position(position)
+
+            position.apply(TestStubs.event_order_filled(
+                order2,
+                instrument=AUDUSD_SIM,
+                position_id=position_id,
+                fill_price=Price("1.00001"),
+            ))
+            positions.append(position)
+
+        # Act
+        cache.update_position(positions[0])
+        cache.update_position(positions[1])
+
+        # Assert
+        self.assertEqual([positions[1]], cache.positions())
+        self.assertEqual([positions[1]], cache.positions_closed(strategy_id=self.strategy.id))
+        self.assertEqual(1, cache.positions_closed_count())
+        self.assertFalse(cache.position_exists(positions[0].id))
+        self.assertFalse(cache.is_position_closed(positions[0].id))
+        self.assertIsNone(cache.position(positions[0].id))
+        self.assertIsNone(cache.strategy_id_for_position(positions[0].id))
+        self.assertTrue(cache.check_integrity())
+
+    def test_update_archived_position_when_reopened_restores_position(self):
+        # Arrange
+        cache = ExecutionCache(
+            database=MockExecutionDatabase(trader_id=self.trader_id, logger=TestLogger(TestClock())),
+            logger=TestLogger(TestClock()),
+            config={"closed_positions_capacity": 1},
+        )
+
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+        order2 = self.strategy.order_factory.market(
+            AUDUSD_SIM.security,
+            OrderSide.SELL,
+            Quantity(100000),
+        )
+        order3 = self.strategy.order_factory.market(
+            AUDUSD_SIM.security,
+            OrderSide.SELL,
+            Quantity(100000),
+        )
+        order4 = self.strategy.order_factory.market(
+            AUDUSD_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        cache.add_order(order1, PositionId("P-1"))
+        cache.add_order(order2, PositionId("P-1"))
+        cache.add_order(order3, PositionId("P-2"))
+        cache.add_order(order4, PositionId("P-2"))
+
+        position1 = Position(TestStubs.event_order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            fill_price=Price("1.00001"),
+        ))
+        cache.add_position(position1)
+        position1.apply(TestStubs.event_order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            fill_price=Price("1.00001"),
+        ))
+        cache.update_position(position1)
+
+        position2 = Position(TestStubs.event_order_filled(
+            order3,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-2"),
+            fill_price=Price("1.00001"),
+        ))
+        cache.add_position(position2)
+        position2.apply(TestStubs.event_order_filled(
+            order4,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-2"),
+            fill_price=Price("1.00001"),
+        ))
+        cache.update_position(position2)
+
+        # Reopen the archived position
+        order5 = self.strategy.order_factory.market(
+            AUDUSD_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+        cache.add_order(order5, PositionId("P-1"))
+        position = cache.position(PositionId("P-1"))
+        position.apply(TestStubs.event_order_filled(
+            order5,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            fill_price=Price("1.00001"),
+        ))
+
+        # Act
+        cache.update_position(position)
+
+        # Assert
+        self.assertEqual(position1, position)
+        self.assertEqual([position1], cache.positions_open())
+        self.assertEqual([position2], cache.positions_closed())
+        self.assertTrue(cache.check_integrity())
+
     def test_update_account(self):
         # Arrange
         event = TestStubs.event_account_state()
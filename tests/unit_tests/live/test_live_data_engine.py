@@ -16,6 +16,7 @@
 import asyncio
 import unittest
 
+from nautilus_trader.backtest.data_client import BacktestMarketDataClient
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.enums import ComponentState
 from nautilus_trader.common.logging import LogLevel
@@ -32,7 +33,9 @@ from nautilus_trader.model.identifiers import Exchange
 from nautilus_trader.model.identifiers import Security
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Price
 from nautilus_trader.model.tick import QuoteTick
+from nautilus_trader.model.tick import TradeTick
 from nautilus_trader.trading.portfolio import Portfolio
 from tests.test_kit.providers import TestInstrumentProvider
 from tests.test_kit.stubs import TestStubs
@@ -42,6 +45,9 @@ BINANCE = Exchange("BINANCE")
 XBTUSD_BITMEX = TestInstrumentProvider.xbtusd_bitmex()
 BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
 ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
+SIM = Venue("SIM")
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
 
 class LiveDataEngineTests(unittest.TestCase):
@@ -185,6 +191,39 @@ class LiveDataEngineTests(unittest.TestCase):
         self.assertEqual(1, self.engine.data_qsize())
         self.assertEqual(0, self.engine.data_count)
 
+    def test_process_when_data_queue_full_processes_data_in_order(self):
+        async def run_test():
+            # Arrange
+            self.engine = LiveDataEngine(
+                loop=self.loop,
+                portfolio=self.portfolio,
+                clock=self.clock,
+                logger=self.logger,
+                config={"qsize": 2},
+            )
+
+            prices = [Price(f"1.0000{i}") for i in range(1, 7)]
+            for price in prices:
+                self.engine.process(TestStubs.trade_tick_5decimal(price=price))
+
+            stats = self.engine.queue_stats()["data"]
+
+            # Act
+            self.engine.start()
+            await asyncio.sleep(0.1)
+
+            # Assert
+            ticks = self.engine.cache.trade_ticks(AUDUSD_SIM.security)
+            self.assertEqual(2, stats["qsize"])
+            self.assertEqual(4, stats["overflow_count"])
+            self.assertEqual(6, self.engine.data_count)
+            self.assertEqual(prices, [tick.price for tick in reversed(ticks)])
+
+            # Tear Down
+            self.engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
     def test_get_event_loop_returns_expected_loop(self):
         # Arrange
         # Act
@@ -337,3 +376,193 @@ class LiveDataEngineTests(unittest.TestCase):
             self.engine.stop()
 
         self.loop.run_until_complete(run_test())
+
+    def test_run_data_queue_drains_data_in_batches(self):
+        async def run_test():
+            # Arrange
+            self.engine = LiveDataEngine(
+                loop=self.loop,
+                portfolio=self.portfolio,
+                clock=self.clock,
+                logger=self.logger,
+                config={"batch_size": 4, "track_residency": True},
+            )
+
+            for _ in range(10):
+                self.engine.process(TestStubs.trade_tick_5decimal())
+
+            # Act
+            self.engine.start()
+            await asyncio.sleep(0.1)
+
+            # Assert
+            stats = self.engine.queue_stats()["data"]
+            self.assertEqual(0, self.engine.data_qsize())
+            self.assertEqual(10, self.engine.data_count)
+            self.assertEqual(3, stats["batch_count"])
+            self.assertEqual(4, stats["max_batch_size"])
+            self.assertTrue(stats["max_residency"] > 0)
+
+            # Tear Down
+            self.engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_process_when_not_conflating_queues_every_quote_tick(self):
+        # Arrange
+        tick1 = TestStubs.quote_tick_5decimal(bid=Price("1.00001"))
+        tick2 = TestStubs.quote_tick_5decimal(bid=Price("1.00002"))
+
+        # Act
+        self.engine.process(tick1)
+        self.engine.process(tick2)
+
+        # Assert
+        self.assertEqual(2, self.engine.data_qsize())
+        self.assertEqual(0, self.engine.conflated_count)
+
+    def test_process_when_conflating_replaces_queued_quote_tick(self):
+        async def run_test():
+            # Arrange
+            self.engine = LiveDataEngine(
+                loop=self.loop,
+                portfolio=self.portfolio,
+                clock=self.clock,
+                logger=self.logger,
+                config={"conflate": True},
+            )
+
+            tick1 = TestStubs.quote_tick_5decimal(bid=Price("1.00001"))
+            tick2 = TestStubs.quote_tick_5decimal(bid=Price("1.00002"))
+            tick3 = TestStubs.quote_tick_5decimal(bid=Price("1.00003"))
+            tick4 = TestStubs.quote_tick_3decimal()
+            trade1 = TestStubs.trade_tick_5decimal()
+            trade2 = TestStubs.trade_tick_5decimal()
+
+            # Act
+            self.engine.process(tick1)
+            self.engine.process(trade1)
+            self.engine.process(tick2)
+            self.engine.process(tick4)
+            self.engine.process(trade2)
+            self.engine.process(tick3)
+
+            qsize = self.engine.data_qsize()
+
+            self.engine.start()
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual(4, qsize)
+            self.assertEqual(2, self.engine.conflated_count)
+            self.assertEqual(4, self.engine.data_count)
+            self.assertEqual(tick3, self.engine.cache.quote_tick(tick3.security))
+            self.assertEqual(1, self.engine.cache.quote_tick_count(tick3.security))
+            self.assertEqual(2, self.engine.cache.trade_tick_count(trade1.security))
+
+            # Tear Down
+            self.engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_process_when_conflating_burst_of_quote_ticks_keeps_qsize_bounded(self):
+        # Arrange
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+            config={"conflate": True, "qsize": 10},
+        )
+
+        # Act
+        qsizes = []
+        for i in range(1000):
+            self.engine.process(TestStubs.quote_tick_5decimal(bid=Price(f"1.{i:05d}")))
+            qsizes.append(self.engine.data_qsize())
+
+        # Assert
+        self.assertEqual(1, max(qsizes))
+        self.assertEqual(0, self.engine.queue_stats()["data"]["overflow_count"])
+        self.assertEqual(999, self.engine.conflated_count)
+
+    def test_process_when_conflating_handles_latest_quote_tick_at_first_position(self):
+        async def run_test():
+            # Arrange
+            self.engine = LiveDataEngine(
+                loop=self.loop,
+                portfolio=self.portfolio,
+                clock=self.clock,
+                logger=self.logger,
+                config={"conflate": True},
+            )
+
+            client = BacktestMarketDataClient(
+                instruments=[AUDUSD_SIM, USDJPY_SIM],
+                name=SIM.value,
+                engine=self.engine,
+                clock=self.clock,
+                logger=self.logger,
+            )
+            self.engine.register_client(client)
+            self.engine.start()
+
+            handler = []
+            for data_type in [QuoteTick, TradeTick]:
+                for security in [AUDUSD_SIM.security, USDJPY_SIM.security]:
+                    self.engine.execute(Subscribe(
+                        provider=SIM.value,
+                        data_type=DataType(data_type, metadata={"Security": security}),
+                        handler=handler.append,
+                        command_id=self.uuid_factory.generate(),
+                        command_timestamp=self.clock.utc_now(),
+                    ))
+            await asyncio.sleep(0.1)
+
+            tick1 = TestStubs.quote_tick_5decimal(bid=Price("1.00001"))
+            tick2 = TestStubs.quote_tick_5decimal(bid=Price("1.00002"))
+            tick3 = TestStubs.quote_tick_5decimal(bid=Price("1.00003"))
+            tick4 = TestStubs.quote_tick_3decimal()
+            trade1 = TestStubs.trade_tick_5decimal()
+            trade2 = TestStubs.trade_tick_5decimal()
+
+            # Act
+            self.engine.process(tick1)
+            self.engine.process(trade1)
+            self.engine.process(tick2)
+            self.engine.process(tick4)
+            self.engine.process(trade2)
+            self.engine.process(tick3)
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual([tick3, trade1, tick4, trade2], handler)
+            self.assertIs(tick3, handler[0])
+
+            # Tear Down
+            self.engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_process_batch_processes_data_as_single_queue_item(self):
+        async def run_test():
+            # Arrange
+            ticks = [TestStubs.trade_tick_5decimal() for _ in range(10)]
+
+            # Act
+            self.engine.process_batch(ticks)
+
+            qsize = self.engine.data_qsize()
+
+            self.engine.start()
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertEqual(1, qsize)
+            self.assertEqual(0, self.engine.data_qsize())
+            self.assertEqual(10, self.engine.data_count)
+
+            # Tear Down
+            self.engine.stop()
+
+        self.loop.run_until_complete(run_test())
@@ -24,9 +24,13 @@ from nautilus_trader.common.logging import TestLogger
 from nautilus_trader.common.uuid import UUIDFactory
 from nautilus_trader.data.cache import DataCache
 from nautilus_trader.execution.database import BypassExecutionDatabase
+from nautilus_trader.execution.reports import ExecutionStateReport
 from nautilus_trader.live.execution_engine import LiveExecutionEngine
+from nautilus_trader.model.commands import CancelOrder
 from nautilus_trader.model.commands import SubmitOrder
 from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import OrderState
+from nautilus_trader.model.identifiers import OrderId
 from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import TraderId
@@ -165,7 +169,7 @@ class LiveExecutionEngineTests(unittest.TestCase):
             portfolio=self.portfolio,
             clock=self.clock,
             logger=self.logger,
-            config={"qsize": 1}
+            config={"qsize": 1, "priority_lanes": False}
         )
 
         strategy = TradingStrategy(order_id_tag="001")
@@ -204,6 +208,90 @@ class LiveExecutionEngineTests(unittest.TestCase):
         self.assertEqual(1, self.engine.qsize())
         self.assertEqual(0, self.engine.command_count)
 
+    def test_process_event_with_priority_lanes_bypasses_full_command_queue(self):
+        # Arrange
+        self.engine = LiveExecutionEngine(
+            loop=self.loop,
+            database=self.database,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+            config={"qsize": 1}
+        )
+
+        strategy = TradingStrategy(order_id_tag="001")
+        strategy.register_trader(
+            TraderId("TESTER", "000"),
+            self.clock,
+            self.logger,
+        )
+
+        self.engine.register_strategy(strategy)
+
+        order = strategy.order_factory.market(
+            AUDUSD_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        submit_order = SubmitOrder(
+            Venue("SIM"),
+            self.trader_id,
+            self.account_id,
+            strategy.id,
+            PositionId.null(),
+            order,
+            self.uuid_factory.generate(),
+            self.clock.utc_now(),
+        )
+
+        event = TestStubs.event_order_submitted(order)
+
+        # Act
+        self.engine.execute(submit_order)
+        self.engine.process(event)
+
+        # Assert
+        stats = self.engine.queue_stats()
+        self.assertEqual(2, self.engine.qsize())
+        self.assertEqual(1, stats["priority"]["qsize"])
+        self.assertEqual(1, stats["message"]["qsize"])
+
+    def test_execute_cancel_order_for_unknown_order_queues_behind_commands(self):
+        # Arrange
+        strategy = TradingStrategy(order_id_tag="001")
+        strategy.register_trader(
+            TraderId("TESTER", "000"),
+            self.clock,
+            self.logger,
+        )
+
+        self.engine.register_strategy(strategy)
+
+        order = strategy.order_factory.market(
+            AUDUSD_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        cancel_order = CancelOrder(
+            Venue("SIM"),
+            self.trader_id,
+            self.account_id,
+            order.cl_ord_id,
+            OrderId.null(),
+            self.uuid_factory.generate(),
+            self.clock.utc_now(),
+        )
+
+        # Act
+        self.engine.execute(cancel_order)
+
+        # Assert
+        stats = self.engine.queue_stats()
+        self.assertEqual(0, stats["priority"]["qsize"])
+        self.assertEqual(1, stats["message"]["qsize"])
+
     def test_get_event_loop_returns_expected_loop(self):
         # Arrange
         # Act
@@ -330,6 +418,129 @@ class LiveExecutionEngineTests(unittest.TestCase):
 
         self.loop.run_until_complete(run_test())
 
+    async def _submit_order_and_report(self, order_state):
+        strategy = TradingStrategy(order_id_tag="001")
+        strategy.register_trader(
+            TraderId("TESTER", "000"),
+            self.clock,
+            self.logger,
+        )
+
+        self.engine.register_strategy(strategy)
+
+        order = strategy.order_factory.market(
+            AUDUSD_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        submit_order = SubmitOrder(
+            self.venue,
+            self.trader_id,
+            self.account_id,
+            strategy.id,
+            PositionId.null(),
+            order,
+            self.uuid_factory.generate(),
+            self.clock.utc_now(),
+        )
+
+        self.engine.execute(submit_order)
+        await asyncio.sleep(0.1)
+        self.engine.process(TestStubs.event_order_submitted(order))
+        await asyncio.sleep(0.1)
+
+        report = ExecutionStateReport(
+            venue=self.venue,
+            account_id=self.account_id,
+            order_states={order.id: order_state},
+            order_filled={},
+            position_states={},
+        )
+
+        async def state_report(active_orders):
+            return report
+
+        self.client.state_report = state_report
+
+        return order
+
+    def test_reconcile_state_with_no_active_orders_returns_true(self):
+        async def run_test():
+            # Arrange
+            self.engine.start()
+
+            async def state_report(active_orders):
+                return ExecutionStateReport(self.venue, self.account_id, {}, {}, {})
+
+            self.client.state_report = state_report
+
+            # Act
+            result = await self.engine.reconcile_state()
+
+            # Assert
+            self.assertTrue(result)
+            self.assertEqual([], self.engine.unresolved_orders())
+
+            # Tear Down
+            self.engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_reconcile_state_resolves_when_events_processed(self):
+        async def run_test():
+            # Arrange
+            self.engine.start()
+
+            order = await self._submit_order_and_report(OrderState.ACCEPTED)
+
+            async def accept_later():
+                await asyncio.sleep(0.1)
+                self.engine.process(TestStubs.event_order_accepted(order))
+
+            self.loop.create_task(accept_later())
+
+            # Act
+            result = await self.engine.reconcile_state()
+
+            # Assert
+            self.assertTrue(result)
+            self.assertEqual(OrderState.ACCEPTED, order.state)
+            self.assertEqual([], self.engine.unresolved_orders())
+
+            # Tear Down
+            self.engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
+    def test_reconcile_state_when_timed_out_returns_false_with_unresolved_orders(self):
+        async def run_test():
+            # Arrange
+            self.engine = LiveExecutionEngine(
+                loop=self.loop,
+                database=self.database,
+                portfolio=self.portfolio,
+                clock=self.clock,
+                logger=self.logger,
+                config={"reconciliation_timeout": 0.1},
+            )
+            self.engine.register_client(self.client)
+            self.engine.start()
+
+            order = await self._submit_order_and_report(OrderState.ACCEPTED)
+
+            # Act
+            result = await self.engine.reconcile_state()
+
+            # Assert
+            self.assertFalse(result)
+            self.assertEqual([order.cl_ord_id], self.engine.unresolved_orders())
+
+            # Tear Down
+            self.engine.stop()
+
+        self.loop.run_until_complete(run_test())
+
     # TODO: WIP
     # def test_reconcile_state_with_multiple_active_orders_resolved_correctly1(self):
     #     async def run_test():
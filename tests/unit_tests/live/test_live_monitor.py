@@ -0,0 +1,185 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import time
+import unittest
+
+from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.latency import LatencyTracer
+from nautilus_trader.common.latency import VENUE_TO_DEQUEUE
+from nautilus_trader.common.logging import TestLogger
+from nautilus_trader.data.cache import DataCache
+from nautilus_trader.execution.database import BypassExecutionDatabase
+from nautilus_trader.live.data_engine import LiveDataEngine
+from nautilus_trader.live.execution_engine import LiveExecutionEngine
+from nautilus_trader.live.monitor import LoopMonitor
+from nautilus_trader.trading.portfolio import Portfolio
+from tests.test_kit.stubs import TestStubs
+
+
+class LoopMonitorTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup
+        self.clock = LiveClock()
+        self.logger = TestLogger(self.clock)
+
+        self.portfolio = Portfolio(
+            clock=self.clock,
+            logger=self.logger,
+        )
+        self.portfolio.register_cache(DataCache(self.logger))
+
+        # Fresh isolated loop testing pattern
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.data_engine = LiveDataEngine(
+            loop=self.loop,
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.exec_engine = LiveExecutionEngine(
+            loop=self.loop,
+            database=BypassExecutionDatabase(trader_id=TestStubs.trader_id(), logger=self.logger),
+            portfolio=self.portfolio,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.monitor = LoopMonitor(
+            loop=self.loop,
+            data_engine=self.data_engine,
+            exec_engine=self.exec_engine,
+            logger=self.logger,
+            interval=0.01,
+            lag_warning=0.05,
+        )
+
+    def tearDown(self):
+        self.monitor.stop()
+        self.loop.stop()
+        self.loop.close()
+
+    def test_instantiate_monitor(self):
+        # Arrange
+        # Act
+        stats = self.monitor.stats()
+
+        # Assert
+        self.assertFalse(self.monitor.is_running)
+        self.assertEqual(0, stats["sample_count"])
+        self.assertEqual(0, stats["max_lag"])
+        self.assertEqual({"data": 0, "message": 0, "exec": 0}, stats["qsize"])
+
+    def test_instantiate_with_non_positive_interval_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(
+            ValueError,
+            LoopMonitor,
+            self.loop,
+            self.data_engine,
+            self.exec_engine,
+            self.logger,
+            0,
+        )
+
+    def test_start_samples_loop_at_interval(self):
+        async def run_test():
+            # Arrange
+            # Act
+            self.monitor.start()
+            await asyncio.sleep(0.1)
+
+            # Assert
+            self.assertTrue(self.monitor.is_running)
+            self.assertTrue(self.monitor.sample_count >= 3)
+            self.assertEqual(0, self.monitor.warning_count)
+
+        self.loop.run_until_complete(run_test())
+
+    def test_blocked_loop_records_lag_and_queue_depths(self):
+        async def run_test():
+            # Arrange
+            self.monitor.start()
+            self.data_engine.process(TestStubs.trade_tick_5decimal())
+
+            # Act
+            time.sleep(0.1)  # Block the event loop
+            await asyncio.sleep(0.05)
+
+            # Assert
+            stats = self.monitor.stats()
+            self.assertTrue(stats["max_lag"] >= 0.05)
+            self.assertEqual(1, stats["warning_count"])
+            self.assertEqual(1, stats["max_qsize"]["data"])
+
+        self.loop.run_until_complete(run_test())
+
+    def test_stop_and_reset(self):
+        async def run_test():
+            # Arrange
+            self.monitor.start()
+            await asyncio.sleep(0.05)
+
+            # Act
+            self.monitor.stop()
+            self.monitor.reset()
+            await asyncio.sleep(0.05)
+
+            # Assert
+            self.assertFalse(self.monitor.is_running)
+            self.assertEqual(0, self.monitor.sample_count)
+
+        self.loop.run_until_complete(run_test())
+
+    def test_stats_with_tracer_includes_latency(self):
+        async def run_test():
+            # Arrange
+            tracer = LatencyTracer()
+            self.data_engine.register_tracer(tracer)
+            monitor = LoopMonitor(
+                loop=self.loop,
+                data_engine=self.data_engine,
+                exec_engine=self.exec_engine,
+                logger=self.logger,
+                interval=0.01,
+                tracer=tracer,
+                trace_log_interval=0.02,
+            )
+
+            self.data_engine.start()
+            self.data_engine.process(TestStubs.trade_tick_5decimal())
+
+            # Act
+            monitor.start()
+            await asyncio.sleep(0.1)
+
+            # Assert
+            stats = monitor.stats()
+            self.assertEqual(1, stats["latency"][VENUE_TO_DEQUEUE]["count"])
+            self.assertEqual(1, stats["handlers"]["TradeTick"]["count"])
+
+            # Tear Down
+            monitor.stop()
+            self.data_engine.stop()
+            await asyncio.sleep(0.05)
+
+        self.loop.run_until_complete(run_test())
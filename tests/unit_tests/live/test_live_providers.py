@@ -14,6 +14,10 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import json
+import os
+import tempfile
+import time
 import unittest
 
 from nautilus_trader.live.providers import InstrumentProvider
@@ -73,3 +77,95 @@ class LiveProvidersTests(unittest.TestCase):
         # Act
         # Assert
         self.assertRaises(NotImplementedError, self.provider.currency, "BTC")
+
+    def test_read_cache_when_no_cache_dir_returns_none(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertIsNone(self.provider.cache_path)
+        self.assertIsNone(self.provider.read_cache())
+
+    def test_update_cache_then_read_cache_returns_payload(self):
+        # Arrange
+        with tempfile.TemporaryDirectory() as cache_dir:
+            provider = InstrumentProvider(venue=BITMEX, cache_dir=cache_dir)
+            payload = {"markets": {"XBT/USD": {"precision": 1}}}
+
+            # Act
+            changed = provider.update_cache(payload)
+            warm_provider = InstrumentProvider(venue=BITMEX, cache_dir=cache_dir)
+            cached = warm_provider.read_cache()
+
+            # Assert
+            self.assertTrue(changed)
+            self.assertEqual(os.path.join(cache_dir, "bitmex-instruments.json"), provider.cache_path)
+            self.assertEqual(payload, cached)
+            self.assertEqual(provider.cache_hash, warm_provider.cache_hash)
+
+    def test_update_cache_when_payload_unchanged_returns_false(self):
+        # Arrange
+        payload = {"markets": {"XBT/USD": {"precision": 1}}}
+        self.provider.update_cache(payload)
+
+        # Act
+        changed = self.provider.update_cache({"markets": {"XBT/USD": {"precision": 1}}})
+
+        # Assert
+        self.assertFalse(changed)
+
+    def test_read_cache_when_hash_does_not_match_returns_none(self):
+        # Arrange
+        with tempfile.TemporaryDirectory() as cache_dir:
+            provider = InstrumentProvider(venue=BITMEX, cache_dir=cache_dir)
+            provider.update_cache({"markets": {"XBT/USD": {"precision": 1}}})
+
+            with open(provider.cache_path) as cache_file:
+                cached = json.load(cache_file)
+
+            cached["payload"]["markets"]["XBT/USD"]["precision"] = 2
+            with open(provider.cache_path, "w") as cache_file:
+                json.dump(cached, cache_file)
+
+            # Act
+            result = provider.read_cache()
+
+            # Assert
+            self.assertIsNone(result)
+
+    def test_read_cache_when_stale_returns_none(self):
+        # Arrange
+        with tempfile.TemporaryDirectory() as cache_dir:
+            provider = InstrumentProvider(venue=BITMEX, cache_dir=cache_dir, cache_ttl=0)
+            provider.update_cache({"markets": {"XBT/USD": {"precision": 1}}})
+
+            # Act
+            result = provider.read_cache()
+
+            # Assert
+            self.assertIsNone(result)
+
+    def test_update_cache_when_payload_unchanged_refreshes_cache_age(self):
+        # Arrange
+        with tempfile.TemporaryDirectory() as cache_dir:
+            payload = {"markets": {"XBT/USD": {"precision": 1}}}
+            provider = InstrumentProvider(venue=BITMEX, cache_dir=cache_dir, cache_ttl=60)
+            provider.update_cache(payload)
+
+            expired = time.time() - 120
+            os.utime(provider.cache_path, (expired, expired))
+            stale = InstrumentProvider(venue=BITMEX, cache_dir=cache_dir, cache_ttl=60).read_cache()
+
+            # Act
+            changed = provider.update_cache({"markets": {"XBT/USD": {"precision": 1}}})
+            cached = InstrumentProvider(venue=BITMEX, cache_dir=cache_dir, cache_ttl=60).read_cache()
+
+            # Assert
+            self.assertIsNone(stale)
+            self.assertFalse(changed)
+            self.assertEqual(payload, cached)
+
+    def test_changed_when_no_instruments_returns_empty_list(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertEqual([], self.provider.changed({}))
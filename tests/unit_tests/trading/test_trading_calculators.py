@@ -26,6 +26,7 @@ from nautilus_trader.model.currencies import JPY
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.trading.calculators import ExchangeRateCalculator
+from nautilus_trader.trading.calculators import ExchangeRateGraph
 from nautilus_trader.trading.calculators import RolloverInterestCalculator
 from tests.test_kit import PACKAGE_ROOT
 from tests.test_kit.stubs import TestStubs
@@ -234,6 +235,139 @@ class ExchangeRateCalculatorTests(unittest.TestCase):
         self.assertEqual(Decimal("110.115"), result)
 
 
+class ExchangeRateGraphTests(unittest.TestCase):
+
+    def test_get_rate_when_price_type_last_raises_value_error(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", Decimal("0.80000"), Decimal("0.80010"))
+
+        # Act
+        # Assert
+        self.assertRaises(ValueError, graph.get_rate, USD, JPY, PriceType.LAST)
+
+    def test_get_rate_when_from_currency_equals_to_currency_returns_one(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+
+        # Act
+        result = graph.get_rate(USD, USD, PriceType.BID)
+
+        # Assert
+        self.assertEqual(1, result)
+
+    def test_get_rate_when_no_currency_rate_returns_zero(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", Decimal("0.80000"), Decimal("0.80010"))
+
+        # Act
+        result = graph.get_rate(USD, JPY, PriceType.BID)
+
+        # Assert
+        self.assertEqual(0, result)
+
+    def test_get_rate(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", Decimal("0.80000"), Decimal("0.80010"))
+
+        # Act
+        result = graph.get_rate(AUD, USD, PriceType.BID)
+
+        # Assert
+        self.assertEqual(Decimal("0.80000"), result)
+
+    def test_get_rate_for_inverse(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("BTC/USD", Decimal("10501.5"), Decimal("10500.0"))
+
+        # Act
+        result = graph.get_rate(USD, BTC, PriceType.BID)
+
+        # Assert
+        self.assertEqual(Decimal("0.00009522449173927534161786411465"), result)
+
+    def test_calculate_exchange_rate_for_mid_price_type(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("USD/JPY", Decimal("110.100"), Decimal("110.130"))
+
+        # Act
+        result = graph.get_rate(JPY, USD, PriceType.MID)
+
+        # Assert
+        self.assertEqual(Decimal("0.009081414884438995595513781047"), result)
+
+    def test_calculate_exchange_rate_by_inference(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("USD/JPY", Decimal("110.100"), Decimal("110.130"))
+        graph.update("AUD/USD", Decimal("0.80000"), Decimal("0.80010"))
+
+        # Act
+        result1 = graph.get_rate(JPY, AUD, PriceType.BID)
+        result2 = graph.get_rate(AUD, JPY, PriceType.ASK)
+
+        # Assert
+        self.assertAlmostEqual(Decimal("0.01135331516802906448683015441"), result1)  # JPYAUD
+        self.assertAlmostEqual(Decimal("88.11501299999999999999999997"), result2)  # AUDJPY
+
+    def test_calculate_exchange_rate_by_inference_over_multiple_hops(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("USD/JPY", Decimal("110.000"), Decimal("110.000"))
+        graph.update("AUD/USD", Decimal("0.80000"), Decimal("0.80000"))
+        graph.update("BTC/AUD", Decimal("50000"), Decimal("50000"))
+
+        # Act
+        result = graph.get_rate(BTC, JPY, PriceType.MID)
+
+        # Assert
+        self.assertEqual(Decimal("4400000"), result)
+
+    def test_get_rate_after_quote_update_returns_new_rate(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("USD/JPY", Decimal("110.100"), Decimal("110.130"))
+        graph.update("AUD/USD", Decimal("0.80000"), Decimal("0.80010"))
+        graph.get_rate(AUD, JPY, PriceType.BID)  # Memoise rate
+
+        graph.update("AUD/USD", Decimal("0.90000"), Decimal("0.90010"))
+
+        # Act
+        result = graph.get_rate(AUD, JPY, PriceType.BID)
+
+        # Assert
+        self.assertEqual(Decimal("99.090000"), result)
+
+    def test_get_rate_after_new_pair_added_returns_inferred_rate(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("USD/JPY", Decimal("110.100"), Decimal("110.130"))
+        graph.get_rate(AUD, JPY, PriceType.BID)  # Memoise missing rate
+
+        graph.update("AUD/USD", Decimal("0.80000"), Decimal("0.80010"))
+
+        # Act
+        result = graph.get_rate(AUD, JPY, PriceType.BID)
+
+        # Assert
+        self.assertEqual(Decimal("88.080000"), result)
+
+    def test_clear_removes_all_rates(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", Decimal("0.80000"), Decimal("0.80010"))
+
+        # Act
+        graph.clear()
+
+        # Assert
+        self.assertEqual(0, graph.get_rate(AUD, USD, PriceType.BID))
+
+
 class RolloverInterestCalculatorTests(unittest.TestCase):
 
     def setUp(self):
@@ -278,3 +412,27 @@ class RolloverInterestCalculatorTests(unittest.TestCase):
         # Assert
         self.assertRaises(RuntimeError, calculator.calc_overnight_rate, AUDUSD_SIM, datetime.date(1900, 1, 1))
         self.assertRaises(RuntimeError, calculator.calc_overnight_rate, AUDUSD_SIM, datetime.date(3000, 1, 1))
+
+    def test_calc_overnight_fx_rate_with_only_quarterly_data_returns_quarterly_rate(self):
+        # Arrange
+        data = pd.DataFrame({
+            "LOCATION": ["AUS", "USA", "USA"],
+            "TIME": ["2019-Q3", "2019-Q3", "2019-08"],
+            "Value": [1.5, 2.0, 2.5],
+        })
+        calculator = RolloverInterestCalculator(data=data)
+
+        # Act
+        rate = calculator.calc_overnight_rate(AUDUSD_SIM, datetime.date(2019, 8, 15))
+
+        # Assert
+        self.assertEqual(Decimal(((1.5 - 2.5) / 365) / 100), rate)
+        self.assertRaises(RuntimeError, calculator.calc_overnight_rate, AUDUSD_SIM, datetime.date(2019, 10, 1))
+
+    def test_calc_overnight_fx_rate_with_missing_quote_rate_raises_runtime_error(self):
+        # Arrange
+        calculator = RolloverInterestCalculator(data=self.data)
+
+        # Act
+        # Assert
+        self.assertRaises(RuntimeError, calculator.calc_overnight_rate, USDJPY_SIM, datetime.date(1990, 1, 1))
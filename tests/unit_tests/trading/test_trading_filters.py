@@ -237,3 +237,121 @@ class EconomicNewsEventFilterTests(unittest.TestCase):
         # Act
         event = news_filter.prev_event(datetime(2017, 8, 10, 15, 0, tzinfo=pytz.utc))
         self.assertEqual(pd.Timestamp("2017-08-04 12:30:00+0000", tz="UTC"), event.timestamp)
+
+
+class EconomicNewsEventFilterIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        # Fixture Setup (unsorted to exercise index sorting)
+        self.news_data = pd.DataFrame(
+            {
+                "Impact": ["HIGH", "LOW", "HIGH", "MEDIUM", "HIGH"],
+                "Name": ["NFP", "Claims", "CPI", "PMI", "BOE"],
+                "Currency": ["USD", "USD", "USD", "EUR", "GBP"],
+            },
+            index=pd.DatetimeIndex([
+                "2020-01-03 13:30:00",
+                "2020-01-02 13:30:00",
+                "2020-01-06 13:30:00",
+                "2020-01-03 09:00:00",
+                "2020-01-04 12:00:00",
+            ], tz="UTC"),
+        )
+
+        self.news_filter = EconomicNewsEventFilter(
+            currencies=["USD", "EUR", "GBP"],
+            impacts=["HIGH", "MEDIUM"],
+            news_data=self.news_data,
+        )
+
+    def test_initialize_filter_with_unsorted_data_sorts_index(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertEqual(pd.Timestamp("2020-01-02 13:30:00", tz="UTC"), self.news_filter.unfiltered_data_start)
+        self.assertEqual(pd.Timestamp("2020-01-06 13:30:00", tz="UTC"), self.news_filter.unfiltered_data_end)
+
+    def test_next_event_at_event_time_returns_that_event(self):
+        # Arrange
+        # Act
+        event = self.news_filter.next_event(datetime(2020, 1, 3, 9, 0, tzinfo=pytz.utc))
+
+        # Assert
+        self.assertEqual("PMI", event.name)
+        self.assertEqual(pd.Timestamp("2020-01-03 09:00:00", tz="UTC"), event.timestamp)
+
+    def test_next_event_with_currency_and_impact_returns_expected_event(self):
+        # Arrange
+        # Act
+        event = self.news_filter.next_event(datetime(2020, 1, 3, 10, 0, tzinfo=pytz.utc), currency="USD", impact="HIGH")
+
+        # Assert
+        self.assertEqual("NFP", event.name)
+        self.assertEqual("USD", event.currency)
+        self.assertEqual("HIGH", event.impact)
+
+    def test_next_event_with_no_later_events_returns_none(self):
+        # Arrange
+        # Act
+        event = self.news_filter.next_event(datetime(2020, 1, 4, 0, 0, tzinfo=pytz.utc), currency="EUR")
+
+        # Assert
+        self.assertIsNone(event)
+
+    def test_next_event_with_unfiltered_currency_returns_none(self):
+        # Arrange
+        # Act
+        event = self.news_filter.next_event(datetime(2020, 1, 3, 0, 0, tzinfo=pytz.utc), currency="JPY")
+
+        # Assert
+        self.assertIsNone(event)
+
+    def test_prev_event_with_impact_returns_expected_event(self):
+        # Arrange
+        # Act
+        event = self.news_filter.prev_event(datetime(2020, 1, 6, 0, 0, tzinfo=pytz.utc), impact="HIGH")
+
+        # Assert
+        self.assertEqual("BOE", event.name)
+
+    def test_prev_event_excludes_filtered_impacts(self):
+        # Arrange
+        # Act
+        event = self.news_filter.prev_event(datetime(2020, 1, 3, 0, 0, tzinfo=pytz.utc))
+
+        # Assert
+        self.assertIsNone(event)  # Only the LOW impact event precedes
+
+    def test_events_between_returns_events_in_order(self):
+        # Arrange
+        # Act
+        events = self.news_filter.events_between(
+            datetime(2020, 1, 3, 9, 0, tzinfo=pytz.utc),
+            datetime(2020, 1, 6, 13, 30, tzinfo=pytz.utc),
+        )
+
+        # Assert
+        self.assertEqual(["PMI", "NFP", "BOE"], [event.name for event in events])
+
+    def test_events_between_with_currency_returns_expected_events(self):
+        # Arrange
+        # Act
+        events = self.news_filter.events_between(
+            datetime(2020, 1, 1, tzinfo=pytz.utc),
+            datetime(2020, 1, 7, tzinfo=pytz.utc),
+            currency="USD",
+        )
+
+        # Assert
+        self.assertEqual(["NFP", "CPI"], [event.name for event in events])
+
+    def test_events_between_given_start_after_end_raises_value_error(self):
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(
+            ValueError,
+            self.news_filter.events_between,
+            datetime(2020, 1, 7, tzinfo=pytz.utc),
+            datetime(2020, 1, 1, tzinfo=pytz.utc),
+        )
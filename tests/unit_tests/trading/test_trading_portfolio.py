@@ -51,6 +51,7 @@ BITMEX = Exchange("BITMEX")
 
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD", leverage=Decimal("50"))
 GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD", leverage=Decimal("50"))
+GBPJPY_SIM = TestInstrumentProvider.default_fx_ccy("GBP/JPY", leverage=Decimal("50"))
 USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY", leverage=Decimal("50"))
 BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
 BTCUSD_BITMEX = TestInstrumentProvider.xbtusd_bitmex(leverage=Decimal("10"))
@@ -265,6 +266,13 @@ class PortfolioTests(unittest.TestCase):
         # Assert
         self.assertEqual(None, self.portfolio.market_values(SIM))
 
+    def test_update_tick_with_none_raises_type_error(self):
+        # Precondition checks are only compiled out of TRUSTED_MODE builds
+        # Arrange
+        # Act
+        # Assert
+        self.assertRaises(TypeError, self.portfolio.update_tick, None)
+
     def test_update_tick(self):
         # Arrange
         tick = TestStubs.quote_tick_5decimal(GBPUSD_SIM.security)
@@ -732,6 +740,485 @@ class PortfolioTests(unittest.TestCase):
         self.assertFalse(self.portfolio.is_flat(AUDUSD_SIM.security))
         self.assertFalse(self.portfolio.is_completely_flat())
 
+    def test_updating_tick_recalculates_unrealized_pnls_for_changed_security(self):
+        # Arrange
+        state = AccountState(
+            AccountId("SIM", "01234"),
+            balances=[Money(1_000_000.00, USD)],
+            balances_free=[Money(1_000_000.00, USD)],
+            balances_locked=[Money(0.00, USD)],
+            info={"default_currency": "USD"},
+            event_id=uuid4(),
+            event_timestamp=UNIX_EPOCH,
+        )
+
+        account = Account(state)
+
+        self.portfolio.register_account(account)
+
+        last_audusd = QuoteTick(
+            AUDUSD_SIM.security,
+            Price("0.80501"),
+            Price("0.80505"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        last_gbpusd = QuoteTick(
+            GBPUSD_SIM.security,
+            Price("1.30315"),
+            Price("1.30317"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        self.data_cache.add_quote_tick(last_audusd)
+        self.data_cache.add_quote_tick(last_gbpusd)
+        self.portfolio.update_tick(last_audusd)
+        self.portfolio.update_tick(last_gbpusd)
+
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        order2 = self.order_factory.market(
+            GBPUSD_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        order1_filled = TestStubs.event_order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            strategy_id=StrategyId("S", "1"),
+            fill_price=Price("1.00000"),
+        )
+
+        order2_filled = TestStubs.event_order_filled(
+            order2,
+            instrument=GBPUSD_SIM,
+            position_id=PositionId("P-2"),
+            strategy_id=StrategyId("S", "1"),
+            fill_price=Price("1.00000"),
+        )
+
+        self.portfolio.update_position(TestStubs.event_position_opened(Position(order1_filled)))
+        self.portfolio.update_position(TestStubs.event_position_opened(Position(order2_filled)))
+        self.portfolio.unrealized_pnls(SIM)  # Cache values
+
+        new_audusd = QuoteTick(
+            AUDUSD_SIM.security,
+            Price("0.81501"),
+            Price("0.81505"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        self.data_cache.add_quote_tick(new_audusd)
+
+        # Act
+        self.portfolio.update_tick(new_audusd)
+
+        # Assert
+        self.assertEqual({USD: Money("11816.00", USD)}, self.portfolio.unrealized_pnls(SIM))
+        self.assertEqual(Money("-18499.00", USD), self.portfolio.unrealized_pnl(AUDUSD_SIM.security))
+        self.assertEqual(Money("30315.00", USD), self.portfolio.unrealized_pnl(GBPUSD_SIM.security))
+
+    def test_updating_tick_applies_value_to_venue_totals_on_update(self):
+        # Arrange
+        state = AccountState(
+            AccountId("SIM", "01234"),
+            balances=[Money(1_000_000.00, USD)],
+            balances_free=[Money(1_000_000.00, USD)],
+            balances_locked=[Money(0.00, USD)],
+            info={"default_currency": "USD"},
+            event_id=uuid4(),
+            event_timestamp=UNIX_EPOCH,
+        )
+
+        self.portfolio.register_account(Account(state))
+
+        last_audusd = QuoteTick(
+            AUDUSD_SIM.security,
+            Price("0.80501"),
+            Price("0.80505"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        self.data_cache.add_quote_tick(last_audusd)
+        self.portfolio.update_tick(last_audusd)
+
+        order = self.order_factory.market(
+            AUDUSD_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        fill = TestStubs.event_order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            strategy_id=StrategyId("S", "1"),
+            fill_price=Price("1.00000"),
+        )
+
+        self.portfolio.update_position(TestStubs.event_position_opened(Position(fill)))
+
+        new_audusd = QuoteTick(
+            AUDUSD_SIM.security,
+            Price("0.81501"),
+            Price("0.81505"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        self.data_cache.add_quote_tick(new_audusd)
+        self.portfolio.update_tick(new_audusd)
+
+        # Price changes in the cache alone are not applied until the next tick
+        self.data_cache.add_quote_tick(last_audusd)
+
+        # Act
+        result = self.portfolio.unrealized_pnls(SIM)
+
+        # Assert
+        self.assertEqual({USD: Money("-18499.00", USD)}, result)
+
+    def test_updating_xrate_tick_revalues_cross_currency_positions(self):
+        # Arrange
+        state = AccountState(
+            AccountId("SIM", "01234"),
+            balances=[Money(1_000_000.00, USD)],
+            balances_free=[Money(1_000_000.00, USD)],
+            balances_locked=[Money(0.00, USD)],
+            info={"default_currency": "USD"},
+            event_id=uuid4(),
+            event_timestamp=UNIX_EPOCH,
+        )
+
+        self.portfolio.register_account(Account(state))
+        self.data_cache.add_instrument(GBPJPY_SIM)
+        self.data_cache.add_instrument(USDJPY_SIM)
+
+        last_gbpjpy = QuoteTick(
+            GBPJPY_SIM.security,
+            Price("155.000"),
+            Price("155.010"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        last_usdjpy = QuoteTick(
+            USDJPY_SIM.security,
+            Price("100.000"),
+            Price("100.000"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        self.data_cache.add_quote_tick(last_gbpjpy)
+        self.data_cache.add_quote_tick(last_usdjpy)
+        self.portfolio.update_tick(last_gbpjpy)
+        self.portfolio.update_tick(last_usdjpy)
+
+        order = self.order_factory.market(
+            GBPJPY_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        fill = TestStubs.event_order_filled(
+            order,
+            instrument=GBPJPY_SIM,
+            position_id=PositionId("P-1"),
+            strategy_id=StrategyId("S", "1"),
+            fill_price=Price("150.000"),
+        )
+
+        self.portfolio.update_position(TestStubs.event_position_opened(Position(fill)))
+        self.assertEqual({USD: Money("5000.00", USD)}, self.portfolio.unrealized_pnls(SIM))
+
+        new_usdjpy = QuoteTick(
+            USDJPY_SIM.security,
+            Price("125.000"),
+            Price("125.000"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        self.data_cache.add_quote_tick(new_usdjpy)
+        self.portfolio.update_tick(new_usdjpy)
+
+        # Assert
+        self.assertEqual(Money("4000.00", USD), self.portfolio.unrealized_pnl(GBPJPY_SIM.security))
+        self.assertEqual({USD: Money("4000.00", USD)}, self.portfolio.unrealized_pnls(SIM))
+
+    def test_updating_tick_applies_maint_margin_delta_to_account(self):
+        # Arrange
+        state = AccountState(
+            AccountId("SIM", "01234"),
+            balances=[Money(1_000_000.00, USD)],
+            balances_free=[Money(1_000_000.00, USD)],
+            balances_locked=[Money(0.00, USD)],
+            info={"default_currency": "USD"},
+            event_id=uuid4(),
+            event_timestamp=UNIX_EPOCH,
+        )
+
+        account = Account(state)
+        self.portfolio.register_account(account)
+
+        last_audusd = QuoteTick(
+            AUDUSD_SIM.security,
+            Price("0.80501"),
+            Price("0.80505"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        self.data_cache.add_quote_tick(last_audusd)
+        self.portfolio.update_tick(last_audusd)
+
+        order = self.order_factory.market(
+            AUDUSD_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        fill = TestStubs.event_order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            strategy_id=StrategyId("S", "1"),
+            fill_price=Price("1.00000"),
+        )
+
+        self.portfolio.update_position(TestStubs.event_position_opened(Position(fill)))
+        self.assertEqual({USD: Money("49.91", USD)}, account.maint_margins())
+
+        new_audusd = QuoteTick(
+            AUDUSD_SIM.security,
+            Price("0.81501"),
+            Price("0.81505"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        self.data_cache.add_quote_tick(new_audusd)
+        self.portfolio.update_tick(new_audusd)
+
+        # Assert
+        self.assertEqual({USD: Money("50.53", USD)}, account.maint_margins())
+        self.assertEqual({USD: Money("50.53", USD)}, self.portfolio.maint_margins(SIM))
+
+    def test_updating_xrate_tick_revalues_cross_currency_maint_margins(self):
+        # Arrange
+        state = AccountState(
+            AccountId("SIM", "01234"),
+            balances=[Money(1_000_000.00, USD)],
+            balances_free=[Money(1_000_000.00, USD)],
+            balances_locked=[Money(0.00, USD)],
+            info={"default_currency": "USD"},
+            event_id=uuid4(),
+            event_timestamp=UNIX_EPOCH,
+        )
+
+        self.portfolio.register_account(Account(state))
+        self.data_cache.add_instrument(GBPJPY_SIM)
+        self.data_cache.add_instrument(USDJPY_SIM)
+
+        last_gbpjpy = QuoteTick(
+            GBPJPY_SIM.security,
+            Price("155.000"),
+            Price("155.010"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        last_usdjpy = QuoteTick(
+            USDJPY_SIM.security,
+            Price("100.000"),
+            Price("100.000"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        self.data_cache.add_quote_tick(last_gbpjpy)
+        self.data_cache.add_quote_tick(last_usdjpy)
+        self.portfolio.update_tick(last_gbpjpy)
+        self.portfolio.update_tick(last_usdjpy)
+
+        order = self.order_factory.market(
+            GBPJPY_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        fill = TestStubs.event_order_filled(
+            order,
+            instrument=GBPJPY_SIM,
+            position_id=PositionId("P-1"),
+            strategy_id=StrategyId("S", "1"),
+            fill_price=Price("150.000"),
+        )
+
+        self.portfolio.update_position(TestStubs.event_position_opened(Position(fill)))
+        self.assertEqual({USD: Money("96.10", USD)}, self.portfolio.maint_margins(SIM))
+
+        new_usdjpy = QuoteTick(
+            USDJPY_SIM.security,
+            Price("125.000"),
+            Price("125.000"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        self.data_cache.add_quote_tick(new_usdjpy)
+        self.portfolio.update_tick(new_usdjpy)
+
+        # Assert
+        self.assertEqual({USD: Money("76.88", USD)}, self.portfolio.maint_margins(SIM))
+
+    def test_initialize_positions_before_instruments_revalues_on_xrate_ticks(self):
+        # Arrange
+        state = AccountState(
+            AccountId("SIM", "01234"),
+            balances=[Money(1_000_000.00, USD)],
+            balances_free=[Money(1_000_000.00, USD)],
+            balances_locked=[Money(0.00, USD)],
+            info={"default_currency": "USD"},
+            event_id=uuid4(),
+            event_timestamp=UNIX_EPOCH,
+        )
+
+        self.portfolio.register_account(Account(state))
+
+        order = self.order_factory.market(
+            GBPJPY_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        fill = TestStubs.event_order_filled(
+            order,
+            instrument=GBPJPY_SIM,
+            position_id=PositionId("P-1"),
+            strategy_id=StrategyId("S", "1"),
+            fill_price=Price("150.000"),
+        )
+
+        # Positions restored before the instruments are loaded
+        self.portfolio.initialize_positions({Position(fill)})
+
+        self.data_cache.add_instrument(GBPJPY_SIM)
+        self.data_cache.add_instrument(USDJPY_SIM)
+
+        last_gbpjpy = QuoteTick(
+            GBPJPY_SIM.security,
+            Price("155.000"),
+            Price("155.010"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        last_usdjpy = QuoteTick(
+            USDJPY_SIM.security,
+            Price("100.000"),
+            Price("100.000"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        self.data_cache.add_quote_tick(last_gbpjpy)
+        self.data_cache.add_quote_tick(last_usdjpy)
+        self.portfolio.update_tick(last_gbpjpy)
+        self.portfolio.update_tick(last_usdjpy)
+        self.assertEqual({USD: Money("5000.00", USD)}, self.portfolio.unrealized_pnls(SIM))
+
+        new_usdjpy = QuoteTick(
+            USDJPY_SIM.security,
+            Price("125.000"),
+            Price("125.000"),
+            Quantity(1),
+            Quantity(1),
+            UNIX_EPOCH,
+        )
+
+        # Act
+        self.data_cache.add_quote_tick(new_usdjpy)
+        self.portfolio.update_tick(new_usdjpy)
+
+        # Assert
+        self.assertEqual(Money("4000.00", USD), self.portfolio.unrealized_pnl(GBPJPY_SIM.security))
+        self.assertEqual({USD: Money("4000.00", USD)}, self.portfolio.unrealized_pnls(SIM))
+
+    def test_updating_trade_tick_revalues_position_without_quotes(self):
+        # Arrange
+        state = AccountState(
+            AccountId("SIM", "01234"),
+            balances=[Money(1_000_000.00, USD)],
+            balances_free=[Money(1_000_000.00, USD)],
+            balances_locked=[Money(0.00, USD)],
+            info={"default_currency": "USD"},
+            event_id=uuid4(),
+            event_timestamp=UNIX_EPOCH,
+        )
+
+        self.portfolio.register_account(Account(state))
+
+        last_trade = TestStubs.trade_tick_5decimal(AUDUSD_SIM.security, Price("0.80501"))
+        self.data_cache.add_trade_tick(last_trade)
+        self.portfolio.update_trade_tick(last_trade)
+
+        order = self.order_factory.market(
+            AUDUSD_SIM.security,
+            OrderSide.BUY,
+            Quantity(100000),
+        )
+
+        fill = TestStubs.event_order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            strategy_id=StrategyId("S", "1"),
+            fill_price=Price("1.00000"),
+        )
+
+        self.portfolio.update_position(TestStubs.event_position_opened(Position(fill)))
+        self.assertEqual({USD: Money("-19499.00", USD)}, self.portfolio.unrealized_pnls(SIM))
+
+        new_trade = TestStubs.trade_tick_5decimal(AUDUSD_SIM.security, Price("0.81501"))
+
+        # Act
+        self.data_cache.add_trade_tick(new_trade)
+        self.portfolio.update_trade_tick(new_trade)
+
+        # Assert
+        self.assertEqual(Money("-18499.00", USD), self.portfolio.unrealized_pnl(AUDUSD_SIM.security))
+        self.assertEqual({USD: Money("-18499.00", USD)}, self.portfolio.unrealized_pnls(SIM))
+
     def test_modifying_position_updates_portfolio(self):
         # Arrange
         state = AccountState(
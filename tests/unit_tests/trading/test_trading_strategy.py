@@ -1019,6 +1019,20 @@ class TradingStrategyTests(unittest.TestCase):
         self.assertEqual(['on_start', 'on_instrument'], strategy.calls)
         self.assertEqual(AUDUSD_SIM, strategy.object_storer.get_store()[0])
 
+    def test_handle_quote_tick_with_none_raises_type_error(self):
+        # Precondition checks are only compiled out of TRUSTED_MODE builds
+        # Arrange
+        strategy = MockStrategy(TestStubs.bartype_audusd_1min_bid())
+        strategy.register_trader(
+            TraderId("TESTER", "000"),
+            self.clock,
+            self.logger,
+        )
+
+        # Act
+        # Assert
+        self.assertRaises(TypeError, strategy.handle_quote_tick, None)
+
     def test_handle_quote_tick_when_not_running_does_not_send_to_on_quote_tick(self):
         # Arrange
         strategy = MockStrategy(TestStubs.bartype_audusd_1min_bid())